@@ -0,0 +1,6 @@
+"""
+매매 핫패스 성능 벤치마크
+
+고정 시드 합성 가격 패널을 스탠드인 DB에 적재하고 가격 조회, 지표 헬퍼, 전략 필터, 분할 매수 계산의
+실행 시간과 최대 메모리를 측정해 JSON으로 남긴다. 실행 방법은 benchmarks/__main__.py 참고.
+"""
@@ -0,0 +1,208 @@
+"""벤치마크용 고정 시드 합성 시장 데이터"""
+import datetime
+import inspect
+from types import SimpleNamespace
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+from peewee import Database, Model
+
+import data.models as models
+from config.constants import MARKET_INDEX_SYMBOLS
+
+# 전략 카테고리 (구독 종목을 순서대로 나눠 배정)
+CATEGORIES = ("dividend", "growth", "box")
+
+# 합성 시세 기준값 (국내 종목, 원 단위)
+BASE_PRICE = 20_000
+DAILY_VOLATILITY = 0.02
+INSERT_BATCH_ROWS = 500
+# 거래일 달력을 오늘 이후로 채워 두는 기간 (일, 달력 보충 API 호출 방지)
+CALENDAR_AHEAD_DAYS = 60
+
+# 카테고리별로 이 간격마다 한 종목은 최근 구간을 해당 전략의 매수 조건에 맞는 모양으로 만든다
+SHAPED_EVERY = 4
+# 모양을 만든 종목의 하루 거래대금 (원, 국내 유동성 기준 이상)
+SHAPED_TURNOVER = 30_000_000_000
+SHAPED_VOLATILITY = 0.003
+
+# 카테고리별 최근 구간 모양: (거래일 수, 일간 수익률, 상승일 거래량 배수, 하락일 거래량 배수)
+# - dividend: 상승 추세 후 거래량이 줄며 BB 하단 아래로 급락, 마지막 날 거래량을 실은 반등 (RSI 과매도 반등, OBV 상승)
+# - growth: 상승 추세 후 52주 고가 대비 약 20% 조정, 바닥 다지기 후 거래량 급증 반등 (RSI 30-60, MACD 골든크로스)
+# - box: 완만한 상승 후 폭 약 8%의 박스권 왕복, 마지막 하락 구간에서 BB 하단 근접 (상승일 거래량 우위로 OBV 상승)
+SHAPED_PROFILES = {
+    "dividend": ((150, 0.0025, 1.5, 0.8), (6, -0.025, 0.5, 0.5), (1, 0.01, 2.0, 2.0)),
+    "growth": ((250, 0.003, 1.2, 0.8), (15, -0.015, 0.8, 0.8), (6, 0.0, 1.0, 1.0), (3, 0.006, 2.0, 2.0)),
+    "box": ((120, 0.002, 1.2, 0.8),) + ((7, 0.012, 2.0, 0.7), (7, -0.012, 2.0, 0.7)) * 4,
+}
+
+
+def all_models() -> List[type]:
+    """data.models의 전체 모델 (스탠드인 DB에 같은 스키마로 생성)"""
+    return [
+        obj for obj in vars(models).values()
+        if inspect.isclass(obj) and issubclass(obj, Model) and obj is not Model and obj.__module__ == models.__name__
+    ]
+
+
+def symbols_for(size: int) -> List[str]:
+    """국내 종목코드 형식의 합성 종목 목록"""
+    return [f"{100000 + i:06d}" for i in range(size)]
+
+
+def trading_dates(years: float, end: datetime.date = None) -> List[datetime.date]:
+    """end까지 years년 + 지표 준비 구간의 평일 목록"""
+    end = end or datetime.date.today()
+    start = end - datetime.timedelta(days=int(365 * years) + 30)
+    return [timestamp.date() for timestamp in pd.bdate_range(start, end)]
+
+
+def synthetic_prices(rng: np.random.Generator, count: int) -> Dict[str, np.ndarray]:
+    """기하 브라운 운동 종가와 그 주변 시가/고가/저가, 간헐적 급증이 섞인 거래량"""
+    drift = rng.normal(0.0003, 0.0004)
+    close = BASE_PRICE * np.exp(np.cumsum(rng.normal(drift, DAILY_VOLATILITY, count)))
+    open_ = close * (1 + rng.normal(0, DAILY_VOLATILITY / 4, count))
+    high = np.maximum.reduce([close * (1 + np.abs(rng.normal(0, DAILY_VOLATILITY / 2, count))), open_, close])
+    low = np.minimum.reduce([close * (1 - np.abs(rng.normal(0, DAILY_VOLATILITY / 2, count))), open_, close])
+    volume = rng.lognormal(12, 0.5, count) * (1 + 3 * (rng.random(count) < 0.03))
+    return {
+        "open": open_.astype(np.int64),
+        "high": high.astype(np.int64),
+        "low": low.astype(np.int64),
+        "close": close.astype(np.int64),
+        "volume": volume.astype(np.int64),
+    }
+
+
+def shaped_prices(rng: np.random.Generator, count: int, category: str) -> Dict[str, np.ndarray]:
+    """
+    synthetic_prices의 최근 구간을 SHAPED_PROFILES[category] 모양으로 바꾼 시세
+
+    앞쪽은 무작위 경로 그대로 두고 뒤쪽 구간의 종가만 모양대로 이어 붙이며, 거래량은 전체 기간을
+    SHAPED_TURNOVER 거래대금 기준으로 맞춘 뒤 모양 구간에서 상승/하락일 배수를 곱한다.
+    """
+    prices = synthetic_prices(rng, count)
+    segments = SHAPED_PROFILES[category]
+    returns = np.concatenate([
+        rng.normal(daily_return, SHAPED_VOLATILITY, days) for days, daily_return, _, _ in segments
+    ])[-count:]
+    shaped = len(returns)
+    start = count - shaped
+    base = float(prices["close"][start - 1]) if start else BASE_PRICE
+    close = prices["close"].astype(float)
+    close[start:] = base * np.exp(np.cumsum(returns))
+
+    multiples = np.ones(count)
+    up_days = np.diff(close, prepend=close[0]) >= 0
+    offset = count - sum(days for days, _, _, _ in segments)
+    for days, _, up_multiple, down_multiple in segments:
+        span = slice(max(offset, 0), max(offset + days, 0))
+        multiples[span] = np.where(up_days[span], up_multiple, down_multiple)
+        offset += days
+
+    noise = close[start:] * np.abs(rng.normal(0, SHAPED_VOLATILITY, shaped))
+    prices["open"][start:] = (close[start:] + rng.normal(0, 0.5, shaped) * noise).astype(np.int64)
+    prices["high"][start:] = (np.maximum(close[start:], prices["open"][start:]) + noise).astype(np.int64)
+    prices["low"][start:] = (np.minimum(close[start:], prices["open"][start:]) - noise).astype(np.int64)
+    prices["close"] = close.astype(np.int64)
+    prices["volume"] = (SHAPED_TURNOVER / close * multiples * rng.lognormal(0, 0.1, count)).astype(np.int64)
+    return prices
+
+
+def build_database(database: Database, size: int, years: float, seed: int) -> List[str]:
+    """
+    스탠드인 DB에 전체 스키마를 만들고 합성 종목/구독/가격 히스토리를 적재
+
+    모델을 database에 다시 바인딩하므로 이후 Repository/헬퍼 호출은 모두 이 DB를 읽는다.
+    카테고리별 SHAPED_EVERY 종목마다 하나는 shaped_prices로 만들어 전략 매수 필터가 후보를 찾게 한다.
+    거래일 달력은 평일을 개장일로 채워 가격 저장소 신선도 확인이 외부 API를 부르지 않게 한다.
+
+    :return: 적재한 종목 목록
+    """
+    model_classes = all_models()
+    database.bind(model_classes)
+    database.drop_tables(model_classes)
+    database.create_tables(model_classes)
+
+    rng = np.random.default_rng(seed)
+    symbols = symbols_for(size)
+    dates = trading_dates(years)
+    history = models.PriceHistory
+    fields = [history.symbol, history.date, history.open, history.high, history.low, history.close, history.volume]
+
+    with database.atomic():
+        models.Stock.insert_many(
+            [(symbol, symbol, "KOR") for symbol in symbols],
+            fields=[models.Stock.symbol, models.Stock.company_name, models.Stock.country],
+        ).execute()
+        models.Subscription.insert_many(
+            [(symbol, CATEGORIES[i % len(CATEGORIES)]) for i, symbol in enumerate(symbols)],
+            fields=[models.Subscription.symbol, models.Subscription.category],
+        ).execute()
+        calendar_days = pd.date_range(dates[0], datetime.date.today() + datetime.timedelta(days=CALENDAR_AHEAD_DAYS))
+        for country in ("KOR", "USA"):
+            models.TradingDay.insert_many(
+                [(country, day.date(), day.weekday() < 5) for day in calendar_days],
+                fields=[models.TradingDay.country, models.TradingDay.date, models.TradingDay.is_open],
+            ).execute()
+
+    for i, symbol in enumerate(symbols):
+        category = CATEGORIES[i % len(CATEGORIES)]
+        if (i // len(CATEGORIES)) % SHAPED_EVERY == 0:
+            prices = shaped_prices(rng, len(dates), category)
+        else:
+            prices = synthetic_prices(rng, len(dates))
+        rows = list(zip(
+            [symbol] * len(dates), dates,
+            prices["open"].tolist(), prices["high"].tolist(), prices["low"].tolist(),
+            prices["close"].tolist(), prices["volume"].tolist(),
+        ))
+        with database.atomic():
+            for offset in range(0, len(rows), INSERT_BATCH_ROWS):
+                history.insert_many(rows[offset:offset + INSERT_BATCH_ROWS], fields=fields).execute()
+    return symbols
+
+
+def synthetic_market_series(years: float, seed: int) -> Dict[str, pd.DataFrame]:
+    """HistoricalMarketSnapshot용 지수/VIX/환율 시계열 (date 인덱스, close/sma50/sma200)"""
+    rng = np.random.default_rng(seed)
+    dates = trading_dates(years)
+    steps = np.arange(len(dates))
+    index = 2_500 * np.exp(np.cumsum(rng.normal(0.0003, 0.01, len(dates))))
+    closes = {
+        MARKET_INDEX_SYMBOLS["KOR"]: index,
+        MARKET_INDEX_SYMBOLS["USA"]: index * 2,
+        "VIX": 15 + 5 * np.abs(np.sin(steps / 50)),
+        "USD/KRW": 1_300 + 50 * np.sin(steps / 100),
+    }
+    series = {}
+    for name, values in closes.items():
+        close = pd.Series(values, index=dates, dtype=float)
+        series[name] = pd.DataFrame({
+            "close": close,
+            "sma50": close.rolling(50).mean(),
+            "sma200": close.rolling(200).mean(),
+        })
+    return series
+
+
+def synthetic_holdings(frames: Dict[str, pd.DataFrame], ratio: float, seed: int) -> List[SimpleNamespace]:
+    """
+    잔고 조회 응답 형태의 합성 보유 종목 (종목의 ratio 비율)
+
+    평균 매입가는 조회 구간 중 임의 시점 종가로 둬 이익/손실 종목이 섞이게 한다.
+    """
+    rng = np.random.default_rng(seed)
+    symbols = sorted(frames)
+    count = max(1, int(len(symbols) * ratio))
+    holdings = []
+    for symbol in rng.choice(symbols, size=min(count, len(symbols)), replace=False):
+        close = frames[symbol]["close"]
+        average_price = float(close.iloc[int(rng.integers(0, len(close)))])
+        holdings.append(SimpleNamespace(
+            pdno=str(symbol),
+            hldg_qty=str(int(rng.integers(10, 500))),
+            pchs_avg_pric=str(average_price),
+        ))
+    return holdings
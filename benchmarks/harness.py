@@ -0,0 +1,158 @@
+"""벤치마크 측정 (실행 시간, 최대 메모리)과 결과 JSON 기록/비교"""
+import datetime
+import gc
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# 직전 결과 대비 이 비율 이상 느려지면 회귀로 표시
+REGRESSION_THRESHOLD = 0.2
+# 측정 잡음 하한 (증가분이 이보다 작으면 비율과 관계없이 무시)
+REGRESSION_MIN_SECONDS = 0.005
+REGRESSION_MIN_MEMORY_MB = 1.0
+
+
+@dataclass
+class BenchmarkResult:
+    """벤치마크 한 항목의 측정값"""
+    name: str
+    size: int
+    repeat: int
+    wall_min: float
+    wall_median: float
+    peak_memory_mb: float
+    calls: int = 1
+    # 결과 건수 (전략 매수 필터의 매수 대상 종목 수 등, count를 준 항목만)
+    candidates: Optional[int] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.size}:{self.name}"
+
+
+def measure(
+        name: str,
+        size: int,
+        func: Callable[[], Any],
+        setup: Optional[Callable[[], None]] = None,
+        repeat: int = 3,
+        calls: int = 1,
+        count: Optional[Callable[[Any], int]] = None,
+) -> BenchmarkResult:
+    """
+    func 실행 시간과 최대 메모리 측정
+
+    시간은 tracemalloc 없이 repeat번 잰 최솟값/중앙값이고, 최대 메모리는 추적 오버헤드가 시간에 섞이지
+    않도록 한 번 더 실행하며 tracemalloc으로 잰 할당 최대치다. setup은 매 실행 직전에 호출되며 측정에서
+    제외된다 (콜드 캐시 재현 등).
+
+    :param calls: func 한 번이 처리하는 호출 수 (종목 수 등, 결과 해석용)
+    :param count: func 반환값에서 결과 건수를 세는 함수 (지정하면 candidates에 기록)
+    """
+    timings = []
+    for _ in range(max(1, repeat)):
+        if setup is not None:
+            setup()
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+
+    if setup is not None:
+        setup()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        output = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    result = BenchmarkResult(
+        name=name,
+        size=size,
+        repeat=len(timings),
+        wall_min=min(timings),
+        wall_median=statistics.median(timings),
+        peak_memory_mb=peak / 1024 / 1024,
+        calls=calls,
+        candidates=count(output) if count is not None else None,
+    )
+    found = f", 결과 {result.candidates}건" if result.candidates is not None else ""
+    logger.info(
+        f"[{size}] {name}: {result.wall_median * 1000:,.1f}ms (min {result.wall_min * 1000:,.1f}ms, "
+        f"{calls}건{found}), 최대 메모리 {result.peak_memory_mb:,.1f}MB"
+    )
+    return result
+
+
+def empty_results(results: List[BenchmarkResult]) -> List[str]:
+    """
+    결과 건수를 기록했는데 0건인 항목
+
+    조건을 통과한 종목이 없으면 후반 파이프라인이 실행되지 않아 빠르게 측정되므로, 이런 항목은
+    회귀 비교와 별개로 실패로 본다.
+    """
+    empty = [f"[{result.size}] {result.name}" for result in results if result.candidates == 0]
+    for line in empty:
+        logger.error(f"벤치마크 결과 0건: {line}")
+    return empty
+
+
+def write_results(results: List[BenchmarkResult], path: Path, meta: Dict[str, Any]) -> None:
+    """결과를 JSON으로 저장"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "created_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        **meta,
+        "results": [asdict(result) for result in results],
+    }
+    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2))
+    logger.info(f"벤치마크 결과 저장: {path}")
+
+
+def latest_result(directory: Path, exclude: Path = None) -> Optional[Path]:
+    """결과 디렉토리의 가장 최근 결과 파일"""
+    paths = sorted(path for path in directory.glob("*.json") if path != exclude)
+    return paths[-1] if paths else None
+
+
+def compare(results: List[BenchmarkResult], baseline_path: Path, threshold: float = REGRESSION_THRESHOLD) -> List[str]:
+    """
+    이전 결과 대비 회귀 항목 (중앙값 실행 시간 또는 최대 메모리가 threshold 이상, 잡음 하한 이상 증가)
+
+    :return: 회귀 설명 목록 (없으면 빈 목록)
+    """
+    baseline = {
+        f"{row['size']}:{row['name']}": row
+        for row in json.loads(baseline_path.read_text()).get("results", [])
+    }
+    regressions = []
+    for result in results:
+        previous = baseline.get(result.key)
+        if previous is None:
+            continue
+        for metric, current, floor in (
+                ("wall_median", result.wall_median, REGRESSION_MIN_SECONDS),
+                ("peak_memory_mb", result.peak_memory_mb, REGRESSION_MIN_MEMORY_MB),
+        ):
+            before = previous[metric]
+            if before > 0 and current > before * (1 + threshold) and current - before >= floor:
+                regressions.append(
+                    f"[{result.size}] {result.name} {metric}: {before:.4f} → {current:.4f} (+{(current / before - 1) * 100:.0f}%)"
+                )
+    for line in regressions:
+        logger.warning(f"벤치마크 회귀: {line}")
+    logger.info(f"기준 결과 {baseline_path.name} 대비 회귀 {len(regressions)}건")
+    return regressions
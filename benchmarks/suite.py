@@ -0,0 +1,164 @@
+"""매매 핫패스 벤치마크 항목"""
+import shutil
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import pandas as pd
+from peewee import Database
+
+from config import setting_env
+from config.logging_config import get_logger
+from services.backtest.market import HistoricalMarketSnapshot
+from services.price_cache import PriceCache
+from services.trading_helpers import (
+    allocate_volume_to_levels,
+    apply_bollinger_bands,
+    bb_proximity_ok,
+    calculate_adtv,
+    calculate_atr,
+    compute_resistance_prices,
+    compute_rsi,
+    fetch_price_dataframe,
+    fetch_price_panel,
+    generate_dca_entry_levels,
+    higher_timeframe_ok,
+    macd_rebound_ok,
+    obv_sma_rising,
+    rsi_in_range,
+    rsi_rebound_below,
+)
+from services.workflows.base import default_strategies, select_sell_stocks
+
+from benchmarks.fixtures import build_database, synthetic_holdings, synthetic_market_series
+from benchmarks.harness import BenchmarkResult, measure
+
+logger = get_logger(__name__)
+
+# fetch_price_dataframe를 호출할 종목 수 (종목 하나씩 조회하는 경로라 전체 대신 표본)
+FETCH_SAMPLE_SIZE = 100
+# 보유 종목 비율 (매도 필터 대상)
+HOLDINGS_RATIO = 0.1
+# allocate_volume_to_levels에 나눌 총 수량
+ALLOCATION_VOLUME = 1_000
+
+# 지표 헬퍼 (종목 히스토리 사본 하나를 받아 매번 새 IndicatorBundle로 계산)
+INDICATOR_HELPERS: Dict[str, Callable[[pd.DataFrame], object]] = {
+    "calculate_adtv": calculate_adtv,
+    "calculate_atr": calculate_atr,
+    "apply_bollinger_bands": apply_bollinger_bands,
+    "compute_resistance_prices": compute_resistance_prices,
+    "higher_timeframe_ok": higher_timeframe_ok,
+    "obv_sma_rising": obv_sma_rising,
+    "macd_rebound_ok": macd_rebound_ok,
+    "rsi_in_range": lambda df: rsi_in_range(df, 14, 30.0, 60.0),
+    "rsi_rebound_below": lambda df: rsi_rebound_below(df, 14, 30.0),
+    "compute_rsi": compute_rsi,
+}
+
+
+def run_suite(database: Database, workdir: Path, size: int, years: float, seed: int, repeat: int) -> List[BenchmarkResult]:
+    """
+    종목 size개 × years년 합성 패널로 전체 벤치마크 실행
+
+    :param database: 가격 히스토리를 적재할 스탠드인 DB (모델이 이 DB로 다시 바인딩됨)
+    :param workdir: 가격 저장소(PRICE_STORE_DIR)로 쓸 작업 디렉토리
+    """
+    logger.info(f"[{size}] 합성 패널 적재: {size}종목 × {years}년 (seed {seed})")
+    symbols = build_database(database, size, years, seed)
+    store_dir = workdir / f"price_store_{size}"
+    setting_env.PRICE_STORE_DIR = str(store_dir)
+
+    def clear_store():
+        shutil.rmtree(store_dir, ignore_errors=True)
+
+    results = []
+    sample = symbols[:FETCH_SAMPLE_SIZE]
+    full_days = int(365 * years)
+
+    # 가격 조회 (DB → 저장소 기록, 저장소 적중)
+    results.append(measure(
+        "fetch_price_dataframe[db]", size, lambda: [fetch_price_dataframe(symbol) for symbol in sample],
+        setup=clear_store, repeat=repeat, calls=len(sample),
+    ))
+    results.append(measure(
+        "fetch_price_dataframe[store]", size, lambda: [fetch_price_dataframe(symbol) for symbol in sample],
+        repeat=repeat, calls=len(sample),
+    ))
+    results.append(measure(
+        "fetch_price_dataframe[db,full]", size,
+        lambda: [fetch_price_dataframe(symbol, days=full_days) for symbol in sample],
+        setup=clear_store, repeat=repeat, calls=len(sample),
+    ))
+    results.append(measure(
+        "fetch_price_panel[db]", size, lambda: fetch_price_panel(symbols),
+        setup=clear_store, repeat=repeat, calls=len(symbols),
+    ))
+    frames = fetch_price_panel(symbols)
+
+    # 지표 헬퍼 (입력을 수정하는 헬퍼가 있어 매 실행마다 사본 사용)
+    working: Dict[str, pd.DataFrame] = {}
+
+    def copy_frames():
+        working.clear()
+        working.update({symbol: df.copy() for symbol, df in frames.items()})
+
+    for name, helper in INDICATOR_HELPERS.items():
+        results.append(measure(
+            name, size, lambda helper=helper: [helper(df) for df in working.values()],
+            setup=copy_frames, repeat=repeat, calls=len(frames),
+        ))
+
+    def copy_frames_with_bands():
+        copy_frames()
+        for df in working.values():
+            apply_bollinger_bands(df)
+
+    results.append(measure(
+        "bb_proximity_ok", size, lambda: [bb_proximity_ok(df) for df in working.values()],
+        setup=copy_frames_with_bands, repeat=repeat, calls=len(frames),
+    ))
+
+    # 분할 매수 가격/수량
+    atrs = {symbol: calculate_atr(df) for symbol, df in frames.items()}
+    atrs = {symbol: atr for symbol, atr in atrs.items() if atr}
+    results.append(measure(
+        "generate_dca_entry_levels", size,
+        lambda: [generate_dca_entry_levels(frames[symbol], atr) for symbol, atr in atrs.items()],
+        repeat=repeat, calls=len(atrs),
+    ))
+    ladders = [generate_dca_entry_levels(frames[symbol], atr) for symbol, atr in atrs.items()]
+    ladders = [ladder for ladder in ladders if ladder]
+    results.append(measure(
+        "allocate_volume_to_levels", size,
+        lambda: [allocate_volume_to_levels(ladder, ALLOCATION_VOLUME) for ladder in ladders],
+        repeat=repeat, calls=len(ladders),
+    ))
+
+    # 전략 필터 (실거래처럼 실행마다 새 PriceCache, 가격은 저장소에서 읽음)
+    series = synthetic_market_series(years, seed)
+    as_of = max(df["date"].iloc[-1] for df in frames.values())
+    holdings = synthetic_holdings(frames, HOLDINGS_RATIO, seed)
+
+    def market():
+        return HistoricalMarketSnapshot(series, as_of)
+
+    for strategy in default_strategies():
+        name = type(strategy).__name__
+        results.append(measure(
+            f"{name}.filter_for_buy", size,
+            lambda strategy=strategy: strategy.filter_for_buy("KOR", price_cache=PriceCache(), market=market()),
+            repeat=repeat, calls=len(symbols), count=len,
+        ))
+        results.append(measure(
+            f"{name}.filter_for_sell", size,
+            lambda strategy=strategy: strategy.filter_for_sell(holdings, price_cache=PriceCache(), market=market()),
+            repeat=repeat, calls=len(holdings),
+        ))
+    results.append(measure(
+        "select_sell_stocks", size,
+        lambda: select_sell_stocks(holdings, price_cache=PriceCache(), market=market()),
+        repeat=repeat, calls=len(holdings),
+    ))
+
+    clear_store()
+    return results
@@ -1,4 +1,4 @@
 """외부 API 클라이언트 모듈"""
-from clients.kis import KISClient
+from clients.kis import KISClient, AsyncKISClient
 
-__all__ = ["KISClient"]
+__all__ = ["KISClient", "AsyncKISClient"]
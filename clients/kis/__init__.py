@@ -1,4 +1,5 @@
 """한국투자증권 API 클라이언트"""
 from clients.kis.client import KISClient
+from clients.kis.async_client import AsyncKISClient
 
-__all__ = ["KISClient"]
+__all__ = ["KISClient", "AsyncKISClient"]
@@ -3,6 +3,7 @@ from typing import Dict, Optional
 
 from core.async_auth import AsyncKISAuth
 from core.async_http_client import AsyncHttpClient
+from core.rate_limiter import get_kis_rate_limiter
 
 
 class AsyncKISBaseClient:
@@ -37,7 +38,7 @@ class AsyncKISBaseClient:
             self._http_client = http_client
             self._own_http_client = False
         else:
-            self._http_client = AsyncHttpClient()
+            self._http_client = AsyncHttpClient(rate_limiter=get_kis_rate_limiter(app_key))
             self._own_http_client = True
 
         if auth is not None:
@@ -92,6 +93,16 @@ class AsyncKISBaseClient:
         """비동기 GET 요청"""
         return await self._http_client.get(path, params, headers, error_log_prefix)
 
+    async def _get_raw(
+            self,
+            path: str,
+            params: Dict,
+            headers: Optional[Dict] = None,
+            error_log_prefix: str = "GET 요청 실패"
+    ):
+        """비동기 GET 요청 (Response 객체 반환, 연속조회 헤더 확인용)"""
+        return await self._http_client.get_raw(path, params, headers, error_log_prefix)
+
     async def _post(
             self,
             path: str,
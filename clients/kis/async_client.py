@@ -0,0 +1,211 @@
+"""KIS 통합 비동기 클라이언트"""
+import asyncio
+from typing import AsyncIterator, List, Union, Dict, Optional
+
+from core.async_http_client import AsyncHttpClient
+from core.async_auth import AsyncKISAuth
+from core.rate_limiter import KISRateLimiter, get_kis_rate_limiter
+from clients.kis.domestic.async_orders import AsyncDomesticOrderClient
+from clients.kis.domestic.async_accounts import AsyncDomesticAccountClient
+from clients.kis.domestic.async_quotes import AsyncDomesticQuoteClient
+from clients.kis.overseas.async_orders import AsyncOverseasOrderClient
+from clients.kis.overseas.async_accounts import AsyncOverseasAccountClient
+from clients.kis.market.async_holidays import AsyncHolidayClient
+from clients.kis.market.async_watchlist import AsyncWatchlistClient
+
+from data.dto.account_dto import AccountResponseDTO, StockResponseDTO, OverseesStockResponseDTO, convert_overseas_to_domestic
+from data.dto.holiday_dto import HolidayResponseDTO
+from data.dto.stock_trade_dto import StockTradeListResponseDTO, OverseasStockTradeListResponseDTO
+from data.dto.interest_stock_dto import InterestGroupListResponseDTO, InterestGroupDetailResponseDTO
+
+
+class AsyncKISClient:
+    """
+    KIS 통합 비동기 클라이언트 - KISClient와 같은 기능을 코루틴으로 제공
+
+    모든 기능별 클라이언트가 HTTP/2 클라이언트 하나와 인증 하나를 공유하므로, 한 이벤트 루프에서
+    동시에 보낸 요청이 연결 하나에 다중화된다. 호출 속도는 앱 키별 공유 제한기가 조절한다.
+
+    사용 예::
+
+        async with AsyncKISClient(app_key, app_secret, account_number, account_code) as ki_api:
+            stocks_held, account = await asyncio.gather(ki_api.get_owned_stock_info(), ki_api.get_account_info())
+    """
+
+    def __init__(
+            self,
+            app_key: str,
+            app_secret: str,
+            account_number: str,
+            account_code: str
+    ):
+        # 공유 인증 및 HTTP 클라이언트 (1회만 인증)
+        # 같은 앱 키를 쓰는 모든 클라이언트/계좌가 호출 예산을 공유
+        self._http = AsyncHttpClient(rate_limiter=get_kis_rate_limiter(app_key))
+        self._auth = AsyncKISAuth(app_key, app_secret, account_number, account_code, http_client=self._http)
+
+        # 공유 객체를 주입하여 기능별 클라이언트 초기화
+        credentials = (app_key, app_secret, account_number, account_code)
+        shared_deps = {
+            "auth": self._auth,
+            "http_client": self._http
+        }
+        self._domestic_order = AsyncDomesticOrderClient(*credentials, **shared_deps)
+        self._domestic_account = AsyncDomesticAccountClient(*credentials, **shared_deps)
+        self._domestic_quote = AsyncDomesticQuoteClient(*credentials, **shared_deps)
+        self._overseas_order = AsyncOverseasOrderClient(*credentials, **shared_deps)
+        self._overseas_account = AsyncOverseasAccountClient(*credentials, **shared_deps)
+        self._holiday = AsyncHolidayClient(*credentials, **shared_deps)
+        self._watchlist = AsyncWatchlistClient(*credentials, **shared_deps)
+
+        self.total_holidays = self._holiday.total_holidays
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self) -> None:
+        """공유 HTTP 연결 종료"""
+        await self._http.close()
+
+    @property
+    def account_number(self) -> str:
+        return self._auth.account_number
+
+    @property
+    def rate_limiter(self) -> KISRateLimiter:
+        """앱 키별 공유 호출 제한기"""
+        return self._http.rate_limiter
+
+    @property
+    def account_code(self) -> str:
+        return self._auth.account_code
+
+    async def buy(self, symbol: str, price: int, volume: int, order_type: str = "00") -> bool:
+        return await self._domestic_order.buy(symbol, price, volume, order_type)
+
+    async def buy_reserve(self, symbol: str, price: int, volume: int, end_date: str, order_type: str = "00") -> bool:
+        return await self._domestic_order.buy_reserve(symbol, price, volume, end_date, order_type)
+
+    async def sell(self, symbol: str, price: int, volume: int, order_type: str = "00") -> bool:
+        return await self._domestic_order.sell(symbol, price, volume, order_type)
+
+    async def sell_reserve(self, symbol: str, price: int, volume: int, end_date: str, order_type: str = "00") -> bool:
+        return await self._domestic_order.sell_reserve(symbol, price, volume, end_date, order_type)
+
+    async def get_current_price(self, symbol: str) -> Optional[int]:
+        return await self._domestic_quote.get_current_price(symbol)
+
+    async def get_account_info(self) -> Optional[AccountResponseDTO]:
+        return await self._domestic_account.get_account_info()
+
+    async def get_korea_owned_stock_info(self, symbol: str = None) -> Union[List[StockResponseDTO], StockResponseDTO, None]:
+        return await self._domestic_account.get_owned_stocks(symbol)
+
+    async def get_stock_order_list(
+            self,
+            start_date: str = None,
+            end_date: str = None
+    ) -> Optional[List[StockTradeListResponseDTO]]:
+        return await self._domestic_account.get_order_list(start_date, end_date)
+
+    def iter_stock_orders(
+            self,
+            start_date: str = None,
+            end_date: str = None
+    ) -> AsyncIterator[StockTradeListResponseDTO]:
+        return self._domestic_account.iter_orders(start_date, end_date)
+
+    async def submit_overseas_reservation_order(
+            self,
+            country: str,
+            action: str,
+            symbol: str,
+            volume: str,
+            price: str
+    ) -> Optional[Dict]:
+        return await self._overseas_order.submit_reservation_order(
+            country_code=country, symbol=symbol, action=action, price=price, volume=volume
+        )
+
+    async def get_oversea_owned_stock_info(
+            self,
+            country: str,
+            symbol: str = None
+    ) -> Union[List[OverseesStockResponseDTO], OverseesStockResponseDTO, None]:
+        return await self._overseas_account.get_owned_stocks(country, symbol)
+
+    async def get_overseas_stock_order_list(
+            self,
+            symbol: Optional[str] = None,
+            country: Optional[str] = None,
+            start_date: Optional[str] = None,
+            end_date: Optional[str] = None,
+    ) -> List[OverseasStockTradeListResponseDTO]:
+        return await self._overseas_account.get_order_list(symbol, country, start_date, end_date)
+
+    def iter_overseas_stock_orders(
+            self,
+            symbol: Optional[str] = None,
+            country: Optional[str] = None,
+            start_date: Optional[str] = None,
+            end_date: Optional[str] = None,
+    ) -> AsyncIterator[OverseasStockTradeListResponseDTO]:
+        return self._overseas_account.iter_orders(symbol, country, start_date, end_date)
+
+    async def get_owned_stock_info(self, symbol: str = None) -> Union[List[StockResponseDTO], StockResponseDTO, None]:
+        """국내/해외 주식 보유 정보를 조회하는 인터페이스 (전체 조회 시 국내/해외를 동시에 조회)"""
+        if symbol:
+            result = await self.get_korea_owned_stock_info(symbol)
+            if result:
+                return result
+            return await self.get_oversea_owned_stock_info(country='USA', symbol=symbol)
+
+        korea_list, oversea_raw = await asyncio.gather(
+            self.get_korea_owned_stock_info(),
+            self.get_oversea_owned_stock_info(country='USA'),
+        )
+
+        korea_list = korea_list or []
+        oversea_list = convert_overseas_to_domestic(oversea_raw or [])
+
+        return korea_list + oversea_list
+
+    async def get_domestic_market_holidays(self, date: str) -> Dict[str, HolidayResponseDTO]:
+        result = await self._holiday.get_holidays(date)
+        self.total_holidays.update(result)
+        return result
+
+    async def get_nth_open_day(self, nth_day: int) -> Optional[str]:
+        return await self._holiday.get_nth_open_day(nth_day)
+
+    async def check_holiday(self, date: str) -> bool:
+        return await self._holiday.check_holiday(date)
+
+    async def get_interest_group_list(
+            self,
+            user_id: str,
+            group_type: str = "1",
+            fid_etc_cls_code: str = "00",
+            custtype: str = "P"
+    ) -> Optional[InterestGroupListResponseDTO]:
+        return await self._watchlist.get_groups(user_id, group_type, fid_etc_cls_code, custtype)
+
+    async def get_interest_group_stocks(
+            self,
+            user_id: str,
+            inter_grp_code: str,
+            group_type: str = "1",
+            data_rank: str = "",
+            inter_grp_name: str = "",
+            hts_kor_isnm: str = "",
+            cntg_cls_code: str = "",
+            fid_etc_cls_code: str = "4",
+            custtype: str = "P"
+    ) -> Optional[InterestGroupDetailResponseDTO]:
+        return await self._watchlist.get_stocks_by_group(
+            user_id, inter_grp_code, group_type, data_rank,
+            inter_grp_name, hts_kor_isnm, cntg_cls_code, fid_etc_cls_code, custtype
+        )
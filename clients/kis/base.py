@@ -2,6 +2,7 @@
 from typing import Dict, Optional, Any
 
 from core.http_client import HttpClient
+from core.rate_limiter import get_kis_rate_limiter
 from core.auth import KISAuth
 
 
@@ -39,8 +40,8 @@ class KISBaseClient:
             self._headers = headers
         else:
             # 직접 생성 모드: 새 객체 생성
-            self._auth = KISAuth(app_key, app_secret, account_number, account_code)
-            self._http = HttpClient()
+            self._http = HttpClient(rate_limiter=get_kis_rate_limiter(app_key))
+            self._auth = KISAuth(app_key, app_secret, account_number, account_code, http_client=self._http)
             self._headers = self._auth.get_base_headers()
             self._http.set_headers(self._headers)
 
@@ -55,7 +56,8 @@ class KISBaseClient:
         return self._auth.account_code
 
     def _get_headers_with_tr_id(self, tr_id: str, use_prefix: bool = True) -> Dict[str, str]:
-        """거래 ID가 추가된 헤더 반환"""
+        """거래 ID가 추가된 헤더 반환 (토큰이 갱신되었으면 공유 헤더의 인증값도 교체)"""
+        self._headers["authorization"] = self._auth.ensure_valid_token()
         return self._auth.add_tr_id(self._headers, tr_id, use_prefix)
 
     def _get(
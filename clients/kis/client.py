@@ -1,7 +1,8 @@
 """KIS 통합 클라이언트"""
-from typing import List, Union, Dict, Optional
+from typing import Iterator, List, Union, Dict, Optional
 
 from core.http_client import HttpClient
+from core.rate_limiter import KISRateLimiter, get_kis_rate_limiter
 from core.auth import KISAuth
 from clients.kis.domestic.orders import DomesticOrderClient
 from clients.kis.domestic.accounts import DomesticAccountClient
@@ -28,8 +29,9 @@ class KISClient:
             account_code: str
     ):
         # 공유 인증 및 HTTP 클라이언트 (1회만 인증)
-        self._auth = KISAuth(app_key, app_secret, account_number, account_code)
-        self._http = HttpClient()
+        # 같은 앱 키를 쓰는 모든 클라이언트/계좌가 호출 예산을 공유
+        self._http = HttpClient(rate_limiter=get_kis_rate_limiter(app_key))
+        self._auth = KISAuth(app_key, app_secret, account_number, account_code, http_client=self._http)
         self._headers = self._auth.get_base_headers()
         self._http.set_headers(self._headers)
 
@@ -53,6 +55,11 @@ class KISClient:
     def account_number(self) -> str:
         return self._auth.account_number
 
+    @property
+    def rate_limiter(self) -> KISRateLimiter:
+        """앱 키별 공유 호출 제한기"""
+        return self._http.rate_limiter
+
     @property
     def account_code(self) -> str:
         return self._auth.account_code
@@ -85,6 +92,13 @@ class KISClient:
     ) -> Optional[List[StockTradeListResponseDTO]]:
         return self._domestic_account.get_order_list(start_date, end_date)
 
+    def iter_stock_orders(
+            self,
+            start_date: str = None,
+            end_date: str = None
+    ) -> Iterator[StockTradeListResponseDTO]:
+        return self._domestic_account.iter_orders(start_date, end_date)
+
     def submit_overseas_reservation_order(
             self,
             country: str,
@@ -93,7 +107,9 @@ class KISClient:
             volume: str,
             price: str
     ) -> Optional[Dict]:
-        return self._overseas_order.submit_reservation_order(country, action, symbol, volume, price)
+        return self._overseas_order.submit_reservation_order(
+            country_code=country, symbol=symbol, action=action, price=price, volume=volume
+        )
 
     def get_oversea_owned_stock_info(
             self,
@@ -111,6 +127,15 @@ class KISClient:
     ) -> List[OverseasStockTradeListResponseDTO]:
         return self._overseas_account.get_order_list(symbol, country, start_date, end_date)
 
+    def iter_overseas_stock_orders(
+            self,
+            symbol: Optional[str] = None,
+            country: Optional[str] = None,
+            start_date: Optional[str] = None,
+            end_date: Optional[str] = None,
+    ) -> Iterator[OverseasStockTradeListResponseDTO]:
+        return self._overseas_account.iter_orders(symbol, country, start_date, end_date)
+
     def get_owned_stock_info(self, symbol: str = None) -> Union[List[StockResponseDTO], StockResponseDTO, None]:
         """국내/해외 주식 보유 정보를 조회하는 인터페이스"""
         if symbol:
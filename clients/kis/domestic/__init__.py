@@ -2,5 +2,11 @@
 from clients.kis.domestic.orders import DomesticOrderClient
 from clients.kis.domestic.accounts import DomesticAccountClient
 from clients.kis.domestic.quotes import DomesticQuoteClient
+from clients.kis.domestic.async_orders import AsyncDomesticOrderClient
+from clients.kis.domestic.async_accounts import AsyncDomesticAccountClient
+from clients.kis.domestic.async_quotes import AsyncDomesticQuoteClient
 
-__all__ = ["DomesticOrderClient", "DomesticAccountClient", "DomesticQuoteClient"]
+__all__ = [
+    "DomesticOrderClient", "DomesticAccountClient", "DomesticQuoteClient",
+    "AsyncDomesticOrderClient", "AsyncDomesticAccountClient", "AsyncDomesticQuoteClient",
+]
@@ -1,6 +1,6 @@
 """국내주식 계좌/잔고 조회 API"""
 from datetime import datetime, timedelta
-from typing import List, Union, Optional
+from typing import Iterator, List, Union, Optional
 
 from clients.kis.base import KISBaseClient
 from config.logging_config import get_logger
@@ -74,26 +74,20 @@ class DomesticAccountClient(KISBaseClient):
             logger.critical(f"보유종목 예상치 못한 오류: {e}")
             return None
 
-    @retry_on_error(max_attempts=2, delay=1.0, exceptions=(APIError,))
-    def get_order_list(
+    def iter_orders(
             self,
             start_date: str = None,
             end_date: str = None
-    ) -> Optional[List[StockTradeListResponseDTO]]:
-        """국내주식 주문 내역 조회"""
-        try:
-            if not start_date:
-                start_date = (datetime.now() - timedelta(days=30)).strftime("%Y%m%d")
-            if not end_date:
-                end_date = datetime.now().strftime("%Y%m%d")
-        except Exception as e:
-            error = DataError("날짜 형식 처리 실패", original_error=e)
-            handle_error(error, context="DomesticAccountClient.get_order_list", should_raise=False)
-            return []
+    ) -> Iterator[StockTradeListResponseDTO]:
+        """
+        국내주식 체결 내역을 한 건씩 반환 (연속조회 페이지는 소비하는 만큼만 요청)
 
-        today = datetime.now().strftime("%Y%m%d")
-        start_date = start_date or today
-        end_date = end_date or today
+        :param start_date: 조회 시작일 (YYYYMMDD, 기본값: 30일 전)
+        :param end_date: 조회 종료일 (YYYYMMDD, 기본값: 오늘)
+        :raises APIError: 페이지 요청 또는 응답 파싱 실패
+        """
+        start_date = start_date or (datetime.now() - timedelta(days=30)).strftime("%Y%m%d")
+        end_date = end_date or datetime.now().strftime("%Y%m%d")
 
         ninety_days_ago = datetime.now() - timedelta(days=90)
         if datetime.strptime(end_date, "%Y%m%d") >= ninety_days_ago:
@@ -102,7 +96,6 @@ class DomesticAccountClient(KISBaseClient):
             tr_id = "CTSC9215R"
 
         headers = self._get_headers_with_tr_id(tr_id, use_prefix=False)
-        all_trades: List[StockTradeListResponseDTO] = []
         ctx_nk, ctx_fk = None, None
 
         while True:
@@ -122,22 +115,31 @@ class DomesticAccountClient(KISBaseClient):
                 headers
             )
             if not resp:
-                logger.critical("stock_order_list HTTP 요청 실패.")
-                return None
+                raise APIError("stock_order_list HTTP 요청 실패.")
 
             try:
-                items = resp.json().get("output1", [])
-                all_trades.extend(StockTradeListResponseDTO(**item) for item in items)
+                items = resp.json().get("output1", []) or []
+                trades = [StockTradeListResponseDTO(**item) for item in items]
             except Exception as e:
-                logger.critical(f"JSON 파싱 오류: {e} | 응답 본문: {resp.text}")
-                return None
+                raise APIError(f"JSON 파싱 오류: {e} | 응답 본문: {resp.text}", original_error=e)
 
-            tr_cont = resp.headers.get('tr_cont')
-            if tr_cont in ['F', 'M']:
-                ctx_nk = resp.headers.get('ctx_area_nk100')
-                ctx_fk = resp.headers.get('ctx_area_fk100')
-                continue
+            for trade in trades:
+                yield trade
 
-            break
+            if resp.headers.get('tr_cont') not in ['F', 'M']:
+                break
+            ctx_nk = resp.headers.get('ctx_area_nk100')
+            ctx_fk = resp.headers.get('ctx_area_fk100')
 
-        return all_trades
+    @retry_on_error(max_attempts=2, delay=1.0, exceptions=(APIError,))
+    def get_order_list(
+            self,
+            start_date: str = None,
+            end_date: str = None
+    ) -> Optional[List[StockTradeListResponseDTO]]:
+        """국내주식 주문 내역 조회 (전체 페이지를 모아서 반환)"""
+        try:
+            return list(self.iter_orders(start_date, end_date))
+        except APIError as e:
+            logger.critical(e.message)
+            return None
@@ -0,0 +1,143 @@
+"""국내주식 계좌/잔고 조회 API (비동기)"""
+from datetime import datetime, timedelta
+from typing import AsyncIterator, List, Union, Optional
+
+from clients.kis.async_base import AsyncKISBaseClient
+from config.logging_config import get_logger
+from core.decorators import retry_on_error
+from core.exceptions import APIError
+from data.dto.account_dto import (
+    InquireBalanceRequestDTO,
+    AccountResponseDTO,
+    StockResponseDTO,
+)
+from data.dto.stock_trade_dto import StockTradeListRequestDTO, StockTradeListResponseDTO
+
+logger = get_logger(__name__)
+
+
+class AsyncDomesticAccountClient(AsyncKISBaseClient):
+    """국내주식 계좌/잔고 조회 비동기 클라이언트"""
+
+    @retry_on_error(max_attempts=2, delay=1.0, exceptions=(APIError,))
+    async def _fetch_balance(self) -> Optional[dict]:
+        """잔고 조회 API 호출 (공통)"""
+        headers = await self._get_headers_with_tr_id("TTC8434R")
+        params = InquireBalanceRequestDTO(
+            cano=self.account_number,
+            acnt_prdt_cd=self.account_code,
+            inqr_dvsn="02"
+        ).__dict__
+        return await self._get("/uapi/domestic-stock/v1/trading/inquire-balance", params, headers)
+
+    async def get_account_info(self) -> Optional[AccountResponseDTO]:
+        """계좌 정보 조회"""
+        response_data = await self._fetch_balance()
+
+        if response_data:
+            try:
+                return AccountResponseDTO(**response_data.get("output2", [])[0])
+            except (KeyError, IndexError) as e:
+                logger.critical(f"계좌정보 파싱 오류 (KeyError/IndexError): {e}")
+                return None
+            except Exception as e:
+                logger.critical(f"계좌정보 예상치 못한 오류: {e}")
+                return None
+        else:
+            logger.critical("계좌정보 API 응답 없음")
+            return None
+
+    async def get_owned_stocks(self, symbol: str = None) -> Union[List[StockResponseDTO], StockResponseDTO, None]:
+        """국내주식 보유 종목 조회"""
+        response_data = await self._fetch_balance()
+
+        if not response_data:
+            return None
+
+        try:
+            stock_data = response_data.get("output1", [])
+            response_list = [StockResponseDTO(**item) for item in stock_data]
+
+            if symbol:
+                for item in response_list:
+                    if item.pdno == symbol:
+                        return item
+                return None
+            else:
+                return response_list
+        except KeyError as e:
+            logger.critical(f"보유종목 파싱 오류 (KeyError): {e}")
+            return None
+        except Exception as e:
+            logger.critical(f"보유종목 예상치 못한 오류: {e}")
+            return None
+
+    async def iter_orders(
+            self,
+            start_date: str = None,
+            end_date: str = None
+    ) -> AsyncIterator[StockTradeListResponseDTO]:
+        """
+        국내주식 체결 내역을 한 건씩 반환 (연속조회 페이지는 소비하는 만큼만 요청)
+
+        :param start_date: 조회 시작일 (YYYYMMDD, 기본값: 30일 전)
+        :param end_date: 조회 종료일 (YYYYMMDD, 기본값: 오늘)
+        :raises APIError: 페이지 요청 또는 응답 파싱 실패
+        """
+        start_date = start_date or (datetime.now() - timedelta(days=30)).strftime("%Y%m%d")
+        end_date = end_date or datetime.now().strftime("%Y%m%d")
+
+        ninety_days_ago = datetime.now() - timedelta(days=90)
+        if datetime.strptime(end_date, "%Y%m%d") >= ninety_days_ago:
+            tr_id = "TTTC0081R"
+        else:
+            tr_id = "CTSC9215R"
+
+        headers = await self._get_headers_with_tr_id(tr_id, use_prefix=False)
+        ctx_nk, ctx_fk = None, None
+
+        while True:
+            params = StockTradeListRequestDTO(
+                CANO=self.account_number,
+                ACNT_PRDT_CD=self.account_code,
+                INQR_STRT_DT=start_date,
+                INQR_END_DT=end_date,
+                CCLD_DVSN='01',
+                CTX_AREA_NK100=ctx_nk or '',
+                CTX_AREA_FK100=ctx_fk or '',
+            ).__dict__
+
+            resp = await self._get_raw(
+                "/uapi/domestic-stock/v1/trading/inquire-daily-ccld",
+                params,
+                headers
+            )
+            if not resp:
+                raise APIError("stock_order_list HTTP 요청 실패.")
+
+            try:
+                items = resp.json().get("output1", []) or []
+                trades = [StockTradeListResponseDTO(**item) for item in items]
+            except Exception as e:
+                raise APIError(f"JSON 파싱 오류: {e} | 응답 본문: {resp.text}", original_error=e)
+
+            for trade in trades:
+                yield trade
+
+            if resp.headers.get('tr_cont') not in ['F', 'M']:
+                break
+            ctx_nk = resp.headers.get('ctx_area_nk100')
+            ctx_fk = resp.headers.get('ctx_area_fk100')
+
+    @retry_on_error(max_attempts=2, delay=1.0, exceptions=(APIError,))
+    async def get_order_list(
+            self,
+            start_date: str = None,
+            end_date: str = None
+    ) -> Optional[List[StockTradeListResponseDTO]]:
+        """국내주식 주문 내역 조회 (전체 페이지를 모아서 반환)"""
+        try:
+            return [trade async for trade in self.iter_orders(start_date, end_date)]
+        except APIError as e:
+            logger.critical(e.message)
+            return None
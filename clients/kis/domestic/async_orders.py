@@ -0,0 +1,105 @@
+"""국내주식 주문 API (비동기)"""
+from typing import Dict
+
+from clients.kis.async_base import AsyncKISBaseClient
+from clients.kis.domestic.orders import DomesticOrderClient
+from config.logging_config import get_logger
+from core.validators import validate_symbol, validate_price, validate_volume, validate_order_type, ValidationError
+from core.exceptions import OrderError, InvalidOrderError
+from core.error_handler import handle_error
+
+logger = get_logger(__name__)
+
+
+class AsyncDomesticOrderClient(AsyncKISBaseClient):
+    """국내주식 주문 비동기 클라이언트"""
+
+    # 페이로드 구성은 동기 클라이언트와 동일
+    _create_order_payload = DomesticOrderClient._create_order_payload
+    _create_reserve_payload = DomesticOrderClient._create_reserve_payload
+
+    async def _send_order(self, endpoint: str, headers: Dict, payload: Dict) -> bool:
+        """주문 요청 전송"""
+        response = await self._post(endpoint, payload, headers)
+        if response:
+            if response.get("rt_cd") == "0":
+                logger.info("주문 처리 성공", endpoint=endpoint)
+                return True
+            else:
+                logger.error("주문 실패", response=response, endpoint=endpoint)
+        else:
+            logger.error("주문 처리 실패", endpoint=endpoint)
+        return False
+
+    async def buy(self, symbol: str, price: int, volume: int, order_type: str = "00") -> bool:
+        """매수 주문"""
+        try:
+            symbol = validate_symbol(symbol)
+            price = int(validate_price(price, min_value=0))
+            volume = validate_volume(volume, min_value=1)
+            order_type = validate_order_type(order_type)
+        except ValidationError as e:
+            error = InvalidOrderError(f"매수 주문 입력값 검증 실패: {symbol}", original_error=e)
+            handle_error(error, context="AsyncDomesticOrderClient.buy", should_raise=False)
+            return False
+
+        try:
+            headers = await self._get_headers_with_tr_id("TTC0012U")
+            order_payload = self._create_order_payload(symbol, price, volume, order_type)
+            return await self._send_order("/uapi/domestic-stock/v1/trading/order-cash", headers, order_payload)
+        except Exception as e:
+            error = OrderError(f"매수 주문 실행 실패: {symbol}", original_error=e)
+            handle_error(
+                error,
+                context="AsyncDomesticOrderClient.buy",
+                metadata={"symbol": symbol, "price": price, "volume": volume},
+                should_raise=False
+            )
+            return False
+
+    async def buy_reserve(self, symbol: str, price: int, volume: int, end_date: str, order_type: str = "00") -> bool:
+        """예약 매수 주문"""
+        try:
+            symbol = validate_symbol(symbol)
+            price = int(validate_price(price, min_value=0))
+            volume = validate_volume(volume, min_value=1)
+            order_type = validate_order_type(order_type)
+        except ValidationError as e:
+            logger.error(f"예약 매수 입력값 검증 실패: {e}")
+            return False
+
+        headers = await self._get_headers_with_tr_id("CTSC0008U", use_prefix=False)
+        logger.info(f"예약 매수: {symbol}, {price}, {volume}, {end_date}")
+        reserve_payload = self._create_reserve_payload(symbol, price, volume, end_date, order_type, "02")
+        return await self._send_order("/uapi/domestic-stock/v1/trading/order-resv", headers, reserve_payload)
+
+    async def sell(self, symbol: str, price: int, volume: int, order_type: str = "00") -> bool:
+        """매도 주문"""
+        try:
+            symbol = validate_symbol(symbol)
+            price = int(validate_price(price, min_value=0))
+            volume = validate_volume(volume, min_value=1)
+            order_type = validate_order_type(order_type)
+        except ValidationError as e:
+            logger.error(f"매도 주문 입력값 검증 실패: {e}")
+            return False
+
+        headers = await self._get_headers_with_tr_id("TTC0011U")
+        order_payload = self._create_order_payload(symbol, price, volume, order_type)
+        return await self._send_order("/uapi/domestic-stock/v1/trading/order-cash", headers, order_payload)
+
+    async def sell_reserve(self, symbol: str, price: int, volume: int, end_date: str, order_type: str = "00") -> bool:
+        """예약 매도 주문"""
+        try:
+            symbol = validate_symbol(symbol)
+            price = int(validate_price(price, min_value=0))
+            volume = validate_volume(volume, min_value=1)
+            order_type = validate_order_type(order_type)
+        except ValidationError as e:
+            logger.error(f"예약 매도 입력값 검증 실패: {e}")
+            return False
+
+        headers = await self._get_headers_with_tr_id("CTSC0008U", use_prefix=False)
+        logger.info(f"예약 매도: {symbol}, {price}, {volume}, {end_date}")
+        reserve_payload = self._create_reserve_payload(symbol, price, volume, end_date, order_type, "01")
+        return await self._send_order("/uapi/domestic-stock/v1/trading/order-resv", headers, reserve_payload)
@@ -1,5 +1,7 @@
 """시장 정보 API 모듈"""
 from clients.kis.market.holidays import HolidayClient
 from clients.kis.market.watchlist import WatchlistClient
+from clients.kis.market.async_holidays import AsyncHolidayClient
+from clients.kis.market.async_watchlist import AsyncWatchlistClient
 
-__all__ = ["HolidayClient", "WatchlistClient"]
+__all__ = ["HolidayClient", "WatchlistClient", "AsyncHolidayClient", "AsyncWatchlistClient"]
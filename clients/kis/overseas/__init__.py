@@ -1,5 +1,9 @@
 """해외주식 API 모듈"""
 from clients.kis.overseas.orders import OverseasOrderClient
 from clients.kis.overseas.accounts import OverseasAccountClient
+from clients.kis.overseas.async_orders import AsyncOverseasOrderClient
+from clients.kis.overseas.async_accounts import AsyncOverseasAccountClient
+from clients.kis.overseas.exchanges import ExchangeResolver, get_exchange_resolver
 
-__all__ = ["OverseasOrderClient", "OverseasAccountClient"]
+__all__ = ["OverseasOrderClient", "OverseasAccountClient", "AsyncOverseasOrderClient", "AsyncOverseasAccountClient",
+           "ExchangeResolver", "get_exchange_resolver"]
@@ -1,9 +1,12 @@
 """해외주식 계좌/잔고 조회 API"""
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Union, Optional
+from typing import Dict, Iterator, List, Union, Optional
 
 from clients.kis.base import KISBaseClient
+from clients.kis.overseas.exchanges import get_exchange_resolver, merge_exchange_holdings
 from config.logging_config import get_logger
+from core.exceptions import APIError
 from config.country_config import COUNTRY_CONFIG_ORDER
 from data.dto.account_dto import OverseesStockResponseDTO
 from data.dto.stock_trade_dto import OverseasStockTradeListRequestDTO, OverseasStockTradeListResponseDTO
@@ -14,13 +17,29 @@ logger = get_logger(__name__)
 class OverseasAccountClient(KISBaseClient):
     """해외주식 계좌/잔고 조회 클라이언트"""
 
+    def _fetch_exchange_holdings(self, params: Dict, exchange: str) -> List[OverseesStockResponseDTO]:
+        """거래소 하나의 보유 종목 조회"""
+        response_data = self._get(
+            '/uapi/overseas-stock/v1/trading/inquire-balance',
+            {**params, 'OVRS_EXCG_CD': exchange},
+            self._get_headers_with_tr_id("TTS3012R", use_prefix=True)
+        )
+        if not response_data:
+            return []
+        try:
+            return [OverseesStockResponseDTO(**item) for item in response_data.get("output1", []) or []]
+        except KeyError as e:
+            logger.error(f"해외보유종목 파싱 오류 (KeyError): {e}")
+        except Exception as e:
+            logger.error(f"해외보유종목 예상치 못한 오류: {e}")
+        return []
+
     def get_owned_stocks(
             self,
             country: str,
             symbol: str = None
     ) -> Union[List[OverseesStockResponseDTO], OverseesStockResponseDTO, None]:
-        """해외주식 보유 종목 조회"""
-        result = list()
+        """해외주식 보유 종목 조회 (거래소별 조회를 동시에 실행)"""
         country_code = country.upper()
         config = COUNTRY_CONFIG_ORDER.get(country_code)
         if not config:
@@ -36,26 +55,13 @@ class OverseasAccountClient(KISBaseClient):
         }
 
         ovrs_excg_cd = [x.strip() for x in config.get("ovrs_excg_cd").split(',')]
-
-        for exchange in ovrs_excg_cd:
-            params['OVRS_EXCG_CD'] = exchange
-            response_data = self._get(
-                '/uapi/overseas-stock/v1/trading/inquire-balance',
-                params,
-                self._get_headers_with_tr_id("TTS3012R", use_prefix=True)
-            )
-            if not response_data:
-                continue
-            try:
-                stock_data = response_data.get("output1", [])
-                if stock_data:
-                    result.extend([OverseesStockResponseDTO(**item) for item in stock_data])
-            except KeyError as e:
-                logger.error(f"해외보유종목 파싱 오류 (KeyError): {e}")
-                continue
-            except Exception as e:
-                logger.error(f"해외보유종목 예상치 못한 오류: {e}")
-                continue
+        # 단일 종목 조회는 색인에 있는 거래소 하나만 조회
+        exchange = get_exchange_resolver().get(symbol) if symbol else None
+        if exchange in ovrs_excg_cd:
+            ovrs_excg_cd = [exchange]
+        with ThreadPoolExecutor(max_workers=len(ovrs_excg_cd), thread_name_prefix="overseas-balance") as executor:
+            responses = list(executor.map(lambda exchange: self._fetch_exchange_holdings(params, exchange), ovrs_excg_cd))
+        result = merge_exchange_holdings(responses, ovrs_excg_cd)
 
         if symbol:
             for item in result:
@@ -65,22 +71,23 @@ class OverseasAccountClient(KISBaseClient):
 
         return result if result else None
 
-    def get_order_list(
+    def iter_orders(
             self,
             symbol: Optional[str] = None,
             country: Optional[str] = None,
             start_date: Optional[str] = None,
             end_date: Optional[str] = None,
-    ) -> List[OverseasStockTradeListResponseDTO]:
-        """해외주식 주문 내역 조회"""
+    ) -> Iterator[OverseasStockTradeListResponseDTO]:
+        """
+        해외주식 체결 내역을 한 건씩 반환 (연속조회 페이지는 소비하는 만큼만 요청)
+
+        :raises APIError: 페이지 요청 또는 응답 파싱 실패
+        """
         today = datetime.now().strftime("%Y%m%d")
         start_date = start_date or today
         end_date = end_date or today
 
-        tr_id = "TTS3035R"
-        headers = self._get_headers_with_tr_id(tr_id, use_prefix=True)
-
-        all_trades: List[OverseasStockTradeListResponseDTO] = []
+        headers = self._get_headers_with_tr_id("TTS3035R", use_prefix=True)
         ctx_nk, ctx_fk = None, None
 
         while True:
@@ -104,21 +111,34 @@ class OverseasAccountClient(KISBaseClient):
                 headers
             )
             if not resp:
-                logger.error("해외주문내역 HTTP 요청 실패")
-                break
+                raise APIError("해외주문내역 HTTP 요청 실패")
 
             try:
-                data = resp.json().get("output1", [])
-                all_trades.extend(OverseasStockTradeListResponseDTO(**item) for item in data)
+                data = resp.json().get("output1", []) or []
+                trades = [OverseasStockTradeListResponseDTO(**item) for item in data]
             except Exception as e:
-                logger.error(f"JSON 파싱 에러: {e}, 응답: {resp.text}")
-                break
+                raise APIError(f"JSON 파싱 에러: {e}, 응답: {resp.text}", original_error=e)
+
+            for trade in trades:
+                yield trade
 
-            tr_cont = resp.headers.get('tr_cont')
-            if tr_cont in ['F', 'M']:
-                ctx_nk = resp.headers.get('ctx_area_nk200')
-                ctx_fk = resp.headers.get('ctx_area_fk200')
-                continue
-            break
+            if resp.headers.get('tr_cont') not in ['F', 'M']:
+                break
+            ctx_nk = resp.headers.get('ctx_area_nk200')
+            ctx_fk = resp.headers.get('ctx_area_fk200')
 
+    def get_order_list(
+            self,
+            symbol: Optional[str] = None,
+            country: Optional[str] = None,
+            start_date: Optional[str] = None,
+            end_date: Optional[str] = None,
+    ) -> List[OverseasStockTradeListResponseDTO]:
+        """해외주식 주문 내역 조회 (실패 시 그때까지 받은 내역 반환)"""
+        all_trades: List[OverseasStockTradeListResponseDTO] = []
+        try:
+            for trade in self.iter_orders(symbol, country, start_date, end_date):
+                all_trades.append(trade)
+        except APIError as e:
+            logger.error(e.message)
         return all_trades
@@ -0,0 +1,145 @@
+"""해외주식 계좌/잔고 조회 API (비동기)"""
+import asyncio
+from datetime import datetime
+from typing import Dict, AsyncIterator, List, Union, Optional
+
+from clients.kis.async_base import AsyncKISBaseClient
+from clients.kis.overseas.exchanges import get_exchange_resolver, merge_exchange_holdings
+from config.logging_config import get_logger
+from core.exceptions import APIError
+from config.country_config import COUNTRY_CONFIG_ORDER
+from data.dto.account_dto import OverseesStockResponseDTO
+from data.dto.stock_trade_dto import OverseasStockTradeListRequestDTO, OverseasStockTradeListResponseDTO
+
+logger = get_logger(__name__)
+
+
+class AsyncOverseasAccountClient(AsyncKISBaseClient):
+    """해외주식 계좌/잔고 조회 비동기 클라이언트"""
+
+    async def _fetch_exchange_holdings(self, params: Dict, exchange: str) -> List[OverseesStockResponseDTO]:
+        """거래소 하나의 보유 종목 조회"""
+        response_data = await self._get(
+            '/uapi/overseas-stock/v1/trading/inquire-balance',
+            {**params, 'OVRS_EXCG_CD': exchange},
+            await self._get_headers_with_tr_id("TTS3012R", use_prefix=True)
+        )
+        if not response_data:
+            return []
+        try:
+            return [OverseesStockResponseDTO(**item) for item in response_data.get("output1", []) or []]
+        except KeyError as e:
+            logger.error(f"해외보유종목 파싱 오류 (KeyError): {e}")
+        except Exception as e:
+            logger.error(f"해외보유종목 예상치 못한 오류: {e}")
+        return []
+
+    async def get_owned_stocks(
+            self,
+            country: str,
+            symbol: str = None
+    ) -> Union[List[OverseesStockResponseDTO], OverseesStockResponseDTO, None]:
+        """해외주식 보유 종목 조회 (거래소별 조회를 동시에 실행)"""
+        country_code = country.upper()
+        config = COUNTRY_CONFIG_ORDER.get(country_code)
+        if not config:
+            logger.error(f"지원하지 않는 국가 코드: {country_code}")
+            return None
+
+        params = {
+            "CANO": self.account_number,
+            "ACNT_PRDT_CD": self.account_code,
+            "TR_CRCY_CD": config.get("tr_crcy_cd"),
+            "CTX_AREA_FK200": '',
+            "CTX_AREA_NK200": '',
+        }
+
+        ovrs_excg_cd = [x.strip() for x in config.get("ovrs_excg_cd").split(',')]
+        # 단일 종목 조회는 색인에 있는 거래소 하나만 조회
+        exchange = get_exchange_resolver().get(symbol) if symbol else None
+        if exchange in ovrs_excg_cd:
+            ovrs_excg_cd = [exchange]
+        responses = await asyncio.gather(
+            *(self._fetch_exchange_holdings(params, exchange) for exchange in ovrs_excg_cd)
+        )
+        result = merge_exchange_holdings(responses, ovrs_excg_cd)
+
+        if symbol:
+            for item in result:
+                if item.ovrs_pdno == symbol:
+                    return item
+            return None
+
+        return result if result else None
+
+    async def iter_orders(
+            self,
+            symbol: Optional[str] = None,
+            country: Optional[str] = None,
+            start_date: Optional[str] = None,
+            end_date: Optional[str] = None,
+    ) -> AsyncIterator[OverseasStockTradeListResponseDTO]:
+        """
+        해외주식 체결 내역을 한 건씩 반환 (연속조회 페이지는 소비하는 만큼만 요청)
+
+        :raises APIError: 페이지 요청 또는 응답 파싱 실패
+        """
+        today = datetime.now().strftime("%Y%m%d")
+        start_date = start_date or today
+        end_date = end_date or today
+
+        headers = await self._get_headers_with_tr_id("TTS3035R", use_prefix=True)
+        ctx_nk, ctx_fk = None, None
+
+        while True:
+            params = OverseasStockTradeListRequestDTO(
+                cano=self.account_number,
+                acnt_prdt_cd=self.account_code,
+                pdno=symbol or '%',
+                ord_strt_dt=start_date,
+                ord_end_dt=end_date,
+                sll_buy_dvsn='00',
+                ccld_nccs_dvsn='01',
+                ovrs_excg_cd=country or '%',
+                sort_sqn="DS",
+                ctx_area_nk200=ctx_nk or '',
+                ctx_area_fk200=ctx_fk or '',
+            ).__dict__
+
+            resp = await self._get_raw(
+                "/uapi/overseas-stock/v1/trading/inquire-ccnl",
+                params,
+                headers
+            )
+            if not resp:
+                raise APIError("해외주문내역 HTTP 요청 실패")
+
+            try:
+                data = resp.json().get("output1", []) or []
+                trades = [OverseasStockTradeListResponseDTO(**item) for item in data]
+            except Exception as e:
+                raise APIError(f"JSON 파싱 에러: {e}, 응답: {resp.text}", original_error=e)
+
+            for trade in trades:
+                yield trade
+
+            if resp.headers.get('tr_cont') not in ['F', 'M']:
+                break
+            ctx_nk = resp.headers.get('ctx_area_nk200')
+            ctx_fk = resp.headers.get('ctx_area_fk200')
+
+    async def get_order_list(
+            self,
+            symbol: Optional[str] = None,
+            country: Optional[str] = None,
+            start_date: Optional[str] = None,
+            end_date: Optional[str] = None,
+    ) -> List[OverseasStockTradeListResponseDTO]:
+        """해외주식 주문 내역 조회 (실패 시 그때까지 받은 내역 반환)"""
+        all_trades: List[OverseasStockTradeListResponseDTO] = []
+        try:
+            async for trade in self.iter_orders(symbol, country, start_date, end_date):
+                all_trades.append(trade)
+        except APIError as e:
+            logger.error(e.message)
+        return all_trades
@@ -0,0 +1,114 @@
+"""해외주식 주문 API (비동기)"""
+from typing import Dict, Optional
+
+from clients.kis.async_base import AsyncKISBaseClient
+from clients.kis.overseas.exchanges import SYMBOL_NOT_FOUND_MESSAGE, get_exchange_resolver
+from config.logging_config import get_logger
+from core.exceptions import InvalidOrderError
+from core.validators import validate_symbol, validate_price, validate_volume, ValidationError
+from core.error_handler import handle_error
+from config.country_config import COUNTRY_CONFIG_ORDER
+
+logger = get_logger(__name__)
+
+
+class AsyncOverseasOrderClient(AsyncKISBaseClient):
+    """해외주식 주문 비동기 클라이언트"""
+
+    async def submit_reservation_order(
+            self,
+            country_code: str,
+            symbol: str,
+            action: str,
+            price: float,
+            volume: int
+    ) -> Optional[Dict]:
+        """
+        해외주식 예약 주문을 제출한다.
+
+        종목의 거래소가 기록되어 있으면 그 거래소로 바로 보내고, 없으면 거래소 목록을 차례로 시도한다.
+
+        :param country_code: 국가코드
+        :param symbol: 종목코드
+        :param action: 매수/매도 (buy/sell)
+        :param price: 가격
+        :param volume: 수량
+        :return: 접수 응답 또는 None (입력값 오류 시 False)
+        """
+        try:
+            symbol = validate_symbol(symbol)
+            price = validate_price(price, min_value=0)
+            volume = validate_volume(volume, min_value=1)
+        except ValidationError as e:
+            error = InvalidOrderError(f"해외 예약 주문 입력값 검증 실패: {symbol}", original_error=e)
+            handle_error(error, context="AsyncOverseasOrderClient.submit_reservation_order", should_raise=False)
+            return False
+
+        config = COUNTRY_CONFIG_ORDER.get(country_code)
+        if not config:
+            error = InvalidOrderError(f"지원하지 않는 국가 코드: {country_code}")
+            handle_error(error, context="AsyncOverseasOrderClient.submit_reservation_order", should_raise=False)
+            return False
+
+        if action.lower() == 'buy':
+            tr_id = config.get("tr_id_buy")
+            sll_buy_dvsn_cd = config.get("sll_buy_dvsn_cd_buy")
+            ord_dvsn = config.get("ord_dvsn_buy")
+        elif action.lower() == 'sell':
+            tr_id = config.get("tr_id_sell")
+            sll_buy_dvsn_cd = config.get("sll_buy_dvsn_cd_sell")
+            ord_dvsn = config.get("ord_dvsn_sell")
+        else:
+            logger.error(f"잘못된 action: {action}. 'buy' 또는 'sell'이어야 합니다.")
+            return None
+
+        prdt_type_cd = config.get("prdt_type_cd")
+        ovrs_excg_cd = [x.strip() for x in config.get("ovrs_excg_cd").split(',')]
+        ord_dvsn = ord_dvsn if ord_dvsn else "00"
+        ovrs_rsvn_odno = config.get("ovrs_rsvn_odno")
+        rvse_cncl_dvsn_cd = config.get("RVSE_CNCL_DVSN_CD")
+        headers = await self._get_headers_with_tr_id(tr_id, use_prefix=True)
+
+        # 기록된 거래소가 있으면 그 거래소로 바로 주문하고, 없을 때만 거래소 순서대로 시도
+        resolver = get_exchange_resolver()
+        for exchange in resolver.candidates(symbol, ovrs_excg_cd):
+            payload = {
+                "CANO": self.account_number,
+                "ACNT_PRDT_CD": self.account_code,
+                "RVSE_CNCL_DVSN_CD": rvse_cncl_dvsn_cd,
+                "PDNO": symbol,
+                "OVRS_EXCG_CD": exchange,
+                "FT_ORD_QTY": volume,
+                "FT_ORD_UNPR3": price,
+                "ORD_DVSN": ord_dvsn,
+                "SLL_BUY_DVSN_CD": sll_buy_dvsn_cd,
+                "PRDT_TYPE_CD": prdt_type_cd,
+                "ORD_SVR_DVSN_CD": "0",
+                "OVRS_RSVN_ODNO": ovrs_rsvn_odno
+            }
+            payload = {k: v for k, v in payload.items() if v is not None}
+
+            response_data = await self._post(
+                "/uapi/overseas-stock/v1/trading/order-resv",
+                payload,
+                headers,
+                error_log_prefix="해외 예약 주문 API 요청 실패"
+            )
+
+            if not response_data:
+                continue
+
+            if SYMBOL_NOT_FOUND_MESSAGE in response_data.get('msg1', ''):
+                if resolver.get(symbol) == exchange:
+                    resolver.forget(symbol)
+                continue
+
+            # 종목 정보가 있는 거래소이므로 접수 여부와 관계없이 기록하고 다른 거래소는 시도하지 않음
+            resolver.remember(symbol, exchange)
+            if response_data.get("rt_cd") == "0":
+                logger.info("해외 예약 주문이 성공적으로 접수되었습니다.")
+                return response_data
+            logger.error(f"{symbol} 해외 예약 주문 실패: {response_data}")
+            break
+
+        return None
@@ -0,0 +1,86 @@
+"""해외 종목 거래소 캐시"""
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# 주문 API가 이 메시지를 내려주면 다른 거래소 상장 종목
+SYMBOL_NOT_FOUND_MESSAGE = '해당종목정보가 없습니다'
+
+
+class ExchangeResolver:
+    """
+    종목코드 → 해외거래소 코드(OVRS_EXCG_CD) 색인
+
+    예약 주문은 종목이 상장된 거래소로 보내야 접수되므로, 시작 시 stock 테이블의 거래소를
+    적재해 두고 주문 응답/잔고 조회로 확인된 거래소로 보정한다. 다음 주문은 그 거래소로 바로 보낸다.
+    """
+
+    def __init__(self):
+        self._exchanges: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def load(self, exchanges: Dict[str, str]) -> None:
+        """종목 목록에 기록된 거래소 일괄 적재 (시작 시/종목 목록 갱신 후)"""
+        with self._lock:
+            self._exchanges.update({symbol.upper(): exchange for symbol, exchange in exchanges.items() if exchange})
+        logger.info(f"해외 종목 거래소 색인 적재: {len(exchanges)}종목")
+
+    def get(self, symbol: str) -> Optional[str]:
+        return self._exchanges.get(symbol.upper())
+
+    def remember(self, symbol: str, exchange: str) -> None:
+        """확인된 거래소 기록"""
+        if not symbol or not exchange:
+            return
+        with self._lock:
+            self._exchanges[symbol.upper()] = exchange
+
+    def forget(self, symbol: str) -> None:
+        """잘못된 것으로 확인된 거래소 기록 삭제"""
+        with self._lock:
+            self._exchanges.pop(symbol.upper(), None)
+
+    def candidates(self, symbol: str, exchanges: Iterable[str]) -> List[str]:
+        """시도할 거래소 순서 (기록된 거래소 우선, 나머지는 설정 순서)"""
+        exchanges = list(exchanges)
+        known = self.get(symbol)
+        if known in exchanges:
+            return [known] + [exchange for exchange in exchanges if exchange != known]
+        return exchanges
+
+    def __len__(self) -> int:
+        return len(self._exchanges)
+
+
+_exchange_resolver: Optional[ExchangeResolver] = None
+_exchange_resolver_lock = threading.Lock()
+
+
+def get_exchange_resolver() -> ExchangeResolver:
+    """프로세스 공용 거래소 캐시"""
+    global _exchange_resolver
+    with _exchange_resolver_lock:
+        if _exchange_resolver is None:
+            _exchange_resolver = ExchangeResolver()
+        return _exchange_resolver
+
+
+def merge_exchange_holdings(responses: Iterable[List], exchanges: Iterable[str]) -> List:
+    """
+    거래소별 잔고 조회 결과 병합
+
+    거래소 코드에 따라 다른 거래소 보유분까지 함께 내려올 수 있으므로 (종목, 거래소) 기준으로
+    중복을 제거하고, 응답에 담긴 종목별 거래소를 캐시에 기록한다.
+    """
+    exchanges = set(exchanges)
+    resolver = get_exchange_resolver()
+    merged = {}
+    for holdings in responses:
+        for item in holdings:
+            merged.setdefault((item.ovrs_pdno, item.ovrs_excg_cd), item)
+            if item.ovrs_excg_cd in exchanges:
+                resolver.remember(item.ovrs_pdno, item.ovrs_excg_cd)
+    return list(merged.values())
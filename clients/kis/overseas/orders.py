@@ -2,6 +2,7 @@
 from typing import Dict
 
 from clients.kis.base import KISBaseClient
+from clients.kis.overseas.exchanges import SYMBOL_NOT_FOUND_MESSAGE, get_exchange_resolver
 from config.logging_config import get_logger
 from dtos.kis.overseas_order_dtos import OverseasReservationOrderRequestDTO
 from core.exceptions import OrderError, InvalidOrderError
@@ -59,7 +60,9 @@ class OverseasOrderClient(KISBaseClient):
         ovrs_rsvn_odno = config.get("ovrs_rsvn_odno")
         rvse_cncl_dvsn_cd = config.get("RVSE_CNCL_DVSN_CD")
 
-        for exchange in ovrs_excg_cd:
+        # 기록된 거래소가 있으면 그 거래소로 바로 주문하고, 없을 때만 거래소 순서대로 시도
+        resolver = get_exchange_resolver()
+        for exchange in resolver.candidates(symbol, ovrs_excg_cd):
             payload = {
                 "CANO": self.account_number,
                 "ACNT_PRDT_CD": self.account_code,
@@ -88,13 +91,17 @@ class OverseasOrderClient(KISBaseClient):
             if not response_data:
                 continue
 
+            if SYMBOL_NOT_FOUND_MESSAGE in response_data.get('msg1', ''):
+                if resolver.get(symbol) == exchange:
+                    resolver.forget(symbol)
+                continue
+
+            # 종목 정보가 있는 거래소이므로 접수 여부와 관계없이 기록하고 다른 거래소는 시도하지 않음
+            resolver.remember(symbol, exchange)
             if response_data.get("rt_cd") == "0":
                 logger.info("해외 예약 주문이 성공적으로 접수되었습니다.")
                 return response_data
-            else:
-                if '해당종목정보가 없습니다' in response_data.get('msg1', ''):
-                    continue
-                logger.error(f"{symbol} 해외 예약 주문 실패: {response_data}")
-                continue
+            logger.error(f"{symbol} 해외 예약 주문 실패: {response_data}")
+            break
 
         return None
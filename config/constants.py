@@ -5,6 +5,31 @@ MAX_WORKER_COUNT = 10
 BLACKLIST_RETENTION_DAYS = 30
 DEFAULT_PRICE_HISTORY_YEARS = 5
 DEFAULT_PRICE_HISTORY_DAYS = 365
+PRICE_PANEL_CHUNK_SIZE = 500  # 일괄 가격 조회 시 쿼리당 종목 수
+PRICE_GAP_LOOKBACK_DAYS = 30  # 가격 결측(gap) 탐지 기간
+PRICE_MARKET_DAY_MIN_COVERAGE = 0.5  # 최다 종목 수 대비 이 비율 이상이 적재된 날짜를 거래일로 간주
+PRICE_UPSERT_BATCH_ROWS = 5000  # 가격 수집 시 upsert 한 번에 모으는 행 수
+PRICE_BACKFILL_BATCH_ROWS = 50000  # 신규 종목 히스토리 백필 시 upsert 한 번에 모으는 행 수
+BULK_UPSERT_CHUNK_ROWS = 1000  # insert_many 한 번에 넣는 행 수 (쿼리 파라미터 수 제한)
+BULK_COPY_MIN_ROWS = 2000  # 이 이상이면 COPY + 임시 테이블 병합 사용 (PostgreSQL)
+PRICE_INGEST_MAX_ATTEMPTS = 3  # 종목별 가격 다운로드 최대 시도 횟수
+PRICE_INGEST_RETRY_DELAY = 1.0  # 첫 재시도 대기 시간 (초, 재시도마다 2배)
+STRATEGY_PARALLEL_MIN_SYMBOLS = 50  # 이보다 적으면 프로세스 풀 없이 순차 평가
+STRATEGY_PARALLEL_CHUNKS_PER_WORKER = 4  # 워커당 분할 청크 수
+TRADING_CALENDAR_HORIZON_DAYS = 120  # 거래일 달력을 미리 채워 두는 기간 (일)
+ORDER_HISTORY_INITIAL_DAYS = 90  # 주문 내역 최초 동기화 시 조회 기간 (일)
+ORDER_HISTORY_BATCH_ROWS = 500  # 주문 내역 동기화 시 upsert 한 번에 모으는 행 수
+MARKET_SNAPSHOT_TTL_SECONDS = 1800  # 시장 지표(VIX, 지수 추세, 환율) 스냅샷 유효 시간 (초)
+MARKET_SERIES_INITIAL_DAYS = 420  # 시장 지표 시계열 최초 적재 기간 (일, SMA200 계산에 충분한 거래일)
+MARKET_SERIES_STALE_SESSIONS = 2  # 마지막 적재일이 최근 거래일보다 이만큼 넘게 뒤처지면 로컬 시계열 대신 직접 조회
+BACKTEST_FEE_RATE = 0.00015  # 백테스트 체결 금액 대비 수수료 (매수/매도 각각)
+BACKTEST_BUY_ORDER_DAYS = {"KOR": 3, "USA": 1}  # 매수 주문 유효 거래일 수 (국내는 예약 주문 만료일과 동일)
+BACKTEST_SELL_ORDER_DAYS = 1  # 매도 주문 유효 거래일 수
+
+# 시장 지표 시계열 (FinanceDataReader 심볼)
+MARKET_INDEX_SYMBOLS = {"USA": "^GSPC", "KOR": "KS11"}
+MARKET_SERIES_CALENDARS = {"VIX": "USA", "^GSPC": "USA", "KS11": "KOR", "USD/KRW": "KOR"}  # 지표별 신선도 판단에 쓰는 거래일 달력
+MARKET_SERIES_SYMBOLS = ("VIX", "^GSPC", "KS11", "USD/KRW")
 
 # 국가별 정규식 패턴
 KOREAN_STOCK_PATTERN = r'(\d{5}[0-9KLMN])'
@@ -235,7 +235,11 @@ class StructuredLogger:
             full_message = message
         
         self.logger.log(level, full_message, extra=kwargs)
-    
+
+    def log(self, level: int, message: str, **kwargs):
+        """레벨을 지정한 로그 출력 (logging.Logger.log 호환)"""
+        self._log(level, message, **kwargs)
+
     def debug(self, message: str, **kwargs):
         self._log(logging.DEBUG, message, **kwargs)
     
@@ -72,6 +72,16 @@ DISCORD_ERROR_URL = get_env("DISCORD_ERROR_URL")
 SIMULATE = get_env("SIMULATE", "true").lower() not in ['false', 'f']
 TR_ID = "V" if SIMULATE else "T"
 DOMAIN = "https://openapivts.koreainvestment.com:29443" if SIMULATE else "https://openapi.koreainvestment.com:9443"
+# KIS API 앱 키별 초당 요청 수 (실전 계좌 한도 20건, 모의투자 2건 기준으로 여유를 둠)
+KIS_REQUESTS_PER_SECOND = float(get_env("KIS_REQUESTS_PER_SECOND", "2" if SIMULATE else "18"))
+# 엔드포인트 분류별 초당 요청 수 (0이면 앱 키 전체 한도만 적용)
+KIS_ORDER_REQUESTS_PER_SECOND = float(get_env("KIS_ORDER_REQUESTS_PER_SECOND", "0"))
+KIS_ACCOUNT_REQUESTS_PER_SECOND = float(get_env("KIS_ACCOUNT_REQUESTS_PER_SECOND", "0"))
+KIS_QUOTE_REQUESTS_PER_SECOND = float(get_env("KIS_QUOTE_REQUESTS_PER_SECOND", "0"))
+# 동시에 진행하는 주문 요청 수 (실제 전송 속도는 위 호출 제한이 결정)
+ORDER_DISPATCH_CONCURRENCY = int(get_env("ORDER_DISPATCH_CONCURRENCY", "8"))
+# KIS 접근 토큰 공유 저장소 디렉터리 (같은 호스트의 프로세스/워커가 토큰 하나를 공유)
+KIS_TOKEN_STORE_DIR = get_env("KIS_TOKEN_STORE_DIR", ".kis_tokens")
 APP_KEY_KOR = get_env("APP_KEY_KOR")
 APP_SECRET_KOR = get_env("APP_SECRET_KOR")
 ACCOUNT_NUMBER_KOR = get_env("ACCOUNT_NUMBER_KOR")
@@ -92,7 +102,18 @@ validate_api_credentials(APP_KEY_ETF, APP_SECRET_ETF, "ETF")
 
 HTS_ID_ETF = get_env("HTS_ID_ETF")
 
+# 가격 히스토리 로컬 저장소 (Arrow 파일 캐시)
+PRICE_STORE_DIR = get_env("PRICE_STORE_DIR", "price_store")
+
+# 가격 수집 소스별 동시 요청 수 / 초당 요청 수 (KOR: NAVER, USA: 해외 시세 소스)
+PRICE_INGEST_CONCURRENCY_KOR = int(get_env("PRICE_INGEST_CONCURRENCY_KOR", "8"))
+PRICE_INGEST_RATE_KOR = float(get_env("PRICE_INGEST_RATE_KOR", "10"))
+PRICE_INGEST_CONCURRENCY_USA = int(get_env("PRICE_INGEST_CONCURRENCY_USA", "4"))
+PRICE_INGEST_RATE_USA = float(get_env("PRICE_INGEST_RATE_USA", "5"))
+
 # 매매 전략 관련
 EQUITY_USD = get_env("EQUITY_USD")
+STRATEGY_PROCESS_WORKERS = int(get_env("STRATEGY_PROCESS_WORKERS", "1"))  # 2 이상이면 매수 평가를 프로세스 풀로 분산
+BACKTEST_SWEEP_WORKERS = int(get_env("BACKTEST_SWEEP_WORKERS", str(os.cpu_count() or 1)))  # 파라미터 탐색 워커 프로세스 수
 # 주요 환경 변수 로그
 logger.info("환경 변수가 성공적으로 로드되었습니다.")
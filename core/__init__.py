@@ -11,6 +11,7 @@ from core.exceptions import (
 )
 from core.validators import ValidationError
 from core.decorators import retry_on_error, log_execution, measure_time
+from core.rate_limiter import KISRateLimiter, TokenBucket, get_kis_rate_limiter
 from core.error_handler import ErrorHandler, get_error_handler, handle_error
 
 __all__ = [
@@ -26,6 +27,9 @@ __all__ = [
     "retry_on_error",
     "log_execution",
     "measure_time",
+    "TokenBucket",
+    "KISRateLimiter",
+    "get_kis_rate_limiter",
     "ErrorHandler",
     "get_error_handler",
     "handle_error",
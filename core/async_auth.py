@@ -1,12 +1,16 @@
 """비동기 KIS API 인증 관리"""
+import asyncio
+import logging
 from datetime import datetime, timedelta
 from typing import Dict, Optional
 
 from config import setting_env
 from config.logging_config import get_logger
 from core.async_http_client import AsyncHttpClient
+from core.rate_limiter import get_kis_rate_limiter
 from core.exceptions import AuthenticationError, APIError
 from core.decorators import retry_on_error, log_execution
+from core.token_store import FileTokenStore, StoredToken, get_token_store
 
 # 토큰 만료 전 갱신 여유 시간 (초)
 TOKEN_REFRESH_BUFFER_SECONDS = 300
@@ -23,7 +27,8 @@ class AsyncKISAuth:
             app_secret: str,
             account_number: str,
             account_code: str,
-            http_client: Optional[AsyncHttpClient] = None
+            http_client: Optional[AsyncHttpClient] = None,
+            token_store: Optional[FileTokenStore] = None
     ):
         """
         :param app_key: 앱 키
@@ -31,17 +36,22 @@ class AsyncKISAuth:
         :param account_number: 계좌번호
         :param account_code: 계좌코드
         :param http_client: HTTP 클라이언트 (None이면 자체 생성)
+        :param token_store: 프로세스 간 공유 토큰 저장소 (기본값: get_token_store())
         """
         self._app_key = app_key
         self._app_secret = app_secret
         self._account_number = account_number
         self._account_code = account_code
-        self._http_client = http_client or AsyncHttpClient()
+        self._http_client = http_client or AsyncHttpClient(rate_limiter=get_kis_rate_limiter(app_key))
         self._own_http_client = http_client is None
 
         self._access_token: Optional[str] = None
         self._token_type: Optional[str] = None
         self._token_expires_at: Optional[datetime] = None
+        # 여러 코루틴이 동시에 만료를 발견해도 토큰은 한 번만 발급
+        self._token_lock = asyncio.Lock()
+        self._token_store = token_store or get_token_store()
+        self._background_issuer = None
 
     @property
     def app_key(self) -> str:
@@ -65,19 +75,59 @@ class AsyncKISAuth:
             return False
         return datetime.now() < (self._token_expires_at - timedelta(seconds=TOKEN_REFRESH_BUFFER_SECONDS))
 
+    def _use_token(self, token: StoredToken) -> str:
+        self._access_token = token.access_token
+        self._token_type = token.token_type
+        self._token_expires_at = token.expires_at
+        return token.authorization
+
+    def _background_issue(self) -> StoredToken:
+        """백그라운드 갱신용 동기 발급 (타이머 스레드에는 이벤트 루프가 없으므로 동기 클라이언트 사용)"""
+        if self._background_issuer is None:
+            from core.auth import KISAuth
+            self._background_issuer = KISAuth(
+                self._app_key, self._app_secret, self._account_number, self._account_code,
+                token_store=self._token_store
+            )
+        return self._background_issuer._issue_token()
+
     @retry_on_error(max_attempts=2, delay=2.0, exceptions=(APIError,))
     @log_execution(level=logging.INFO)
     async def authenticate(self, force: bool = False) -> str:
         """
         API 인증을 수행하고 Authorization 헤더 값을 반환
 
-        :param force: 강제 재인증 여부
+        공유 토큰 저장소에 유효한 토큰이 있으면 발급 없이 사용하고, 없을 때만 저장소 잠금을
+        잡은 상태에서 새로 발급해 저장한다.
+
+        :param force: 강제 재인증 여부 (저장소 토큰이 현재 토큰과 같으면 새로 발급)
         :return: "Bearer {access_token}" 형식의 인증 헤더 값
         :raises AuthenticationError: 인증 실패 시
         """
         if not force and self.is_token_valid():
             return f"{self._token_type} {self._access_token}"
 
+        async with self._token_store.lock_async(self._app_key):
+            token = self._token_store.load(self._app_key)
+            reusable = (
+                token is not None
+                and token.remaining_seconds() > TOKEN_REFRESH_BUFFER_SECONDS
+                and not (force and token.access_token == self._access_token)
+            )
+            if not reusable:
+                token = await self._issue_token()
+                self._token_store.save(self._app_key, token)
+                logger.info(f"토큰 발급 완료. 만료: {token.expires_at.strftime('%Y-%m-%d %H:%M:%S')}")
+
+        self._token_store.schedule_refresh(self._app_key, token, self._background_issue)
+        return self._use_token(token)
+
+    async def _issue_token(self) -> StoredToken:
+        """
+        토큰 발급 API 호출 (저장소 잠금 안에서만 호출)
+
+        :raises AuthenticationError: 발급 실패 시
+        """
         auth_header = {
             "Content-Type": "application/json",
             "appkey": self._app_key,
@@ -100,19 +150,21 @@ class AsyncKISAuth:
             raise AuthenticationError("API 인증 요청 실패", original_error=e)
 
         if response and "access_token" in response and "token_type" in response:
-            self._access_token = response["access_token"]
-            self._token_type = response["token_type"]
             expires_in = response.get("expires_in", 86400)
-            self._token_expires_at = datetime.now() + timedelta(seconds=expires_in)
-            logger.info(f"토큰 발급 완료. 만료: {self._token_expires_at.strftime('%Y-%m-%d %H:%M:%S')}")
-            return f"{self._token_type} {self._access_token}"
-        else:
-            raise AuthenticationError("인증 응답이 유효하지 않습니다.")
+            return StoredToken(
+                token_type=response["token_type"],
+                access_token=response["access_token"],
+                expires_at=datetime.now() + timedelta(seconds=expires_in),
+            )
+        raise AuthenticationError("인증 응답이 유효하지 않습니다.")
 
     async def ensure_valid_token(self) -> str:
         """토큰이 유효한지 확인하고, 만료되었으면 갱신"""
         if not self.is_token_valid():
-            return await self.authenticate(force=True)
+            async with self._token_lock:
+                # 대기하는 동안 다른 코루틴이 갱신했으면 그 토큰을 사용
+                if not self.is_token_valid():
+                    return await self.authenticate(force=True)
         return f"{self._token_type} {self._access_token}"
 
     async def get_base_headers(self) -> Dict[str, str]:
@@ -1,7 +1,7 @@
 """비동기 HTTP 클라이언트"""
+import asyncio
 import urllib.parse
 from typing import Dict, Optional, Tuple
-import asyncio
 
 import httpx
 
@@ -14,9 +14,7 @@ from core.exceptions import (
     APIResponseError,
     NetworkError,
 )
-
-# API 요청 간 대기 시간 (초)
-API_REQUEST_DELAY = 0.5
+from core.rate_limiter import KISRateLimiter, build_kis_rate_limiter
 
 logger = get_logger(__name__)
 
@@ -27,6 +25,9 @@ DEFAULT_TIMEOUT: Tuple[int, int] = (10, 30)
 MAX_RETRY_COUNT = 3
 RATE_LIMIT_STATUS_CODE = 429
 
+# 타임아웃/연결 실패 후 재시도 대기 시간 (초, 시도마다 증가)
+RETRY_BACKOFF_SECONDS = 0.5
+
 # 민감한 파라미터 (로그 마스킹)
 SENSITIVE_PARAMS = ["appkey", "appsecret", "password", "token", "authorization"]
 
@@ -38,38 +39,51 @@ class AsyncHttpClient:
             self,
             base_url: str = None,
             headers: Optional[Dict[str, str]] = None,
-            request_delay: float = API_REQUEST_DELAY,
             timeout: Tuple[int, int] = DEFAULT_TIMEOUT,
-            verify_ssl: bool = True
+            verify_ssl: bool = True,
+            rate_limiter: Optional[KISRateLimiter] = None
     ):
         """
         :param base_url: API 기본 URL
         :param headers: 기본 헤더
-        :param request_delay: API 요청 간 대기 시간 (초)
         :param timeout: (connect_timeout, read_timeout)
         :param verify_ssl: SSL 인증서 검증 여부
+        :param rate_limiter: 앱 키별 공유 제한기 (get_kis_rate_limiter, 없으면 단독 제한기 생성)
         """
         self._base_url = base_url or setting_env.DOMAIN
         self._headers = headers or {}
-        self._request_delay = request_delay
+        self._rate_limiter = rate_limiter or build_kis_rate_limiter()
         self._timeout = httpx.Timeout(timeout[0], read=timeout[1])
         self._verify_ssl = verify_ssl
         self._client: Optional[httpx.AsyncClient] = None
 
     async def __aenter__(self):
         """컨텍스트 매니저 진입"""
-        self._client = httpx.AsyncClient(
-            base_url=self._base_url,
-            timeout=self._timeout,
-            verify=self._verify_ssl,
-            http2=True  # HTTP/2 지원
-        )
+        self._ensure_client()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """컨텍스트 매니저 종료"""
-        if self._client:
-            await self._client.aclose()
+        await self.close()
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        """
+        공유 httpx 클라이언트 반환 (없으면 생성)
+
+        await 없이 확인/생성하므로 동시에 호출한 코루틴도 같은 클라이언트(HTTP/2 연결 하나)를 쓴다.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout,
+                verify=self._verify_ssl,
+                http2=True  # HTTP/2 지원 (요청을 연결 하나에 다중화)
+            )
+        return self._client
+
+    @property
+    def rate_limiter(self) -> KISRateLimiter:
+        """앱 키별 공유 호출 제한기"""
+        return self._rate_limiter
 
     def set_headers(self, headers: Dict[str, str]) -> None:
         """헤더 설정"""
@@ -126,18 +140,15 @@ class AsyncHttpClient:
         url = f"{self._base_url}{path}"
         effective_headers = headers if headers is not None else self._headers
 
-        if not self._client:
-            self._client = httpx.AsyncClient(
-                timeout=self._timeout,
-                verify=self._verify_ssl,
-                http2=True
-            )
+        client = self._ensure_client()
 
         last_exception = None
         for attempt in range(MAX_RETRY_COUNT):
-            await asyncio.sleep(self._request_delay)
+            if attempt:
+                await asyncio.sleep(RETRY_BACKOFF_SECONDS * attempt)
+            await self._rate_limiter.acquire_async(path)
             try:
-                resp = await self._client.get(
+                resp = await client.get(
                     url,
                     params=params,
                     headers=effective_headers
@@ -219,18 +230,15 @@ class AsyncHttpClient:
         full_url = f"{self._base_url}{path}"
         effective_headers = headers if headers is not None else self._headers
 
-        if not self._client:
-            self._client = httpx.AsyncClient(
-                timeout=self._timeout,
-                verify=self._verify_ssl,
-                http2=True
-            )
+        client = self._ensure_client()
 
         last_exception = None
         for attempt in range(MAX_RETRY_COUNT):
-            await asyncio.sleep(self._request_delay)
+            if attempt:
+                await asyncio.sleep(RETRY_BACKOFF_SECONDS * attempt)
+            await self._rate_limiter.acquire_async(path)
             try:
-                response = await self._client.post(
+                response = await client.post(
                     full_url,
                     json=payload,
                     headers=effective_headers
@@ -6,8 +6,10 @@ from typing import Dict, Optional
 from config import setting_env
 from config.logging_config import get_logger
 from core.http_client import HttpClient
+from core.rate_limiter import get_kis_rate_limiter
 from core.exceptions import AuthenticationError, APIError
 from core.decorators import retry_on_error, log_execution
+from core.token_store import FileTokenStore, StoredToken, get_token_store
 
 # 토큰 만료 전 갱신 여유 시간 (초)
 TOKEN_REFRESH_BUFFER_SECONDS = 300
@@ -24,16 +26,21 @@ class KISAuth:
             app_secret: str,
             account_number: str,
             account_code: str,
-            http_client: Optional[HttpClient] = None
+            http_client: Optional[HttpClient] = None,
+            token_store: Optional[FileTokenStore] = None
     ):
+        """
+        :param token_store: 프로세스 간 공유 토큰 저장소 (기본값: get_token_store())
+        """
         self._app_key = app_key
         self._app_secret = app_secret
         self._account_number = account_number
         self._account_code = account_code
-        self._http_client = http_client or HttpClient()
+        self._http_client = http_client or HttpClient(rate_limiter=get_kis_rate_limiter(app_key))
         self._access_token: Optional[str] = None
         self._token_type: Optional[str] = None
         self._token_expires_at: Optional[datetime] = None
+        self._token_store = token_store or get_token_store()
 
     @property
     def app_key(self) -> str:
@@ -54,13 +61,22 @@ class KISAuth:
         # 만료 시간 전 버퍼 시간을 두고 갱신
         return datetime.now() < (self._token_expires_at - timedelta(seconds=TOKEN_REFRESH_BUFFER_SECONDS))
 
+    def _use_token(self, token: StoredToken) -> str:
+        self._access_token = token.access_token
+        self._token_type = token.token_type
+        self._token_expires_at = token.expires_at
+        return token.authorization
+
     @retry_on_error(max_attempts=2, delay=2.0, exceptions=(APIError,))
     @log_execution(level=logging.INFO)
     def authenticate(self, force: bool = False) -> str:
         """
         API 인증을 수행하고 Authorization 헤더 값을 반환한다.
 
-        :param force: 강제 재인증 여부
+        공유 토큰 저장소에 유효한 토큰이 있으면 발급 없이 사용하고, 없을 때만 저장소 잠금을
+        잡은 상태에서 새로 발급해 저장한다. 발급/재사용한 토큰은 만료 전에 백그라운드에서 갱신된다.
+
+        :param force: 강제 재인증 여부 (저장소 토큰이 현재 토큰과 같으면 새로 발급)
         :return: "Bearer {access_token}" 형식의 인증 헤더 값
         :raises AuthenticationError: 인증 실패 시
         """
@@ -68,6 +84,27 @@ class KISAuth:
         if not force and self.is_token_valid():
             return f"{self._token_type} {self._access_token}"
 
+        with self._token_store.lock(self._app_key):
+            token = self._token_store.load(self._app_key)
+            reusable = (
+                token is not None
+                and token.remaining_seconds() > TOKEN_REFRESH_BUFFER_SECONDS
+                and not (force and token.access_token == self._access_token)
+            )
+            if not reusable:
+                token = self._issue_token()
+                self._token_store.save(self._app_key, token)
+                logger.info(f"토큰 발급 완료. 만료: {token.expires_at.strftime('%Y-%m-%d %H:%M:%S')}")
+
+        self._token_store.schedule_refresh(self._app_key, token, self._issue_token)
+        return self._use_token(token)
+
+    def _issue_token(self) -> StoredToken:
+        """
+        토큰 발급 API 호출 (저장소 잠금 안에서만 호출)
+
+        :raises AuthenticationError: 발급 실패 시
+        """
         auth_header = {
             "Content-Type": "application/json",
             "appkey": self._app_key,
@@ -78,7 +115,7 @@ class KISAuth:
             "appkey": self._app_key,
             "appsecret": self._app_secret
         }
-        
+
         try:
             response = self._http_client.post(
                 "/oauth2/tokenP",
@@ -90,15 +127,14 @@ class KISAuth:
             raise AuthenticationError("API 인증 요청 실패", original_error=e)
 
         if response and "access_token" in response and "token_type" in response:
-            self._access_token = response["access_token"]
-            self._token_type = response["token_type"]
             # 토큰 만료 시간 저장 (기본 24시간, API 응답에 expires_in이 있으면 사용)
             expires_in = response.get("expires_in", 86400)
-            self._token_expires_at = datetime.now() + timedelta(seconds=expires_in)
-            logger.info(f"토큰 발급 완료. 만료: {self._token_expires_at.strftime('%Y-%m-%d %H:%M:%S')}")
-            return f"{self._token_type} {self._access_token}"
-        else:
-            raise AuthenticationError("인증 응답이 유효하지 않습니다.")
+            return StoredToken(
+                token_type=response["token_type"],
+                access_token=response["access_token"],
+                expires_at=datetime.now() + timedelta(seconds=expires_in),
+            )
+        raise AuthenticationError("인증 응답이 유효하지 않습니다.")
 
     def ensure_valid_token(self) -> str:
         """토큰이 유효한지 확인하고, 만료되었으면 갱신한다."""
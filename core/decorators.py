@@ -1,5 +1,7 @@
-"""데코레이터 모음"""
+"""데코레이터 모음 (동기 함수와 코루틴 함수 모두 지원)"""
+import asyncio
 import functools
+import inspect
 import logging
 import time
 from typing import Callable, Type, Tuple, Optional
@@ -29,10 +31,47 @@ def retry_on_error(
     :param on_retry: 재시도 전 실행할 콜백 함수
     """
     def decorator(func: Callable) -> Callable:
+        def next_wait(attempt: int, e: Exception, current_delay: float) -> float:
+            """재시도 대기 시간 계산 (마지막 시도면 예외를 그대로 raise)"""
+            if attempt == max_attempts:
+                logger.error(f"{func.__name__} 최대 재시도 횟수({max_attempts}) 도달. 실패.")
+                raise e
+
+            # RateLimitError의 경우 retry_after 사용
+            if isinstance(e, RateLimitError) and e.retry_after:
+                wait_time = e.retry_after
+            else:
+                wait_time = current_delay
+
+            logger.warning(
+                f"{func.__name__} 실패 (시도 {attempt}/{max_attempts}): "
+                f"{type(e).__name__}: {e}. {wait_time:.1f}초 후 재시도"
+            )
+
+            # 콜백 실행
+            if on_retry:
+                on_retry(attempt, e)
+            return wait_time
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                current_delay = delay
+                for attempt in range(1, max_attempts + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except exclude_exceptions as e:
+                        logger.error(f"{func.__name__} 재시도 제외 예외 발생: {type(e).__name__}: {e}")
+                        raise
+                    except exceptions as e:
+                        await asyncio.sleep(next_wait(attempt, e, current_delay))
+                        current_delay *= backoff
+
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             current_delay = delay
-            last_exception = None
 
             for attempt in range(1, max_attempts + 1):
                 try:
@@ -42,33 +81,9 @@ def retry_on_error(
                     logger.error(f"{func.__name__} 재시도 제외 예외 발생: {type(e).__name__}: {e}")
                     raise
                 except exceptions as e:
-                    last_exception = e
-                    if attempt == max_attempts:
-                        logger.error(f"{func.__name__} 최대 재시도 횟수({max_attempts}) 도달. 실패.")
-                        raise
-                    
-                    # RateLimitError의 경우 retry_after 사용
-                    if isinstance(e, RateLimitError) and e.retry_after:
-                        wait_time = e.retry_after
-                    else:
-                        wait_time = current_delay
-
-                    logger.warning(
-                        f"{func.__name__} 실패 (시도 {attempt}/{max_attempts}): "
-                        f"{type(e).__name__}: {e}. {wait_time:.1f}초 후 재시도"
-                    )
-
-                    # 콜백 실행
-                    if on_retry:
-                        on_retry(attempt, e)
-
-                    time.sleep(wait_time)
+                    time.sleep(next_wait(attempt, e, current_delay))
                     current_delay *= backoff
 
-            # 이 지점에 도달하면 모든 시도 실패
-            if last_exception:
-                raise last_exception
-
         return wrapper
     return decorator
 
@@ -81,10 +96,9 @@ def log_execution(level: int = logging.INFO, include_args: bool = False):
     :param include_args: 인자 포함 여부
     """
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            func_name = func.__name__
-            
+        func_name = func.__name__
+
+        def log_start(args, kwargs) -> None:
             if include_args:
                 args_repr = [repr(a) for a in args]
                 kwargs_repr = [f"{k}={v!r}" for k, v in kwargs.items()]
@@ -93,6 +107,24 @@ def log_execution(level: int = logging.INFO, include_args: bool = False):
             else:
                 logger.log(level, f"{func_name} 시작")
 
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                log_start(args, kwargs)
+                start_time = time.time()
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as e:
+                    logger.error(f"{func_name} 실패 ({time.time() - start_time:.2f}초): {type(e).__name__}: {e}")
+                    raise
+                logger.log(level, f"{func_name} 완료 ({time.time() - start_time:.2f}초)")
+                return result
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            log_start(args, kwargs)
             start_time = time.time()
             try:
                 result = func(*args, **kwargs)
@@ -110,6 +142,15 @@ def log_execution(level: int = logging.INFO, include_args: bool = False):
 
 def measure_time(func: Callable) -> Callable:
     """함수 실행 시간을 측정하는 데코레이터"""
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            start_time = time.time()
+            result = await func(*args, **kwargs)
+            logger.debug(f"{func.__name__} 실행 시간: {time.time() - start_time:.4f}초")
+            return result
+        return async_wrapper
+
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         start_time = time.time()
@@ -128,6 +169,16 @@ def suppress_errors(default_return=None, log_level: int = logging.ERROR):
     :param log_level: 로깅 레벨
     """
     def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    logger.log(log_level, f"{func.__name__} 에러 억제됨: {type(e).__name__}: {e}")
+                    return default_return
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             try:
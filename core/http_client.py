@@ -5,6 +5,7 @@ from time import sleep
 from typing import Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from config import setting_env
 from config.logging_config import get_logger
@@ -15,9 +16,7 @@ from core.exceptions import (
     APIResponseError,
     NetworkError,
 )
-
-# API 요청 간 대기 시간 (초) - Rate Limit 방지
-API_REQUEST_DELAY = 0.5
+from core.rate_limiter import KISRateLimiter, build_kis_rate_limiter
 
 logger = get_logger(__name__)
 
@@ -28,25 +27,75 @@ DEFAULT_TIMEOUT: Tuple[int, int] = (10, 30)
 MAX_RETRY_COUNT = 3
 RATE_LIMIT_STATUS_CODE = 429
 
+# 타임아웃/연결 실패 후 재시도 대기 시간 (초, 시도마다 증가)
+RETRY_BACKOFF_SECONDS = 0.5
+
+# 세션 커넥션 풀 크기 (호스트 수 / 호스트당 유지 연결 수)
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+
 # 로깅에서 마스킹할 민감 파라미터
 SENSITIVE_PARAMS = {'appkey', 'appsecret', 'APP_KEY', 'APP_SECRET', 'password', 'token'}
 
 
+def build_session(pool_connections: int = POOL_CONNECTIONS, pool_maxsize: int = POOL_MAXSIZE) -> requests.Session:
+    """keep-alive 커넥션 풀을 쓰는 Session 생성 (재시도는 HttpClient가 직접 처리)"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 class HttpClient:
-    """KIS API HTTP 요청을 처리하는 기본 클라이언트"""
+    """
+    KIS API HTTP 요청을 처리하는 기본 클라이언트
+
+    Session 하나로 TCP/TLS 연결을 재사용하며, 요청 전 KIS 제한기에서 경로 분류별 호출 예산을 얻는다.
+    예산이 남아 있으면 대기 없이 바로 요청한다.
+    """
 
     def __init__(
             self,
             base_url: str = None,
-            request_delay: float = API_REQUEST_DELAY,
             timeout: Tuple[int, int] = DEFAULT_TIMEOUT,
-            verify_ssl: bool = True
+            verify_ssl: bool = True,
+            rate_limiter: Optional[KISRateLimiter] = None,
+            session: Optional[requests.Session] = None
     ):
+        """
+        :param base_url: API 기본 URL
+        :param timeout: (connect_timeout, read_timeout)
+        :param verify_ssl: SSL 인증서 검증 여부
+        :param rate_limiter: 앱 키별 공유 제한기 (get_kis_rate_limiter, 없으면 단독 제한기 생성)
+        :param session: 공유할 Session (주입 시)
+        """
         self._base_url = base_url or setting_env.DOMAIN
         self._headers: Dict[str, str] = {}
-        self._request_delay = request_delay
+        self._rate_limiter = rate_limiter or build_kis_rate_limiter()
         self._timeout = timeout
         self._verify_ssl = verify_ssl
+        self._session = session or build_session()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """커넥션 풀 정리"""
+        self._session.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """공유 가능한 Session"""
+        return self._session
+
+    @property
+    def rate_limiter(self) -> KISRateLimiter:
+        """호출 제한기 (통계 조회용)"""
+        return self._rate_limiter
 
     def set_headers(self, headers: Dict[str, str]) -> None:
         """기본 헤더 설정"""
@@ -113,9 +162,11 @@ class HttpClient:
 
         last_exception = None
         for attempt in range(MAX_RETRY_COUNT):
-            sleep(self._request_delay)
+            if attempt:
+                sleep(RETRY_BACKOFF_SECONDS * attempt)
+            self._rate_limiter.acquire(path)
             try:
-                resp = requests.get(
+                resp = self._session.get(
                     url,
                     headers=effective_headers,
                     timeout=self._timeout,
@@ -202,9 +253,11 @@ class HttpClient:
 
         last_exception = None
         for attempt in range(MAX_RETRY_COUNT):
-            sleep(self._request_delay)
+            if attempt:
+                sleep(RETRY_BACKOFF_SECONDS * attempt)
+            self._rate_limiter.acquire(path)
             try:
-                response = requests.post(
+                response = self._session.post(
                     full_url,
                     json=payload,
                     headers=effective_headers,
@@ -0,0 +1,187 @@
+"""호출 속도 제한 (토큰 버킷, KIS 앱 키별 공유 제한기)"""
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+from config import setting_env
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# KIS 엔드포인트 분류 (경로에 포함된 문자열 기준, 먼저 일치하는 분류 적용)
+KIS_ENDPOINT_CLASSES = (
+    ("order", "/trading/order"),
+    ("account", "/trading/inquire"),
+    ("quote", "/quotations/"),
+    ("auth", "/oauth2/"),
+)
+DEFAULT_ENDPOINT_CLASS = "default"
+# KIS 버킷 순간 허용량 (1이면 호출이 1/rate초 간격으로 퍼져 어떤 1초 구간에도 초당 한도를 넘지 않음)
+KIS_BUCKET_CAPACITY = 1.0
+
+
+class TokenBucket:
+    """
+    토큰 버킷 기반 속도 제한기
+
+    초당 rate개씩 토큰이 충전되고 최대 capacity개까지 쌓인다. 토큰이 부족하면 미리 예약한 뒤
+    부족분이 충전될 때까지 기다리므로, 동시에 여러 호출자가 대기해도 요청 간격이 균등하게 유지된다.
+    스레드와 코루틴에서 함께 사용할 수 있다.
+
+    버킷은 가득 찬 상태로 시작하므로 한 1초 구간에 최대 capacity + rate개가 통과할 수 있다.
+    초 단위 한도를 정확히 지켜야 하는 API(KIS 등)는 capacity=1로 만든다.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        """
+        :param rate: 초당 허용 호출 수 (0 이하이면 제한 없음)
+        :param capacity: 순간 허용 호출 수 (기본값: max(1, rate), 유휴 후 이만큼 연속 통과)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _reserve(self, tokens: float) -> float:
+        """토큰을 예약하고 대기해야 할 시간(초) 반환"""
+        with self._lock:
+            self.acquired += 1
+            if self.rate <= 0:
+                return 0.0
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            wait = -self._tokens / self.rate
+            self.throttled += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            return wait
+
+    def stats(self) -> Dict[str, float]:
+        """획득/대기 통계"""
+        with self._lock:
+            return {
+                "acquired": self.acquired,
+                "throttled": self.throttled,
+                "total_wait": round(self.total_wait, 3),
+                "max_wait": round(self.max_wait, 3),
+            }
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """토큰 획득 (필요하면 블로킹 대기), 대기한 시간(초) 반환"""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """토큰 획득 (비동기 대기), 대기한 시간(초) 반환"""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+def classify_kis_endpoint(path: str) -> str:
+    """KIS API 경로의 엔드포인트 분류 (order/account/quote/auth/default)"""
+    for endpoint_class, marker in KIS_ENDPOINT_CLASSES:
+        if marker in path:
+            return endpoint_class
+    return DEFAULT_ENDPOINT_CLASS
+
+
+class KISRateLimiter:
+    """
+    KIS 앱 키 하나의 호출 예산
+
+    앱 키 전체 한도(total) 버킷과 엔드포인트 분류별 버킷을 함께 둔다. 요청은 분류 버킷과
+    전체 버킷에서 차례로 토큰을 얻으므로, 같은 앱 키를 쓰는 모든 하위 클라이언트/계좌가
+    전체 한도를 나눠 쓰면서 주문 등 특정 분류만 따로 더 낮게 제한할 수 있다.
+    모든 버킷은 순간 허용량 KIS_BUCKET_CAPACITY로 만들어 동시 주문도 초당 한도 안에서 균등하게 나간다.
+    """
+
+    def __init__(self, total_rate: float, class_rates: Optional[Dict[str, float]] = None):
+        """
+        :param total_rate: 앱 키 전체 초당 요청 수
+        :param class_rates: 분류별 초당 요청 수 (0 이하 또는 생략 시 전체 한도만 적용)
+        """
+        self.total = TokenBucket(total_rate, capacity=KIS_BUCKET_CAPACITY)
+        self.classes: Dict[str, TokenBucket] = {
+            endpoint_class: TokenBucket(rate, capacity=KIS_BUCKET_CAPACITY)
+            for endpoint_class, rate in (class_rates or {}).items()
+        }
+        self._classes_lock = threading.Lock()
+
+    def _class_bucket(self, endpoint_class: str) -> TokenBucket:
+        with self._classes_lock:
+            if endpoint_class not in self.classes:
+                self.classes[endpoint_class] = TokenBucket(0)
+            return self.classes[endpoint_class]
+
+    def acquire(self, path: str) -> float:
+        """경로에 해당하는 분류/전체 토큰 획득 (블로킹), 대기한 시간(초) 반환"""
+        endpoint_class = classify_kis_endpoint(path)
+        wait = self._class_bucket(endpoint_class).acquire() + self.total.acquire()
+        if wait > 0:
+            logger.debug(f"KIS 호출 제한 대기: {endpoint_class} {wait:.3f}초")
+        return wait
+
+    async def acquire_async(self, path: str) -> float:
+        """경로에 해당하는 분류/전체 토큰 획득 (비동기), 대기한 시간(초) 반환"""
+        endpoint_class = classify_kis_endpoint(path)
+        wait = await self._class_bucket(endpoint_class).acquire_async() + await self.total.acquire_async()
+        if wait > 0:
+            logger.debug(f"KIS 호출 제한 대기: {endpoint_class} {wait:.3f}초")
+        return wait
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """전체/분류별 획득·제한·대기 통계"""
+        with self._classes_lock:
+            buckets = dict(self.classes)
+        result = {"total": self.total.stats()}
+        result.update({endpoint_class: bucket.stats() for endpoint_class, bucket in sorted(buckets.items())})
+        return result
+
+    def log_stats(self, label: str = "") -> None:
+        """호출 제한 통계 로깅"""
+        for name, stat in self.stats().items():
+            if stat["acquired"]:
+                logger.info(
+                    f"KIS 호출 제한 통계{f' ({label})' if label else ''} [{name}]: 요청 {stat['acquired']}, "
+                    f"대기 {stat['throttled']}회, 누적 {stat['total_wait']}초, 최대 {stat['max_wait']}초"
+                )
+
+
+_kis_limiters: Dict[str, KISRateLimiter] = {}
+_kis_limiters_lock = threading.Lock()
+
+
+def build_kis_rate_limiter() -> KISRateLimiter:
+    """설정값으로 KIS 제한기 생성"""
+    return KISRateLimiter(
+        setting_env.KIS_REQUESTS_PER_SECOND,
+        {
+            "order": setting_env.KIS_ORDER_REQUESTS_PER_SECOND,
+            "account": setting_env.KIS_ACCOUNT_REQUESTS_PER_SECOND,
+            "quote": setting_env.KIS_QUOTE_REQUESTS_PER_SECOND,
+        },
+    )
+
+
+def get_kis_rate_limiter(app_key: Optional[str]) -> KISRateLimiter:
+    """앱 키별 공유 KIS 제한기 (앱 키가 없으면 공유하지 않는 새 제한기)"""
+    if not app_key:
+        return build_kis_rate_limiter()
+    with _kis_limiters_lock:
+        if app_key not in _kis_limiters:
+            _kis_limiters[app_key] = build_kis_rate_limiter()
+        return _kis_limiters[app_key]
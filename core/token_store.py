@@ -0,0 +1,197 @@
+"""KIS 접근 토큰 공유 저장소 (프로세스 간 파일 캐시 + 만료 전 백그라운드 갱신)
+
+앱 키(와 접속 도메인)마다 JSON 파일 하나에 토큰을 저장한다::
+
+    {KIS_TOKEN_STORE_DIR}/{sha256(domain|app_key)[:32]}.json
+
+발급은 같은 이름의 ``.lock`` 파일에 배타 잠금(fcntl.flock)을 건 상태에서만 하므로, 여러 프로세스/워커가
+동시에 만료를 발견해도 한 곳만 발급하고 나머지는 저장된 토큰을 읽어 간다. 토큰 파일은 소유자만 읽을 수 있다.
+"""
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없이 프로세스 내 잠금만 사용
+    fcntl = None
+
+from config import setting_env
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# 만료 몇 초 전에 백그라운드에서 새 토큰을 발급할지
+TOKEN_REFRESH_AHEAD_SECONDS = 3600
+# 백그라운드 갱신 실패 시 재시도 간격 (초)
+TOKEN_REFRESH_RETRY_SECONDS = 60
+
+
+@dataclass(frozen=True)
+class StoredToken:
+    """저장된 접근 토큰"""
+    token_type: str
+    access_token: str
+    expires_at: datetime
+
+    @property
+    def authorization(self) -> str:
+        """Authorization 헤더 값"""
+        return f"{self.token_type} {self.access_token}"
+
+    def remaining_seconds(self) -> float:
+        return (self.expires_at - datetime.now()).total_seconds()
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "token_type": self.token_type,
+            "access_token": self.access_token,
+            "expires_at": self.expires_at.isoformat(),
+        })
+
+    @classmethod
+    def from_json(cls, raw: str) -> "StoredToken":
+        data = json.loads(raw)
+        return cls(data["token_type"], data["access_token"], datetime.fromisoformat(data["expires_at"]))
+
+
+class FileTokenStore:
+    """앱 키별 토큰 파일 저장소"""
+
+    def __init__(self, directory: str = None):
+        """
+        :param directory: 토큰 파일 디렉터리 (기본값: KIS_TOKEN_STORE_DIR)
+        """
+        self._directory = Path(directory or setting_env.KIS_TOKEN_STORE_DIR)
+        self._thread_locks: Dict[str, threading.Lock] = {}
+        self._thread_locks_guard = threading.Lock()
+        self._timers: Dict[str, threading.Timer] = {}
+
+    def _key(self, app_key: str) -> str:
+        # 파일 이름에 앱 키가 드러나지 않도록 해시 사용
+        return hashlib.sha256(f"{setting_env.DOMAIN}|{app_key}".encode()).hexdigest()[:32]
+
+    def path(self, app_key: str) -> Path:
+        """토큰 파일 경로"""
+        return self._directory / f"{self._key(app_key)}.json"
+
+    def load(self, app_key: str) -> Optional[StoredToken]:
+        """저장된 토큰 (없거나 손상되었으면 None)"""
+        try:
+            return StoredToken.from_json(self.path(app_key).read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"토큰 저장소 파일 손상, 무시: {e}")
+            return None
+
+    def save(self, app_key: str, token: StoredToken) -> None:
+        """토큰 저장 (임시 파일 기록 후 교체, 소유자 전용 권한)"""
+        path = self.path(app_key)
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                f.write(token.to_json())
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # 저장 실패 시에도 발급한 토큰은 현재 프로세스에서 계속 사용
+            logger.warning(f"토큰 저장 실패: {e}")
+
+    def _thread_lock(self, app_key: str) -> threading.Lock:
+        with self._thread_locks_guard:
+            return self._thread_locks.setdefault(app_key, threading.Lock())
+
+    def _acquire(self, app_key: str):
+        self._thread_lock(app_key).acquire()
+        if fcntl is None:
+            return None
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            handle = open(self.path(app_key).with_suffix(".lock"), "a")
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            return handle
+        except OSError as e:
+            logger.warning(f"토큰 저장소 잠금 실패, 프로세스 내 잠금만 사용: {e}")
+            return None
+
+    def _release(self, app_key: str, handle) -> None:
+        try:
+            if handle is not None:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+                handle.close()
+        finally:
+            self._thread_lock(app_key).release()
+
+    @contextlib.contextmanager
+    def lock(self, app_key: str):
+        """앱 키별 발급 잠금 (스레드/프로세스 간 배타)"""
+        handle = self._acquire(app_key)
+        try:
+            yield
+        finally:
+            self._release(app_key, handle)
+
+    @contextlib.asynccontextmanager
+    async def lock_async(self, app_key: str):
+        """앱 키별 발급 잠금 (대기는 스레드에서 수행해 이벤트 루프를 막지 않음)"""
+        handle = await asyncio.to_thread(self._acquire, app_key)
+        try:
+            yield
+        finally:
+            self._release(app_key, handle)
+
+    def schedule_refresh(self, app_key: str, token: StoredToken, issue: Callable[[], StoredToken]) -> None:
+        """
+        만료 TOKEN_REFRESH_AHEAD_SECONDS초 전에 백그라운드에서 토큰 갱신 예약 (앱 키당 타이머 하나)
+
+        :param issue: 새 토큰을 발급하는 동기 함수
+        """
+        delay = max(0.0, token.remaining_seconds() - TOKEN_REFRESH_AHEAD_SECONDS)
+        self._start_timer(app_key, delay, issue)
+
+    def _start_timer(self, app_key: str, delay: float, issue: Callable[[], StoredToken]) -> None:
+        timer = threading.Timer(delay, self._refresh, args=(app_key, issue))
+        timer.daemon = True
+        with self._thread_locks_guard:
+            previous = self._timers.get(app_key)
+            if previous is not None:
+                previous.cancel()
+            self._timers[app_key] = timer
+        timer.start()
+
+    def _refresh(self, app_key: str, issue: Callable[[], StoredToken]) -> None:
+        """예약된 갱신 실행 (다른 프로세스가 이미 갱신했으면 그 토큰의 만료에 맞춰 다시 예약)"""
+        try:
+            with self.lock(app_key):
+                token = self.load(app_key)
+                if token is None or token.remaining_seconds() <= TOKEN_REFRESH_AHEAD_SECONDS:
+                    token = issue()
+                    self.save(app_key, token)
+                    logger.info(f"토큰 백그라운드 갱신 완료. 만료: {token.expires_at.strftime('%Y-%m-%d %H:%M:%S')}")
+        except Exception as e:
+            logger.warning(f"토큰 백그라운드 갱신 실패, {TOKEN_REFRESH_RETRY_SECONDS}초 후 재시도: {e}")
+            self._start_timer(app_key, TOKEN_REFRESH_RETRY_SECONDS, issue)
+            return
+        self.schedule_refresh(app_key, token, issue)
+
+
+_token_store: Optional[FileTokenStore] = None
+_token_store_lock = threading.Lock()
+
+
+def get_token_store() -> FileTokenStore:
+    """프로세스 공용 토큰 저장소"""
+    global _token_store
+    with _token_store_lock:
+        if _token_store is None:
+            _token_store = FileTokenStore()
+        return _token_store
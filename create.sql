@@ -4,6 +4,31 @@ CREATE TABLE public.blacklist (
 	CONSTRAINT blacklist_pkey PRIMARY KEY (symbol)
 );
 
+CREATE TABLE public.market_series (
+	series varchar NOT NULL,
+	"date" date NOT NULL,
+	"close" numeric(20, 4) NOT NULL,
+	sma50 numeric(20, 4) NULL,
+	sma200 numeric(20, 4) NULL,
+	CONSTRAINT market_series_pkey PRIMARY KEY (series, date)
+);
+
+CREATE TABLE public.order_history (
+	account varchar NOT NULL,
+	country varchar NOT NULL,
+	order_date date NOT NULL,
+	order_no varchar NOT NULL,
+	symbol varchar NOT NULL,
+	side varchar NOT NULL,
+	order_quantity int4 NOT NULL,
+	filled_quantity int4 NOT NULL,
+	filled_price numeric(20, 4) NULL,
+	filled_amount numeric(20, 4) NULL,
+	order_time varchar NULL,
+	CONSTRAINT order_history_pkey PRIMARY KEY (account, country, order_date, order_no)
+);
+CREATE INDEX order_history_symbol_order_date ON public.order_history USING btree (symbol, order_date);
+
 CREATE TABLE public.price_history (
 	symbol varchar NOT NULL,
 	"date" date NOT NULL,
@@ -26,6 +51,13 @@ CREATE TABLE public.price_history_us (
 	CONSTRAINT price_history_us_pkey PRIMARY KEY (symbol, date)
 );
 
+CREATE TABLE public.trading_calendar (
+	country varchar NOT NULL,
+	"date" date NOT NULL,
+	is_open bool NOT NULL,
+	CONSTRAINT trading_calendar_pkey PRIMARY KEY (country, date)
+);
+
 CREATE TABLE public.sell_queue (
 	id bigserial NOT NULL,
 	symbol varchar NOT NULL,
@@ -38,8 +70,10 @@ CREATE TABLE public.stock (
 	symbol varchar NOT NULL,
 	company_name varchar NOT NULL,
 	country varchar NULL,
+	exchange varchar NULL,
 	CONSTRAINT stock_pkey PRIMARY KEY (symbol)
 );
+CREATE INDEX stock_exchange ON public.stock USING btree (exchange);
 
 CREATE TABLE public.stop_loss (
 	symbol varchar NOT NULL,
@@ -30,6 +30,7 @@ class Stock(Model):
     symbol = CharField(primary_key=True)
     company_name = CharField()
     country = CharField(null=True)
+    exchange = CharField(null=True, index=True)
 
     class Meta:
         database = db
@@ -81,6 +82,59 @@ class PriceHistoryUS(Model):
         )
 
 
+class TradingDay(Model):
+    country = CharField()
+    date = DateField()
+    is_open = BooleanField()
+
+    class Meta:
+        database = db
+        table_name = 'trading_calendar'
+        primary_key = False
+        indexes = (
+            (('country', 'date'), True),
+        )
+
+
+class MarketSeries(Model):
+    series = CharField()
+    date = DateField()
+    close = DecimalField(max_digits=20, decimal_places=4)
+    sma50 = DecimalField(max_digits=20, decimal_places=4, null=True)
+    sma200 = DecimalField(max_digits=20, decimal_places=4, null=True)
+
+    class Meta:
+        database = db
+        table_name = 'market_series'
+        primary_key = False
+        indexes = (
+            (('series', 'date'), True),
+        )
+
+
+class OrderHistory(Model):
+    account = CharField()
+    country = CharField()
+    order_date = DateField()
+    order_no = CharField()
+    symbol = CharField()
+    side = CharField()
+    order_quantity = IntegerField()
+    filled_quantity = IntegerField()
+    filled_price = DecimalField(max_digits=20, decimal_places=4, null=True)
+    filled_amount = DecimalField(max_digits=20, decimal_places=4, null=True)
+    order_time = CharField(null=True)
+
+    class Meta:
+        database = db
+        table_name = 'order_history'
+        primary_key = False
+        indexes = (
+            (('account', 'country', 'order_date', 'order_no'), True),
+            (('symbol', 'order_date'), False),
+        )
+
+
 class SellQueue(Model):
     symbol = CharField()
     volume = IntegerField()
@@ -1,12 +1,20 @@
 """데이터 접근 계층"""
 from repositories.stock_repository import StockRepository
 from repositories.price_repository import PriceRepository
+from repositories.price_store import PriceStore
 from repositories.subscription_repository import SubscriptionRepository
 from repositories.blacklist_repository import BlacklistRepository
+from repositories.calendar_repository import TradingCalendarRepository
+from repositories.order_history_repository import OrderHistoryRepository
+from repositories.market_series_repository import MarketSeriesRepository
 
 __all__ = [
     "StockRepository",
     "PriceRepository",
+    "PriceStore",
     "SubscriptionRepository",
     "BlacklistRepository",
+    "TradingCalendarRepository",
+    "OrderHistoryRepository",
+    "MarketSeriesRepository",
 ]
@@ -0,0 +1,142 @@
+"""거래일 달력 데이터 접근"""
+import datetime
+from typing import Dict, Optional, Set
+
+from dateutil.easter import easter
+from dateutil.relativedelta import relativedelta, MO, TH
+
+from config import setting_env
+from config.constants import TRADING_CALENDAR_HORIZON_DAYS
+from config.logging_config import get_logger
+from core.exceptions import DatabaseError
+from data.models import TradingDay
+from utils.data_util import bulk_upsert
+
+logger = get_logger(__name__)
+
+
+class TradingCalendarRepository:
+    """거래일 달력 Repository"""
+
+    @staticmethod
+    def get_days(country: str, start: datetime.date = None) -> Dict[datetime.date, bool]:
+        """국가별 저장된 날짜의 개장 여부 {date: is_open} (start 이후)"""
+        query = TradingDay.select(TradingDay.date, TradingDay.is_open).where(TradingDay.country == country.upper())
+        if start is not None:
+            query = query.where(TradingDay.date >= start)
+        return {row.date: row.is_open for row in query.order_by(TradingDay.date).namedtuples()}
+
+    @staticmethod
+    def last_date(country: str) -> Optional[datetime.date]:
+        """국가별 달력이 채워진 마지막 날짜"""
+        return TradingDay.select(TradingDay.date).where(
+            TradingDay.country == country.upper()
+        ).order_by(TradingDay.date.desc()).limit(1).scalar()
+
+    @staticmethod
+    def save(country: str, days: Dict[datetime.date, bool]) -> bool:
+        """날짜별 개장 여부 저장 (기존 날짜는 갱신)"""
+        if not days:
+            return True
+        data = [{'country': country.upper(), 'date': date, 'is_open': is_open} for date, is_open in days.items()]
+        return bulk_upsert(TradingDay, data, [TradingDay.country, TradingDay.date], ['is_open'])
+
+    @staticmethod
+    def update(country: str, horizon_days: int = TRADING_CALENDAR_HORIZON_DAYS) -> int:
+        """
+        오늘부터 horizon_days일 뒤까지 달력을 일괄 적재
+
+        국내는 KIS 휴장일 API(조회 기준일부터 수십 일씩 반환)를 몇 번만 호출하고,
+        미국은 NYSE 휴장 규칙으로 계산한다.
+
+        :return: 저장한 날짜 수
+        """
+        country = country.upper()
+        today = datetime.date.today()
+        end = today + datetime.timedelta(days=horizon_days)
+        start = today if country == "KOR" else datetime.date(today.year, 1, 1)
+        days = TradingCalendarRepository.fetch_days(country, start, end)
+
+        if not TradingCalendarRepository.save(country, days):
+            raise DatabaseError(f"거래일 달력 저장 실패: {country}")
+        logger.info(f"거래일 달력 적재 완료: {country} {len(days)}일 (~{max(days, default=today)})")
+        return len(days)
+
+    @staticmethod
+    def fetch_days(country: str, start: datetime.date, end: datetime.date) -> Dict[datetime.date, bool]:
+        """[start, end] 구간 개장 여부를 원천에서 조회 (국내: KIS 휴장일 API, 미국: NYSE 휴장 규칙)"""
+        country = country.upper()
+        if country == "KOR":
+            return TradingCalendarRepository._fetch_kor_days(start, end)
+        if country == "USA":
+            return TradingCalendarRepository._usa_days(start, end)
+        raise ValueError(f"Unsupported country code: {country}")
+
+    @staticmethod
+    def _fetch_kor_days(start: datetime.date, end: datetime.date) -> Dict[datetime.date, bool]:
+        """KIS 휴장일 API로 국내 개장 여부 조회"""
+        from clients.kis import KISClient
+
+        client = KISClient(
+            app_key=setting_env.APP_KEY_KOR,
+            app_secret=setting_env.APP_SECRET_KOR,
+            account_number=setting_env.ACCOUNT_NUMBER_KOR,
+            account_code=setting_env.ACCOUNT_CODE_KOR
+        )
+        days: Dict[datetime.date, bool] = {}
+        current = start
+        while current <= end:
+            holidays = client.get_domestic_market_holidays(current.strftime("%Y%m%d"))
+            if not holidays:
+                logger.warning(f"국내 휴장일 조회 결과 없음: {current}")
+                break
+            for bass_dt, holiday in holidays.items():
+                days[datetime.datetime.strptime(bass_dt, "%Y%m%d").date()] = holiday.opnd_yn == "Y"
+            last = max(days)
+            if last < current:
+                break
+            current = last + datetime.timedelta(days=1)
+        return days
+
+    @staticmethod
+    def _usa_days(start: datetime.date, end: datetime.date) -> Dict[datetime.date, bool]:
+        """NYSE 휴장 규칙으로 미국 개장 여부 계산"""
+        holidays: Set[datetime.date] = set()
+        for year in range(start.year, end.year + 2):
+            holidays |= TradingCalendarRepository._nyse_holidays(year)
+
+        days = {}
+        date = start
+        while date <= end:
+            days[date] = date.weekday() < 5 and date not in holidays
+            date += datetime.timedelta(days=1)
+        return days
+
+    @staticmethod
+    def _nyse_holidays(year: int) -> Set[datetime.date]:
+        """NYSE 정규 휴장일 (임시 휴장은 포함하지 않음)"""
+        def observed(date: datetime.date) -> datetime.date:
+            # 토요일 휴일은 전날, 일요일 휴일은 다음 날 휴장
+            if date.weekday() == 5:
+                return date - datetime.timedelta(days=1)
+            if date.weekday() == 6:
+                return date + datetime.timedelta(days=1)
+            return date
+
+        jan1 = datetime.date(year, 1, 1)
+        holidays = {
+            jan1 + relativedelta(weekday=MO(+3)),  # Martin Luther King Jr. Day
+            datetime.date(year, 2, 1) + relativedelta(weekday=MO(+3)),  # Presidents' Day
+            easter(year) - datetime.timedelta(days=2),  # Good Friday
+            datetime.date(year, 5, 31) + relativedelta(weekday=MO(-1)),  # Memorial Day
+            observed(datetime.date(year, 7, 4)),
+            datetime.date(year, 9, 1) + relativedelta(weekday=MO(+1)),  # Labor Day
+            datetime.date(year, 11, 1) + relativedelta(weekday=TH(+4)),  # Thanksgiving
+            observed(datetime.date(year, 12, 25)),
+        }
+        # 1월 1일이 토요일이면 전년도 12월 31일은 휴장하지 않음
+        if jan1.weekday() != 5:
+            holidays.add(observed(jan1))
+        if year >= 2022:
+            holidays.add(observed(datetime.date(year, 6, 19)))  # Juneteenth
+        return holidays
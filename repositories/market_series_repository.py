@@ -0,0 +1,107 @@
+"""시장 지표 시계열 (지수, VIX, 환율) 데이터 접근"""
+import datetime
+from typing import Any, Dict, Optional
+
+import FinanceDataReader
+import pandas as pd
+
+from config.constants import MARKET_SERIES_INITIAL_DAYS
+from config.logging_config import get_logger
+from core.exceptions import DatabaseError
+from data.models import MarketSeries
+from utils.data_util import bulk_upsert
+
+logger = get_logger(__name__)
+
+# 이동평균 기간 (가장 긴 기간만큼의 과거 종가를 이어 붙여 계산)
+SMA_WINDOWS = (50, 200)
+
+
+class MarketSeriesRepository:
+    """시장 지표 시계열 Repository"""
+
+    @staticmethod
+    def get_latest(series: str) -> Optional[MarketSeries]:
+        """지표의 마지막 적재 행 (없으면 None)"""
+        return MarketSeries.select().where(
+            MarketSeries.series == series
+        ).order_by(MarketSeries.date.desc()).first()
+
+    @staticmethod
+    def last_date(series: str) -> Optional[datetime.date]:
+        """지표의 마지막 적재일"""
+        return MarketSeries.select(MarketSeries.date).where(
+            MarketSeries.series == series
+        ).order_by(MarketSeries.date.desc()).limit(1).scalar()
+
+    @staticmethod
+    def get_closes(series: str, before: datetime.date, limit: int) -> pd.Series:
+        """before 이전 최근 limit개 종가 (날짜 오름차순)"""
+        rows = list(MarketSeries.select(MarketSeries.date, MarketSeries.close).where(
+            (MarketSeries.series == series) & (MarketSeries.date < before)
+        ).order_by(MarketSeries.date.desc()).limit(limit).tuples())
+        rows.reverse()
+        return pd.Series([float(close) for _, close in rows], index=[date for date, _ in rows], dtype=float)
+
+    @staticmethod
+    def get_range(series: str, start: datetime.date = None, end: datetime.date = None) -> pd.DataFrame:
+        """기간 내 지표 행 (date 인덱스, close/sma50/sma200 float 컬럼)"""
+        query = MarketSeries.select(
+            MarketSeries.date, MarketSeries.close, MarketSeries.sma50, MarketSeries.sma200
+        ).where(MarketSeries.series == series)
+        if start is not None:
+            query = query.where(MarketSeries.date >= start)
+        if end is not None:
+            query = query.where(MarketSeries.date <= end)
+        df = pd.DataFrame(list(query.order_by(MarketSeries.date).tuples()), columns=['date', 'close', 'sma50', 'sma200'])
+        return df.set_index('date').astype(float)
+
+    @staticmethod
+    def update(series: str, start: datetime.date = None) -> int:
+        """
+        마지막 적재일부터 오늘까지 증분 적재
+
+        마지막 적재일은 장중 값이었을 수 있으므로 다시 받아 덮어쓰고, 이동평균은 이미 저장된
+        과거 종가를 이어 붙여 새 구간만 계산한다.
+
+        :param series: FinanceDataReader 심볼 (VIX, ^GSPC, KS11, USD/KRW)
+        :param start: 이 날짜부터 다시 적재 (과거 구간 백필용, 기본값: 마지막 적재일)
+        :return: 저장한 행 수
+        """
+        today = datetime.date.today()
+        start = start or MarketSeriesRepository.last_date(series) \
+            or today - datetime.timedelta(days=MARKET_SERIES_INITIAL_DAYS)
+        df = FinanceDataReader.DataReader(series, start=start.strftime("%Y-%m-%d"))
+        if df is None or df.empty or "Close" not in df:
+            logger.warning(f"시장 지표 조회 결과 없음: {series} ({start} ~)")
+            return 0
+
+        close = df["Close"].astype(float).dropna()
+        close.index = pd.to_datetime(close.index).date
+        close = close[close.index >= start]
+        if close.empty:
+            return 0
+
+        history = MarketSeriesRepository.get_closes(series, close.index[0], max(SMA_WINDOWS) - 1)
+        full = pd.concat([history, close])
+        full = full[~full.index.duplicated(keep="last")].sort_index()
+        smas = {window: full.rolling(window).mean() for window in SMA_WINDOWS}
+
+        rows = [
+            MarketSeriesRepository._to_row(series, date, value, smas[50][date], smas[200][date])
+            for date, value in close.items()
+        ]
+        if not bulk_upsert(MarketSeries, rows, [MarketSeries.series, MarketSeries.date], ['close', 'sma50', 'sma200']):
+            raise DatabaseError(f"시장 지표 저장 실패: {series}")
+        logger.info(f"시장 지표 적재 완료: {series} {len(rows)}일 (~{close.index[-1]})")
+        return len(rows)
+
+    @staticmethod
+    def _to_row(series: str, date: datetime.date, close: float, sma50: float, sma200: float) -> Dict[str, Any]:
+        return {
+            'series': series,
+            'date': date,
+            'close': round(close, 4),
+            'sma50': None if pd.isna(sma50) else round(float(sma50), 4),
+            'sma200': None if pd.isna(sma200) else round(float(sma200), 4),
+        }
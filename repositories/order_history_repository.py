@@ -0,0 +1,137 @@
+"""주문(체결) 내역 데이터 접근"""
+import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, List, Optional
+
+from config.constants import ORDER_HISTORY_BATCH_ROWS, ORDER_HISTORY_INITIAL_DAYS
+from config.logging_config import get_logger
+from core.exceptions import DatabaseError
+from data.dto.stock_trade_dto import StockTradeListResponseDTO, convert_overseas_to_stock_trade
+from data.models import OrderHistory
+from utils.data_util import bulk_upsert
+
+logger = get_logger(__name__)
+
+
+class OrderHistoryRepository:
+    """주문 내역 Repository"""
+
+    # KIS 매도매수구분코드 → 매매 구분
+    SIDES = {'01': 'sell', '02': 'buy'}
+
+    @staticmethod
+    def get(
+            account: str = None,
+            country: str = None,
+            symbol: str = None,
+            start_date: datetime.date = None,
+            end_date: datetime.date = None
+    ):
+        """저장된 주문 내역 조회 (주문일/주문시각 순)"""
+        query = OrderHistory.select()
+        if account:
+            query = query.where(OrderHistory.account == account)
+        if country:
+            query = query.where(OrderHistory.country == country.upper())
+        if symbol:
+            query = query.where(OrderHistory.symbol == symbol)
+        if start_date:
+            query = query.where(OrderHistory.order_date >= start_date)
+        if end_date:
+            query = query.where(OrderHistory.order_date <= end_date)
+        return query.order_by(OrderHistory.order_date, OrderHistory.order_time)
+
+    @staticmethod
+    def last_order_date(account: str, country: str) -> Optional[datetime.date]:
+        """계좌/국가별 마지막으로 저장된 주문일"""
+        return OrderHistory.select(OrderHistory.order_date).where(
+            (OrderHistory.account == account) & (OrderHistory.country == country.upper())
+        ).order_by(OrderHistory.order_date.desc()).limit(1).scalar()
+
+    @staticmethod
+    def sync(client, country: str) -> int:
+        """
+        마지막 저장 주문일부터 오늘까지 체결 내역을 증분 동기화
+
+        마지막 주문일은 그날 이후 체결이 늘었을 수 있으므로 다시 받아 덮어쓰고,
+        내역은 페이지 단위로 받으면서 ORDER_HISTORY_BATCH_ROWS 행씩 저장한다.
+
+        :param client: 해당 국가 계좌의 KISClient 인스턴스
+        :param country: 국가 코드 (KOR, USA)
+        :return: 저장한 행 수
+        """
+        country = country.upper()
+        account = f"{client.account_number}-{client.account_code}"
+        today = datetime.date.today()
+        start = OrderHistoryRepository.last_order_date(account, country) \
+            or today - datetime.timedelta(days=ORDER_HISTORY_INITIAL_DAYS)
+        start_date, end_date = start.strftime("%Y%m%d"), today.strftime("%Y%m%d")
+
+        if country == "KOR":
+            trades = client.iter_stock_orders(start_date, end_date)
+        elif country == "USA":
+            trades = (
+                converted
+                for trade in client.iter_overseas_stock_orders(start_date=start_date, end_date=end_date)
+                for converted in convert_overseas_to_stock_trade(trade)
+            )
+        else:
+            raise ValueError(f"Unsupported country code: {country}")
+
+        batch: List[Dict[str, Any]] = []
+        saved = 0
+        for trade in trades:
+            row = OrderHistoryRepository._to_row(account, country, trade)
+            if row is None:
+                continue
+            batch.append(row)
+            if len(batch) >= ORDER_HISTORY_BATCH_ROWS:
+                saved += OrderHistoryRepository._save(batch)
+                batch = []
+        saved += OrderHistoryRepository._save(batch)
+
+        logger.info(f"주문 내역 동기화 완료: {country} {start} ~ {today}, {saved}건")
+        return saved
+
+    @staticmethod
+    def _save(rows: List[Dict[str, Any]]) -> int:
+        if not rows:
+            return 0
+        conflict_target = [OrderHistory.account, OrderHistory.country, OrderHistory.order_date, OrderHistory.order_no]
+        preserve_fields = ['order_quantity', 'filled_quantity', 'filled_price', 'filled_amount', 'order_time']
+        if not bulk_upsert(OrderHistory, rows, conflict_target, preserve_fields):
+            raise DatabaseError(f"주문 내역 저장 실패: {len(rows)}건")
+        return len(rows)
+
+    @staticmethod
+    def _to_row(account: str, country: str, trade: StockTradeListResponseDTO) -> Optional[Dict[str, Any]]:
+        """체결 내역 DTO를 order_history 행으로 변환 (주문일/주문번호가 없으면 None)"""
+        if not trade.ord_dt or not trade.odno:
+            return None
+        return {
+            'account': account,
+            'country': country,
+            'order_date': datetime.datetime.strptime(trade.ord_dt, "%Y%m%d").date(),
+            'order_no': trade.odno,
+            'symbol': trade.pdno,
+            'side': OrderHistoryRepository.SIDES.get(trade.sll_buy_dvsn_cd, trade.sll_buy_dvsn_cd),
+            'order_quantity': OrderHistoryRepository._to_int(trade.ord_qty),
+            'filled_quantity': OrderHistoryRepository._to_int(trade.tot_ccld_qty),
+            'filled_price': OrderHistoryRepository._to_decimal(trade.avg_prvs),
+            'filled_amount': OrderHistoryRepository._to_decimal(trade.tot_ccld_amt),
+            'order_time': trade.ord_tmd or None,
+        }
+
+    @staticmethod
+    def _to_int(value: str) -> int:
+        try:
+            return int(float(value or 0))
+        except (TypeError, ValueError):
+            return 0
+
+    @staticmethod
+    def _to_decimal(value: str) -> Optional[Decimal]:
+        try:
+            return Decimal(value) if value not in (None, "") else None
+        except InvalidOperation:
+            return None
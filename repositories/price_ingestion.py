@@ -0,0 +1,191 @@
+"""비동기 가격 수집 파이프라인
+
+종목별 다운로드(FinanceDataReader, 동기 호출)를 스레드에서 실행하되, 시세 소스별로
+동시 요청 수(Semaphore)와 초당 요청 수(TokenBucket)를 제한한다. 실패한 다운로드는
+지수 백오프로 재시도하고, 받은 행은 국가별로 모아 PRICE_UPSERT_BATCH_ROWS 단위로 upsert한다.
+"""
+import asyncio
+import datetime
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Tuple
+
+from config import setting_env
+from config.constants import PRICE_INGEST_MAX_ATTEMPTS, PRICE_INGEST_RETRY_DELAY, PRICE_UPSERT_BATCH_ROWS
+from config.logging_config import get_logger
+from core.exceptions import NotFoundError as NotFoundUrl
+from core.rate_limiter import TokenBucket
+from repositories.price_repository import PriceRepository
+
+logger = get_logger(__name__)
+
+# 국가별 시세 소스 (FinanceDataReader 기준)
+PRICE_SOURCE_BY_COUNTRY = {
+    "KOR": "NAVER",
+    "USA": "US",
+}
+
+
+@dataclass
+class IngestionSummary:
+    """가격 수집 결과 집계"""
+    succeeded: int = 0
+    skipped: int = 0
+    failed: int = 0
+    rows: int = 0
+    failed_symbols: List[str] = field(default_factory=list)
+
+    def log(self) -> None:
+        """결과 요약 로깅"""
+        logger.info(
+            f"가격 수집 완료: 성공 {self.succeeded}, 건너뜀 {self.skipped}, 실패 {self.failed}, 적재 {self.rows}행"
+        )
+        if self.failed_symbols:
+            logger.warning(f"가격 수집 실패 종목: {', '.join(sorted(self.failed_symbols))}")
+
+
+class _SourceLimit:
+    """시세 소스 하나의 동시성/속도 제한"""
+
+    def __init__(self, concurrency: int, rate: float):
+        self.semaphore = asyncio.Semaphore(max(1, concurrency))
+        self.bucket = TokenBucket(rate)
+
+
+class PriceIngestionPipeline:
+    """소스별 제한을 지키며 여러 종목 가격을 받아 일괄 적재하는 파이프라인"""
+
+    def __init__(
+            self,
+            batch_rows: int = PRICE_UPSERT_BATCH_ROWS,
+            max_attempts: int = PRICE_INGEST_MAX_ATTEMPTS,
+            retry_delay: float = PRICE_INGEST_RETRY_DELAY
+    ):
+        """
+        :param batch_rows: upsert 한 번에 모으는 최소 행 수
+        :param max_attempts: 종목별 다운로드 최대 시도 횟수
+        :param retry_delay: 첫 재시도 대기 시간 (초, 재시도마다 2배)
+        """
+        self._batch_rows = batch_rows
+        self._max_attempts = max_attempts
+        self._retry_delay = retry_delay
+        self._summary = IngestionSummary()
+        self._buffers: Dict[str, List[Dict]] = {}
+        self._pending: Dict[str, List[str]] = {}
+        self._limits: Dict[str, _SourceLimit] = {}
+        self._flush_lock: asyncio.Lock = None
+        self._executor: ThreadPoolExecutor = None
+
+    def _limit_for(self, country: str) -> _SourceLimit:
+        source = PRICE_SOURCE_BY_COUNTRY[country]
+        if source not in self._limits:
+            self._limits[source] = _SourceLimit(
+                getattr(setting_env, f"PRICE_INGEST_CONCURRENCY_{country}"),
+                getattr(setting_env, f"PRICE_INGEST_RATE_{country}"),
+            )
+        return self._limits[source]
+
+    async def _call(self, func, *args):
+        """동기 함수를 파이프라인 전용 스레드 풀에서 실행"""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, functools.partial(func, *args))
+
+    async def run(
+            self,
+            tasks: Iterable[Tuple[str, str, datetime.datetime]],
+            end_date: datetime.datetime = None
+    ) -> IngestionSummary:
+        """
+        종목 가격 수집 실행
+
+        :param tasks: (symbol, country, start_date) 목록
+        :param end_date: 수집 종료일 (None이면 최신까지)
+        :return: 성공/건너뜀/실패 집계
+        """
+        tasks = list(tasks)
+        if not tasks:
+            return self._summary
+
+        # 소스별 동시 요청 수 합만큼 스레드를 두어 기본 실행기 크기에 묶이지 않게 한다
+        countries = {country for _, country, _ in tasks}
+        workers = sum(max(1, getattr(setting_env, f"PRICE_INGEST_CONCURRENCY_{country}")) for country in countries)
+        self._flush_lock = asyncio.Lock()
+        with ThreadPoolExecutor(max_workers=workers + 1, thread_name_prefix="price-ingest") as self._executor:
+            await asyncio.gather(*(
+                self._ingest(symbol, country, start_date, end_date)
+                for symbol, country, start_date in tasks
+            ))
+            for country in list(self._buffers):
+                await self._flush(country)
+        return self._summary
+
+    async def _ingest(
+            self,
+            symbol: str,
+            country: str,
+            start_date: datetime.datetime,
+            end_date: datetime.datetime
+    ) -> None:
+        try:
+            rows = await self._fetch_with_retry(symbol, country, start_date, end_date)
+        except NotFoundUrl:
+            await self._call(PriceRepository.remove_symbol, symbol, country)
+            logger.info(f"시세 소스에 없는 종목 삭제: {symbol}")
+            self._summary.skipped += 1
+            return
+        except Exception as e:
+            logger.error(f"가격 다운로드 실패: {symbol} -> {type(e).__name__}: {e}")
+            self._summary.failed += 1
+            self._summary.failed_symbols.append(symbol)
+            return
+
+        if not rows:
+            self._summary.skipped += 1
+            return
+
+        self._buffers.setdefault(country, []).extend(rows)
+        self._pending.setdefault(country, []).append(symbol)
+        if len(self._buffers[country]) >= self._batch_rows:
+            await self._flush(country)
+
+    async def _fetch_with_retry(
+            self,
+            symbol: str,
+            country: str,
+            start_date: datetime.datetime,
+            end_date: datetime.datetime
+    ) -> List[Dict]:
+        limit = self._limit_for(country)
+        delay = self._retry_delay
+        for attempt in range(1, self._max_attempts + 1):
+            async with limit.semaphore:
+                await limit.bucket.acquire_async()
+                try:
+                    return await self._call(PriceRepository.fetch_rows, symbol, country, start_date, end_date)
+                except (NotFoundUrl, KeyError):
+                    # 없는 종목/응답 형식 오류는 재시도해도 같은 결과
+                    raise
+                except Exception as e:
+                    if attempt == self._max_attempts:
+                        raise
+                    logger.warning(
+                        f"가격 다운로드 실패 (시도 {attempt}/{self._max_attempts}): {symbol} -> "
+                        f"{type(e).__name__}: {e}. {delay:.1f}초 후 재시도"
+                    )
+            await asyncio.sleep(delay)
+            delay *= 2
+        return []
+
+    async def _flush(self, country: str) -> None:
+        """국가별로 모인 행을 한 번에 upsert"""
+        async with self._flush_lock:
+            rows = self._buffers.pop(country, [])
+            symbols = self._pending.pop(country, [])
+            if not rows:
+                return
+            if await self._call(PriceRepository.store_rows, country, rows):
+                self._summary.succeeded += len(symbols)
+                self._summary.rows += len(rows)
+            else:
+                self._summary.failed += len(symbols)
+                self._summary.failed_symbols.extend(symbols)
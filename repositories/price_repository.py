@@ -1,17 +1,30 @@
 """가격 데이터 접근"""
+import asyncio
 import datetime
-import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter
+from typing import TYPE_CHECKING, Dict, Iterable, List, Set, Tuple
 
 import FinanceDataReader
 import pandas as pd
 from dateutil.relativedelta import relativedelta
+from peewee import fn
 
+from config.constants import (
+    DEFAULT_PRICE_HISTORY_YEARS,
+    PRICE_BACKFILL_BATCH_ROWS,
+    PRICE_GAP_LOOKBACK_DAYS,
+    PRICE_MARKET_DAY_MIN_COVERAGE,
+    PRICE_UPSERT_BATCH_ROWS,
+)
 from config.logging_config import get_logger
 from core.exceptions import NotFoundError as NotFoundUrl
 from data.models import Stock
+from repositories.price_store import PriceStore
 from repositories.stock_repository import StockRepository
-from utils.data_util import upsert_many
+from utils.data_util import bulk_upsert
+
+if TYPE_CHECKING:
+    from repositories.price_ingestion import IngestionSummary
 
 logger = get_logger(__name__)
 
@@ -25,76 +38,262 @@ class PriceRepository:
             country: str = None,
             start_date: datetime.datetime = None,
             end_date: datetime.datetime = None
-    ):
-        """가격 데이터 추가 (전체 또는 특정 종목)"""
-        if start_date is None:
-            start_date = datetime.datetime.now()
+    ) -> "IngestionSummary":
+        """
+        가격 데이터 추가 (전체 또는 특정 종목)
+
+        start_date를 주면 해당 구간을 다시 받아 upsert하고, 생략하면 종목별 마지막 적재일과
+        결측 구간을 기준으로 부족한 구간만 받는다 (증분 적재).
+        다운로드는 PriceIngestionPipeline이 소스별 동시성/속도 제한을 지켜 비동기로 수행한다.
+        이벤트 루프 안에서는 asyncio.to_thread로 호출해야 한다.
 
+        :return: 종목별 성공/건너뜀/실패 집계
+        """
         if symbol:
-            PriceRepository.add_for_symbol(symbol, start_date, end_date)
+            symbols_by_country = {StockRepository.get_country_by_symbol(symbol): [symbol]}
         else:
-            stocks = Stock.select()
+            stocks = Stock.select(Stock.symbol, Stock.country)
             if country:
                 stocks = stocks.where(Stock.country == country)
+            symbols_by_country: Dict[str, List[str]] = {}
+            for stock in stocks:
+                symbols_by_country.setdefault(stock.country, []).append(stock.symbol)
+
+        tasks: List[Tuple[str, str, datetime.datetime]] = []
+        for stock_country, symbols in symbols_by_country.items():
+            if stock_country not in ("KOR", "USA"):
+                continue
+            if start_date is not None:
+                tasks.extend((item, stock_country, start_date) for item in symbols)
+            else:
+                plan = PriceRepository.plan_incremental(stock_country, symbols)
+                tasks.extend((item, stock_country, item_start) for item, item_start in plan.items())
+
+        total = sum(len(symbols) for symbols in symbols_by_country.values())
+        return PriceRepository._ingest(tasks, total, end_date, PRICE_UPSERT_BATCH_ROWS)
+
+    @staticmethod
+    def backfill(
+            symbols: Iterable[str],
+            start_date: datetime.datetime = None,
+            end_date: datetime.datetime = None
+    ) -> "IngestionSummary":
+        """
+        신규 종목 가격 히스토리 일괄 적재 (기본: DEFAULT_PRICE_HISTORY_YEARS 전부터)
+
+        여러 종목의 행을 PRICE_BACKFILL_BATCH_ROWS 단위로 모아 COPY 경로로 적재한다.
+        """
+        start_date = start_date or datetime.datetime.now() - relativedelta(years=DEFAULT_PRICE_HISTORY_YEARS)
+        symbols = list(symbols)
+        tasks = []
+        for symbol in symbols:
+            country = StockRepository.get_country_by_symbol(symbol)
+            if country in ("KOR", "USA"):
+                tasks.append((symbol, country, start_date))
+        return PriceRepository._ingest(tasks, len(symbols), end_date, PRICE_BACKFILL_BATCH_ROWS)
+
+    @staticmethod
+    def _ingest(
+            tasks: List[Tuple[str, str, datetime.datetime]],
+            total: int,
+            end_date: datetime.datetime,
+            batch_rows: int
+    ) -> "IngestionSummary":
+        """수집 파이프라인 실행 (요청하지 않은 종목은 건너뜀으로 집계)"""
+        from repositories.price_ingestion import PriceIngestionPipeline
+        summary = asyncio.run(PriceIngestionPipeline(batch_rows=batch_rows).run(tasks, end_date))
+        summary.skipped += total - len(tasks)
+        summary.log()
+        return summary
+
+    @staticmethod
+    def get_date_ranges(country: str, symbols: Iterable[str] = None) -> Dict[str, Tuple[datetime.date, datetime.date]]:
+        """종목별 (최초 적재일, 마지막 적재일) (symbols를 주면 해당 종목만, 적재 이력이 없는 종목은 제외)"""
+        table = StockRepository.get_history_table(country)
+        query = table.select(table.symbol, fn.MIN(table.date), fn.MAX(table.date))
+        if symbols is not None:
+            query = query.where(table.symbol.in_(list(symbols)))
+        query = query.group_by(table.symbol).tuples()
+        return {symbol: (first_date, last_date) for symbol, first_date, last_date in query}
+
+    @staticmethod
+    def find_gaps(
+            country: str,
+            since: datetime.date,
+            ranges: Dict[str, Tuple[datetime.date, datetime.date]] = None
+    ) -> Dict[str, datetime.date]:
+        """
+        since 이후 종목별 첫 결측 거래일
+
+        거래일은 같은 시장에서 충분히 많은 종목이 적재된 날짜로 판단하므로 휴장일은 결측이 아니다.
+        종목이 처음 적재된 날보다 이른 거래일은 결측으로 보지 않는다.
+
+        :param ranges: get_date_ranges 결과 (없으면 조회)
+        """
+        table = StockRepository.get_history_table(country)
+        rows = list(
+            table.select(table.symbol, table.date)
+            .where(table.date >= since)
+            .tuples()
+        )
+        if not rows:
+            return {}
+
+        dates_by_symbol: Dict[str, Set[datetime.date]] = {}
+        for symbol, date in rows:
+            dates_by_symbol.setdefault(symbol, set()).add(date)
+
+        day_counts = Counter(date for _, date in rows)
+        threshold = max(day_counts.values()) * PRICE_MARKET_DAY_MIN_COVERAGE
+        market_days = sorted(date for date, count in day_counts.items() if count >= threshold)
+
+        ranges = ranges if ranges is not None else PriceRepository.get_date_ranges(country)
+        gaps: Dict[str, datetime.date] = {}
+        for symbol, dates in dates_by_symbol.items():
+            first_date, last_date = ranges.get(symbol, (min(dates), max(dates)))
+            for day in market_days:
+                if day > last_date:
+                    break
+                if day >= first_date and day not in dates:
+                    gaps[symbol] = day
+                    break
+        return gaps
+
+    @staticmethod
+    def plan_incremental(
+            country: str,
+            symbols: Iterable[str],
+            as_of: datetime.datetime = None
+    ) -> Dict[str, datetime.datetime]:
+        """
+        종목별 증분 적재 시작일 (이미 최신인 종목은 제외)
 
-            with ThreadPoolExecutor(max_workers=min(os.cpu_count(), 10)) as executor:
-                futures = []
-                for stock in stocks:
-                    futures.append(executor.submit(PriceRepository.add_for_symbol, stock.symbol, start_date, end_date))
+        - 적재 이력이 없으면 DEFAULT_PRICE_HISTORY_YEARS 전부터
+        - 마지막 적재일이 최근 거래일보다 이르면 그 다음 날부터
+        - 결측 거래일이 있으면 첫 결측일부터 (위 시작일보다 이르면 우선)
+        """
+        as_of = as_of or datetime.datetime.now()
+        latest_session = PriceRepository.latest_session_date(country, as_of.date())
+        ranges = PriceRepository.get_date_ranges(country)
+        gaps = PriceRepository.find_gaps(country, as_of.date() - datetime.timedelta(days=PRICE_GAP_LOOKBACK_DAYS), ranges)
 
-                for future in as_completed(futures):
-                    try:
-                        future.result()
-                    except Exception as e:
-                        logger.error(f"에러 발생: {e}")
+        plan: Dict[str, datetime.datetime] = {}
+        new_count = stale_count = gap_count = skip_count = 0
+        for symbol in symbols:
+            if symbol not in ranges:
+                plan[symbol] = as_of - relativedelta(years=DEFAULT_PRICE_HISTORY_YEARS)
+                new_count += 1
+                continue
+
+            starts = []
+            last_date = ranges[symbol][1]
+            if last_date < latest_session:
+                starts.append(last_date + datetime.timedelta(days=1))
+                stale_count += 1
+            if symbol in gaps:
+                starts.append(gaps[symbol])
+                gap_count += 1
+            if starts:
+                plan[symbol] = datetime.datetime.combine(min(starts), datetime.time.min)
+            else:
+                skip_count += 1
+
+        logger.info(
+            f"{country} 증분 적재 계획: 신규 {new_count}, 지연 {stale_count}, 결측 보충 {gap_count}, "
+            f"최신 건너뜀 {skip_count}"
+        )
+        return plan
+
+    @staticmethod
+    def latest_session_date(country: str, today: datetime.date) -> datetime.date:
+        """적재 시점에 데이터가 있어야 하는 가장 최근 거래일 (거래일 달력 기준, 휴장일 제외)"""
+        from services.trading_calendar import get_trading_calendar
+
+        # 미국 장은 한국 시간 기준 다음 날 새벽에 마감하므로 전일이 최근 거래일
+        day = today - datetime.timedelta(days=1) if country == "USA" else today
+        return get_trading_calendar(country).last_open_day(day)
 
     @staticmethod
     def add_for_symbol(
             symbol: str,
             start_date: datetime.datetime = None,
             end_date: datetime.datetime = None
-    ):
-        """특정 종목의 가격 데이터 추가"""
-        start_date_str = (datetime.datetime.now() - relativedelta(days=5)).strftime('%Y-%m-%d') \
-            if not start_date else start_date.strftime('%Y-%m-%d')
-
+    ) -> int:
+        """특정 종목의 가격 데이터 추가 (적재한 행 수 반환)"""
+        country = None
         try:
             country = StockRepository.get_country_by_symbol(symbol)
-            table = StockRepository.get_history_table(country)
-            data_to_insert = None
-
-            if country == "KOR":
-                df = FinanceDataReader.DataReader(
-                    symbol=f'NAVER:{symbol}',
-                    start=start_date_str,
-                    end=end_date
-                )
-                if not df.empty:
-                    df = df.reset_index()
-                    df['symbol'] = symbol
-                    df['date'] = df['Date'].dt.date
-                    data_to_insert = df[['symbol', 'date', 'Open', 'High', 'Close', 'Low', 'Volume']].rename(
-                        columns={'Open': 'open', 'High': 'high', 'Close': 'close', 'Low': 'low', 'Volume': 'volume'}
-                    ).to_dict('records')
-            elif country == "USA":
-                df = FinanceDataReader.DataReader(symbol=symbol, start=start_date_str, end=end_date)
-                if not df.empty:
-                    df = df.reset_index()
-                    df['symbol'] = symbol
-                    df['date'] = df['Date'].dt.date
-                    df['open'] = df['Open'].astype(float)
-                    df['high'] = df['High'].astype(float)
-                    df['close'] = df['Close'].astype(float)
-                    df['low'] = df['Low'].astype(float)
-                    df['volume'] = df['Volume'].apply(lambda x: int(x) if pd.notna(x) else None)
-                    data_to_insert = df[['symbol', 'date', 'open', 'high', 'close', 'low', 'volume']].to_dict('records')
-
-            if data_to_insert:
-                upsert_many(table, data_to_insert, [table.symbol, table.date], ['open', 'high', 'close', 'low', 'volume'])
+            data_to_insert = PriceRepository.fetch_rows(symbol, country, start_date, end_date)
+            if data_to_insert and PriceRepository.store_rows(country, data_to_insert):
+                return len(data_to_insert)
 
         except NotFoundUrl:
-            Stock.delete().where(Stock.symbol == symbol).execute()
+            PriceRepository.remove_symbol(symbol, country)
         except KeyError:
             pass
         except Exception:
             pass
+        return 0
+
+    @staticmethod
+    def fetch_rows(
+            symbol: str,
+            country: str,
+            start_date: datetime.datetime = None,
+            end_date: datetime.datetime = None
+    ) -> List[Dict]:
+        """FinanceDataReader에서 가격 데이터를 받아 가격 히스토리 테이블 행으로 변환 (예외는 호출자가 처리)"""
+        start_date_str = (datetime.datetime.now() - relativedelta(days=5)).strftime('%Y-%m-%d') \
+            if not start_date else start_date.strftime('%Y-%m-%d')
+
+        if country == "KOR":
+            df = FinanceDataReader.DataReader(
+                symbol=f'NAVER:{symbol}',
+                start=start_date_str,
+                end=end_date
+            )
+            if df.empty:
+                return []
+            df = df.reset_index()
+            df['symbol'] = symbol
+            df['date'] = df['Date'].dt.date
+            return df[['symbol', 'date', 'Open', 'High', 'Close', 'Low', 'Volume']].rename(
+                columns={'Open': 'open', 'High': 'high', 'Close': 'close', 'Low': 'low', 'Volume': 'volume'}
+            ).to_dict('records')
+
+        if country == "USA":
+            df = FinanceDataReader.DataReader(symbol=symbol, start=start_date_str, end=end_date)
+            if df.empty:
+                return []
+            df = df.reset_index()
+            df['symbol'] = symbol
+            df['date'] = df['Date'].dt.date
+            df['open'] = df['Open'].astype(float)
+            df['high'] = df['High'].astype(float)
+            df['close'] = df['Close'].astype(float)
+            df['low'] = df['Low'].astype(float)
+            df['volume'] = df['Volume'].apply(lambda x: int(x) if pd.notna(x) else None)
+            return df[['symbol', 'date', 'open', 'high', 'close', 'low', 'volume']].to_dict('records')
+
+        return []
+
+    @staticmethod
+    def store_rows(country: str, rows: List[Dict]) -> bool:
+        """가격 행 upsert 후 가격 저장소에 종목별로 병합 (여러 종목 행을 한 번에 받을 수 있음)"""
+        table = StockRepository.get_history_table(country)
+        if not bulk_upsert(table, rows, [table.symbol, table.date], ['open', 'high', 'close', 'low', 'volume']):
+            return False
+
+        rows_by_symbol: Dict[str, List[Dict]] = {}
+        for row in rows:
+            rows_by_symbol.setdefault(row['symbol'], []).append(row)
+        for symbol, symbol_rows in rows_by_symbol.items():
+            PriceStore.merge(country, symbol, symbol_rows)
+        return True
+
+    @staticmethod
+    def remove_symbol(symbol: str, country: str = None) -> None:
+        """시세 소스에서 사라진 종목 삭제"""
+        Stock.delete().where(Stock.symbol == symbol).execute()
+        if country:
+            PriceStore.invalidate(country, symbol)
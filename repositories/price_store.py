@@ -0,0 +1,310 @@
+"""가격 히스토리 로컬 컬럼형 저장소 (Postgres 앞단 read-through 캐시)
+
+시장별 디렉터리 아래 종목당 Arrow IPC 파일 하나를 둔다::
+
+    {PRICE_STORE_DIR}/KOR/005930.arrow
+    {PRICE_STORE_DIR}/USA/AAPL.arrow
+
+파일은 비압축 IPC 포맷이라 메모리 매핑으로 바로 읽으며, 스키마 메타데이터의
+``covered_from``(보장 시작일)보다 이른 구간을 요청하거나 ``covered_to``(DB와 맞춘 마지막 일자)가
+호출자가 요구한 일자보다 이르면 캐시 미스로 보고 DB에서 다시 채운다.
+DB가 원본이며, PriceRepository.store_rows 가 DB 적재 후 같은 행을 저장소에도 병합한다.
+"""
+import datetime
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from config import setting_env
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+PRICE_FIELDS = ("open", "high", "close", "low")
+COVERED_FROM_KEY = b"covered_from"
+COVERED_TO_KEY = b"covered_to"
+
+_PRICE_TYPES = {
+    "KOR": pa.int64(),
+    "USA": pa.float64(),
+}
+
+_locks: Dict[Path, threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+def _lock_for(path: Path) -> threading.Lock:
+    with _locks_guard:
+        return _locks.setdefault(path, threading.Lock())
+
+
+def _to_date(value) -> datetime.date:
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return pd.Timestamp(value).date()
+
+
+class PriceStore:
+    """종목별 Arrow 파일 기반 가격 저장소"""
+
+    @staticmethod
+    def schema(country: str) -> pa.Schema:
+        """국가별 스키마 (컬럼 순서는 가격 히스토리 테이블과 동일)"""
+        price_type = _PRICE_TYPES[country.upper()]
+        return pa.schema(
+            [("symbol", pa.string()), ("date", pa.date32())]
+            + [(name, price_type) for name in PRICE_FIELDS]
+            + [("volume", pa.int64())]
+        )
+
+    @staticmethod
+    def path(country: str, symbol: str) -> Path:
+        """종목 파일 경로"""
+        return Path(setting_env.PRICE_STORE_DIR) / country.upper() / f"{symbol}.arrow"
+
+    @staticmethod
+    def _read_table(path: Path) -> Optional[pa.Table]:
+        try:
+            with pa.memory_map(str(path), "r") as source:
+                return pa.ipc.open_file(source).read_all()
+        except FileNotFoundError:
+            return None
+        except (pa.ArrowInvalid, OSError) as e:
+            logger.warning(f"가격 저장소 파일 손상, 무시: {path} -> {e}")
+            return None
+
+    @staticmethod
+    def _metadata_date(table: pa.Table, key: bytes) -> Optional[datetime.date]:
+        metadata = table.schema.metadata or {}
+        raw = metadata.get(key)
+        return datetime.date.fromisoformat(raw.decode()) if raw else None
+
+    @staticmethod
+    def _covered_from(table: pa.Table) -> Optional[datetime.date]:
+        return PriceStore._metadata_date(table, COVERED_FROM_KEY)
+
+    @staticmethod
+    def _covered_to(table: pa.Table) -> Optional[datetime.date]:
+        return PriceStore._metadata_date(table, COVERED_TO_KEY)
+
+    @staticmethod
+    def _covers(table: pa.Table, start: datetime.date, fresh_through: Optional[datetime.date]) -> bool:
+        """start부터의 구간을 보장하고 fresh_through까지 DB와 맞춰진 파일인지"""
+        covered_from = PriceStore._covered_from(table)
+        if covered_from is None or covered_from > start:
+            return False
+        if fresh_through is None:
+            return True
+        covered_to = PriceStore._covered_to(table)
+        return covered_to is not None and covered_to >= fresh_through
+
+    @staticmethod
+    def read(
+            country: str,
+            symbol: str,
+            start_date: datetime.datetime,
+            end_date: datetime.datetime,
+            fresh_through: Optional[datetime.date] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        기간 내 가격 히스토리 조회 (DB의 ``date BETWEEN start_date AND end_date``와 같은 구간, 시각은 버림)
+
+        :param fresh_through: 파일이 이 날짜까지 DB와 맞춰져 있어야 적중 (None이면 확인하지 않음)
+        :return: date 오름차순 DataFrame, 파일이 없거나 요청 구간을 보장하지 못하면 None
+        """
+        table = PriceStore._read_table(PriceStore.path(country, symbol))
+        if table is None:
+            return None
+
+        start, end = _to_date(start_date), _to_date(end_date)
+        if not PriceStore._covers(table, start, fresh_through):
+            return None
+
+        return table.filter(PriceStore._between_mask(table, start, end)).to_pandas(date_as_object=True)
+
+    @staticmethod
+    def read_many(
+            country: str,
+            symbols: Iterable[str],
+            start_date: datetime.datetime,
+            end_date: datetime.datetime,
+            fresh_through: Union[datetime.date, Mapping[str, datetime.date], None] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        여러 종목 일괄 조회 (매핑된 테이블을 이어 붙여 pandas 변환을 한 번만 수행)
+
+        :param fresh_through: 파일이 이 날짜까지 DB와 맞춰져 있어야 적중 (종목별 매핑이면 매핑에 없는 종목은 미스)
+        :return: 요청 구간을 보장하는 종목만 담은 {symbol: DataFrame}, 나머지는 캐시 미스
+        """
+        start, end = _to_date(start_date), _to_date(end_date)
+        hits: List[str] = []
+        tables: List[pa.Table] = []
+        for symbol in symbols:
+            if isinstance(fresh_through, Mapping):
+                if symbol not in fresh_through:
+                    continue
+                symbol_fresh_through = fresh_through[symbol]
+            else:
+                symbol_fresh_through = fresh_through
+            table = PriceStore._read_table(PriceStore.path(country, symbol))
+            if table is None or not PriceStore._covers(table, start, symbol_fresh_through):
+                continue
+            hits.append(symbol)
+            tables.append(table.replace_schema_metadata(None))
+        if not tables:
+            return {}
+
+        combined = pa.concat_tables(tables)
+        mask = PriceStore._between_mask(combined, start, end).to_numpy(zero_copy_only=False)
+        # 종목별 테이블 경계에서 남은 행 수를 세어 변환된 프레임을 다시 나눈다
+        bounds = np.cumsum([0] + [table.num_rows for table in tables])
+        offsets = np.concatenate([[0], np.cumsum(mask)])[bounds]
+
+        if not mask.all():
+            combined = combined.filter(mask)
+        frame = combined.to_pandas(date_as_object=True)
+        return {
+            symbol: frame.iloc[offsets[index]:offsets[index + 1]].reset_index(drop=True)
+            for index, symbol in enumerate(hits)
+        }
+
+    @staticmethod
+    def _between_mask(table: pa.Table, start: datetime.date, end: datetime.date) -> pa.ChunkedArray:
+        dates = table.column("date")
+        return pc.and_(
+            pc.greater_equal(dates, pa.scalar(start, pa.date32())),
+            pc.less_equal(dates, pa.scalar(end, pa.date32())),
+        )
+
+    @staticmethod
+    def write(
+            country: str,
+            symbol: str,
+            rows: pd.DataFrame,
+            covered_from: datetime.datetime
+    ) -> None:
+        """
+        종목 파일 전체 교체 (DB에서 다시 채울 때 사용)
+
+        rows는 DB 조회 결과 전체여야 하며, 마지막 행의 일자를 DB와 맞춘 일자(covered_to)로 기록한다.
+        빈 결과는 아직 적재 전일 수 있어 저장하지 않는다.
+
+        :param covered_from: rows가 빠짐없이 담고 있는 구간의 시작 (조회 시작 시각)
+        """
+        if rows.empty:
+            return
+        path = PriceStore.path(country, symbol)
+        covered_to = max(_to_date(value) for value in rows["date"])
+        with _lock_for(path):
+            PriceStore._write_unlocked(country, path, rows, _to_date(covered_from), covered_to)
+
+    @staticmethod
+    def merge(country: str, symbol: str, rows: Iterable[Dict[str, Any]]) -> None:
+        """
+        적재된 행을 종목 파일에 병합 (같은 날짜는 새 값으로 교체)
+
+        파일이 없으면 새 행의 최초 일자부터 보장하는 파일을 만든다. 새 행이 파일의 covered_to 다음
+        거래일 이전부터 시작할 때만 covered_to를 늘리고, 사이가 비면 그대로 둬 다음 조회가 DB에서
+        다시 채우게 한다.
+        """
+        new_rows = pd.DataFrame(list(rows))
+        if new_rows.empty:
+            return
+
+        path = PriceStore.path(country, symbol)
+        with _lock_for(path):
+            existing = PriceStore._read_table(path)
+            new_rows["date"] = new_rows["date"].map(_to_date)
+            first_date = min(new_rows["date"])
+            last_date = max(new_rows["date"])
+            if existing is None:
+                merged, covered_from, covered_to = new_rows, first_date, last_date
+            else:
+                # 보장 구간은 유지 (앞쪽에 붙은 행은 사이 구간이 비어 있을 수 있어 보장하지 않음)
+                covered_from = PriceStore._covered_from(existing) or first_date
+                covered_to = PriceStore._covered_to(existing)
+                if covered_to is not None and first_date <= PriceStore._next_session(country, covered_to):
+                    covered_to = max(covered_to, last_date)
+                old_rows = existing.to_pandas(date_as_object=True)
+                old_rows = old_rows[~old_rows["date"].isin(set(new_rows["date"]))]
+                merged = pd.concat([old_rows, new_rows], ignore_index=True)
+            PriceStore._write_unlocked(country, path, merged, covered_from, covered_to)
+
+    @staticmethod
+    def _next_session(country: str, date: datetime.date) -> datetime.date:
+        """date 다음 거래일"""
+        from services.trading_calendar import get_trading_calendar
+
+        return get_trading_calendar(country).nth_open_day(date, 1)
+
+    @staticmethod
+    def _write_unlocked(
+            country: str,
+            path: Path,
+            rows: pd.DataFrame,
+            covered_from: datetime.date,
+            covered_to: Optional[datetime.date]
+    ) -> None:
+        try:
+            PriceStore._write_file(country, path, rows, covered_from, covered_to)
+        except (OSError, pa.ArrowException, ValueError) as e:
+            # 저장소는 캐시이므로 쓰기 실패 시 파일을 지워 다음 조회가 DB로 가도록 한다
+            logger.warning(f"가격 저장소 쓰기 실패: {path} -> {e}")
+            path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _write_file(
+            country: str,
+            path: Path,
+            rows: pd.DataFrame,
+            covered_from: datetime.date,
+            covered_to: Optional[datetime.date]
+    ) -> None:
+        metadata = {COVERED_FROM_KEY: covered_from.isoformat().encode()}
+        if covered_to is not None:
+            metadata[COVERED_TO_KEY] = covered_to.isoformat().encode()
+        schema = PriceStore.schema(country).with_metadata(metadata)
+        if rows.empty:
+            table = schema.empty_table()
+        else:
+            table = PriceStore._to_table(rows, schema)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _to_table(rows: pd.DataFrame, schema: pa.Schema) -> pa.Table:
+        frame = rows.reindex(columns=schema.names).sort_values("date").reset_index(drop=True)
+        frame["date"] = frame["date"].map(_to_date)
+        for name in PRICE_FIELDS + ("volume",):
+            frame[name] = pd.to_numeric(frame[name], errors="coerce")
+            if pa.types.is_integer(schema.field(name).type):
+                frame[name] = frame[name].round().astype("Int64")
+        return pa.Table.from_pandas(frame, schema=schema, preserve_index=False)
+
+    @staticmethod
+    def invalidate(country: str, symbol: str) -> None:
+        """종목 파일 삭제 (다음 조회 시 DB에서 다시 채움)"""
+        path = PriceStore.path(country, symbol)
+        with _lock_for(path):
+            path.unlink(missing_ok=True)
+
+    @staticmethod
+    def symbols(country: str) -> List[str]:
+        """저장소에 파일이 있는 종목 목록"""
+        directory = Path(setting_env.PRICE_STORE_DIR) / country.upper()
+        if not directory.is_dir():
+            return []
+        return sorted(path.stem for path in directory.glob("*.arrow"))
@@ -1,8 +1,7 @@
 """종목 정보 데이터 접근"""
 import datetime
-import os
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict
 
 import FinanceDataReader
 import pandas as pd
@@ -10,10 +9,10 @@ from dateutil.relativedelta import relativedelta
 
 from config.logging_config import get_logger
 from data.models import Stock, PriceHistory, PriceHistoryUS
+from utils.data_util import bulk_upsert
 from config.constants import (
     KOREAN_STOCK_PATTERN,
     AMERICA_STOCK_PATTERN,
-    MAX_WORKER_COUNT,
     DEFAULT_PRICE_HISTORY_YEARS,
 )
 
@@ -23,6 +22,12 @@ logger = get_logger(__name__)
 class StockRepository:
     """종목 정보 Repository"""
 
+    # FinanceDataReader 시장 목록 → KIS 해외거래소 코드 (OVRS_EXCG_CD)
+    USA_LISTING_EXCHANGES = {
+        'NASDAQ': 'NASD',
+        'NYSE': 'NYSE',
+    }
+
     @staticmethod
     def get_country_by_symbol(symbol: str) -> str:
         """종목코드로 국가 판별"""
@@ -120,20 +125,52 @@ class StockRepository:
         Stock.delete().where(Stock.symbol == symbol).execute()
 
     @staticmethod
-    def _process_listing(df, code_col, name_col, region):
-        """시장 데이터를 처리하고 insert 함수를 병렬로 실행"""
+    def get_exchange_map(country: str = "USA") -> Dict[str, str]:
+        """거래소가 기록된 종목의 {종목코드: 해외거래소 코드}"""
+        query = Stock.select(Stock.symbol, Stock.exchange).where(
+            (Stock.country == country) & Stock.exchange.is_null(False)
+        )
+        return {row.symbol: row.exchange for row in query.namedtuples()}
+
+    @staticmethod
+    def _process_listing(df, code_col, name_col, region, exchange_col: str = None):
+        """
+        시장 데이터의 신규 종목 저장 후 가격 히스토리를 일괄 적재
+
+        종목 행은 한 번에 insert하고, 히스토리는 종목별로 따로 적재하지 않고
+        PriceRepository.backfill로 모아서 적재한다. exchange_col이 있으면 기존 종목의
+        거래소도 목록 기준으로 갱신한다.
+        """
         try:
-            with ThreadPoolExecutor(max_workers=min(os.cpu_count(), MAX_WORKER_COUNT)) as executor:
-                futures = [
-                    executor.submit(StockRepository.insert, item[code_col], item[name_col], region)
-                    for item in df.to_dict('records')
-                ]
-
-                for future in as_completed(futures):
-                    try:
-                        future.result()
-                    except Exception as e:
-                        logger.error(f"Error while processing data: {e}")
+            existing = {stock.symbol: stock.exchange for stock in Stock.select(Stock.symbol, Stock.exchange)}
+            new_rows = {}
+            exchange_updates = {}
+            for item in df.to_dict('records'):
+                symbol = item[code_col]
+                if not isinstance(symbol, str) or not symbol:
+                    continue
+                exchange = item.get(exchange_col) if exchange_col else None
+                exchange = exchange if isinstance(exchange, str) and exchange else None
+                if symbol not in existing:
+                    new_rows.setdefault(symbol, {'symbol': symbol, 'company_name': item[name_col], 'country': region, 'exchange': exchange})
+                elif exchange and existing[symbol] != exchange:
+                    exchange_updates.setdefault(symbol, {'symbol': symbol, 'company_name': item[name_col], 'exchange': exchange})
+
+            if exchange_updates:
+                if bulk_upsert(Stock, list(exchange_updates.values()), [Stock.symbol], ['exchange']):
+                    logger.info(f"종목 거래소 갱신 {len(exchange_updates)}개 ({region})")
+                else:
+                    logger.error(f"종목 거래소 갱신 실패: {region} {len(exchange_updates)}개")
+            if not new_rows:
+                return
+
+            if not bulk_upsert(Stock, list(new_rows.values()), [Stock.symbol]):
+                logger.error(f"신규 종목 저장 실패: {region} {len(new_rows)}개")
+                return
+            logger.info(f"신규 종목 {len(new_rows)}개 저장 ({region}), 가격 히스토리 적재 시작")
+
+            from repositories.price_repository import PriceRepository
+            PriceRepository.backfill(new_rows)
         except Exception as e:
             logger.error(f"Error loading data for market: {e}")
 
@@ -150,13 +187,14 @@ class StockRepository:
             logger.error(f"Error loading KOR data: {e}")
 
         try:
-            df_us = pd.concat([
-                FinanceDataReader.StockListing('S&P500'),
-                FinanceDataReader.StockListing('NASDAQ'),
-                FinanceDataReader.StockListing('NYSE')
-            ])
+            # 거래소별 목록을 먼저 두어 S&P500과 겹치는 종목은 거래소가 있는 행을 사용
+            listings = [
+                FinanceDataReader.StockListing(market).assign(Exchange=exchange)
+                for market, exchange in StockRepository.USA_LISTING_EXCHANGES.items()
+            ]
+            df_us = pd.concat(listings + [FinanceDataReader.StockListing('S&P500')])
             try:
-                StockRepository._process_listing(df_us, "Symbol", "Name", "USA")
+                StockRepository._process_listing(df_us, "Symbol", "Name", "USA", exchange_col="Exchange")
             except Exception as e:
                 logger.error(f"Error insert USA data: {e}")
         except Exception as e:
@@ -1,5 +1,5 @@
+import datetime
 from contextlib import asynccontextmanager
-from datetime import datetime, timedelta
 from typing import AsyncGenerator
 
 from apscheduler.schedulers.background import BackgroundScheduler
@@ -10,6 +10,7 @@ from config import setting_env
 from config.logging_config import get_logger
 from services import data_handler
 from services.data_handler import add_stock_price
+from services.trading_calendar import update_trading_calendar
 from services.workflows.korea_workflow import korea_trading
 from services.workflows.usa_workflow import usa_trading
 from services.workflows.etf_workflow import buy_etf_group_stocks
@@ -21,6 +22,27 @@ def start() -> None:
     """스케줄러 시작"""
     scheduler = BackgroundScheduler(misfire_grace_time=3600, coalesce=True, timezone='Asia/Seoul')
 
+    # 워크플로우가 API 호출 없이 개장일을 조회하도록 거래일 달력을 미리 적재 (시작 시 1회 포함)
+    # 매매 잡과 같이 SIMULATE 모드에서도 실행한다
+    scheduler.add_job(
+        update_trading_calendar,
+        trigger=CronTrigger(day_of_week="mon", hour=7, minute=0, second=0),
+        id="update_trading_calendar",
+        max_instances=1,
+        replace_existing=True,
+        next_run_time=datetime.datetime.now(),
+    )
+
+    # 매매 전 지수/VIX/환율 시계열을 증분 적재해 시장 상황 판단이 로컬에서 끝나도록 함 (시작 시 1회 포함)
+    scheduler.add_job(
+        data_handler.update_market_series,
+        trigger=CronTrigger(day_of_week="mon-sat", hour=7, minute=40, second=0),
+        id="update_market_series",
+        max_instances=1,
+        replace_existing=True,
+        next_run_time=datetime.datetime.now(),
+    )
+
     if not setting_env.SIMULATE:
         scheduler.add_job(
             data_handler.update_subscription_stock,
@@ -46,10 +68,29 @@ def start() -> None:
             replace_existing=True,
         )
 
+        # 장 마감 후 체결 내역을 마지막 저장일부터 증분 동기화
+        scheduler.add_job(
+            data_handler.sync_order_history,
+            trigger=CronTrigger(day_of_week="mon-fri", hour=16, minute=30, second=0),
+            kwargs={'country': 'KOR'},
+            id="sync_korea_order_history",
+            max_instances=1,
+            replace_existing=True,
+        )
+
+        scheduler.add_job(
+            data_handler.sync_order_history,
+            trigger=CronTrigger(day_of_week="tue-sat", hour=7, minute=30, second=0),
+            kwargs={'country': 'USA'},
+            id="sync_usa_order_history",
+            max_instances=1,
+            replace_existing=True,
+        )
+
         scheduler.add_job(
             add_stock_price,
             trigger=CronTrigger(day_of_week="tue-sat", hour=12, minute=00, second=0),
-            kwargs={'country': 'USA', 'start_date': datetime.now() - timedelta(days=5)},
+            kwargs={'country': 'USA'},
             id="add_usa_stock_price",
             max_instances=1,
             replace_existing=True,
@@ -90,6 +131,7 @@ def start() -> None:
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """FastAPI lifespan 이벤트 핸들러"""
+    data_handler.load_exchange_index()
     start()
     yield
     logger.info("lifespan finished")
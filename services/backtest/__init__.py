@@ -0,0 +1,29 @@
+"""전략 백테스트 모듈"""
+from services.backtest.engine import Backtester, BacktestReport, Fill
+from services.backtest.market import HistoricalMarketSnapshot, load_market_series
+from services.backtest.price_cache import BacktestPriceCache
+from services.backtest.shared_panel import SharedPricePanel
+from services.backtest.sweep import (
+    ParameterSweep,
+    SweepResult,
+    WalkForwardResult,
+    apply_config,
+    grid,
+    sample_configs,
+)
+
+__all__ = [
+    "Backtester",
+    "BacktestReport",
+    "Fill",
+    "HistoricalMarketSnapshot",
+    "load_market_series",
+    "BacktestPriceCache",
+    "SharedPricePanel",
+    "ParameterSweep",
+    "SweepResult",
+    "WalkForwardResult",
+    "apply_config",
+    "grid",
+    "sample_configs",
+]
@@ -0,0 +1,288 @@
+"""저장된 가격 히스토리로 전략을 하루씩 재생하는 백테스터"""
+import datetime
+import time
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from config import setting_env
+from config.constants import (
+    BACKTEST_BUY_ORDER_DAYS,
+    BACKTEST_FEE_RATE,
+    BACKTEST_SELL_ORDER_DAYS,
+    DEFAULT_PRICE_HISTORY_DAYS,
+    MARKET_INDEX_SYMBOLS,
+)
+from config.logging_config import get_logger
+from services.backtest.market import HistoricalMarketSnapshot, load_market_series
+from services.backtest.price_cache import BacktestPriceCache
+from services.strategies.base import BaseStrategy
+from services.workflows.base import (
+    build_buy_orders,
+    build_sell_orders,
+    default_strategies,
+    select_buy_stocks,
+    select_sell_stocks,
+)
+from services.workflows.holdings import HoldingsSnapshot
+from services.workflows.order_dispatcher import BUY, OrderRequest
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class Fill:
+    """체결 한 건"""
+    date: datetime.date
+    symbol: str
+    side: str
+    price: float
+    volume: int
+    fee: float
+    realized_pnl: float = 0.0
+
+    @property
+    def amount(self) -> float:
+        return self.price * self.volume
+
+
+@dataclass
+class Position:
+    """보유 종목 (수량, 평균 매입가)"""
+    quantity: int = 0
+    average_price: float = 0.0
+
+
+@dataclass
+class BacktestReport:
+    """백테스트 결과 (일별 평가금액과 체결 내역)"""
+    country: str
+    start: datetime.date
+    end: datetime.date
+    initial_equity: float
+    equity: pd.Series
+    fills: List[Fill] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def final_equity(self) -> float:
+        return float(self.equity.iloc[-1]) if len(self.equity) else self.initial_equity
+
+    @property
+    def pnl(self) -> float:
+        """평가 손익 (수수료 차감 후)"""
+        return self.final_equity - self.initial_equity
+
+    @property
+    def return_pct(self) -> float:
+        return self.pnl / self.initial_equity * 100 if self.initial_equity else 0.0
+
+    @property
+    def realized_pnl(self) -> float:
+        """매도 체결 실현 손익 (수수료 차감 후)"""
+        return sum(fill.realized_pnl for fill in self.fills)
+
+    @property
+    def fees(self) -> float:
+        return sum(fill.fee for fill in self.fills)
+
+    @property
+    def max_drawdown_pct(self) -> float:
+        """최대 낙폭 (%)"""
+        if self.equity.empty:
+            return 0.0
+        drawdown = self.equity / self.equity.cummax() - 1
+        return float(-drawdown.min() * 100)
+
+    @property
+    def turnover(self) -> float:
+        """회전율 (총 체결 금액 / 평균 평가금액)"""
+        average_equity = float(self.equity.mean()) if len(self.equity) else 0.0
+        return sum(fill.amount for fill in self.fills) / average_equity if average_equity else 0.0
+
+    def summary(self) -> Dict[str, float]:
+        """결과 지표 요약 (파라미터 탐색 결과 비교용)"""
+        buys = sum(1 for fill in self.fills if fill.side == BUY)
+        return {
+            'pnl': self.pnl,
+            'return_pct': self.return_pct,
+            'realized_pnl': self.realized_pnl,
+            'max_drawdown_pct': self.max_drawdown_pct,
+            'turnover': self.turnover,
+            'fees': self.fees,
+            'buys': buys,
+            'sells': len(self.fills) - buys,
+            'elapsed': self.elapsed,
+        }
+
+    def log(self) -> None:
+        """결과 요약 로깅"""
+        summary = self.summary()
+        logger.info(
+            f"백테스트 결과 [{self.country} {self.start} ~ {self.end}]: "
+            f"손익 {summary['pnl']:,.0f} ({summary['return_pct']:.2f}%), 실현 {summary['realized_pnl']:,.0f}, "
+            f"MDD {summary['max_drawdown_pct']:.2f}%, 회전율 {summary['turnover']:.2f}, "
+            f"체결 {len(self.fills)}건 (매수 {summary['buys']}, 매도 {summary['sells']}), "
+            f"수수료 {summary['fees']:,.0f}, 소요 {summary['elapsed']:.1f}초"
+        )
+
+
+class Backtester:
+    """
+    이벤트 기반 백테스터
+
+    거래일마다 (1) 전일까지 접수된 지정가 주문을 당일 시세로 체결하고 (2) 종가로 평가한 뒤
+    (3) 실거래 워크플로우와 같은 select_sell_stocks/select_buy_stocks와 주문 변환 규칙으로
+    다음 거래일부터 유효한 주문을 만든다. 전략은 BacktestPriceCache와 HistoricalMarketSnapshot을
+    통해 기준일까지의 데이터만 본다.
+
+    체결 규칙: 매수는 저가가 지정가 이하이면 min(시가, 지정가), 매도는 고가가 지정가 이상이면
+    max(시가, 지정가)로 체결한다. 현금이 부족하면 살 수 있는 수량만 체결한다.
+    """
+
+    def __init__(
+            self,
+            country: str = "KOR",
+            start: datetime.date = None,
+            end: datetime.date = None,
+            strategies: Optional[List[BaseStrategy]] = None,
+            initial_cash: Optional[float] = None,
+            fee_rate: float = BACKTEST_FEE_RATE,
+            days: int = DEFAULT_PRICE_HISTORY_DAYS,
+            price_cache: Optional[BacktestPriceCache] = None,
+            market_series: Optional[Dict[str, pd.DataFrame]] = None,
+    ):
+        """
+        :param country: 국가 코드 (KOR, USA)
+        :param start: 시작일 (기본값: 1년 전)
+        :param end: 종료일 (기본값: 오늘)
+        :param strategies: 재생할 전략 (기본값: 워크플로우 기본 전략)
+        :param initial_cash: 초기 자금 (기본값: EQUITY_USD, 국내는 시작일 환율로 환산)
+        :param fee_rate: 체결 금액 대비 수수료율
+        :param days: 전략에 보여 줄 가격 히스토리 기간 (일)
+        :param price_cache: 재사용할 가격 캐시 (여러 번 실행할 때 지표 계산 공유, 기본값: 새로 생성)
+        :param market_series: 미리 읽어 둔 시장 지표 시계열 (기본값: load_market_series)
+        """
+        self.country = country.upper()
+        self.end = end or datetime.date.today()
+        self.start = start or self.end - datetime.timedelta(days=365)
+        self.strategies = strategies or default_strategies()
+        self.initial_cash = initial_cash
+        self.fee_rate = fee_rate
+        self.days = days
+        self.buy_order_days = BACKTEST_BUY_ORDER_DAYS.get(self.country, 1)
+        self.price_cache = price_cache
+        self.market_series = market_series
+
+    def run(self) -> BacktestReport:
+        """백테스트 실행"""
+        started = time.perf_counter()
+        series = self.market_series if self.market_series is not None else load_market_series(self.start, self.end)
+        trading_days = self._trading_days(series)
+        if not trading_days:
+            raise ValueError(f"백테스트 기간에 거래일이 없습니다: {self.start} ~ {self.end}")
+
+        price_cache = self.price_cache or BacktestPriceCache(self.start, days=self.days)
+        cash = self.initial_cash
+        if cash is None:
+            equity_usd = float(getattr(setting_env, "EQUITY_USD", 100_000.0))
+            cash = equity_usd * (1 if self.country == "USA" else HistoricalMarketSnapshot(series, trading_days[0]).usd_krw)
+        initial_equity = cash
+
+        positions: Dict[str, Position] = {}
+        open_orders: List[tuple[OrderRequest, int]] = []
+        fills: List[Fill] = []
+        equity: Dict[datetime.date, float] = {}
+
+        for index, day in enumerate(trading_days):
+            price_cache.set_as_of(day)
+
+            # 전일까지 접수된 주문 체결 (만료된 주문 제거)
+            open_orders = [(order, expires) for order, expires in open_orders if expires >= index]
+            remaining = []
+            for order, expires in open_orders:
+                fill = self._try_fill(order, day, price_cache, positions, cash)
+                if fill is None:
+                    remaining.append((order, expires))
+                    continue
+                cash += -fill.amount - fill.fee if fill.side == BUY else fill.amount - fill.fee
+                fills.append(fill)
+            open_orders = remaining
+
+            equity[day] = cash + sum(
+                position.quantity * (price_cache.last_close(symbol, day) or position.average_price)
+                for symbol, position in positions.items()
+            )
+
+            # 기준일 데이터로 다음 거래일부터 유효한 주문 생성
+            market = HistoricalMarketSnapshot(series, day)
+            holdings = HoldingsSnapshot([
+                SimpleNamespace(pdno=symbol, hldg_qty=str(position.quantity), pchs_avg_pric=str(position.average_price))
+                for symbol, position in positions.items()
+            ])
+            sell_levels = select_sell_stocks(holdings, price_cache=price_cache, market=market, strategies=self.strategies)
+            buy_levels = select_buy_stocks(self.country, price_cache=price_cache, market=market, strategies=self.strategies)
+            open_orders.extend((order, index + BACKTEST_SELL_ORDER_DAYS) for order in build_sell_orders(sell_levels, holdings))
+            open_orders.extend((order, index + self.buy_order_days) for order in build_buy_orders(buy_levels, holdings))
+
+        report = BacktestReport(
+            country=self.country,
+            start=trading_days[0],
+            end=trading_days[-1],
+            initial_equity=initial_equity,
+            equity=pd.Series(equity, dtype=float),
+            fills=fills,
+            elapsed=time.perf_counter() - started,
+        )
+        price_cache.log_stats()
+        report.log()
+        return report
+
+    def _trading_days(self, series: Dict[str, pd.DataFrame]) -> List[datetime.date]:
+        """기간 내 거래일 (국가 대표 지수가 있는 날, 지수가 없으면 평일)"""
+        index = series.get(MARKET_INDEX_SYMBOLS.get(self.country, MARKET_INDEX_SYMBOLS["KOR"]))
+        if index is not None and not index.empty:
+            return [date for date in index.index if self.start <= date <= self.end]
+        logger.warning(f"지수 시계열이 없어 평일을 거래일로 사용: {self.country}")
+        return [date.date() for date in pd.bdate_range(self.start, self.end)]
+
+    def _try_fill(
+            self,
+            order: OrderRequest,
+            day: datetime.date,
+            price_cache: BacktestPriceCache,
+            positions: Dict[str, Position],
+            cash: float
+    ) -> Optional[Fill]:
+        """당일 시세로 지정가 주문 체결 시도 (체결되지 않으면 None)"""
+        bar = price_cache.bar(order.symbol, day)
+        if bar is None or pd.isna(bar["low"]) or pd.isna(bar["high"]):
+            return None
+        open_price = bar["open"] if not pd.isna(bar["open"]) else order.price
+
+        if order.side == BUY:
+            if float(bar["low"]) > order.price:
+                return None
+            price = min(float(open_price), order.price)
+            volume = min(order.volume, int(cash / (price * (1 + self.fee_rate)))) if price > 0 else 0
+            if volume <= 0:
+                return None
+            position = positions.setdefault(order.symbol, Position())
+            cost = position.average_price * position.quantity + price * volume
+            position.quantity += volume
+            position.average_price = cost / position.quantity
+            return Fill(day, order.symbol, order.side, price, volume, price * volume * self.fee_rate)
+
+        position = positions.get(order.symbol)
+        if position is None or position.quantity <= 0 or float(bar["high"]) < order.price:
+            return None
+        price = max(float(open_price), order.price)
+        volume = min(order.volume, position.quantity)
+        fee = price * volume * self.fee_rate
+        realized = (price - position.average_price) * volume - fee
+        position.quantity -= volume
+        if position.quantity == 0:
+            del positions[order.symbol]
+        return Fill(day, order.symbol, order.side, price, volume, fee, realized)
@@ -0,0 +1,91 @@
+"""백테스트 기준일 시장 지표 스냅샷"""
+import datetime
+from typing import Dict, Optional
+
+import pandas as pd
+
+from config.constants import MARKET_INDEX_SYMBOLS, MARKET_SERIES_INITIAL_DAYS, MARKET_SERIES_SYMBOLS
+from config.logging_config import get_logger
+from repositories.market_series_repository import MarketSeriesRepository
+from services.market_condition import classify_market_trend
+from services.market_snapshot import MarketSnapshot
+
+logger = get_logger(__name__)
+
+
+def load_market_series(start: datetime.date, end: datetime.date) -> Dict[str, pd.DataFrame]:
+    """
+    백테스트 기간의 시장 지표 시계열 로드
+
+    market_series가 시작일 이전 SMA200 계산 구간까지 채워져 있지 않으면 한 번 백필한 뒤 읽는다.
+
+    :return: {지표 심볼: date 인덱스 DataFrame (close, sma50, sma200)}
+    """
+    backfill_from = start - datetime.timedelta(days=MARKET_SERIES_INITIAL_DAYS)
+    series_frames = {}
+    for series in MARKET_SERIES_SYMBOLS:
+        df = MarketSeriesRepository.get_range(series, end=end)
+        if df.empty or df.index[0] > start:
+            try:
+                MarketSeriesRepository.update(series, start=backfill_from)
+                df = MarketSeriesRepository.get_range(series, end=end)
+            except Exception as e:
+                logger.warning(f"시장 지표 백필 실패: {series} -> {e}")
+        series_frames[series] = df
+    return series_frames
+
+
+class HistoricalMarketSnapshot(MarketSnapshot):
+    """
+    과거 기준일의 시장 지표 (미리 읽어 둔 market_series에서 기준일 이전 마지막 값을 조회)
+
+    전략은 실거래와 같은 MarketSnapshot 인터페이스로 VIX/지수 추세/환율을 읽고, as_of는
+    매수 기준일로 그대로 쓰인다.
+    """
+
+    def __init__(self, series: Dict[str, pd.DataFrame], as_of: datetime.date):
+        """
+        :param series: load_market_series 결과
+        :param as_of: 기준일
+        """
+        super().__init__(ttl=float("inf"))
+        self.as_of = as_of
+        self._series = series
+
+    def _row(self, symbol: str, earliest: bool = False) -> Optional[pd.Series]:
+        """기준일 이전 마지막 행 (earliest이면 기준일이 범위 앞이어도 첫 행으로 대체)"""
+        df = self._series.get(symbol)
+        if df is None or df.empty:
+            return None
+        index = df.index.searchsorted(self.as_of, side="right") - 1
+        if index < 0:
+            return df.iloc[0] if earliest else None
+        return df.iloc[index]
+
+    @property
+    def vix(self) -> Optional[float]:
+        def load():
+            row = self._row("VIX")
+            return float(row["close"]) if row is not None else None
+        return self._get(("vix",), load)
+
+    @property
+    def usd_krw(self) -> float:
+        def load():
+            row = self._row("USD/KRW", earliest=True)
+            if row is None:
+                raise ValueError(f"원/달러 환율 시계열 없음: {self.as_of}")
+            return float(row["close"])
+        return self._get(("usd_krw",), load)
+
+    def market_trend(self, country: str) -> str:
+        def load():
+            row = self._row(MARKET_INDEX_SYMBOLS.get(country, MARKET_INDEX_SYMBOLS["KOR"]))
+            if row is None:
+                return "neutral"
+            return classify_market_trend(
+                float(row["close"]),
+                None if pd.isna(row["sma50"]) else row["sma50"],
+                None if pd.isna(row["sma200"]) else row["sma200"],
+            )
+        return self._get(("trend", country), load)
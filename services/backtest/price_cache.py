@@ -0,0 +1,155 @@
+"""백테스트용 기준일 가격 캐시"""
+import datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config.constants import DEFAULT_PRICE_HISTORY_DAYS
+from services.backtest.shared_panel import SharedPricePanel
+from services.indicator_bundle import IndicatorBundle
+from services.indicator_engine import IndicatorEngine
+from services.price_cache import PriceCache
+
+
+class BacktestPriceCache(PriceCache):
+    """
+    기준일(as_of)까지의 데이터만 보이는 가격 캐시
+
+    백테스트 기간 전체 히스토리를 종목별로 한 번만 읽어 두고, set_as_of()로 날짜를 옮길 때마다
+    실거래와 같은 [as_of - days, as_of] 구간만 잘라 전략에 넘긴다. 지표 번들과 벡터 엔진은 전체
+    히스토리에서 지표를 한 번 계산해 두고 구간 뷰로 공유하므로, 날짜마다 창 전체를 다시 계산하지 않는다.
+    같은 캐시로 백테스트를 여러 번 실행하면 (파라미터 탐색) 계산해 둔 지표도 그대로 재사용된다.
+    """
+
+    def __init__(
+            self,
+            start: datetime.date,
+            days: int = DEFAULT_PRICE_HISTORY_DAYS,
+            panel: Optional[SharedPricePanel] = None
+    ):
+        """
+        :param start: 백테스트 시작일 (이보다 days일 앞선 히스토리부터 적재)
+        :param days: 전략에 보여 줄 조회 기간 (일, 실거래 PriceCache와 동일)
+        :param panel: 공유 가격 패널 (있으면 패널에 든 종목은 DB 대신 패널에서 읽음)
+        """
+        super().__init__(days=days + (datetime.date.today() - start).days)
+        self._window_days = days
+        self._panel = panel
+        self._dates: Dict[str, np.ndarray] = {}
+        self._bounds: Dict[str, Tuple[int, int]] = {}
+        self._engines: Dict[Tuple[str, ...], IndicatorEngine] = {}
+        self.as_of: Optional[datetime.date] = None
+
+    def loaded_frames(self) -> Dict[str, pd.DataFrame]:
+        """적재된 전체 기간 히스토리 (공유 패널 생성용, 읽기 전용)"""
+        return {symbol: df for symbol, df in self._frames.items() if df is not None}
+
+    def set_as_of(self, as_of: datetime.date) -> None:
+        """기준일 이동 (이후 조회는 as_of까지의 데이터만 반환)"""
+        self.as_of = as_of
+        self._bounds = {}
+        self._served = set()
+
+    def prefetch(self, symbols: Iterable[str]) -> None:
+        """캐시에 없는 종목의 전체 기간 히스토리를 일괄 적재"""
+        missing = [symbol for symbol in dict.fromkeys(symbols) if symbol and symbol not in self._frames]
+        if self._panel is not None:
+            for symbol in missing:
+                if symbol in self._panel:
+                    self.misses += 1
+                    self._frames[symbol] = self._panel.frame(symbol)
+        super().prefetch([symbol for symbol in missing if symbol not in self._frames])
+        for symbol in missing:
+            df = self._frames.get(symbol)
+            if df is None:
+                continue
+            df = df.reset_index(drop=True)
+            self._frames[symbol] = df
+            self._dates[symbol] = df["date"].astype(str).to_numpy(dtype=object)
+
+    def _window(self, symbol: str) -> Tuple[int, int]:
+        """종목 히스토리에서 기준일 조회 구간의 행 범위 [start, end)"""
+        if symbol not in self._bounds:
+            dates = self._dates.get(symbol)
+            if dates is None or self.as_of is None:
+                self._bounds[symbol] = (0, 0)
+            else:
+                start = str(self.as_of - datetime.timedelta(days=self._window_days))
+                self._bounds[symbol] = (
+                    int(np.searchsorted(dates, start)),
+                    int(np.searchsorted(dates, str(self.as_of), side="right")),
+                )
+        return self._bounds[symbol]
+
+    def get(self, symbol: str) -> Optional[pd.DataFrame]:
+        """기준일 조회 구간의 가격 히스토리 사본 (없으면 None)"""
+        if symbol not in self._frames:
+            self.prefetch([symbol])
+
+        if symbol in self._served:
+            self.hits += 1
+        else:
+            self._served.add(symbol)
+
+        df = self._frames.get(symbol)
+        start, end = self._window(symbol)
+        if df is None or end <= start:
+            return None
+        return df.iloc[start:end].copy()
+
+    def indicators(self, symbol: str) -> Optional[IndicatorBundle]:
+        """기준일 조회 구간의 지표 번들 (전체 히스토리 번들의 구간 뷰)"""
+        bundle = super().indicators(symbol)
+        start, end = self._window(symbol)
+        if bundle is None or end <= start:
+            return None
+        return bundle.window(start, end)
+
+    def frames(self, symbols: Iterable[str]) -> Dict[str, pd.DataFrame]:
+        """기준일 조회 구간의 원본 히스토리 (읽기 전용)"""
+        symbols = list(dict.fromkeys(symbols))
+        self.prefetch(symbols)
+        frames = {}
+        for symbol in symbols:
+            df = self._frames.get(symbol)
+            start, end = self._window(symbol)
+            if df is not None and end > start:
+                frames[symbol] = df.iloc[start:end]
+        return frames
+
+    def engine(self, symbols: Iterable[str]) -> IndicatorEngine:
+        """기준일 조회 구간의 벡터 지표 엔진 (종목 묶음별 전체 기간 엔진의 구간 뷰)"""
+        key = tuple(sorted(set(symbols)))
+        if key not in self._engines:
+            self.prefetch(key)
+            self._engines[key] = IndicatorEngine.aligned(
+                {symbol: self._frames[symbol] for symbol in key if self._frames.get(symbol) is not None}
+            )
+        engine = self._engines[key]
+        start = str(self.as_of - datetime.timedelta(days=self._window_days))
+        return engine.window(
+            int(np.searchsorted(engine.dates, start)),
+            int(np.searchsorted(engine.dates, str(self.as_of), side="right")),
+        )
+
+    def bar(self, symbol: str, date: datetime.date) -> Optional[pd.Series]:
+        """종목의 해당 날짜 시세 행 (거래가 없으면 None)"""
+        dates = self._dates.get(symbol)
+        if dates is None:
+            return None
+        index = int(np.searchsorted(dates, str(date)))
+        if index >= len(dates) or dates[index] != str(date):
+            return None
+        return self._frames[symbol].iloc[index]
+
+    def last_close(self, symbol: str, date: datetime.date) -> Optional[float]:
+        """해당 날짜 이전 마지막 종가 (평가용)"""
+        dates = self._dates.get(symbol)
+        if dates is None:
+            return None
+        index = int(np.searchsorted(dates, str(date), side="right")) - 1
+        if index < 0:
+            return None
+        close = self._frames[symbol]["close"].iloc[index]
+        return None if pd.isna(close) else float(close)
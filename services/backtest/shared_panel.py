@@ -0,0 +1,95 @@
+"""프로세스 간 공유 가격 패널 (multiprocessing.shared_memory)"""
+import datetime
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+PANEL_COLUMNS = ("date", "open", "high", "low", "close", "volume")
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+@dataclass(frozen=True)
+class PanelSpec:
+    """워커가 공유 메모리에 붙기 위한 패널 정보 (피클로 전달)"""
+    name: str
+    symbols: Tuple[str, ...]
+    offsets: Tuple[int, ...]
+    rows: int
+
+
+class SharedPricePanel:
+    """
+    종목별 가격 히스토리를 하나의 공유 메모리 블록에 이어 붙인 패널
+
+    (전체 행 × PANEL_COLUMNS) float64 배열 하나에 종목 히스토리를 순서대로 넣고, 종목별 시작 위치만
+    따로 둔다. 부모 프로세스가 한 번 만들면 워커는 이름으로 붙어 복사 없이 읽으므로, 워커 수만큼
+    가격 히스토리를 다시 조회하거나 메모리에 복제하지 않는다. 날짜는 1970-01-01 기준 일수로 저장한다.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, spec: PanelSpec, owner: bool):
+        self._shm = shm
+        self.spec = spec
+        self._owner = owner
+        self._values = np.ndarray((spec.rows, len(PANEL_COLUMNS)), dtype=np.float64, buffer=shm.buf)
+        self._index = {symbol: i for i, symbol in enumerate(spec.symbols)}
+
+    @classmethod
+    def create(cls, frames: Dict[str, pd.DataFrame]) -> "SharedPricePanel":
+        """종목별 히스토리로 공유 패널 생성 (생성한 프로세스가 close()로 해제)"""
+        frames = {symbol: df for symbol, df in frames.items() if df is not None and not df.empty}
+        offsets = [0]
+        for df in frames.values():
+            offsets.append(offsets[-1] + len(df))
+        rows = offsets[-1]
+        shm = shared_memory.SharedMemory(create=True, size=max(1, rows * len(PANEL_COLUMNS) * 8))
+        spec = PanelSpec(shm.name, tuple(frames), tuple(offsets), rows)
+        panel = cls(shm, spec, owner=True)
+        for i, df in enumerate(frames.values()):
+            block = panel._values[offsets[i]:offsets[i + 1]]
+            dates = pd.to_datetime(df["date"]).to_numpy(dtype="datetime64[D]").astype(np.int64)
+            block[:, 0] = dates
+            for j, column in enumerate(PANEL_COLUMNS[1:], start=1):
+                block[:, j] = pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=float)
+        logger.info(f"공유 가격 패널 생성: {len(frames)}종목, {rows}행, {shm.size / 1024 / 1024:.1f}MB")
+        return panel
+
+    @classmethod
+    def attach(cls, spec: PanelSpec) -> "SharedPricePanel":
+        """다른 프로세스가 만든 패널에 연결"""
+        return cls(shared_memory.SharedMemory(name=spec.name), spec, owner=False)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._index
+
+    def __len__(self) -> int:
+        return len(self.spec.symbols)
+
+    def frame(self, symbol: str) -> Optional[pd.DataFrame]:
+        """
+        종목 가격 히스토리 (가격 컬럼은 공유 메모리 뷰, 수정하지 말 것)
+
+        date 컬럼만 datetime.date로 변환해 새로 만든다.
+        """
+        i = self._index.get(symbol)
+        if i is None:
+            return None
+        block = self._values[self.spec.offsets[i]:self.spec.offsets[i + 1]]
+        columns = {"symbol": np.full(len(block), symbol, dtype=object)}
+        columns["date"] = block[:, 0].astype(np.int64).astype("datetime64[D]").astype(object)
+        for j, column in enumerate(PANEL_COLUMNS[1:], start=1):
+            columns[column] = block[:, j]
+        return pd.DataFrame(columns, copy=False)
+
+    def close(self) -> None:
+        """공유 메모리 해제 (생성한 프로세스는 블록도 삭제)"""
+        self._values = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
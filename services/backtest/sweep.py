@@ -0,0 +1,343 @@
+"""전략 파라미터 탐색 (그리드/랜덤 샘플, 워크포워드)"""
+import dataclasses
+import datetime
+import itertools
+import multiprocessing
+import random
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from config import setting_env, strategy_config
+from config.constants import DEFAULT_PRICE_HISTORY_DAYS
+from config.logging_config import get_logger
+from data.models import Blacklist, Stock, Subscription
+from services.backtest.engine import Backtester
+from services.backtest.market import load_market_series
+from services.backtest.price_cache import BacktestPriceCache
+from services.backtest.shared_panel import PanelSpec, SharedPricePanel
+
+logger = get_logger(__name__)
+
+# 워커 프로세스 전역 상태 (워커마다 한 번 초기화해 모든 실행이 공유)
+_PRICE_CACHE: Optional[BacktestPriceCache] = None
+_MARKET_SERIES: Optional[Dict[str, pd.DataFrame]] = None
+
+
+def grid(space: Dict[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """
+    파라미터 공간의 모든 조합
+
+    :param space: {"GROWTH_CONFIG.drawdown_min": [0.1, 0.15], ...} (config.strategy_config 설정 객체.필드)
+    :return: 조합별 덮어쓸 값 목록
+    """
+    keys = list(space)
+    return [dict(zip(keys, values)) for values in itertools.product(*(space[key] for key in keys))]
+
+
+def sample_configs(space: Dict[str, Sequence[Any]], n: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """파라미터 공간에서 서로 다른 조합 n개 무작위 추출 (조합 수가 n 이하이면 전체)"""
+    keys = list(space)
+    sizes = [len(space[key]) for key in keys]
+    total = 1
+    for size in sizes:
+        total *= size
+    if total <= n:
+        return grid(space)
+
+    configs = []
+    for flat in random.Random(seed).sample(range(total), n):
+        overrides = {}
+        for key, size in zip(reversed(keys), reversed(sizes)):
+            flat, index = divmod(flat, size)
+            overrides[key] = space[key][index]
+        configs.append({key: overrides[key] for key in keys})
+    return configs
+
+
+def _resolve(key: str) -> Tuple[Any, str]:
+    """'설정 객체.필드' 키를 (설정 객체, 필드명)으로 변환"""
+    name, _, attr = key.partition(".")
+    target = getattr(strategy_config, name, None)
+    if target is None or not dataclasses.is_dataclass(target) or attr not in {f.name for f in dataclasses.fields(target)}:
+        raise ValueError(f"알 수 없는 전략 파라미터: {key}")
+    return target, attr
+
+
+@contextmanager
+def apply_config(overrides: Dict[str, Any]) -> Iterator[None]:
+    """config.strategy_config 설정 객체 값을 잠시 덮어쓰고 블록이 끝나면 원래 값으로 복원"""
+    targets = [(_resolve(key), value) for key, value in overrides.items()]
+    originals = [(target, attr, getattr(target, attr)) for (target, attr), _ in targets]
+    try:
+        for (target, attr), value in targets:
+            setattr(target, attr, value)
+        yield
+    finally:
+        for target, attr, value in reversed(originals):
+            setattr(target, attr, value)
+
+
+def _init_worker(
+        panel_spec: Optional[PanelSpec],
+        market_series: Dict[str, pd.DataFrame],
+        start: datetime.date,
+        days: int
+) -> None:
+    """워커 초기화: 공유 패널에 연결하고 실행 간 공유할 가격 캐시를 만든다"""
+    global _PRICE_CACHE, _MARKET_SERIES
+    setting_env.STRATEGY_PROCESS_WORKERS = 1
+    panel = SharedPricePanel.attach(panel_spec) if panel_spec is not None else None
+    _PRICE_CACHE = BacktestPriceCache(start, days=days, panel=panel)
+    _MARKET_SERIES = market_series
+
+
+def _run_task(task: Tuple[Dict[str, Any], datetime.date, datetime.date, str, Optional[float]]) -> Dict[str, float]:
+    """설정 하나로 백테스트 한 번 실행 (워커에서 호출)"""
+    overrides, start, end, country, initial_cash = task
+    with apply_config(overrides):
+        report = Backtester(
+            country,
+            start=start,
+            end=end,
+            initial_cash=initial_cash,
+            price_cache=_PRICE_CACHE,
+            market_series=_MARKET_SERIES,
+        ).run()
+    return report.summary()
+
+
+@dataclass
+class SweepResult:
+    """설정 하나의 백테스트 결과"""
+    overrides: Dict[str, Any]
+    start: datetime.date
+    end: datetime.date
+    metrics: Dict[str, float]
+
+
+@dataclass
+class WalkForwardFold:
+    """워크포워드 구간 하나 (학습 구간 최적 설정의 검증 구간 성과)"""
+    train_start: datetime.date
+    train_end: datetime.date
+    test_start: datetime.date
+    test_end: datetime.date
+    best: SweepResult
+    test: SweepResult
+
+
+@dataclass
+class WalkForwardResult:
+    """워크포워드 전체 결과"""
+    folds: List[WalkForwardFold] = field(default_factory=list)
+
+    @property
+    def oos_return_pct(self) -> float:
+        """검증 구간 수익률을 이어 붙인 누적 수익률 (%)"""
+        growth = 1.0
+        for fold in self.folds:
+            growth *= 1 + fold.test.metrics["return_pct"] / 100
+        return (growth - 1) * 100
+
+    @property
+    def oos_max_drawdown_pct(self) -> float:
+        """검증 구간 중 가장 큰 최대 낙폭 (%)"""
+        return max((fold.test.metrics["max_drawdown_pct"] for fold in self.folds), default=0.0)
+
+    def log(self) -> None:
+        """구간별 결과 로깅"""
+        for fold in self.folds:
+            logger.info(
+                f"워크포워드 [{fold.train_start} ~ {fold.train_end} → {fold.test_start} ~ {fold.test_end}]: "
+                f"학습 {fold.best.metrics['return_pct']:.2f}%, 검증 {fold.test.metrics['return_pct']:.2f}% "
+                f"(MDD {fold.test.metrics['max_drawdown_pct']:.2f}%), 설정 {fold.best.overrides}"
+            )
+        logger.info(
+            f"워크포워드 검증 누적: {self.oos_return_pct:.2f}%, 최대 낙폭 {self.oos_max_drawdown_pct:.2f}% "
+            f"({len(self.folds)}구간)"
+        )
+
+
+class ParameterSweep:
+    """
+    strategy_config 파라미터 조합별 백테스트를 프로세스 풀로 병렬 실행
+
+    가격 히스토리는 부모 프로세스가 한 번 읽어 SharedPricePanel로 공유하고, 워커는 초기화 때 만든
+    BacktestPriceCache를 모든 실행에 재사용하므로 지표는 워커마다 종목당 한 번만 계산된다.
+    with 블록으로 사용하며, 블록이 끝나면 풀과 공유 메모리를 정리한다.
+    """
+
+    def __init__(
+            self,
+            country: str = "KOR",
+            start: datetime.date = None,
+            end: datetime.date = None,
+            workers: int = None,
+            days: int = DEFAULT_PRICE_HISTORY_DAYS,
+            initial_cash: Optional[float] = None,
+    ):
+        """
+        :param country: 국가 코드 (KOR, USA)
+        :param start: 탐색 전체 기간 시작일 (기본값: 1년 전)
+        :param end: 탐색 전체 기간 종료일 (기본값: 오늘)
+        :param workers: 워커 프로세스 수 (기본값: BACKTEST_SWEEP_WORKERS, 1이면 현재 프로세스에서 실행)
+        :param days: 전략에 보여 줄 가격 히스토리 기간 (일)
+        :param initial_cash: 실행마다 쓸 초기 자금 (기본값: Backtester 기본값)
+        """
+        self.country = country.upper()
+        self.end = end or datetime.date.today()
+        self.start = start or self.end - datetime.timedelta(days=365)
+        self.workers = workers or setting_env.BACKTEST_SWEEP_WORKERS
+        self.days = days
+        self.initial_cash = initial_cash
+        self._panel: Optional[SharedPricePanel] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "ParameterSweep":
+        self.open()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _universe(self) -> List[str]:
+        """전략이 조회할 수 있는 종목 (구독 종목 중 블랙리스트 제외)"""
+        query = Stock.select(Stock.symbol).where(
+            (Stock.country == self.country)
+            & (Stock.symbol.in_(Subscription.select(Subscription.symbol)))
+            & ~(Stock.symbol.in_(Blacklist.select(Blacklist.symbol)))
+        )
+        return [row.symbol for row in query]
+
+    def open(self) -> None:
+        """가격 히스토리와 시장 지표를 읽고 워커 풀 시작"""
+        global _PRICE_CACHE, _MARKET_SERIES
+        market_series = load_market_series(self.start, self.end)
+        price_cache = BacktestPriceCache(self.start, days=self.days)
+        price_cache.prefetch(self._universe())
+
+        if self.workers <= 1:
+            setting_env.STRATEGY_PROCESS_WORKERS = 1
+            _PRICE_CACHE, _MARKET_SERIES = price_cache, market_series
+            return
+
+        self._panel = SharedPricePanel.create(price_cache.loaded_frames())
+        del price_cache
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self._panel.spec, market_series, self.start, self.days),
+        )
+
+    def close(self) -> None:
+        """워커 풀 종료 및 공유 메모리 해제"""
+        global _PRICE_CACHE, _MARKET_SERIES
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._panel is not None:
+            self._panel.close()
+            self._panel = None
+        _PRICE_CACHE = _MARKET_SERIES = None
+
+    def _map(self, tasks: List[tuple]) -> List[Dict[str, float]]:
+        if self._executor is None:
+            if _PRICE_CACHE is None:
+                raise RuntimeError("ParameterSweep은 with 블록 안에서 실행해야 합니다.")
+            return [_run_task(task) for task in tasks]
+        return list(self._executor.map(_run_task, tasks))
+
+    def run(
+            self,
+            configs: List[Dict[str, Any]],
+            start: datetime.date = None,
+            end: datetime.date = None
+    ) -> List[SweepResult]:
+        """
+        설정별 백테스트 실행
+
+        :param configs: grid()/sample_configs() 결과
+        :param start: 실행 기간 시작일 (기본값: 탐색 시작일, 탐색 기간 안이어야 함)
+        :param end: 실행 기간 종료일 (기본값: 탐색 종료일)
+        :return: configs 순서의 결과
+        """
+        start, end = start or self.start, end or self.end
+        for overrides in configs:
+            for key in overrides:
+                _resolve(key)
+        tasks = [(overrides, start, end, self.country, self.initial_cash) for overrides in configs]
+        results = [
+            SweepResult(overrides, start, end, metrics)
+            for overrides, metrics in zip(configs, self._map(tasks))
+        ]
+        logger.info(f"파라미터 탐색 완료 [{self.country} {start} ~ {end}]: {len(results)}개 설정")
+        return results
+
+    def walk_forward(
+            self,
+            configs: List[Dict[str, Any]],
+            train_days: int = 365,
+            test_days: int = 90,
+            step_days: int = None,
+            score: Callable[[Dict[str, float]], float] = lambda metrics: metrics["return_pct"],
+    ) -> WalkForwardResult:
+        """
+        워크포워드 검증
+
+        탐색 기간을 [학습 train_days → 검증 test_days] 구간으로 step_days씩 밀면서, 구간마다 학습
+        기간 score가 가장 높은 설정을 바로 뒤 검증 기간에 실행한다. 모든 구간의 학습 실행을 한 번에
+        풀에 넣은 뒤 검증 실행을 모아 돌린다.
+
+        :param configs: 후보 설정 목록
+        :param train_days: 학습 기간 (일)
+        :param test_days: 검증 기간 (일)
+        :param step_days: 구간 이동 간격 (일, 기본값: test_days)
+        :param score: 학습 결과 지표 → 점수 (높을수록 좋음)
+        """
+        step = datetime.timedelta(days=step_days or test_days)
+        windows = []
+        train_start = self.start
+        while True:
+            train_end = train_start + datetime.timedelta(days=train_days - 1)
+            test_start = train_end + datetime.timedelta(days=1)
+            test_end = min(test_start + datetime.timedelta(days=test_days - 1), self.end)
+            if test_start > self.end:
+                break
+            windows.append((train_start, train_end, test_start, test_end))
+            if test_end >= self.end:
+                break
+            train_start += step
+        if not windows:
+            raise ValueError(f"워크포워드 구간을 만들 수 없습니다: {self.start} ~ {self.end}, 학습 {train_days}일")
+
+        train_metrics = self._map([
+            (overrides, train_start, train_end, self.country, self.initial_cash)
+            for train_start, train_end, _, _ in windows
+            for overrides in configs
+        ])
+        bests = []
+        for i, (train_start, train_end, _, _) in enumerate(windows):
+            candidates = [
+                SweepResult(overrides, train_start, train_end, metrics)
+                for overrides, metrics in zip(configs, train_metrics[i * len(configs):(i + 1) * len(configs)])
+            ]
+            bests.append(max(candidates, key=lambda result: score(result.metrics)))
+
+        test_metrics = self._map([
+            (best.overrides, test_start, test_end, self.country, self.initial_cash)
+            for best, (_, _, test_start, test_end) in zip(bests, windows)
+        ])
+        result = WalkForwardResult([
+            WalkForwardFold(
+                train_start, train_end, test_start, test_end, best,
+                SweepResult(best.overrides, test_start, test_end, metrics),
+            )
+            for best, metrics, (train_start, train_end, test_start, test_end) in zip(bests, test_metrics, windows)
+        ])
+        result.log()
+        return result
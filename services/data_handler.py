@@ -1,18 +1,19 @@
 import datetime
-import os
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlparse, parse_qs
 
-import FinanceDataReader
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
-from dateutil.relativedelta import relativedelta
 
+from clients.kis import KISClient
+from clients.kis.overseas.exchanges import get_exchange_resolver
+from config import setting_env
 from config.logging_config import get_logger
-from core.exceptions import NotFoundError as NotFoundUrl
-from data.models import Stock, Subscription, Blacklist
+from data.models import Subscription, Blacklist
+from repositories.market_series_repository import MarketSeriesRepository
+from repositories.order_history_repository import OrderHistoryRepository
+from repositories.price_repository import PriceRepository
 from repositories.stock_repository import StockRepository
 from services.tradingview_scan import (
     build_tradingview_payload,
@@ -22,15 +23,14 @@ from utils.data_util import upsert_many
 from config.constants import (
     KOREAN_STOCK_PATTERN,
     AMERICA_STOCK_PATTERN,
-    MAX_WORKER_COUNT,
     BLACKLIST_RETENTION_DAYS,
-    DEFAULT_PRICE_HISTORY_YEARS,
     TICKER_INDEX,
     DIVIDEND_YIELD_INDEX,
     DIVIDEND_PAYOUT_RATIO_INDEX,
     CONTINUOUS_DIVIDEND_INDEX,
     CASH_FLOW_INDEX,
     NET_INCOME_INDEX,
+    MARKET_SERIES_SYMBOLS,
 )
 
 logger = get_logger(__name__)
@@ -50,19 +50,7 @@ def get_history_table(country: str):
 
 
 def insert_stock(symbol: str, company_name: str = None, country: str = None):
-    existing_stock = Stock.get_or_none(Stock.symbol == symbol)
-    if existing_stock:
-        return existing_stock
-
-    if not company_name:
-        company_name = get_company_name(symbol)
-
-    if not country:
-        country = get_country_by_symbol(symbol)
-
-    new_stock = Stock.create(symbol=symbol, company_name=company_name, country=country)
-    add_price_for_symbol(symbol, start_date=datetime.datetime.now() - relativedelta(years=DEFAULT_PRICE_HISTORY_YEARS), end_date=datetime.datetime.now())
-    return new_stock
+    return StockRepository.insert(symbol, company_name, country)
 
 
 def stock_dividend_filter(country="korea",
@@ -465,121 +453,63 @@ def update_blacklist():
 
 def process_stock_listing(df, code_col, name_col, region):
     """
-    주어진 시장 데이터를 처리하고, insert_stock 함수를 병렬로 실행.
+    주어진 시장 데이터의 신규 종목을 저장하고 가격 히스토리를 일괄 적재 (StockRepository로 위임)
     """
-    try:
-        with ThreadPoolExecutor(max_workers=min(os.cpu_count(), MAX_WORKER_COUNT)) as executor:
-            futures = [
-                executor.submit(insert_stock, item[code_col], item[name_col], region)
-                for item in df.to_dict('records')
-            ]
-
-            for future in as_completed(futures):
-                try:
-                    future.result()
-                except Exception as e:
-                    logger.error(f"Error while processing data: {e}")
-    except Exception as e:
-        logger.error(f"Error loading data for market: {e}")
+    StockRepository._process_listing(df, code_col, name_col, region)
 
 
 def update_stock_listings():
     """
-    KRX 및 미국 시장 데이터를 병렬로 처리.
+    KRX 및 미국 시장 데이터를 처리 (StockRepository로 위임)
     """
+    StockRepository.update_listings()
+    load_exchange_index()
+
 
+def sync_order_history(country: str):
+    """
+    국가별 계좌의 체결 내역을 order_history에 증분 동기화 (OrderHistoryRepository로 위임)
+    """
+    credentials = {
+        'KOR': (setting_env.APP_KEY_KOR, setting_env.APP_SECRET_KOR, setting_env.ACCOUNT_NUMBER_KOR, setting_env.ACCOUNT_CODE_KOR),
+        'USA': (setting_env.APP_KEY_USA, setting_env.APP_SECRET_USA, setting_env.ACCOUNT_NUMBER_USA, setting_env.ACCOUNT_CODE_USA),
+    }
     try:
-        df_kr = FinanceDataReader.StockListing('KRX')
-        try:
-            process_stock_listing(df_kr, 'Code', 'Name', "KOR")
-        except Exception as e:
-            logger.error(f"Error insert KOR data: {e}")
+        client = KISClient(*credentials[country.upper()])
+        return OrderHistoryRepository.sync(client, country)
     except Exception as e:
-        logger.error(f"Error loading KOR data: {e}")
+        logger.error(f"주문 내역 동기화 실패: {country} -> {e}")
+        return 0
 
-    try:
-        df_us = pd.concat([
-            FinanceDataReader.StockListing('S&P500'),
-            FinanceDataReader.StockListing('NASDAQ'),
-            FinanceDataReader.StockListing('NYSE')  # 주석 해제 시 추가 가능
-        ])
+
+def update_market_series():
+    """
+    지수/VIX/환율 시계열을 market_series에 증분 적재 (MarketSeriesRepository로 위임)
+    """
+    for series in MARKET_SERIES_SYMBOLS:
         try:
-            process_stock_listing(df_us, "Symbol", "Name", "USA")
+            MarketSeriesRepository.update(series)
         except Exception as e:
-            logger.error(f"Error insert USA data: {e}")
+            logger.error(f"시장 지표 적재 실패: {series} -> {e}")
+
+
+def load_exchange_index():
+    """
+    미국 종목 거래소 색인을 메모리에 적재 (시작 시/종목 목록 갱신 후)
+    """
+    try:
+        get_exchange_resolver().load(StockRepository.get_exchange_map("USA"))
     except Exception as e:
-        logger.error(f"Error loading USA data: {e}")
+        logger.error(f"해외 종목 거래소 색인 적재 실패: {e}")
 
 
+# PriceRepository로 위임 (DB 적재 후 가격 저장소 동기화 포함)
 def add_stock_price(symbol: str = None, country: str = None, start_date: datetime.datetime = None, end_date: datetime.datetime = None):
-    if start_date is None:
-        start_date = datetime.datetime.now()
-
-    # 특정 종목만 처리할 경우
-    if symbol:
-        add_price_for_symbol(symbol, start_date, end_date)
-    else:
-        # 전체 종목 조회
-        stocks = Stock.select()
-        if country:
-            stocks = stocks.where(Stock.country == country)
-
-        # ThreadPoolExecutor로 스레드 풀 생성
-        with ThreadPoolExecutor(max_workers=min(os.cpu_count(), 10)) as executor:
-            futures = []
-            for stock in stocks:
-                futures.append(executor.submit(add_price_for_symbol, stock.symbol, start_date, end_date))
-
-            # 모든 작업이 완료될 때까지 대기하며 에러 확인
-            for future in as_completed(futures):
-                try:
-                    future.result()
-                except Exception as e:
-                    logger.error(f"에러 발생: {e}")
+    return PriceRepository.add(symbol, country, start_date, end_date)
 
 
 def add_price_for_symbol(symbol: str, start_date: datetime.datetime = None, end_date: datetime.datetime = None):
-    start_date_str = (datetime.datetime.now() - relativedelta(days=5)).strftime('%Y-%m-%d') if not start_date else start_date.strftime('%Y-%m-%d')
-    try:
-        country = get_country_by_symbol(symbol)
-        table = get_history_table(country)
-        data_to_insert = None
-
-        if country == "KOR":
-            df = FinanceDataReader.DataReader(
-                symbol=f'NAVER:{symbol}',
-                start=start_date_str,
-                end=end_date
-            )
-            if not df.empty:
-                df = df.reset_index()
-                df['symbol'] = symbol
-                df['date'] = df['Date'].dt.date
-                data_to_insert = df[['symbol', 'date', 'Open', 'High', 'Close', 'Low', 'Volume']].rename(
-                    columns={'Open': 'open', 'High': 'high', 'Close': 'close', 'Low': 'low', 'Volume': 'volume'}
-                ).to_dict('records')
-        elif country == "USA":
-            df = FinanceDataReader.DataReader(symbol=symbol, start=start_date_str, end=end_date)
-            if not df.empty:
-                df = df.reset_index()
-                df['symbol'] = symbol
-                df['date'] = df['Date'].dt.date
-                df['open'] = df['Open'].astype(float)
-                df['high'] = df['High'].astype(float)
-                df['close'] = df['Close'].astype(float)
-                df['low'] = df['Low'].astype(float)
-                df['volume'] = df['Volume'].apply(lambda x: int(x) if pd.notna(x) else None)
-                data_to_insert = df[['symbol', 'date', 'open', 'high', 'close', 'low', 'volume']].to_dict('records')
-
-        if data_to_insert:
-            upsert_many(table, data_to_insert, [table.symbol, table.date], ['open', 'high', 'close', 'low', 'volume'])
-
-    except NotFoundUrl:
-        Stock.delete().where(Stock.symbol == symbol).execute()
-    except KeyError:
-        pass
-    except Exception:
-        pass
+    PriceRepository.add_for_symbol(symbol, start_date, end_date)
 
 
 if __name__ == "__main__":
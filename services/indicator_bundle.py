@@ -0,0 +1,129 @@
+"""종목별 지표 지연 계산 번들
+
+한 종목의 가격 히스토리에 대해 지표 시리즈를 (지표, 파라미터) 단위로 최초 요청 시 한 번만
+계산해 보관한다. trading_helpers / market_condition의 헬퍼는 번들을 전달받으면 같은 시리즈를
+재사용하므로, 여러 전략이 같은 종목을 평가해도 ATR·볼린저·RSI·MACD·OBV는 한 번씩만 계산된다.
+
+메모 키는 (메서드명, 인자...) 형태이므로 window()로 만든 기간 뷰는 같은 메서드를 전체 히스토리
+번들에서 한 번 계산해 잘라 쓴다 (백테스트에서 날짜마다 지표를 다시 계산하지 않음).
+"""
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+import pandas as pd
+from ta.momentum import RSIIndicator
+from ta.trend import MACD
+from ta.volatility import AverageTrueRange, BollingerBands
+from ta.volume import OnBalanceVolumeIndicator
+
+from config.constants import BOLLINGER_STD_DEV, BOLLINGER_WINDOW
+
+OHLCV_AGG = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+
+# 마지막 구간이 미완성일 수 있어 전체 히스토리 계산을 잘라 쓰면 안 되는 지표
+NON_CAUSAL_KEYS = {"resample"}
+
+
+class IndicatorBundle:
+    """종목 하나의 지표 시리즈 메모이제이션 (가격 데이터는 읽기 전용으로 취급)"""
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        :param df: 정제된 가격 히스토리 (date 오름차순)
+        """
+        self._df = df
+        self._cache: Dict[Tuple[Hashable, ...], object] = {}
+        self.computed = 0
+        self.reused = 0
+
+    def _memo(self, key: Tuple[Hashable, ...], compute: Callable[[], object]):
+        if key in self._cache:
+            self.reused += 1
+        else:
+            self._cache[key] = compute()
+            self.computed += 1
+        return self._cache[key]
+
+    def atr(self, window: int) -> pd.Series:
+        """AverageTrueRange(window)"""
+        df = self._df
+        return self._memo(
+            ("atr", window),
+            lambda: AverageTrueRange(high=df["high"], low=df["low"], close=df["close"], window=window).average_true_range(),
+        )
+
+    def bollinger(self, window: int = BOLLINGER_WINDOW, window_dev: float = BOLLINGER_STD_DEV) -> Tuple[pd.Series, pd.Series, pd.Series]:
+        """볼린저 밴드 (mavg, upper, lower)"""
+        def compute():
+            indicator = BollingerBands(close=self._df["close"], window=window, window_dev=window_dev)
+            return indicator.bollinger_mavg(), indicator.bollinger_hband(), indicator.bollinger_lband()
+        return self._memo(("bollinger", window, window_dev), compute)
+
+    def rsi(self, window: int) -> pd.Series:
+        """RSIIndicator(window)"""
+        return self._memo(("rsi", window), lambda: RSIIndicator(close=self._df["close"], window=window).rsi())
+
+    def macd(self, window_fast: int = 12, window_slow: int = 26, window_sign: int = 9) -> Tuple[pd.Series, pd.Series]:
+        """MACD (macd, signal)"""
+        def compute():
+            indicator = MACD(close=self._df["close"], window_fast=window_fast, window_slow=window_slow, window_sign=window_sign)
+            return indicator.macd(), indicator.macd_signal()
+        return self._memo(("macd", window_fast, window_slow, window_sign), compute)
+
+    def obv(self) -> pd.Series:
+        """OnBalanceVolumeIndicator"""
+        return self._memo(
+            ("obv",),
+            lambda: OnBalanceVolumeIndicator(close=self._df["close"], volume=self._df["volume"]).on_balance_volume(),
+        )
+
+    def obv_sma(self, window: int = 10) -> pd.Series:
+        """OBV 단순이동평균"""
+        return self._memo(("obv_sma", window), lambda: self.obv().rolling(window=window).mean())
+
+    def rolling(self, column: str, window: int, stat: str = "mean", min_periods: Optional[int] = None, q: Optional[float] = None) -> pd.Series:
+        """가격 컬럼 롤링 통계 (mean/max/min/quantile)"""
+        def compute():
+            roller = self._df[column].rolling(window=window, min_periods=min_periods)
+            if stat == "quantile":
+                return roller.quantile(q)
+            return getattr(roller, stat)()
+        return self._memo(("rolling", column, window, stat, min_periods, q), compute)
+
+    def resample(self, rule: str) -> pd.DataFrame:
+        """주봉/월봉 등 상위 타임프레임 OHLCV (결측 구간 제거)"""
+        def compute():
+            df_res = self._df[["date", "open", "high", "low", "close", "volume"]].copy()
+            df_res["date_dt"] = pd.to_datetime(df_res["date"], errors="coerce")
+            df_res = df_res.dropna(subset=["date_dt"]).sort_values("date_dt")
+            if len(df_res) < 2:
+                return df_res.iloc[0:0]
+            return df_res.resample(rule, on="date_dt").agg(OHLCV_AGG).dropna()
+        return self._memo(("resample", rule), compute)
+
+    def window(self, start: int, end: int) -> "IndicatorBundle":
+        """
+        가격 히스토리 행 구간 [start, end)에 대한 번들 뷰
+
+        지표는 이 번들(전체 히스토리)에서 한 번 계산해 같은 구간으로 잘라 반환하므로, 창 앞쪽
+        워밍업 구간이 더 긴 히스토리로 계산된다는 점만 창 단위 계산과 다르다.
+        """
+        return _BundleWindow(self, start, end)
+
+
+class _BundleWindow(IndicatorBundle):
+    """전체 히스토리 번들의 행 구간 뷰 (IndicatorBundle.window)"""
+
+    def __init__(self, parent: IndicatorBundle, start: int, end: int):
+        super().__init__(parent._df.iloc[start:end])
+        self._parent = parent
+        self._start = start
+        self._end = end
+
+    def _memo(self, key: Tuple[Hashable, ...], compute: Callable[[], object]):
+        if key[0] in NON_CAUSAL_KEYS:
+            return super()._memo(key, compute)
+        self.reused += 1
+        value = getattr(self._parent, key[0])(*key[1:])
+        if isinstance(value, tuple):
+            return tuple(series.iloc[self._start:self._end] for series in value)
+        return value.iloc[self._start:self._end]
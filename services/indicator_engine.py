@@ -0,0 +1,381 @@
+"""종목 유니버스 전체에 대한 벡터화 지표 엔진
+
+종목별 가격 히스토리를 (거래일 × 종목) 2차원 배열로 쌓아 trading_helpers의
+ta 기반 지표(ATR, 볼린저 밴드, RSI, MACD, OBV)를 모든 종목에 대해 한 번에 계산한다.
+
+- 각 종목의 최신 거래일이 마지막 행에 오도록 아래쪽 정렬하고, 히스토리가 짧은 종목의
+  앞쪽은 NaN으로 채운다.
+- 지표는 행(위치) 기준으로 계산되므로 종목별 ta 계산 결과와 부동소수 오차 범위 내에서 같다.
+- 스크리닝 조건은 종목(열)별 bool 마스크로 반환되며, 전략은 마스크를 통과한 종목에만
+  기존 종목별 파이프라인을 실행한다.
+- 백테스트는 aligned()로 거래일 기준 정렬한 엔진을 만들고 window()로 날짜별 구간 뷰를 얻는다.
+  지표 행렬은 전체 기간에서 한 번만 계산하고 뷰는 행 구간을 잘라 공유한다.
+"""
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from config.constants import (
+    ADTV_ROLLING_WINDOW,
+    ATR_WINDOWS,
+    BOLLINGER_STD_DEV,
+    BOLLINGER_WINDOW,
+    KOREAN_LIQUIDITY_THRESHOLD_BASE,
+    USA_LIQUIDITY_THRESHOLD,
+)
+from services.market_condition import bb_width_in_range, fakeout_filter_passed
+
+PRICE_COLUMNS = ("close", "high", "low", "volume")
+
+
+def _shift(values: np.ndarray, periods: int = 1) -> np.ndarray:
+    """행 방향으로 periods만큼 아래로 민 배열 (pandas shift)"""
+    shifted = np.full(values.shape, np.nan)
+    if periods < values.shape[0]:
+        shifted[periods:] = values[:-periods]
+    return shifted
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """rolling(window, min_periods=window).mean()"""
+    out = np.full(values.shape, np.nan)
+    if 0 < window <= values.shape[0]:
+        out[window - 1:] = sliding_window_view(values, window, axis=0).mean(axis=-1)
+    return out
+
+
+def _rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """rolling(window, min_periods=window).std(ddof=0)"""
+    out = np.full(values.shape, np.nan)
+    if 0 < window <= values.shape[0]:
+        out[window - 1:] = sliding_window_view(values, window, axis=0).std(axis=-1)
+    return out
+
+
+def _ewm_mean(values: np.ndarray, alpha: float, min_periods: int) -> np.ndarray:
+    """ewm(alpha=alpha, min_periods=min_periods, adjust=False).mean()
+
+    앞쪽 NaN은 시작 전 구간으로 취급한다 (pandas와 동일).
+    """
+    out = np.full(values.shape, np.nan)
+    state = np.full(values.shape[1], np.nan)
+    count = np.zeros(values.shape[1], dtype=int)
+    for row in range(values.shape[0]):
+        x = values[row]
+        valid = ~np.isnan(x)
+        started = ~np.isnan(state)
+        state = np.where(valid & started, (1.0 - alpha) * state + alpha * x, np.where(valid, x, state))
+        count += valid
+        out[row] = np.where(count >= min_periods, state, np.nan)
+    return out
+
+
+class IndicatorEngine:
+    """(거래일 × 종목) 가격 행렬 기반 지표 계산 및 스크리닝 마스크"""
+
+    def __init__(self, frames: Dict[str, pd.DataFrame]):
+        """
+        :param frames: 종목별 정제된 가격 히스토리 (date 오름차순)
+        """
+        frames = {symbol: df for symbol, df in frames.items() if df is not None and not df.empty}
+        self.symbols: List[str] = list(frames)
+        self.lengths = np.array([len(df) for df in frames.values()], dtype=int)
+        self.last_dates = np.array([str(df["date"].iloc[-1]) for df in frames.values()], dtype=object)
+
+        rows = int(self.lengths.max()) if len(self.lengths) else 0
+        self._starts = rows - self.lengths
+        matrices = {column: np.full((rows, len(self.symbols)), np.nan) for column in PRICE_COLUMNS}
+        for idx, df in enumerate(frames.values()):
+            for column in PRICE_COLUMNS:
+                matrices[column][self._starts[idx]:, idx] = pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=float)
+
+        self.close = matrices["close"]
+        self.high = matrices["high"]
+        self.low = matrices["low"]
+        self.volume = matrices["volume"]
+        self._present = np.arange(rows)[:, None] >= self._starts[None, :]
+
+        # 자체 구간에 결측치가 있는 종목은 행렬 계산이 ta와 달라질 수 있어 스크리닝 대상에서 제외 (항상 통과)
+        self._screenable = np.ones(len(self.symbols), dtype=bool)
+        for matrix in matrices.values():
+            self._screenable &= ~(np.isnan(matrix) & self._present).any(axis=0)
+
+        self._cache: Dict[tuple, object] = {}
+        self.dates: Optional[np.ndarray] = None
+
+    @classmethod
+    def aligned(cls, frames: Dict[str, pd.DataFrame]) -> "IndicatorEngine":
+        """
+        거래일 기준으로 정렬한 엔진 (행 = 전체 종목 거래일의 합집합)
+
+        종목별 히스토리는 첫 거래일부터 마지막 행까지 같은 날짜 행에 놓이고, 그 사이 거래가 없는
+        날은 NaN으로 채운다. window()로 날짜 구간 뷰를 만들 수 있다.
+        """
+        frames = {symbol: df for symbol, df in frames.items() if df is not None and not df.empty}
+        dates = np.array(sorted({str(date) for df in frames.values() for date in df["date"]}), dtype=object)
+        aligned = {}
+        for symbol, df in frames.items():
+            indexed = df.assign(date=df["date"].astype(str)).drop_duplicates("date", keep="last").set_index("date")
+            span = dates[np.searchsorted(dates, indexed.index[0]):]
+            aligned[symbol] = indexed.reindex(span).rename_axis("date").reset_index()
+        engine = cls(aligned)
+        engine.dates = dates
+        return engine
+
+    def window(self, start: int, end: int) -> "IndicatorEngine":
+        """
+        거래일 행 구간 [start, end)에 대한 엔진 뷰 (aligned()로 만든 엔진 전용)
+
+        종목별 히스토리 길이/마지막 거래일은 구간 안의 실제 거래 행 기준이며, 지표 행렬은
+        이 엔진에서 한 번 계산한 결과를 잘라 쓴다. 구간 중간에 빠진 거래일이 있는 종목은
+        스크리닝하지 않고 종목별 파이프라인으로 넘긴다.
+        """
+        if self.dates is None:
+            raise ValueError("window()는 aligned()로 만든 엔진에서만 사용할 수 있습니다")
+        view = _EngineWindow.__new__(_EngineWindow)
+        view._parent, view._start, view._end = self, start, end
+        view.symbols = self.symbols
+        view.close = self.close[start:end]
+        view.high = self.high[start:end]
+        view.low = self.low[start:end]
+        view.volume = self.volume[start:end]
+        view.dates = self.dates[start:end]
+        view._cache = {}
+
+        valid = ~np.isnan(view.close)
+        rows = end - start
+        view.lengths = valid.sum(axis=0)
+        has_rows = view.lengths > 0
+        first = np.where(has_rows, valid.argmax(axis=0), rows)
+        last = np.where(has_rows, rows - 1 - valid[::-1].argmax(axis=0), -1)
+        view._starts = first
+        view._present = np.arange(rows)[:, None] >= first[None, :]
+        view.last_dates = np.where(has_rows, view.dates[np.clip(last, 0, None)], None) if rows else \
+            np.full(len(self.symbols), None, dtype=object)
+        # 처음과 마지막 거래 행 사이에 빠진 날이 없어야 스크리닝 (마지막 거래일이 기준일이 아니면 기준일 마스크에서 걸러짐)
+        inside = view._present & (np.arange(rows)[:, None] <= last[None, :])
+        view._screenable = ~(inside & ~valid).any(axis=0)
+        return view
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def _memo(self, key: tuple, compute):
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def latest(self, matrix: np.ndarray, back: int = 1) -> np.ndarray:
+        """종목별 뒤에서 back번째 값 (df.iloc[-back]), 히스토리가 짧으면 NaN"""
+        if back > matrix.shape[0]:
+            return np.full(matrix.shape[1], np.nan)
+        return matrix[-back]
+
+    def select(self, mask: np.ndarray) -> List[str]:
+        """마스크를 통과한 종목 (결측치로 스크리닝할 수 없는 종목 포함)"""
+        keep = np.asarray(mask, dtype=bool) | ~self._screenable
+        return [symbol for symbol, ok in zip(self.symbols, keep) if ok]
+
+    # ------------------------------------------------------------------
+    # 지표 행렬
+    # ------------------------------------------------------------------
+    def sma(self, window: int) -> np.ndarray:
+        """종가 단순이동평균"""
+        return self._memo(("sma", window), lambda: _rolling_mean(self.close, window))
+
+    def volume_sma(self, window: int) -> np.ndarray:
+        """거래량 단순이동평균"""
+        return self._memo(("volume_sma", window), lambda: _rolling_mean(self.volume, window))
+
+    def atr(self, window: int) -> np.ndarray:
+        """AverageTrueRange(window).average_true_range() (Wilder 평활)"""
+        return self._memo(("atr", window), lambda: self._compute_atr(window))
+
+    def _compute_atr(self, window: int) -> np.ndarray:
+        prev_close = _shift(self.close)
+        with np.errstate(invalid="ignore"):
+            true_range = np.fmax(
+                self.high - self.low,
+                np.fmax(np.abs(self.high - prev_close), np.abs(self.low - prev_close)),
+            )
+
+        out = np.full(self.close.shape, np.nan)
+        state = np.full(self.close.shape[1], np.nan)
+        seed_rows = self._starts + window - 1
+        for row in range(self.close.shape[0]):
+            seed = seed_rows == row
+            if seed.any():
+                state[seed] = np.nanmean(true_range[row - window + 1:row + 1, seed], axis=0)
+            update = seed_rows < row
+            state[update] = (state[update] * (window - 1) + true_range[row, update]) / float(window)
+            out[row] = state
+        return out
+
+    def bollinger(self, window: int = BOLLINGER_WINDOW, window_dev: float = BOLLINGER_STD_DEV) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(BB_Mavg, BB_Upper, BB_Lower)"""
+        def compute():
+            mavg = _rolling_mean(self.close, window)
+            mstd = _rolling_std(self.close, window)
+            return mavg, mavg + window_dev * mstd, mavg - window_dev * mstd
+        return self._memo(("bollinger", window, window_dev), compute)
+
+    def rsi(self, window: int) -> np.ndarray:
+        """RSIIndicator(window).rsi()"""
+        def compute():
+            diff = self.close - _shift(self.close)
+            with np.errstate(invalid="ignore"):
+                up = np.where(diff > 0, diff, 0.0)
+                down = np.where(diff < 0, -diff, 0.0)
+            up[~self._present] = np.nan
+            down[~self._present] = np.nan
+            ema_up = _ewm_mean(up, 1.0 / window, window)
+            ema_down = _ewm_mean(down, 1.0 / window, window)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return np.where(ema_down == 0, 100.0, 100.0 - (100.0 / (1.0 + ema_up / ema_down)))
+        return self._memo(("rsi", window), compute)
+
+    def macd(self, window_fast: int = 12, window_slow: int = 26, window_sign: int = 9) -> Tuple[np.ndarray, np.ndarray]:
+        """(MACD, MACD_Signal)"""
+        def compute():
+            ema_fast = _ewm_mean(self.close, 2.0 / (window_fast + 1), window_fast)
+            ema_slow = _ewm_mean(self.close, 2.0 / (window_slow + 1), window_slow)
+            macd = ema_fast - ema_slow
+            return macd, _ewm_mean(macd, 2.0 / (window_sign + 1), window_sign)
+        return self._memo(("macd", window_fast, window_slow, window_sign), compute)
+
+    def obv(self) -> np.ndarray:
+        """OnBalanceVolumeIndicator().on_balance_volume()"""
+        def compute():
+            with np.errstate(invalid="ignore"):
+                step = np.where(self.close < _shift(self.close), -self.volume, self.volume)
+            obv = np.nancumsum(step, axis=0)
+            obv[~self._present] = np.nan
+            return obv
+        return self._memo(("obv",), compute)
+
+    def obv_sma(self, window: int = 10) -> np.ndarray:
+        """OBV 단순이동평균"""
+        return self._memo(("obv_sma", window), lambda: _rolling_mean(self.obv(), window))
+
+    def adtv(self) -> np.ndarray:
+        """calculate_adtv: 최근 종가 × ADTV_ROLLING_WINDOW 평균 거래량"""
+        return self.latest(self.close) * self.latest(self.volume_sma(ADTV_ROLLING_WINDOW))
+
+    def atr_max(self) -> np.ndarray:
+        """calculate_atr: ATR_WINDOWS 중 최신 ATR 최댓값 (하나라도 유효하지 않으면 NaN)"""
+        latest = np.vstack([self.latest(self.atr(window)) for window in ATR_WINDOWS])
+        with np.errstate(invalid="ignore"):
+            valid = (latest > 0).all(axis=0)
+        return np.where(valid, latest.max(axis=0), np.nan)
+
+    # ------------------------------------------------------------------
+    # 스크리닝 마스크 (trading_helpers 종목별 함수와 동일 조건)
+    # ------------------------------------------------------------------
+    def anchor_date_mask(self, anchor_date: str) -> np.ndarray:
+        """is_same_anchor_date"""
+        return self.last_dates == anchor_date
+
+    def min_rows_mask(self, min_length: int) -> np.ndarray:
+        """has_min_rows"""
+        return self.lengths >= min_length
+
+    def liquidity_mask(self, country: str, usd_krw: float) -> np.ndarray:
+        """meets_liquidity_threshold(calculate_adtv(df), ...)"""
+        threshold = KOREAN_LIQUIDITY_THRESHOLD_BASE * usd_krw if country == "KOR" else USA_LIQUIDITY_THRESHOLD
+        adtv = self.adtv()
+        with np.errstate(invalid="ignore"):
+            return (adtv > 0) & (adtv >= threshold)
+
+    def atr_mask(self) -> np.ndarray:
+        """calculate_atr(df) is not None"""
+        return ~np.isnan(self.atr_max())
+
+    def bb_proximity_mask(self, tol: float = 0.05, use_low: bool = True, lookback: int = 3) -> np.ndarray:
+        """bb_proximity_ok"""
+        _, upper, lower = self.bollinger()
+        lookback = int(max(1, lookback))
+        upper, lower = upper[-lookback:], lower[-lookback:]
+        price = np.minimum(self.close, self.low)[-lookback:] if use_low else self.close[-lookback:]
+        denom = upper - lower
+        with np.errstate(invalid="ignore", divide="ignore"):
+            valid = ~np.isnan(lower) & ~np.isnan(upper) & ~np.isnan(price) & (denom > 0)
+            pct_b = (price - lower) / denom
+            return (valid & (pct_b <= tol)).any(axis=0)
+
+    def obv_sma_rising_mask(self, steps: int = 3) -> np.ndarray:
+        """obv_sma_rising"""
+        obv_sma = self.obv_sma(10)
+        with np.errstate(invalid="ignore"):
+            rising = self.latest(obv_sma) > self.latest(obv_sma, steps)
+        return (self.lengths >= steps + 1) & rising
+
+    def rsi_in_range_mask(self, window: int, lower: float, upper: float) -> np.ndarray:
+        """rsi_in_range"""
+        curr = self.latest(self.rsi(window))
+        with np.errstate(invalid="ignore"):
+            return (lower <= curr) & (curr <= upper)
+
+    def rsi_rebound_below_mask(self, window: int, upper_bound: float) -> np.ndarray:
+        """rsi_rebound_below"""
+        rsi = self.rsi(window)
+        curr, prev = self.latest(rsi), self.latest(rsi, 2)
+        with np.errstate(invalid="ignore"):
+            return (self.lengths >= 2) & (prev < curr) & (curr < upper_bound)
+
+    def macd_rebound_mask(self) -> np.ndarray:
+        """macd_rebound_ok"""
+        macd, signal = self.macd()
+        macd_curr, macd_prev = self.latest(macd), self.latest(macd, 2)
+        sig_curr, sig_prev = self.latest(signal), self.latest(signal, 2)
+        with np.errstate(invalid="ignore"):
+            recent_below_signal = (macd[-6:-1] <= signal[-6:-1]).any(axis=0)
+            return (
+                (self.lengths >= 2)
+                & (macd_curr >= sig_curr)
+                & ((macd_curr - sig_curr) > (macd_prev - sig_prev))
+                & recent_below_signal
+            )
+
+    # ------------------------------------------------------------------
+    # 박스권/돌파 패턴 마스크 (market_condition 종목별 함수와 동일 조건)
+    # ------------------------------------------------------------------
+    def range_bound_duration_mask(self, min_days: int = 20, bb_width_range: Tuple[float, float] = (0.07, 0.18)) -> np.ndarray:
+        """check_range_bound_duration (기본 볼린저 밴드 기준)"""
+        mavg, upper, lower = self.bollinger()
+        in_range = bb_width_in_range(upper[-min_days:], lower[-min_days:], mavg[-min_days:], bb_width_range)
+        return (self.lengths >= min_days) & (in_range.sum(axis=0) >= min_days * 0.8)
+
+    def fakeout_filter_mask(self, confirm_days: int = 3) -> np.ndarray:
+        """check_fakeout_filter (데이터가 부족한 종목은 통과)"""
+        rows = confirm_days + 5
+        if self.close.shape[0] < rows:
+            return np.ones(len(self.symbols), dtype=bool)
+        _, _, lower = self.bollinger()
+        passed = fakeout_filter_passed(self.low[-rows:], self.close[-rows:], lower[-rows:], confirm_days)
+        return (self.lengths < rows) | passed
+
+    def breakout_with_volume_mask(self, lookback: int = 5, volume_mult: float = 1.5) -> np.ndarray:
+        """check_breakout_with_volume"""
+        if self.close.shape[0] < max(30, lookback + 1):
+            return np.zeros(len(self.symbols), dtype=bool)
+        avg_volume = self.latest(self.volume_sma(20), lookback + 1)
+        resistance = self.high[-lookback - 1:-1].max(axis=0)
+        with np.errstate(invalid="ignore"):
+            breakout = (self.close[-lookback:] > resistance) & (self.volume[-lookback:] > avg_volume * volume_mult)
+            return (self.lengths >= 30) & (avg_volume > 0) & (resistance > 0) & breakout.any(axis=0)
+
+
+class _EngineWindow(IndicatorEngine):
+    """거래일 정렬 엔진의 행 구간 뷰 (IndicatorEngine.window)"""
+
+    def _memo(self, key: tuple, compute):
+        # 메모 키는 (메서드명, 인자...) 형태이므로 전체 기간 엔진의 같은 메서드 결과를 잘라 쓴다
+        if key not in self._cache:
+            value = getattr(self._parent, key[0])(*key[1:])
+            if isinstance(value, tuple):
+                self._cache[key] = tuple(matrix[self._start:self._end] for matrix in value)
+            else:
+                self._cache[key] = value[self._start:self._end]
+        return self._cache[key]
@@ -3,16 +3,61 @@ import datetime
 from typing import Optional, Tuple
 
 import FinanceDataReader
+import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
+from config.constants import (
+    MARKET_INDEX_SYMBOLS,
+    MARKET_SERIES_CALENDARS,
+    MARKET_SERIES_INITIAL_DAYS,
+    MARKET_SERIES_STALE_SESSIONS,
+)
 from config.logging_config import get_logger
 from config.strategy_config import RISK_CONFIG, MARKET_CONDITION_CONFIG
+from data.models import MarketSeries
+from repositories.market_series_repository import MarketSeriesRepository
+from services.indicator_bundle import IndicatorBundle
+from services.trading_calendar import get_trading_calendar
 
 logger = get_logger(__name__)
 
 
+def get_local_series(series: str) -> Optional[MarketSeries]:
+    """
+    market_series 테이블의 지표 최신 행 (없거나 오래됐으면 None)
+
+    오늘 이전 MARKET_SERIES_STALE_SESSIONS번째 거래일보다 오래된 행은 갱신 잡이 실패한 것으로 보고
+    버린다 (VIX 매수 차단이 며칠 지난 값으로 판단하지 않도록).
+    
+    Args:
+        series: 지표 심볼 (VIX, ^GSPC, KS11, USD/KRW)
+    """
+    try:
+        row = MarketSeriesRepository.get_latest(series)
+    except Exception as e:
+        logger.warning(f"시장 지표 로컬 조회 실패: {series} -> {e}")
+        return None
+    if row is None or row.date < _stale_before(series):
+        logger.warning(f"시장 지표 로컬 시계열 없음/오래됨, 직접 조회: {series} (~{row.date if row else None})")
+        return None
+    return row
+
+
+def _stale_before(series: str) -> datetime.date:
+    """이 날짜보다 오래된 지표 행은 오래된 것으로 간주 (지표 시장의 거래일 기준)"""
+    calendar = get_trading_calendar(MARKET_SERIES_CALENDARS.get(series, "KOR"))
+    cutoff = datetime.date.today()
+    for _ in range(MARKET_SERIES_STALE_SESSIONS):
+        cutoff = calendar.last_open_day(cutoff - datetime.timedelta(days=1))
+    return cutoff
+
+
 def get_vix() -> Optional[float]:
-    """현재 VIX 지수 조회"""
+    """현재 VIX 지수 조회 (로컬 시계열 우선)"""
+    row = get_local_series("VIX")
+    if row is not None:
+        return float(row.close)
     try:
         df = FinanceDataReader.DataReader("VIX", 
             start=(datetime.datetime.now() - datetime.timedelta(days=7)).strftime("%Y-%m-%d"))
@@ -24,6 +69,14 @@ def get_vix() -> Optional[float]:
         return None
 
 
+def get_usd_krw() -> float:
+    """현재 원/달러 환율 조회 (로컬 시계열 우선)"""
+    row = get_local_series("USD/KRW")
+    if row is not None:
+        return float(row.close)
+    return float(FinanceDataReader.DataReader("USD/KRW").iloc[-1]["Adj Close"])
+
+
 def is_buy_allowed() -> Tuple[bool, Optional[float]]:
     """
     매수 가능 여부 확인 (VIX 기반)
@@ -31,7 +84,16 @@ def is_buy_allowed() -> Tuple[bool, Optional[float]]:
     Returns:
         Tuple[bool, Optional[float]]: (매수가능여부, 현재VIX)
     """
-    vix = get_vix()
+    return evaluate_buy_allowed(get_vix())
+
+
+def evaluate_buy_allowed(vix: Optional[float]) -> Tuple[bool, Optional[float]]:
+    """
+    조회된 VIX로 매수 가능 여부 판단
+    
+    Returns:
+        Tuple[bool, Optional[float]]: (매수가능여부, 현재VIX)
+    """
     if vix is None:
         logger.warning("VIX 조회 불가, 매수 허용")
         return True, None
@@ -45,7 +107,7 @@ def is_buy_allowed() -> Tuple[bool, Optional[float]]:
 
 def get_market_trend(country: str = "USA") -> str:
     """
-    시장 추세 판단 (상승/횡보/하락)
+    시장 추세 판단 (상승/횡보/하락, 로컬 시계열의 SMA50/SMA200 우선)
     
     Args:
         country: 국가 코드 (USA, KOR)
@@ -53,10 +115,15 @@ def get_market_trend(country: str = "USA") -> str:
     Returns:
         str: "bull", "neutral", "bear"
     """
+    index_symbol = MARKET_INDEX_SYMBOLS.get(country, MARKET_INDEX_SYMBOLS["KOR"])
+    row = get_local_series(index_symbol)
+    if row is not None:
+        return classify_market_trend(float(row.close), row.sma50, row.sma200)
+
     try:
-        index_symbol = "^GSPC" if country == "USA" else "KS11"
+        # 로컬 시계열과 같은 결과가 나오도록 SMA200을 계산할 수 있는 기간을 받는다
         df = FinanceDataReader.DataReader(index_symbol,
-            start=(datetime.datetime.now() - datetime.timedelta(days=200)).strftime("%Y-%m-%d"))
+            start=(datetime.datetime.now() - datetime.timedelta(days=MARKET_SERIES_INITIAL_DAYS)).strftime("%Y-%m-%d"))
         
         if df is None or len(df) < 50:
             return "neutral"
@@ -66,22 +133,35 @@ def get_market_trend(country: str = "USA") -> str:
         sma200 = close.rolling(200).mean()
         
         current_price = float(close.iloc[-1])
-        sma50_val = float(sma50.iloc[-1]) if not pd.isna(sma50.iloc[-1]) else current_price
-        sma200_val = float(sma200.iloc[-1]) if not pd.isna(sma200.iloc[-1]) else current_price
-        
-        # 골든크로스/데드크로스 + 가격 위치
-        if current_price > sma50_val > sma200_val:
-            return "bull"
-        elif current_price < sma50_val < sma200_val:
-            return "bear"
-        else:
-            return "neutral"
+        sma50_val = None if pd.isna(sma50.iloc[-1]) else float(sma50.iloc[-1])
+        sma200_val = None if pd.isna(sma200.iloc[-1]) else float(sma200.iloc[-1])
+        return classify_market_trend(current_price, sma50_val, sma200_val)
             
     except Exception as e:
         logger.warning(f"시장 추세 판단 실패: {e}")
         return "neutral"
 
 
+def classify_market_trend(current_price: float, sma50: Optional[float], sma200: Optional[float]) -> str:
+    """
+    지수 종가와 이동평균으로 시장 추세 분류 (SMA50이 없으면 횡보, SMA200이 없으면 종가로 대체)
+    
+    Returns:
+        str: "bull", "neutral", "bear"
+    """
+    if sma50 is None:
+        return "neutral"
+    sma50 = float(sma50)
+    sma200 = float(sma200) if sma200 is not None else current_price
+    # 골든크로스/데드크로스 + 가격 위치
+    if current_price > sma50 > sma200:
+        return "bull"
+    elif current_price < sma50 < sma200:
+        return "bear"
+    else:
+        return "neutral"
+
+
 def get_sell_ratio_adjusted(base_ratio: float, vix: Optional[float] = None) -> float:
     """
     VIX 기반 매도 비율 조정
@@ -95,7 +175,20 @@ def get_sell_ratio_adjusted(base_ratio: float, vix: Optional[float] = None) -> f
     """
     if vix is None:
         vix = get_vix()
+    return adjust_sell_ratio(base_ratio, vix)
+
+
+def adjust_sell_ratio(base_ratio: float, vix: Optional[float]) -> float:
+    """
+    조회된 VIX로 매도 비율 조정 (VIX가 없으면 기본 비율)
     
+    Args:
+        base_ratio: 기본 매도 비율
+        vix: 현재 VIX
+    
+    Returns:
+        float: 조정된 매도 비율
+    """
     if vix is None:
         return base_ratio
     
@@ -106,26 +199,48 @@ def get_sell_ratio_adjusted(base_ratio: float, vix: Optional[float] = None) -> f
     return adjusted
 
 
-def get_position_size_adjusted(base_size: int, country: str = "USA") -> int:
+def get_position_multiplier(country: str = "USA") -> float:
+    """
+    시장 추세 기반 포지션 배수 조회
+    
+    Args:
+        country: 국가 코드
+    
+    Returns:
+        float: 포지션 사이즈 배수
+    """
+    market_trend = get_market_trend(country)
+    multiplier = MARKET_CONDITION_CONFIG.get_position_multiplier(market_trend)
+    logger.debug(f"포지션 배수: {multiplier:.2f} (추세: {market_trend})")
+    return multiplier
+
+
+def get_position_size_adjusted(base_size: int, country: str = "USA", multiplier: Optional[float] = None) -> int:
     """
     시장 상황 기반 포지션 사이즈 조정
     
     Args:
         base_size: 기본 포지션 사이즈
         country: 국가 코드
+        multiplier: 미리 조회한 포지션 배수 (None이면 시장 추세 조회)
     
     Returns:
         int: 조정된 포지션 사이즈
     """
-    market_trend = get_market_trend(country)
-    multiplier = MARKET_CONDITION_CONFIG.get_position_multiplier(market_trend)
+    if multiplier is None:
+        multiplier = get_position_multiplier(country)
     adjusted = max(1, int(base_size * multiplier))
     
-    logger.debug(f"포지션 조정: {base_size} * {multiplier:.2f} = {adjusted} (추세: {market_trend})")
+    logger.debug(f"포지션 조정: {base_size} * {multiplier:.2f} = {adjusted}")
     return adjusted
 
 
-def check_52week_high_drawdown(df: pd.DataFrame, min_dd: float = 0.15, max_dd: float = 0.35) -> bool:
+def check_52week_high_drawdown(
+        df: pd.DataFrame,
+        min_dd: float = 0.15,
+        max_dd: float = 0.35,
+        indicators: Optional[IndicatorBundle] = None
+) -> bool:
     """
     52주 신고가 대비 조정폭 확인
     
@@ -133,6 +248,7 @@ def check_52week_high_drawdown(df: pd.DataFrame, min_dd: float = 0.15, max_dd: f
         df: 가격 데이터프레임
         min_dd: 최소 조정폭
         max_dd: 최대 조정폭
+        indicators: 종목 지표 번들 (None이면 새로 생성)
     
     Returns:
         bool: 조건 충족 여부
@@ -141,7 +257,7 @@ def check_52week_high_drawdown(df: pd.DataFrame, min_dd: float = 0.15, max_dd: f
         return False
     
     try:
-        high_52w = float(df["high"].tail(252).max())
+        high_52w = float((indicators or IndicatorBundle(df)).rolling("high", 252, "max", min_periods=1).iloc[-1])
         current_price = float(df.iloc[-1]["close"])
         
         if high_52w <= 0:
@@ -153,7 +269,12 @@ def check_52week_high_drawdown(df: pd.DataFrame, min_dd: float = 0.15, max_dd: f
         return False
 
 
-def check_breakout_with_volume(df: pd.DataFrame, lookback: int = 5, volume_mult: float = 1.5) -> bool:
+def check_breakout_with_volume(
+        df: pd.DataFrame,
+        lookback: int = 5,
+        volume_mult: float = 1.5,
+        indicators: Optional[IndicatorBundle] = None
+) -> bool:
     """
     브레이크아웃 + 거래량 급증 확인
     
@@ -161,6 +282,7 @@ def check_breakout_with_volume(df: pd.DataFrame, lookback: int = 5, volume_mult:
         df: 가격 데이터프레임
         lookback: 확인 기간
         volume_mult: 평균 대비 거래량 배수
+        indicators: 종목 지표 번들 (None이면 새로 생성)
     
     Returns:
         bool: 브레이크아웃 조건 충족 여부
@@ -170,21 +292,15 @@ def check_breakout_with_volume(df: pd.DataFrame, lookback: int = 5, volume_mult:
     
     try:
         recent = df.tail(lookback)
-        avg_volume = float(df["volume"].rolling(20).mean().iloc[-lookback-1])
+        avg_volume = float((indicators or IndicatorBundle(df)).rolling("volume", 20).iloc[-lookback-1])
         resistance = float(df["high"].iloc[-lookback-1:-1].max())
         
         if avg_volume <= 0 or resistance <= 0:
             return False
         
         # 최근 기간 내 저항선 돌파 + 거래량 급증
-        for i in range(len(recent)):
-            close = float(recent.iloc[i]["close"])
-            volume = float(recent.iloc[i]["volume"])
-            
-            if close > resistance and volume > avg_volume * volume_mult:
-                return True
-        
-        return False
+        breakout = (recent["close"].to_numpy(dtype=float) > resistance) & (recent["volume"].to_numpy(dtype=float) > avg_volume * volume_mult)
+        return bool(breakout.any())
     except (KeyError, IndexError, ValueError):
         return False
 
@@ -206,19 +322,11 @@ def check_range_bound_duration(df: pd.DataFrame, min_days: int = 20, bb_width_ra
     
     try:
         recent = df.tail(min_days)
-        count_in_range = 0
+        bb_upper = recent["BB_Upper"].to_numpy(dtype=float)
+        bb_lower = recent["BB_Lower"].to_numpy(dtype=float)
+        bb_mavg = recent["BB_Mavg"].to_numpy(dtype=float)
         
-        for i in range(len(recent)):
-            bb_upper = float(recent.iloc[i]["BB_Upper"])
-            bb_lower = float(recent.iloc[i]["BB_Lower"])
-            bb_mavg = float(recent.iloc[i]["BB_Mavg"])
-            
-            if pd.isna(bb_upper) or pd.isna(bb_lower) or bb_mavg <= 0:
-                continue
-            
-            width = (bb_upper - bb_lower) / bb_mavg
-            if bb_width_range[0] <= width <= bb_width_range[1]:
-                count_in_range += 1
+        count_in_range = int(bb_width_in_range(bb_upper, bb_lower, bb_mavg, bb_width_range).sum())
         
         # 최소 80% 이상의 기간이 박스권 범위 내
         return count_in_range >= min_days * 0.8
@@ -244,32 +352,44 @@ def check_fakeout_filter(df: pd.DataFrame, confirm_days: int = 3) -> bool:
         recent = df.tail(confirm_days + 5)
         
         # 최근 confirm_days+5일 내에 BB 하단 터치 후 복귀 패턴 확인
-        touched_lower = False
-        recovered = False
-        
-        for i in range(len(recent) - confirm_days):
-            low = float(recent.iloc[i]["low"])
-            bb_lower = float(recent.iloc[i]["BB_Lower"])
-            
-            if pd.isna(bb_lower):
-                continue
-            
-            if low <= bb_lower * 1.02:  # 2% 이내 터치
-                touched_lower = True
-                
-                # 이후 confirm_days 내 복귀 확인
-                for j in range(1, min(confirm_days + 1, len(recent) - i)):
-                    future_close = float(recent.iloc[i + j]["close"])
-                    future_bb_lower = float(recent.iloc[i + j]["BB_Lower"])
-                    
-                    if not pd.isna(future_bb_lower) and future_close > future_bb_lower * 1.05:
-                        recovered = True
-                        break
-                
-                if touched_lower and recovered:
-                    return True
-        
-        # 터치하지 않았거나 복귀 패턴이면 진입 허용
-        return not touched_lower or recovered
+        return bool(fakeout_filter_passed(
+            recent["low"].to_numpy(dtype=float)[:, None],
+            recent["close"].to_numpy(dtype=float)[:, None],
+            recent["BB_Lower"].to_numpy(dtype=float)[:, None],
+            confirm_days,
+        )[0])
     except (KeyError, IndexError, ValueError):
         return True
+
+
+def bb_width_in_range(
+        bb_upper: np.ndarray,
+        bb_lower: np.ndarray,
+        bb_mavg: np.ndarray,
+        bb_width_range: Tuple[float, float]
+) -> np.ndarray:
+    """BB 폭 비율이 허용 범위 안인 위치 (결측/비양수 평균은 제외)"""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        width = (bb_upper - bb_lower) / bb_mavg
+        valid = ~np.isnan(bb_upper) & ~np.isnan(bb_lower) & (bb_mavg > 0)
+        return valid & (bb_width_range[0] <= width) & (width <= bb_width_range[1])
+
+
+def fakeout_filter_passed(low: np.ndarray, close: np.ndarray, bb_lower: np.ndarray, confirm_days: int) -> np.ndarray:
+    """
+    가짜 돌파 필터 판정 (행: 최근 confirm_days+5 거래일, 열: 종목)
+    
+    BB 하단 2% 이내 터치가 없거나, 터치 후 confirm_days 안에 하단 대비 5% 위로
+    복귀한 터치가 하나라도 있으면 통과
+    """
+    touch_rows = low.shape[0] - confirm_days
+    with np.errstate(invalid="ignore"):
+        has_band = ~np.isnan(bb_lower)
+        touched = has_band & (low <= bb_lower * 1.02)
+        recovered = has_band & (close > bb_lower * 1.05)
+    touched = touched[:touch_rows]
+    if confirm_days > 0:
+        recovered_ahead = sliding_window_view(recovered[1:], confirm_days, axis=0).any(axis=-1)[:touch_rows]
+    else:
+        recovered_ahead = np.zeros_like(touched)
+    return ~touched.any(axis=0) | (touched & recovered_ahead).any(axis=0)
@@ -0,0 +1,80 @@
+"""워크플로우 실행 단위 시장 지표 스냅샷"""
+import datetime
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from config.constants import MARKET_SNAPSHOT_TTL_SECONDS
+from config.logging_config import get_logger
+from config.strategy_config import MARKET_CONDITION_CONFIG
+from services.market_condition import (
+    adjust_sell_ratio,
+    evaluate_buy_allowed,
+    get_market_trend,
+    get_usd_krw,
+    get_vix,
+)
+
+logger = get_logger(__name__)
+
+
+class MarketSnapshot:
+    """
+    워크플로우 1회 실행 동안 공유하는 시장 지표 (VIX, 지수 추세, 원/달러 환율)
+
+    각 지표는 처음 필요할 때 한 번만 내려받고 ttl초 동안 재사용한다. 전략마다, 종목마다
+    같은 지표를 다시 받지 않도록 워크플로우가 하나를 만들어 모든 전략에 넘긴다.
+    조회 실패(None)도 그대로 기억하므로 실패한 지표를 종목마다 다시 요청하지 않는다.
+    as_of가 None이면 오늘 기준이며, 백테스트용 스냅샷은 과거 기준일을 지정해 전략에 전달한다.
+    """
+
+    as_of: Optional[datetime.date] = None
+
+    def __init__(self, ttl: float = MARKET_SNAPSHOT_TTL_SECONDS):
+        """
+        :param ttl: 지표 유효 시간 (초)
+        """
+        self._ttl = ttl
+        self._values: Dict[Tuple[str, ...], Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self.fetches = 0
+
+    def _get(self, key: Tuple[str, ...], loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            cached = self._values.get(key)
+            if cached is not None and time.monotonic() - cached[0] < self._ttl:
+                return cached[1]
+            value = loader()
+            self._values[key] = (time.monotonic(), value)
+            self.fetches += 1
+            return value
+
+    @property
+    def vix(self) -> Optional[float]:
+        """현재 VIX (조회 실패 시 None)"""
+        return self._get(("vix",), get_vix)
+
+    @property
+    def usd_krw(self) -> float:
+        """원/달러 환율"""
+        return self._get(("usd_krw",), get_usd_krw)
+
+    def market_trend(self, country: str) -> str:
+        """국가별 지수 추세 (bull, neutral, bear)"""
+        return self._get(("trend", country), lambda: get_market_trend(country))
+
+    def position_multiplier(self, country: str) -> float:
+        """시장 추세 기반 포지션 배수"""
+        return MARKET_CONDITION_CONFIG.get_position_multiplier(self.market_trend(country))
+
+    def is_buy_allowed(self) -> Tuple[bool, Optional[float]]:
+        """VIX 기반 매수 가능 여부 (매수가능여부, 현재VIX)"""
+        return evaluate_buy_allowed(self.vix)
+
+    def sell_ratio_adjusted(self, base_ratio: float) -> float:
+        """VIX 기반 매도 비율 조정"""
+        return adjust_sell_ratio(base_ratio, self.vix)
+
+    def log_stats(self) -> None:
+        """지표 조회 횟수 로깅"""
+        logger.info(f"시장 지표 스냅샷: 조회 {self.fetches}회 ({', '.join('/'.join(key) for key in self._values)})")
@@ -0,0 +1,92 @@
+"""워크플로우 실행 단위 가격 히스토리 캐시"""
+from typing import Dict, Iterable, Optional
+
+import pandas as pd
+
+from config.constants import DEFAULT_PRICE_HISTORY_DAYS
+from config.logging_config import get_logger
+from services.data_handler import get_country_by_symbol
+from services.indicator_bundle import IndicatorBundle
+from services.indicator_engine import IndicatorEngine
+from services.trading_helpers import fetch_price_panel, normalize_dataframe_for_country
+
+logger = get_logger(__name__)
+
+
+class PriceCache:
+    """
+    워크플로우 1회 실행 동안 종목별 가격 히스토리를 공유하는 캐시
+
+    종목별 히스토리는 최초 요청 시 한 번만 조회/정제되며, 이후 전략들은
+    메모리의 사본을 받아 사용한다. 전략이 지표 컬럼을 추가해도 원본은 오염되지 않는다.
+    종목별 지표 번들도 함께 보관하여 여러 전략이 같은 지표 시리즈를 재사용한다.
+    """
+
+    def __init__(self, days: int = DEFAULT_PRICE_HISTORY_DAYS):
+        """
+        :param days: 조회 기간 (일)
+        """
+        self._days = days
+        self._frames: Dict[str, Optional[pd.DataFrame]] = {}
+        self._served: set[str] = set()
+        self._bundles: Dict[str, IndicatorBundle] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def prefetch(self, symbols: Iterable[str]) -> None:
+        """캐시에 없는 종목을 일괄 조회하여 적재"""
+        missing = [symbol for symbol in dict.fromkeys(symbols) if symbol and symbol not in self._frames]
+        if not missing:
+            return
+
+        panel = fetch_price_panel(missing, days=self._days)
+        for symbol in missing:
+            self.misses += 1
+            df = panel.get(symbol)
+            if df is None or df.empty:
+                self._frames[symbol] = None
+                continue
+            self._frames[symbol] = normalize_dataframe_for_country(df, get_country_by_symbol(symbol))
+
+    def get(self, symbol: str) -> Optional[pd.DataFrame]:
+        """정제된 가격 히스토리 사본 반환 (없으면 None)"""
+        if symbol not in self._frames:
+            self.prefetch([symbol])
+
+        if symbol in self._served:
+            self.hits += 1
+        else:
+            self._served.add(symbol)
+
+        df = self._frames.get(symbol)
+        return df.copy() if df is not None else None
+
+    def indicators(self, symbol: str) -> Optional[IndicatorBundle]:
+        """종목 지표 번들 (가격 히스토리가 없으면 None)"""
+        if symbol not in self._frames:
+            self.prefetch([symbol])
+        df = self._frames.get(symbol)
+        if df is None:
+            return None
+        if symbol not in self._bundles:
+            self._bundles[symbol] = IndicatorBundle(df)
+        return self._bundles[symbol]
+
+    def frames(self, symbols: Iterable[str]) -> Dict[str, pd.DataFrame]:
+        """캐시된 원본 히스토리 (벡터 스크리닝용, 읽기 전용이며 통계에 집계하지 않음)"""
+        symbols = list(dict.fromkeys(symbols))
+        self.prefetch(symbols)
+        return {symbol: self._frames[symbol] for symbol in symbols if self._frames.get(symbol) is not None}
+
+    def engine(self, symbols: Iterable[str]) -> IndicatorEngine:
+        """종목 전체 벡터 지표 엔진 (전략의 일괄 스크리닝용)"""
+        return IndicatorEngine(self.frames(symbols))
+
+    def log_stats(self) -> None:
+        """캐시 hit/miss 통계 로깅"""
+        computed = sum(bundle.computed for bundle in self._bundles.values())
+        reused = sum(bundle.reused for bundle in self._bundles.values())
+        logger.info(
+            f"가격 캐시 통계: hit {self.hits}, miss {self.misses}, 종목 {len(self._frames)}, "
+            f"지표 계산 {computed}, 재사용 {reused}"
+        )
@@ -1,27 +1,126 @@
 """전략 기본 인터페이스"""
+import math
+import multiprocessing
 from abc import ABC, abstractmethod
-from typing import List, Union
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from typing import Iterable, List, Optional, Tuple, Union
 
+import pandas as pd
+
+from config import setting_env
+from config.constants import STRATEGY_PARALLEL_CHUNKS_PER_WORKER, STRATEGY_PARALLEL_MIN_SYMBOLS
+from config.logging_config import get_logger
 from data.dto.account_dto import StockResponseDTO
 from config.strategy_config import RISK_CONFIG
+from services.indicator_bundle import IndicatorBundle
+from services.market_snapshot import MarketSnapshot
+from services.price_cache import PriceCache
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class BuyContext:
+    """매수 평가 공통 값 (워커 프로세스로 그대로 전달되므로 DB/네트워크 조회 결과만 담는다)"""
+    country: str
+    anchor_date: str
+    risk_amount_value: float
+    risk_k: float
+    adtv_limit_ratio: float
+    usd_krw: float
+    position_multiplier: float
 
 
 class BaseStrategy(ABC):
     """매매 전략 기본 클래스"""
 
     @abstractmethod
-    def filter_for_buy(self, country: str = "KOR") -> dict[str, dict[float, int]]:
+    def filter_for_buy(
+            self,
+            country: str = "KOR",
+            price_cache: Optional[PriceCache] = None,
+            market: Optional[MarketSnapshot] = None
+    ) -> dict[str, dict[float, int]]:
         """매수 대상 종목 필터링"""
         pass
 
     @abstractmethod
     def filter_for_sell(
             self,
-            stocks_held: Union[List[StockResponseDTO], StockResponseDTO, None]
+            stocks_held: Union[List[StockResponseDTO], StockResponseDTO, None],
+            price_cache: Optional[PriceCache] = None,
+            market: Optional[MarketSnapshot] = None
     ) -> dict[str, dict[float, int]]:
         """매도 대상 종목 필터링"""
         pass
-    
+
+    @abstractmethod
+    def _evaluate_buy(
+            self,
+            symbol: str,
+            df: pd.DataFrame,
+            ctx: BuyContext,
+            indicators: IndicatorBundle
+    ) -> Optional[dict[float, int]]:
+        """종목 하나의 매수 가격/수량 산출 (대상이 아니면 None)"""
+        pass
+
+    def _evaluate_buy_batch(
+            self,
+            items: List[Tuple[str, pd.DataFrame, IndicatorBundle]],
+            ctx: BuyContext
+    ) -> dict[str, dict[float, int]]:
+        """종목 묶음 매수 평가 (프로세스 풀 워커에서도 실행됨)"""
+        buy_levels: dict[str, dict[float, int]] = {}
+        for symbol, df, indicators in items:
+            try:
+                levels = self._evaluate_buy(symbol, df, ctx, indicators)
+            except Exception as e:
+                logger.error(f"{type(self).__name__}.filter_for_buy 처리 중 에러: {symbol} -> {e}")
+                continue
+            if levels:
+                buy_levels[symbol] = levels
+        return buy_levels
+
+    def _run_buy_evaluation(
+            self,
+            symbols: Iterable[str],
+            price_cache: PriceCache,
+            ctx: BuyContext
+    ) -> dict[str, dict[float, int]]:
+        """
+        후보 종목 매수 평가 실행
+
+        STRATEGY_PROCESS_WORKERS가 2 이상이고 후보가 충분하면 종목을 청크로 나눠 프로세스 풀에서
+        평가한다. 워커는 DB에 접근하지 않도록 가격 데이터와 지표 번들을 직접 전달받는다.
+        (워커에서 새로 계산된 지표는 부모 캐시로 돌아오지 않는다.)
+        """
+        items = []
+        for symbol in symbols:
+            df = price_cache.get(symbol)
+            if df is not None and not df.empty:
+                items.append((symbol, df, price_cache.indicators(symbol)))
+
+        workers = setting_env.STRATEGY_PROCESS_WORKERS
+        if workers <= 1 or len(items) < STRATEGY_PARALLEL_MIN_SYMBOLS:
+            return self._evaluate_buy_batch(items, ctx)
+
+        chunk_size = max(1, math.ceil(len(items) / (workers * STRATEGY_PARALLEL_CHUNKS_PER_WORKER)))
+        chunks = [items[offset:offset + chunk_size] for offset in range(0, len(items), chunk_size)]
+        buy_levels: dict[str, dict[float, int]] = {}
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+                for result in executor.map(self._evaluate_buy_batch, chunks, repeat(ctx)):
+                    buy_levels.update(result)
+        except Exception as e:
+            logger.warning(f"{type(self).__name__} 병렬 평가 실패, 순차 실행으로 전환: {e}")
+            return self._evaluate_buy_batch(items, ctx)
+
+        logger.info(f"{type(self).__name__} 병렬 평가 완료: {len(items)}종목, {len(chunks)}청크, 워커 {workers}")
+        return buy_levels
+
     def _apply_max_position_weight(self, volume: int, close_price: float, risk_amount_value: float) -> int:
         """
         종목당 최대 비중 제한 적용 (공통 로직)
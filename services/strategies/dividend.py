@@ -5,15 +5,20 @@
 - 연간 리밸런싱 (단기 매매 아님)
 - VIX 기반 매수 중단
 """
-from typing import List, Union
+from typing import List, Optional, Union
 
+import numpy as np
 import pandas as pd
 
 from config.logging_config import get_logger
 from config.strategy_config import DIVIDEND_CONFIG
 from data.dto.account_dto import StockResponseDTO
 from data.models import Subscription
-from services.strategies.base import BaseStrategy
+from services.indicator_bundle import IndicatorBundle
+from services.indicator_engine import IndicatorEngine
+from services.market_snapshot import MarketSnapshot
+from services.price_cache import PriceCache
+from services.strategies.base import BaseStrategy, BuyContext
 from services.trading_helpers import (
     allocate_volume_to_levels,
     apply_bollinger_bands,
@@ -21,20 +26,18 @@ from services.trading_helpers import (
     calculate_atr,
     calculate_adtv,
     calculate_position_volume,
-    fetch_price_dataframe,
     generate_dca_entry_levels,
     higher_timeframe_ok,
     has_min_rows,
     is_same_anchor_date,
     macd_rebound_ok,
     meets_liquidity_threshold,
-    normalize_dataframe_for_country,
     obv_sma_rising,
     prepare_buy_context,
     rsi_rebound_below,
     add_prev_close_allocation,
 )
-from services.market_condition import is_buy_allowed, get_position_size_adjusted
+from services.market_condition import get_position_size_adjusted
 from services.data_handler import get_country_by_symbol
 
 logger = get_logger(__name__)
@@ -43,89 +46,123 @@ logger = get_logger(__name__)
 class DividendStrategy(BaseStrategy):
     """배당주 전략 (안정적인 배당 수익 추구)"""
 
-    def filter_for_buy(self, country: str = "KOR") -> dict[str, dict[float, int]]:
+    def filter_for_buy(
+            self,
+            country: str = "KOR",
+            price_cache: Optional[PriceCache] = None,
+            market: Optional[MarketSnapshot] = None
+    ) -> dict[str, dict[float, int]]:
         """배당주 매수 대상 필터링"""
+        market = market or MarketSnapshot()
         # VIX 체크 - 30 이상이면 매수 중단
-        buy_allowed, vix = is_buy_allowed()
+        buy_allowed, vix = market.is_buy_allowed()
         if not buy_allowed:
             logger.info(f"VIX {vix:.2f} >= 30, 배당주 매수 중단")
             return {}
         
-        anchor_date, risk_amount_value, risk_k, adtv_limit_ratio, stocks, usd_krw = prepare_buy_context(country, "dividend")
-        buy_levels: dict[str, dict[float, int]] = {}
-
-        for symbol in stocks:
-            try:
-                df = fetch_price_dataframe(symbol)
-                if df is None or df.empty:
-                    continue
-                df = normalize_dataframe_for_country(df, country)
-
-                if not is_same_anchor_date(df, anchor_date):
-                    continue
-
-                if not has_min_rows(df, DIVIDEND_CONFIG.min_data_rows):
-                    continue
-
-                adtv = calculate_adtv(df)
-                if not meets_liquidity_threshold(adtv, country, usd_krw):
-                    continue
-
-                if not higher_timeframe_ok(df):
-                    continue
-
-                df = apply_bollinger_bands(df)
-                if not bb_proximity_ok(df, tol=DIVIDEND_CONFIG.bb_tolerance, use_low=True, lookback=3):
-                    continue
-
-                # OBV 상승 확인 기간 5일로 확대
-                if not obv_sma_rising(df, steps=DIVIDEND_CONFIG.obv_rising_steps):
-                    continue
-
-                if not (rsi_rebound_below(df, window=7, upper_bound=DIVIDEND_CONFIG.rsi_upper_bound) or macd_rebound_ok(df)):
-                    continue
-
-                if not (float(df.iloc[-1]['close']) > float(df.iloc[-2]['low'])):
-                    continue
-
-                atr = calculate_atr(df)
-                if atr is None:
-                    continue
-
-                close_price = float(df.iloc[-1]['close'])
-                volume = calculate_position_volume(
-                    atr=atr,
-                    adtv=adtv,
-                    close_price=close_price,
-                    risk_amount_value=risk_amount_value,
-                    risk_k=risk_k,
-                    adtv_limit_ratio=adtv_limit_ratio,
-                )
-                if volume <= 0:
-                    continue
-
-                # 시장 상황 기반 포지션 사이즈 조정
-                volume = get_position_size_adjusted(volume, country)
-                
-                # 종목당 최대 비중 체크
-                volume = self._apply_max_position_weight(volume, close_price, risk_amount_value)
-
-                price_levels = generate_dca_entry_levels(df, atr)
-                if not price_levels:
-                    continue
-
-                levels = allocate_volume_to_levels(price_levels, total_volume=volume)
-                if not levels:
-                    continue
+        anchor_date, risk_amount_value, risk_k, adtv_limit_ratio, stocks, usd_krw = prepare_buy_context(country, "dividend", usd_krw=market.usd_krw, as_of=market.as_of)
+        ctx = BuyContext(
+            country=country,
+            anchor_date=anchor_date,
+            risk_amount_value=risk_amount_value,
+            risk_k=risk_k,
+            adtv_limit_ratio=adtv_limit_ratio,
+            usd_krw=usd_krw,
+            position_multiplier=market.position_multiplier(country),
+        )
+        price_cache = price_cache or PriceCache()
+        engine = price_cache.engine(stocks)
+        candidates = engine.select(self._screen_for_buy(engine, anchor_date, country, usd_krw))
+        logger.info(f"배당주 벡터 스크리닝: {len(stocks)}개 중 {len(candidates)}개 후보")
 
-                buy_levels[symbol] = add_prev_close_allocation(levels, df, volume)
-            except Exception as e:
-                logger.error(f"DividendStrategy.filter_for_buy 처리 중 에러: {symbol} -> {e}")
-        return buy_levels
+        return self._run_buy_evaluation(candidates, price_cache, ctx)
     
+    def _evaluate_buy(
+            self,
+            symbol: str,
+            df: pd.DataFrame,
+            ctx: BuyContext,
+            indicators: IndicatorBundle
+    ) -> Optional[dict[float, int]]:
+        """종목 하나의 매수 가격/수량 산출 (대상이 아니면 None)"""
+        if not is_same_anchor_date(df, ctx.anchor_date):
+            return None
+
+        if not has_min_rows(df, DIVIDEND_CONFIG.min_data_rows):
+            return None
+
+        adtv = calculate_adtv(df, indicators=indicators)
+        if not meets_liquidity_threshold(adtv, ctx.country, ctx.usd_krw):
+            return None
+
+        if not higher_timeframe_ok(df, indicators=indicators):
+            return None
+
+        df = apply_bollinger_bands(df, indicators=indicators)
+        if not bb_proximity_ok(df, tol=DIVIDEND_CONFIG.bb_tolerance, use_low=True, lookback=3):
+            return None
+
+        # OBV 상승 확인 기간 5일로 확대
+        if not obv_sma_rising(df, steps=DIVIDEND_CONFIG.obv_rising_steps, indicators=indicators):
+            return None
+
+        if not (rsi_rebound_below(df, window=7, upper_bound=DIVIDEND_CONFIG.rsi_upper_bound, indicators=indicators) or macd_rebound_ok(df, indicators=indicators)):
+            return None
+
+        if not (float(df.iloc[-1]['close']) > float(df.iloc[-2]['low'])):
+            return None
+
+        atr = calculate_atr(df, indicators=indicators)
+        if atr is None:
+            return None
+
+        close_price = float(df.iloc[-1]['close'])
+        volume = calculate_position_volume(
+            atr=atr,
+            adtv=adtv,
+            close_price=close_price,
+            risk_amount_value=ctx.risk_amount_value,
+            risk_k=ctx.risk_k,
+            adtv_limit_ratio=ctx.adtv_limit_ratio,
+        )
+        if volume <= 0:
+            return None
+
+        # 시장 상황 기반 포지션 사이즈 조정
+        volume = get_position_size_adjusted(volume, ctx.country, multiplier=ctx.position_multiplier)
+
+        # 종목당 최대 비중 체크
+        volume = self._apply_max_position_weight(volume, close_price, ctx.risk_amount_value)
+
+        price_levels = generate_dca_entry_levels(df, atr, indicators=indicators)
+        if not price_levels:
+            return None
+
+        levels = allocate_volume_to_levels(price_levels, total_volume=volume)
+        if not levels:
+            return None
+
+        return add_prev_close_allocation(levels, df, volume)
+
+    @staticmethod
+    def _screen_for_buy(engine: IndicatorEngine, anchor_date: str, country: str, usd_krw: float) -> np.ndarray:
+        """종목별 파이프라인 전에 지표 조건을 종목 전체에 대해 마스크로 선별"""
+        return (
+            engine.anchor_date_mask(anchor_date)
+            & engine.min_rows_mask(DIVIDEND_CONFIG.min_data_rows)
+            & engine.liquidity_mask(country, usd_krw)
+            & engine.bb_proximity_mask(tol=DIVIDEND_CONFIG.bb_tolerance, use_low=True, lookback=3)
+            & engine.obv_sma_rising_mask(steps=DIVIDEND_CONFIG.obv_rising_steps)
+            & (engine.rsi_rebound_below_mask(window=7, upper_bound=DIVIDEND_CONFIG.rsi_upper_bound) | engine.macd_rebound_mask())
+            & (engine.latest(engine.close) > engine.latest(engine.low, 2))
+            & engine.atr_mask()
+        )
+
     def filter_for_sell(
             self,
-            stocks_held: Union[List[StockResponseDTO], StockResponseDTO, None]
+            stocks_held: Union[List[StockResponseDTO], StockResponseDTO, None],
+            price_cache: Optional[PriceCache] = None,
+            market: Optional[MarketSnapshot] = None
     ) -> dict[str, dict[float, int]]:
         """배당주 매도 대상 필터링 - 연간 리밸런싱 방식
         
@@ -147,6 +184,11 @@ class DividendStrategy(BaseStrategy):
             .where(Subscription.category.in_(["growth", "box"]))
         )
         other_symbols = {sub.symbol for sub in other_strategy_query}
+        price_cache = price_cache or PriceCache()
+        price_cache.prefetch(
+            stock.pdno for stock in holdings
+            if getattr(stock, "pdno", None) and stock.pdno not in other_symbols
+        )
 
         for stock in holdings:
             try:
@@ -170,15 +212,15 @@ class DividendStrategy(BaseStrategy):
                 continue
 
             try:
-                df = fetch_price_dataframe(symbol)
+                df = price_cache.get(symbol)
                 if df is None or df.empty:
                     continue
-                df = normalize_dataframe_for_country(df, country)
+                indicators = price_cache.indicators(symbol)
 
                 if not has_min_rows(df, DIVIDEND_CONFIG.min_data_rows):
                     continue
 
-                df = apply_bollinger_bands(df)
+                df = apply_bollinger_bands(df, indicators=indicators)
                 if df is None or "BB_Upper" not in df.columns:
                     continue
 
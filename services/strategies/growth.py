@@ -6,36 +6,37 @@
 - 브레이크아웃 + 거래량 급증 조건
 - VIX 기반 매수 중단
 """
-from typing import List, Union
+from typing import List, Optional, Union
 
+import numpy as np
 import pandas as pd
 
 from config.logging_config import get_logger
 from config.strategy_config import GROWTH_CONFIG
 from data.dto.account_dto import StockResponseDTO
 from data.models import Subscription
-from services.strategies.base import BaseStrategy
+from services.indicator_bundle import IndicatorBundle
+from services.indicator_engine import IndicatorEngine
+from services.market_snapshot import MarketSnapshot
+from services.price_cache import PriceCache
+from services.strategies.base import BaseStrategy, BuyContext
 from services.trading_helpers import (
     allocate_volume_to_levels,
     apply_bollinger_bands,
     calculate_atr,
     calculate_adtv,
     calculate_position_volume,
-    fetch_price_dataframe,
     generate_dca_entry_levels,
     has_min_rows,
     is_same_anchor_date,
     macd_rebound_ok,
     meets_liquidity_threshold,
-    normalize_dataframe_for_country,
     prepare_buy_context,
     rsi_in_range,
     add_prev_close_allocation,
 )
 from services.market_condition import (
-    is_buy_allowed,
     get_position_size_adjusted,
-    get_sell_ratio_adjusted,
     check_52week_high_drawdown,
     check_breakout_with_volume,
 )
@@ -47,119 +48,170 @@ logger = get_logger(__name__)
 class GrowthStrategy(BaseStrategy):
     """성장주 전략 (추세 추종)"""
 
-    def filter_for_buy(self, country: str = "KOR") -> dict[str, dict[float, int]]:
+    def filter_for_buy(
+            self,
+            country: str = "KOR",
+            price_cache: Optional[PriceCache] = None,
+            market: Optional[MarketSnapshot] = None
+    ) -> dict[str, dict[float, int]]:
         """성장주 매수 대상 필터링"""
+        market = market or MarketSnapshot()
         # VIX 체크
-        buy_allowed, vix = is_buy_allowed()
+        buy_allowed, vix = market.is_buy_allowed()
         if not buy_allowed:
             logger.info(f"VIX {vix:.2f} >= 30, 성장주 매수 중단")
             return {}
         
-        anchor_date, risk_amount_value, risk_k, adtv_limit_ratio, stocks, usd_krw = prepare_buy_context(country, "growth")
-        buy_levels: dict[str, dict[float, int]] = {}
-
-        for symbol in stocks:
-            try:
-                df = fetch_price_dataframe(symbol)
-                if df is None or df.empty:
-                    continue
-                df = normalize_dataframe_for_country(df, country)
-
-                if not is_same_anchor_date(df, anchor_date):
-                    continue
-
-                if not has_min_rows(df, GROWTH_CONFIG.min_data_rows):
-                    continue
-
-                adtv = calculate_adtv(df)
-                if not meets_liquidity_threshold(adtv, country, usd_krw):
-                    continue
-
-                # SMA 추세 확인 (완화: 둘 중 하나만 상승해도 OK)
-                sma60 = df['close'].rolling(window=60).mean()
-                sma120 = df['close'].rolling(window=120).mean()
-                if pd.isna(sma60.iloc[-1]) or pd.isna(sma120.iloc[-1]):
-                    continue
-                
-                sma60_rising = sma60.iloc[-1] > sma60.iloc[-5] if len(sma60) >= 5 else False
-                sma120_rising = sma120.iloc[-1] > sma120.iloc[-5] if len(sma120) >= 5 else False
-                if not (sma60_rising or sma120_rising):
-                    continue
-
-                # 52주 신고가 대비 조정폭 (15-35%)
-                if GROWTH_CONFIG.use_52week_high:
-                    if not check_52week_high_drawdown(df, GROWTH_CONFIG.drawdown_min, GROWTH_CONFIG.drawdown_max):
-                        # fallback: 120일 기준
-                        recent_peak = df['close'].rolling(window=120).max().iloc[-2]
-                        if pd.isna(recent_peak) or recent_peak <= 0:
-                            continue
-                        drawdown = (recent_peak - float(df.iloc[-1]['close'])) / recent_peak
-                        if not (GROWTH_CONFIG.drawdown_min <= drawdown <= GROWTH_CONFIG.drawdown_max):
-                            continue
-
-                # RSI 범위 확대 (30-60)
-                if not rsi_in_range(df, window=7, lower=GROWTH_CONFIG.rsi_lower, upper=GROWTH_CONFIG.rsi_upper):
-                    continue
-
-                if not macd_rebound_ok(df):
-                    continue
-
-                # 브레이크아웃 + 거래량 급증 조건
-                if not check_breakout_with_volume(df, 
-                        lookback=GROWTH_CONFIG.breakout_lookback, 
-                        volume_mult=GROWTH_CONFIG.breakout_volume_mult):
-                    # 기존 거래량 조건으로 fallback
-                    vol = df['volume']
-                    v20 = vol.rolling(window=20).mean()
-                    recent_vol = vol.iloc[-3:]
-                    recent_v20 = v20.iloc[-3:]
-                    if recent_vol.isna().any() or recent_v20.isna().any():
-                        continue
-                    if not ((recent_vol > 1.2 * recent_v20).any()):
-                        continue
-
-                df = apply_bollinger_bands(df)
-
-                atr = calculate_atr(df)
-                if atr is None:
-                    continue
-
-                close_price = float(df.iloc[-1]['close'])
-                volume_shares = calculate_position_volume(
-                    atr=atr,
-                    adtv=adtv,
-                    close_price=close_price,
-                    risk_amount_value=risk_amount_value,
-                    risk_k=risk_k,
-                    adtv_limit_ratio=adtv_limit_ratio,
-                )
-                if volume_shares <= 0:
-                    continue
-
-                # 시장 상황 기반 포지션 조정
-                volume_shares = get_position_size_adjusted(volume_shares, country)
-                
-                # 종목당 최대 비중 체크
-                volume_shares = self._apply_max_position_weight(volume_shares, close_price, risk_amount_value)
-
-                price_levels = generate_dca_entry_levels(df, atr)
-                if not price_levels:
-                    continue
-
-                levels = allocate_volume_to_levels(price_levels, total_volume=volume_shares)
-                if not levels:
-                    continue
+        anchor_date, risk_amount_value, risk_k, adtv_limit_ratio, stocks, usd_krw = prepare_buy_context(country, "growth", usd_krw=market.usd_krw, as_of=market.as_of)
+        ctx = BuyContext(
+            country=country,
+            anchor_date=anchor_date,
+            risk_amount_value=risk_amount_value,
+            risk_k=risk_k,
+            adtv_limit_ratio=adtv_limit_ratio,
+            usd_krw=usd_krw,
+            position_multiplier=market.position_multiplier(country),
+        )
+        price_cache = price_cache or PriceCache()
+        engine = price_cache.engine(stocks)
+        candidates = engine.select(self._screen_for_buy(engine, anchor_date, country, usd_krw))
+        logger.info(f"성장주 벡터 스크리닝: {len(stocks)}개 중 {len(candidates)}개 후보")
 
-                buy_levels[symbol] = add_prev_close_allocation(levels, df, volume_shares)
-            except Exception as e:
-                logger.error(f"GrowthStrategy.filter_for_buy 처리 중 에러: {symbol} -> {e}")
-        return buy_levels
+        return self._run_buy_evaluation(candidates, price_cache, ctx)
     
+    def _evaluate_buy(
+            self,
+            symbol: str,
+            df: pd.DataFrame,
+            ctx: BuyContext,
+            indicators: IndicatorBundle
+    ) -> Optional[dict[float, int]]:
+        """종목 하나의 매수 가격/수량 산출 (대상이 아니면 None)"""
+        if not is_same_anchor_date(df, ctx.anchor_date):
+            return None
+
+        if not has_min_rows(df, GROWTH_CONFIG.min_data_rows):
+            return None
+
+        adtv = calculate_adtv(df, indicators=indicators)
+        if not meets_liquidity_threshold(adtv, ctx.country, ctx.usd_krw):
+            return None
+
+        # SMA 추세 확인 (완화: 둘 중 하나만 상승해도 OK)
+        sma60 = indicators.rolling('close', 60)
+        sma120 = indicators.rolling('close', 120)
+        if pd.isna(sma60.iloc[-1]) or pd.isna(sma120.iloc[-1]):
+            return None
+
+        sma60_rising = sma60.iloc[-1] > sma60.iloc[-5] if len(sma60) >= 5 else False
+        sma120_rising = sma120.iloc[-1] > sma120.iloc[-5] if len(sma120) >= 5 else False
+        if not (sma60_rising or sma120_rising):
+            return None
+
+        # 52주 신고가 대비 조정폭 (15-35%)
+        if GROWTH_CONFIG.use_52week_high:
+            if not check_52week_high_drawdown(df, GROWTH_CONFIG.drawdown_min, GROWTH_CONFIG.drawdown_max, indicators=indicators):
+                # fallback: 120일 기준
+                recent_peak = indicators.rolling('close', 120, 'max').iloc[-2]
+                if pd.isna(recent_peak) or recent_peak <= 0:
+                    return None
+                drawdown = (recent_peak - float(df.iloc[-1]['close'])) / recent_peak
+                if not (GROWTH_CONFIG.drawdown_min <= drawdown <= GROWTH_CONFIG.drawdown_max):
+                    return None
+
+        # RSI 범위 확대 (30-60)
+        if not rsi_in_range(df, window=7, lower=GROWTH_CONFIG.rsi_lower, upper=GROWTH_CONFIG.rsi_upper, indicators=indicators):
+            return None
+
+        if not macd_rebound_ok(df, indicators=indicators):
+            return None
+
+        # 브레이크아웃 + 거래량 급증 조건
+        if not check_breakout_with_volume(df, 
+                lookback=GROWTH_CONFIG.breakout_lookback, 
+                volume_mult=GROWTH_CONFIG.breakout_volume_mult,
+                indicators=indicators):
+            # 기존 거래량 조건으로 fallback
+            vol = df['volume']
+            v20 = indicators.rolling('volume', 20)
+            recent_vol = vol.iloc[-3:]
+            recent_v20 = v20.iloc[-3:]
+            if recent_vol.isna().any() or recent_v20.isna().any():
+                return None
+            if not ((recent_vol > 1.2 * recent_v20).any()):
+                return None
+
+        df = apply_bollinger_bands(df, indicators=indicators)
+
+        atr = calculate_atr(df, indicators=indicators)
+        if atr is None:
+            return None
+
+        close_price = float(df.iloc[-1]['close'])
+        volume_shares = calculate_position_volume(
+            atr=atr,
+            adtv=adtv,
+            close_price=close_price,
+            risk_amount_value=ctx.risk_amount_value,
+            risk_k=ctx.risk_k,
+            adtv_limit_ratio=ctx.adtv_limit_ratio,
+        )
+        if volume_shares <= 0:
+            return None
+
+        # 시장 상황 기반 포지션 조정
+        volume_shares = get_position_size_adjusted(volume_shares, ctx.country, multiplier=ctx.position_multiplier)
+
+        # 종목당 최대 비중 체크
+        volume_shares = self._apply_max_position_weight(volume_shares, close_price, ctx.risk_amount_value)
+
+        price_levels = generate_dca_entry_levels(df, atr, indicators=indicators)
+        if not price_levels:
+            return None
+
+        levels = allocate_volume_to_levels(price_levels, total_volume=volume_shares)
+        if not levels:
+            return None
+
+        return add_prev_close_allocation(levels, df, volume_shares)
+
+    @staticmethod
+    def _screen_for_buy(engine: IndicatorEngine, anchor_date: str, country: str, usd_krw: float) -> np.ndarray:
+        """종목별 파이프라인 전에 지표 조건을 종목 전체에 대해 마스크로 선별"""
+        sma60 = engine.sma(60)
+        sma120 = engine.sma(120)
+        sma60_last, sma120_last = engine.latest(sma60), engine.latest(sma120)
+        with np.errstate(invalid="ignore"):
+            sma_rising = (sma60_last > engine.latest(sma60, 5)) | (sma120_last > engine.latest(sma120, 5))
+            # 브레이크아웃 미충족 시 최근 3일 거래량 급증으로 대체
+            recent_vol, recent_v20 = engine.volume[-3:], engine.volume_sma(20)[-3:]
+            volume_fallback = (
+                ~np.isnan(recent_vol).any(axis=0) & ~np.isnan(recent_v20).any(axis=0)
+                & (recent_vol > 1.2 * recent_v20).any(axis=0)
+            )
+        breakout = engine.breakout_with_volume_mask(
+            lookback=GROWTH_CONFIG.breakout_lookback,
+            volume_mult=GROWTH_CONFIG.breakout_volume_mult,
+        )
+        return (
+            engine.anchor_date_mask(anchor_date)
+            & engine.min_rows_mask(GROWTH_CONFIG.min_data_rows)
+            & engine.liquidity_mask(country, usd_krw)
+            & ~np.isnan(sma60_last) & ~np.isnan(sma120_last) & sma_rising
+            & engine.rsi_in_range_mask(window=7, lower=GROWTH_CONFIG.rsi_lower, upper=GROWTH_CONFIG.rsi_upper)
+            & engine.macd_rebound_mask()
+            & (breakout | volume_fallback)
+            & engine.atr_mask()
+        )
+
     def filter_for_sell(
             self,
-            stocks_held: Union[List[StockResponseDTO], StockResponseDTO, None]
+            stocks_held: Union[List[StockResponseDTO], StockResponseDTO, None],
+            price_cache: Optional[PriceCache] = None,
+            market: Optional[MarketSnapshot] = None
     ) -> dict[str, dict[float, int]]:
         """성장주 매도 대상 필터링"""
+        market = market or MarketSnapshot()
         sell_levels: dict[str, dict[float, int]] = {}
         if not stocks_held:
             return sell_levels
@@ -171,6 +223,11 @@ class GrowthStrategy(BaseStrategy):
             .where(Subscription.category == "growth")
         )
         growth_symbols = {sub.symbol for sub in growth_query}
+        price_cache = price_cache or PriceCache()
+        price_cache.prefetch(
+            stock.pdno for stock in holdings
+            if getattr(stock, "pdno", None) in growth_symbols
+        )
 
         for stock in holdings:
             try:
@@ -194,19 +251,19 @@ class GrowthStrategy(BaseStrategy):
                 continue
 
             try:
-                df = fetch_price_dataframe(symbol)
+                df = price_cache.get(symbol)
                 if df is None or df.empty:
                     continue
-                df = normalize_dataframe_for_country(df, country)
+                indicators = price_cache.indicators(symbol)
 
                 if not has_min_rows(df, GROWTH_CONFIG.min_data_rows):
                     continue
 
-                df = apply_bollinger_bands(df)
+                df = apply_bollinger_bands(df, indicators=indicators)
                 close_price = float(df.iloc[-1]["close"])
 
-                sma60 = df['close'].rolling(window=60).mean()
-                sma120 = df['close'].rolling(window=120).mean()
+                sma60 = indicators.rolling('close', 60)
+                sma120 = indicators.rolling('close', 120)
 
                 if pd.isna(sma60.iloc[-1]) or pd.isna(sma120.iloc[-1]):
                     continue
@@ -214,7 +271,7 @@ class GrowthStrategy(BaseStrategy):
                 # 추세 이탈 시 매도 (VIX 기반 비율 조정)
                 if close_price < float(sma120.iloc[-1]):
                     base_ratio = GROWTH_CONFIG.sell_ratio_trend_break
-                    adjusted_ratio = get_sell_ratio_adjusted(base_ratio)
+                    adjusted_ratio = market.sell_ratio_adjusted(base_ratio)
                     sell_vol = max(1, int(hldg_qty * adjusted_ratio))
                     sell_price = round(close_price * 0.995, 2) if country == "USA" else int(close_price * 0.995)
                     sell_levels.setdefault(symbol, {})[sell_price] = sell_vol
@@ -224,10 +281,10 @@ class GrowthStrategy(BaseStrategy):
                 # 볼린저 밴드 상단 돌파 후 반락 시
                 bb_upper = float(df["BB_Upper"].iloc[-1])
                 if close_price >= bb_upper * 0.98:
-                    atr = calculate_atr(df)
+                    atr = calculate_atr(df, indicators=indicators)
                     if atr and atr > 0:
                         base_ratio = 0.3
-                        adjusted_ratio = get_sell_ratio_adjusted(base_ratio)
+                        adjusted_ratio = market.sell_ratio_adjusted(base_ratio)
                         sell_vol = max(1, int(hldg_qty * adjusted_ratio))
                         sell_price = round(bb_upper * 1.01, 2) if country == "USA" else int(bb_upper * 1.01)
                         sell_levels.setdefault(symbol, {})[sell_price] = sell_vol
@@ -5,15 +5,20 @@
 - 가짜 돌파 필터 (3일 확인)
 - VIX 기반 매수 중단
 """
-from typing import List, Union
+from typing import List, Optional, Union
 
+import numpy as np
 import pandas as pd
 
 from config.logging_config import get_logger
 from config.strategy_config import RANGEBOX_CONFIG
 from data.dto.account_dto import StockResponseDTO
 from data.models import Subscription
-from services.strategies.base import BaseStrategy
+from services.indicator_bundle import IndicatorBundle
+from services.indicator_engine import IndicatorEngine
+from services.market_snapshot import MarketSnapshot
+from services.price_cache import PriceCache
+from services.strategies.base import BaseStrategy, BuyContext
 from services.trading_helpers import (
     allocate_volume_to_levels,
     apply_bollinger_bands,
@@ -21,21 +26,17 @@ from services.trading_helpers import (
     calculate_atr,
     calculate_adtv,
     calculate_position_volume,
-    fetch_price_dataframe,
     generate_dca_entry_levels,
     higher_timeframe_ok,
     has_min_rows,
     is_same_anchor_date,
     meets_liquidity_threshold,
-    normalize_dataframe_for_country,
     obv_sma_rising,
     prepare_buy_context,
     add_prev_close_allocation,
 )
 from services.market_condition import (
-    is_buy_allowed,
     get_position_size_adjusted,
-    get_sell_ratio_adjusted,
     check_range_bound_duration,
     check_fakeout_filter,
 )
@@ -47,109 +48,156 @@ logger = get_logger(__name__)
 class RangeBoundStrategy(BaseStrategy):
     """박스권 전략 (횡보 구간 매매)"""
 
-    def filter_for_buy(self, country: str = "KOR") -> dict[str, dict[float, int]]:
+    def filter_for_buy(
+            self,
+            country: str = "KOR",
+            price_cache: Optional[PriceCache] = None,
+            market: Optional[MarketSnapshot] = None
+    ) -> dict[str, dict[float, int]]:
         """박스권 매수 대상 필터링"""
+        market = market or MarketSnapshot()
         # VIX 체크
-        buy_allowed, vix = is_buy_allowed()
+        buy_allowed, vix = market.is_buy_allowed()
         if not buy_allowed:
             logger.info(f"VIX {vix:.2f} >= 30, 박스권 매수 중단")
             return {}
         
-        anchor_date, risk_amount_value, risk_k, adtv_limit_ratio, stocks, usd_krw = prepare_buy_context(country, "box")
-        buy_levels: dict[str, dict[float, int]] = {}
-
-        for symbol in stocks:
-            try:
-                df = fetch_price_dataframe(symbol)
-                if df is None or df.empty:
-                    continue
-                df = normalize_dataframe_for_country(df, country)
-
-                if not is_same_anchor_date(df, anchor_date):
-                    continue
-                if not has_min_rows(df, RANGEBOX_CONFIG.min_data_rows):
-                    continue
-
-                adtv = calculate_adtv(df)
-                if not meets_liquidity_threshold(adtv, country, usd_krw):
-                    continue
-
-                df = apply_bollinger_bands(df)
-
-                bb_upper = df["BB_Upper"].iloc[-1]
-                bb_lower = df["BB_Lower"].iloc[-1]
-                bb_mavg = df["BB_Mavg"].iloc[-1]
-                if pd.isna(bb_upper) or pd.isna(bb_lower) or pd.isna(bb_mavg) or bb_mavg <= 0:
-                    continue
-                width_ratio = float((bb_upper - bb_lower) / bb_mavg)
-                if not (RANGEBOX_CONFIG.bb_width_min <= width_ratio <= RANGEBOX_CONFIG.bb_width_max):
-                    continue
-
-                sma20 = df["close"].rolling(window=20).mean()
-                if len(sma20) < 11 or pd.isna(sma20.iloc[-1]) or pd.isna(sma20.iloc[-11]):
-                    continue
-                slope_ratio = abs(float(sma20.iloc[-1]) / float(sma20.iloc[-11]) - 1.0)
-                if slope_ratio > RANGEBOX_CONFIG.sma_slope_max:
-                    continue
-
-                # 박스권 최소 20거래일 유지 확인
-                if not check_range_bound_duration(df, 
-                        min_days=RANGEBOX_CONFIG.min_range_days,
-                        bb_width_range=(RANGEBOX_CONFIG.bb_width_min, RANGEBOX_CONFIG.bb_width_max)):
-                    continue
-
-                # 가짜 돌파 필터 (3일 확인)
-                if not check_fakeout_filter(df, confirm_days=RANGEBOX_CONFIG.fakeout_confirm_days):
-                    continue
-
-                if not higher_timeframe_ok(df):
-                    continue
-                if not obv_sma_rising(df, steps=3):
-                    continue
-
-                if not bb_proximity_ok(df, tol=RANGEBOX_CONFIG.bb_tolerance, use_low=True, lookback=3):
-                    continue
-
-                atr = calculate_atr(df)
-                if atr is None:
-                    continue
+        anchor_date, risk_amount_value, risk_k, adtv_limit_ratio, stocks, usd_krw = prepare_buy_context(country, "box", usd_krw=market.usd_krw, as_of=market.as_of)
+        ctx = BuyContext(
+            country=country,
+            anchor_date=anchor_date,
+            risk_amount_value=risk_amount_value,
+            risk_k=risk_k,
+            adtv_limit_ratio=adtv_limit_ratio,
+            usd_krw=usd_krw,
+            position_multiplier=market.position_multiplier(country),
+        )
+        price_cache = price_cache or PriceCache()
+        engine = price_cache.engine(stocks)
+        candidates = engine.select(self._screen_for_buy(engine, anchor_date, country, usd_krw))
+        logger.info(f"박스권 벡터 스크리닝: {len(stocks)}개 중 {len(candidates)}개 후보")
 
-                close_price = float(df.iloc[-1]["close"])
-                volume = calculate_position_volume(
-                    atr=atr,
-                    adtv=adtv,
-                    close_price=close_price,
-                    risk_amount_value=risk_amount_value,
-                    risk_k=risk_k,
-                    adtv_limit_ratio=adtv_limit_ratio,
+        return self._run_buy_evaluation(candidates, price_cache, ctx)
+    
+    def _evaluate_buy(
+            self,
+            symbol: str,
+            df: pd.DataFrame,
+            ctx: BuyContext,
+            indicators: IndicatorBundle
+    ) -> Optional[dict[float, int]]:
+        """종목 하나의 매수 가격/수량 산출 (대상이 아니면 None)"""
+        if not is_same_anchor_date(df, ctx.anchor_date):
+            return None
+        if not has_min_rows(df, RANGEBOX_CONFIG.min_data_rows):
+            return None
+
+        adtv = calculate_adtv(df, indicators=indicators)
+        if not meets_liquidity_threshold(adtv, ctx.country, ctx.usd_krw):
+            return None
+
+        df = apply_bollinger_bands(df, indicators=indicators)
+
+        bb_upper = df["BB_Upper"].iloc[-1]
+        bb_lower = df["BB_Lower"].iloc[-1]
+        bb_mavg = df["BB_Mavg"].iloc[-1]
+        if pd.isna(bb_upper) or pd.isna(bb_lower) or pd.isna(bb_mavg) or bb_mavg <= 0:
+            return None
+        width_ratio = float((bb_upper - bb_lower) / bb_mavg)
+        if not (RANGEBOX_CONFIG.bb_width_min <= width_ratio <= RANGEBOX_CONFIG.bb_width_max):
+            return None
+
+        sma20 = indicators.rolling("close", 20)
+        if len(sma20) < 11 or pd.isna(sma20.iloc[-1]) or pd.isna(sma20.iloc[-11]):
+            return None
+        slope_ratio = abs(float(sma20.iloc[-1]) / float(sma20.iloc[-11]) - 1.0)
+        if slope_ratio > RANGEBOX_CONFIG.sma_slope_max:
+            return None
+
+        # 박스권 최소 20거래일 유지 확인
+        if not check_range_bound_duration(df, 
+                min_days=RANGEBOX_CONFIG.min_range_days,
+                bb_width_range=(RANGEBOX_CONFIG.bb_width_min, RANGEBOX_CONFIG.bb_width_max)):
+            return None
+
+        # 가짜 돌파 필터 (3일 확인)
+        if not check_fakeout_filter(df, confirm_days=RANGEBOX_CONFIG.fakeout_confirm_days):
+            return None
+
+        if not higher_timeframe_ok(df, indicators=indicators):
+            return None
+        if not obv_sma_rising(df, steps=3, indicators=indicators):
+            return None
+
+        if not bb_proximity_ok(df, tol=RANGEBOX_CONFIG.bb_tolerance, use_low=True, lookback=3):
+            return None
+
+        atr = calculate_atr(df, indicators=indicators)
+        if atr is None:
+            return None
+
+        close_price = float(df.iloc[-1]["close"])
+        volume = calculate_position_volume(
+            atr=atr,
+            adtv=adtv,
+            close_price=close_price,
+            risk_amount_value=ctx.risk_amount_value,
+            risk_k=ctx.risk_k,
+            adtv_limit_ratio=ctx.adtv_limit_ratio,
+        )
+        if volume <= 0:
+            return None
+
+        # 시장 상황 기반 포지션 조정
+        volume = get_position_size_adjusted(volume, ctx.country, multiplier=ctx.position_multiplier)
+
+        # 종목당 최대 비중 체크
+        volume = self._apply_max_position_weight(volume, close_price, ctx.risk_amount_value)
+
+        price_levels = generate_dca_entry_levels(df, atr, indicators=indicators)
+        if not price_levels:
+            return None
+
+        levels = allocate_volume_to_levels(price_levels, total_volume=volume)
+        if not levels:
+            return None
+
+        return add_prev_close_allocation(levels, df, volume)
+
+    @staticmethod
+    def _screen_for_buy(engine: IndicatorEngine, anchor_date: str, country: str, usd_krw: float) -> np.ndarray:
+        """종목별 파이프라인 전에 지표 조건을 종목 전체에 대해 마스크로 선별"""
+        bb_mavg, bb_upper, bb_lower = (engine.latest(band) for band in engine.bollinger())
+        sma20 = engine.sma(20)
+        sma20_last, sma20_prev = engine.latest(sma20), engine.latest(sma20, 11)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            width_ratio = (bb_upper - bb_lower) / bb_mavg
+            slope_ratio = np.abs(sma20_last / sma20_prev - 1.0)
+            return (
+                engine.anchor_date_mask(anchor_date)
+                & engine.min_rows_mask(RANGEBOX_CONFIG.min_data_rows)
+                & engine.liquidity_mask(country, usd_krw)
+                & (bb_mavg > 0)
+                & (RANGEBOX_CONFIG.bb_width_min <= width_ratio) & (width_ratio <= RANGEBOX_CONFIG.bb_width_max)
+                & (slope_ratio <= RANGEBOX_CONFIG.sma_slope_max)
+                & engine.range_bound_duration_mask(
+                    min_days=RANGEBOX_CONFIG.min_range_days,
+                    bb_width_range=(RANGEBOX_CONFIG.bb_width_min, RANGEBOX_CONFIG.bb_width_max),
                 )
-                if volume <= 0:
-                    continue
-
-                # 시장 상황 기반 포지션 조정
-                volume = get_position_size_adjusted(volume, country)
-                
-                # 종목당 최대 비중 체크
-                volume = self._apply_max_position_weight(volume, close_price, risk_amount_value)
-
-                price_levels = generate_dca_entry_levels(df, atr)
-                if not price_levels:
-                    continue
+                & engine.fakeout_filter_mask(confirm_days=RANGEBOX_CONFIG.fakeout_confirm_days)
+                & engine.obv_sma_rising_mask(steps=3)
+                & engine.bb_proximity_mask(tol=RANGEBOX_CONFIG.bb_tolerance, use_low=True, lookback=3)
+                & engine.atr_mask()
+            )
 
-                levels = allocate_volume_to_levels(price_levels, total_volume=volume)
-                if not levels:
-                    continue
-
-                buy_levels[symbol] = add_prev_close_allocation(levels, df, volume)
-            except Exception as e:
-                logger.error(f"RangeBoundStrategy.filter_for_buy 처리 중 에러: {symbol} -> {e}")
-        return buy_levels
-    
     def filter_for_sell(
             self,
-            stocks_held: Union[List[StockResponseDTO], StockResponseDTO, None]
+            stocks_held: Union[List[StockResponseDTO], StockResponseDTO, None],
+            price_cache: Optional[PriceCache] = None,
+            market: Optional[MarketSnapshot] = None
     ) -> dict[str, dict[float, int]]:
         """박스권 매도 대상 필터링"""
+        market = market or MarketSnapshot()
         sell_levels: dict[str, dict[float, int]] = {}
         if not stocks_held:
             return sell_levels
@@ -161,6 +209,11 @@ class RangeBoundStrategy(BaseStrategy):
             .where(Subscription.category == "box")
         )
         box_symbols = {sub.symbol for sub in box_query}
+        price_cache = price_cache or PriceCache()
+        price_cache.prefetch(
+            stock.pdno for stock in holdings
+            if getattr(stock, "pdno", None) in box_symbols
+        )
 
         for stock in holdings:
             try:
@@ -184,15 +237,15 @@ class RangeBoundStrategy(BaseStrategy):
                 continue
 
             try:
-                df = fetch_price_dataframe(symbol)
+                df = price_cache.get(symbol)
                 if df is None or df.empty:
                     continue
-                df = normalize_dataframe_for_country(df, country)
+                indicators = price_cache.indicators(symbol)
 
                 if not has_min_rows(df, RANGEBOX_CONFIG.min_data_rows):
                     continue
 
-                df = apply_bollinger_bands(df)
+                df = apply_bollinger_bands(df, indicators=indicators)
                 if df is None or "BB_Upper" not in df.columns:
                     continue
 
@@ -204,7 +257,7 @@ class RangeBoundStrategy(BaseStrategy):
                 if pd.isna(bb_upper) or pd.isna(bb_lower) or pd.isna(bb_mavg):
                     continue
 
-                atr = calculate_atr(df)
+                atr = calculate_atr(df, indicators=indicators)
                 if atr is None:
                     continue
 
@@ -212,7 +265,7 @@ class RangeBoundStrategy(BaseStrategy):
                 dist_to_upper = (bb_upper - close_price) / atr if atr > 0 else 999
                 if dist_to_upper <= 0.3:
                     base_ratio = RANGEBOX_CONFIG.sell_ratio_upper
-                    adjusted_ratio = get_sell_ratio_adjusted(base_ratio)
+                    adjusted_ratio = market.sell_ratio_adjusted(base_ratio)
                     sell_vol = max(1, int(hldg_qty * adjusted_ratio))
                     sell_price = round(bb_upper * 0.99, 2) if country == "USA" else int(bb_upper * 0.99)
                     sell_levels.setdefault(symbol, {})[sell_price] = sell_vol
@@ -224,14 +277,11 @@ class RangeBoundStrategy(BaseStrategy):
                     # 3일 연속 하단 이탈 확인
                     if len(df) >= 3:
                         recent_3 = df.tail(3)
-                        all_below = all(
-                            float(recent_3.iloc[i]["close"]) < float(recent_3.iloc[i]["BB_Lower"])
-                            for i in range(len(recent_3))
-                            if not pd.isna(recent_3.iloc[i]["BB_Lower"])
-                        )
+                        has_band = recent_3["BB_Lower"].notna()
+                        all_below = bool((recent_3["close"][has_band] < recent_3["BB_Lower"][has_band]).all())
                         if all_below:
                             base_ratio = RANGEBOX_CONFIG.sell_ratio_breakdown
-                            adjusted_ratio = get_sell_ratio_adjusted(base_ratio)
+                            adjusted_ratio = market.sell_ratio_adjusted(base_ratio)
                             sell_vol = max(1, int(hldg_qty * adjusted_ratio))
                             sell_price = round(close_price * 0.995, 2) if country == "USA" else int(close_price * 0.995)
                             sell_levels.setdefault(symbol, {})[sell_price] = sell_vol
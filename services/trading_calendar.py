@@ -0,0 +1,196 @@
+"""거래일 달력 (개장 여부/n번째 개장일 조회)"""
+import bisect
+import datetime
+import threading
+import time
+from typing import Dict, List, Tuple, Union
+
+from config.logging_config import get_logger
+from repositories.calendar_repository import TradingCalendarRepository
+
+logger = get_logger(__name__)
+
+DateLike = Union[datetime.date, datetime.datetime, str]
+
+
+def _to_date(value: DateLike) -> datetime.date:
+    """date/datetime/'YYYYMMDD' 문자열을 date로 변환"""
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.datetime.strptime(value, "%Y%m%d").date()
+
+
+class TradingCalendar:
+    """
+    국가별 거래일 달력
+
+    trading_calendar 테이블에 미리 적재한 날짜를 메모리에 올려 개장일 목록과
+    날짜별 "다음 개장일 위치"를 미리 계산해 두므로, 개장 여부와 n번째 개장일 조회가
+    API 호출 없이 O(1)로 끝난다. 적재 범위 밖의 날짜를 조회하면 그 구간을 원천(국내: KIS
+    휴장일 API, 미국: NYSE 휴장 규칙)에서 받아 채우고 테이블에도 저장한다. 원천 조회마저
+    실패한 경우에만 주말만 휴장으로 간주한다.
+    """
+
+    # 범위 밖 조회 시 한 번에 채우는 최소 기간 (일)
+    FILL_DAYS = 31
+    # 원천 조회 실패 후 다시 조회하기까지 기다리는 시간 (초, 그동안은 주말만 휴장으로 간주)
+    FILL_RETRY_SECONDS = 600
+
+    def __init__(self, country: str, days: Dict[datetime.date, bool]):
+        """
+        :param country: 국가 코드 (KOR, USA)
+        :param days: 날짜별 개장 여부 {date: is_open} (연속된 날짜)
+        """
+        self.country = country.upper()
+        self._lock = threading.RLock()
+        self._fill_failed_at = None
+        self._is_open: Dict[datetime.date, bool] = {}
+        self._index(days)
+
+    def _index(self, days: Dict[datetime.date, bool]) -> None:
+        """개장일 목록과 날짜별 다음 개장일 위치 재계산"""
+        self._is_open = dict(days)
+        self._open_days: List[datetime.date] = sorted(date for date, is_open in days.items() if is_open)
+        # 날짜별로 그 날짜 "이후" 첫 개장일의 _open_days 위치
+        self._next_open_index: Dict[datetime.date, int] = {}
+        index = len(self._open_days)
+        for date in sorted(days, reverse=True):
+            self._next_open_index[date] = index
+            if days[date]:
+                index -= 1
+        self.first_date = min(days) if days else None
+        self.last_date = max(days) if days else None
+
+    @classmethod
+    def load(cls, country: str, start: datetime.date = None) -> "TradingCalendar":
+        """저장된 달력 로드 (기본값: 올해 1월 1일 이후)"""
+        start = start or datetime.date(datetime.date.today().year, 1, 1)
+        calendar = cls(country, TradingCalendarRepository.get_days(country, start))
+        if calendar.last_date is None or calendar.last_date < datetime.date.today():
+            logger.warning(f"거래일 달력이 비어 있거나 오래됨: {country} (~{calendar.last_date}), 조회 시 보충")
+        return calendar
+
+    def _fill(self, start: datetime.date, end: datetime.date) -> bool:
+        """
+        [start, end]가 적재 범위에 들도록 빠진 구간을 원천에서 받아 채움
+
+        범위가 끊기지 않도록 기존 범위와 요청 구간 사이도 함께 채운다.
+
+        :return: 요청 구간을 모두 채웠으면 True
+        """
+        with self._lock:
+            if self.first_date is None:
+                missing = [(start, end)]
+            else:
+                missing = []
+                if start < self.first_date:
+                    missing.append((start, self.first_date - datetime.timedelta(days=1)))
+                if end > self.last_date:
+                    missing.append((self.last_date + datetime.timedelta(days=1), end))
+            if not missing:
+                return True
+            if self._fill_failed_at is not None and time.monotonic() - self._fill_failed_at < self.FILL_RETRY_SECONDS:
+                return False
+
+            fetched: Dict[datetime.date, bool] = {}
+            for fill_start, fill_end in missing:
+                try:
+                    fetched.update(TradingCalendarRepository.fetch_days(self.country, fill_start, fill_end))
+                except Exception as e:
+                    self._fill_failed_at = time.monotonic()
+                    logger.error(f"거래일 달력 보충 조회 실패: {self.country} {fill_start} ~ {fill_end} -> {e}")
+            if fetched:
+                try:
+                    TradingCalendarRepository.save(self.country, fetched)
+                except Exception as e:
+                    logger.warning(f"거래일 달력 보충 저장 실패: {self.country} -> {e}")
+                self._index({**self._is_open, **fetched})
+                logger.info(f"거래일 달력 보충: {self.country} {min(fetched)} ~ {max(fetched)}")
+            return all(fill_start in self._is_open and fill_end in self._is_open for fill_start, fill_end in missing)
+
+    def _ensure(self, start: datetime.date, end: datetime.date) -> bool:
+        """[start, end]가 적재 범위 안인지 확인하고, 아니면 보충"""
+        if start in self._is_open and end in self._is_open:
+            return True
+        return self._fill(start, max(end, start + datetime.timedelta(days=self.FILL_DAYS)))
+
+    def covers(self, date: DateLike) -> bool:
+        """적재 범위 안의 날짜인지 여부"""
+        return _to_date(date) in self._is_open
+
+    def is_open(self, date: DateLike) -> bool:
+        """개장일 여부"""
+        date = _to_date(date)
+        with self._lock:
+            self._ensure(date, date)
+            is_open = self._is_open.get(date)
+        if is_open is None:
+            logger.error(f"거래일 달력 보충 실패, 주말만 휴장으로 간주: {self.country} {date}")
+            return date.weekday() < 5
+        return is_open
+
+    def nth_open_day(self, date: DateLike, n: int = 1) -> datetime.date:
+        """
+        date 이후(당일 제외) n번째 개장일
+
+        :param date: 기준 날짜
+        :param n: n번째 (1 이상)
+        """
+        date = _to_date(date)
+        with self._lock:
+            for attempt in range(2):
+                index = self._next_open_index.get(date)
+                if index is not None and index + n - 1 < len(self._open_days):
+                    return self._open_days[index + n - 1]
+                if attempt == 0:
+                    self._fill(date, date + datetime.timedelta(days=max(self.FILL_DAYS, n * 7)))
+
+        logger.error(f"거래일 달력 보충 실패, 주말만 휴장으로 간주: {self.country} {date} +{n}")
+        while n > 0:
+            date += datetime.timedelta(days=1)
+            if self._is_open.get(date, date.weekday() < 5):
+                n -= 1
+        return date
+
+    def last_open_day(self, date: DateLike) -> datetime.date:
+        """date 당일 또는 그 이전의 가장 최근 개장일"""
+        date = _to_date(date)
+        with self._lock:
+            self._ensure(date - datetime.timedelta(days=self.FILL_DAYS), date)
+            index = bisect.bisect_right(self._open_days, date) - 1
+            if index >= 0 and self._open_days[index] >= date - datetime.timedelta(days=self.FILL_DAYS):
+                return self._open_days[index]
+
+        logger.error(f"거래일 달력 보충 실패, 주말만 휴장으로 간주: {self.country} {date} 이전")
+        while not self._is_open.get(date, date.weekday() < 5):
+            date -= datetime.timedelta(days=1)
+        return date
+
+
+_calendars: Dict[str, Tuple[datetime.date, TradingCalendar]] = {}
+_calendars_lock = threading.Lock()
+
+
+def get_trading_calendar(country: str) -> TradingCalendar:
+    """프로세스 공용 거래일 달력 (하루에 한 번 테이블에서 다시 로드)"""
+    country = country.upper()
+    today = datetime.date.today()
+    with _calendars_lock:
+        cached = _calendars.get(country)
+        if cached is None or cached[0] != today:
+            cached = (today, TradingCalendar.load(country))
+            _calendars[country] = cached
+        return cached[1]
+
+
+def update_trading_calendar() -> None:
+    """국내/미국 거래일 달력 일괄 적재 (스케줄러용)"""
+    for country in ("KOR", "USA"):
+        try:
+            TradingCalendarRepository.update(country)
+        except Exception as e:
+            logger.error(f"거래일 달력 적재 실패: {country} -> {e}")
+    with _calendars_lock:
+        _calendars.clear()
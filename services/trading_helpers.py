@@ -2,22 +2,22 @@
 
 import datetime
 import math
-from typing import Iterable, Optional, Set, Tuple, Union
+from typing import Dict, Iterable, Optional, Set, Tuple, Union
 
-import FinanceDataReader
 import numpy as np
 import pandas as pd
-from ta.momentum import RSIIndicator
-from ta.trend import MACD
-from ta.volatility import BollingerBands, AverageTrueRange
-from ta.volume import OnBalanceVolumeIndicator
 
 from config import setting_env
 from data.models import Blacklist, Stock, Subscription
+from repositories.price_repository import PriceRepository
+from repositories.price_store import PriceStore
 from services.data_handler import get_country_by_symbol, get_history_table
+from services.indicator_bundle import IndicatorBundle
+from services.market_condition import get_usd_krw
 from utils.operations import price_refine
 from config.constants import (
     DEFAULT_PRICE_HISTORY_DAYS,
+    PRICE_PANEL_CHUNK_SIZE,
     VOLUME_SPLIT_RATIO,
     KOREAN_PRICE_MARKUP_LEVEL1,
     KOREAN_PRICE_MARKUP_LEVEL2,
@@ -39,6 +39,11 @@ from config.constants import (
 def fetch_price_dataframe(symbol: str, days: int = DEFAULT_PRICE_HISTORY_DAYS) -> pd.DataFrame:
     """Return recent price history for ``symbol``.
 
+    The local :class:`~repositories.price_store.PriceStore` is read first
+    (memory-mapped) when its file is in sync with the database (see
+    :func:`read_price_store`); on a miss the rows are loaded from the
+    database and written back to the store for the next run.
+
     Parameters
     ----------
     symbol: str
@@ -46,21 +51,118 @@ def fetch_price_dataframe(symbol: str, days: int = DEFAULT_PRICE_HISTORY_DAYS) -
     days: int
         Number of days to look back.
     """
-    table = get_history_table(get_country_by_symbol(symbol))
-    return pd.DataFrame(
+    country = get_country_by_symbol(symbol)
+    end = pd.Timestamp.now()
+    start = end - pd.Timedelta(days=days)
+
+    cached = read_price_store(country, [symbol], start, end).get(symbol)
+    if cached is not None:
+        return cached
+
+    table = get_history_table(country)
+    df = pd.DataFrame(
         list(
             table.select()
             .where(
-                (table.date.between(
-                    pd.Timestamp.now() - pd.Timedelta(days=days),
-                    pd.Timestamp.now(),
-                ))
+                (table.date.between(start, end))
                 & (table.symbol == symbol)
             )
             .order_by(table.date)
             .dicts()
         )
     )
+    PriceStore.write(country, symbol, df, covered_from=start)
+    return df
+
+
+def fetch_price_panel(
+        symbols: Iterable[str],
+        days: int = DEFAULT_PRICE_HISTORY_DAYS,
+        chunk_size: int = PRICE_PANEL_CHUNK_SIZE,
+) -> Dict[str, pd.DataFrame]:
+    """Return recent price history for many symbols with a few bulk queries.
+
+    Symbols whose local price store file is in sync with the database are
+    read from their memory-mapped files. The rest are grouped by country
+    and loaded ``chunk_size`` at a time, so a full-market screen costs a
+    handful of SELECTs instead of one per symbol, and are written back to
+    the store (symbols with no rows yet are not cached).
+    Each frame has the same shape as :func:`fetch_price_dataframe`.
+
+    Parameters
+    ----------
+    symbols: Iterable[str]
+        Stock symbols.
+    days: int
+        Number of days to look back.
+    chunk_size: int
+        Maximum number of symbols per query.
+    """
+    end = pd.Timestamp.now()
+    start = end - pd.Timedelta(days=days)
+    panel: Dict[str, pd.DataFrame] = {}
+
+    by_country: Dict[str, list[str]] = {}
+    for symbol in dict.fromkeys(symbols):
+        if not symbol:
+            continue
+        country = get_country_by_symbol(symbol)
+        if country:
+            by_country.setdefault(country, []).append(symbol)
+
+    for country, country_symbols in by_country.items():
+        cached = read_price_store(country, country_symbols, start, end, chunk_size)
+        panel.update({symbol: df for symbol, df in cached.items() if not df.empty})
+        country_symbols = [symbol for symbol in country_symbols if symbol not in cached]
+
+        table = get_history_table(country)
+        columns = [field.name for field in table._meta.sorted_fields]
+        for offset in range(0, len(country_symbols), max(1, chunk_size)):
+            chunk = country_symbols[offset:offset + max(1, chunk_size)]
+            rows = list(
+                table.select()
+                .where(
+                    (table.date.between(start, end))
+                    & (table.symbol.in_(chunk))
+                )
+                .order_by(table.symbol, table.date)
+                .tuples()
+            )
+            frame = pd.DataFrame(rows, columns=columns)
+            groups = dict(tuple(frame.groupby("symbol", sort=False)))
+            for symbol, group in groups.items():
+                PriceStore.write(country, symbol, group, covered_from=start)
+                panel[symbol] = group.reset_index(drop=True)
+
+    return panel
+
+
+def read_price_store(
+        country: str,
+        symbols: Iterable[str],
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        chunk_size: int = PRICE_PANEL_CHUNK_SIZE,
+) -> Dict[str, pd.DataFrame]:
+    """Return price store hits whose files are in sync with the database.
+
+    A file is fresh when its ``covered_to`` date reaches the latest trading
+    session. Files that fall short are still served when the database has
+    no newer row for the symbol (e.g. before the day's ingestion has run),
+    which costs one ``MAX(date)`` query per ``chunk_size`` such symbols.
+    Everything else is a miss, so rows written to the database outside
+    :meth:`PriceRepository.store_rows` are picked up on the next read.
+    """
+    symbols = list(symbols)
+    session = PriceRepository.latest_session_date(country, end.date())
+    cached = PriceStore.read_many(country, symbols, start, end, fresh_through=session)
+
+    behind = [symbol for symbol in symbols if symbol not in cached and PriceStore.path(country, symbol).exists()]
+    for offset in range(0, len(behind), max(1, chunk_size)):
+        chunk = behind[offset:offset + max(1, chunk_size)]
+        latest = {symbol: last_date for symbol, (_, last_date) in PriceRepository.get_date_ranges(country, chunk).items()}
+        cached.update(PriceStore.read_many(country, chunk, start, end, fresh_through=latest))
+    return cached
 
 
 def calc_adjusted_volumes(volume: int, base_price: float, country: str) -> Iterable[tuple[int, float]]:
@@ -82,7 +184,7 @@ def calc_adjusted_volumes(volume: int, base_price: float, country: str) -> Itera
     return []
 
 
-def compute_resistance_prices(df: pd.DataFrame) -> Tuple[float, float, float]:
+def compute_resistance_prices(df: pd.DataFrame, indicators: Optional[IndicatorBundle] = None) -> Tuple[float, float, float]:
     """Compute three resistance prices using recent price action.
 
     Returns a tuple of:
@@ -91,6 +193,7 @@ def compute_resistance_prices(df: pd.DataFrame) -> Tuple[float, float, float]:
       - atr_up: pivot_high + 0.5 * ATR(max of 5/10/20)
 
     This function performs safe fallbacks for NaNs and insufficient data.
+    ``indicators`` lets callers share already computed ATR/Bollinger series.
     """
     if df is None or len(df) < 20:
         raise ValueError("Insufficient data to compute resistance prices")
@@ -100,12 +203,11 @@ def compute_resistance_prices(df: pd.DataFrame) -> Tuple[float, float, float]:
         if col in df.columns:
             df[col] = pd.to_numeric(df[col], errors="coerce")
 
+    indicators = indicators or IndicatorBundle(df)
+
     # ATR (max of 5/10/20)
-    atr_columns = {}
     for window in ATR_WINDOWS:
-        col_name = f'ATR{window}'
-        atr_columns[col_name] = AverageTrueRange(high=df['high'], low=df['low'], close=df['close'], window=window).average_true_range()
-        df[col_name] = atr_columns[col_name]
+        df[f'ATR{window}'] = indicators.atr(window)
     
     atr_vals = [df.iloc[-1][f'ATR{w}'] for w in ATR_WINDOWS]
     atr = max([v for v in atr_vals if not pd.isna(v)] or [np.nan])
@@ -118,15 +220,15 @@ def compute_resistance_prices(df: pd.DataFrame) -> Tuple[float, float, float]:
         pivot_high_val = float(pivots.iloc[-1]['high'])
     else:
         # fallback to rolling maxima
-        pivot_high_val = float(df['high'].rolling(window=5).max().iloc[-2])
+        pivot_high_val = float(indicators.rolling('high', 5, 'max').iloc[-2])
         if pd.isna(pivot_high_val) or pivot_high_val <= 0:
-            pivot_high_val = float(df['high'].rolling(window=10).max().iloc[-2])
+            pivot_high_val = float(indicators.rolling('high', 10, 'max').iloc[-2])
 
     # Bollinger Upper with fallback
-    boll = BollingerBands(close=df['close'], window=BOLLINGER_WINDOW, window_dev=BOLLINGER_STD_DEV)
-    bb_upper_today = float(boll.bollinger_hband().iloc[-1])
+    _, bb_upper, _ = indicators.bollinger(BOLLINGER_WINDOW, BOLLINGER_STD_DEV)
+    bb_upper_today = float(bb_upper.iloc[-1])
     if pd.isna(bb_upper_today) or bb_upper_today <= 0:
-        bb_upper_today = float(df['high'].rolling(window=BOLLINGER_WINDOW).quantile(0.9).iloc[-2])
+        bb_upper_today = float(indicators.rolling('high', BOLLINGER_WINDOW, 'quantile', q=0.9).iloc[-2])
 
     # ATR-up projection
     atr = 0.0 if (pd.isna(atr) or atr <= 0) else float(atr)
@@ -138,17 +240,31 @@ def compute_resistance_prices(df: pd.DataFrame) -> Tuple[float, float, float]:
     return price_r1, price_r2, price_r3
 
 
-def prepare_buy_context(country: str, category: str) -> tuple[str, float, float, float, Set[str], float]:
-    usd_krw = float(FinanceDataReader.DataReader("USD/KRW").iloc[-1]["Adj Close"])
+def prepare_buy_context(
+        country: str,
+        category: str,
+        usd_krw: Optional[float] = None,
+        as_of: Optional[datetime.date] = None,
+) -> tuple[str, float, float, float, Set[str], float]:
+    """Return the shared buy context for ``category``.
+
+    ``as_of`` replays the context for a past trading date (backtests): the
+    anchor date becomes that date instead of today's session.
+    """
+    if usd_krw is None:
+        usd_krw = get_usd_krw()
 
     risk_pct = float(getattr(setting_env, "RISK_PCT", 0.0051))
     risk_k = float(getattr(setting_env, "RISK_ATR_MULT", 12.0))
     adtv_limit_ratio = float(getattr(setting_env, "ADTV_LIMIT_RATIO", 0.015))
     default_equity_usd = float(getattr(setting_env, "EQUITY_USD", 100_000.0))
 
-    anchor_date = datetime.datetime.now()
-    if country == "USA":
-        anchor_date -= datetime.timedelta(days=1)
+    if as_of is not None:
+        anchor_date = as_of
+    else:
+        anchor_date = datetime.datetime.now()
+        if country == "USA":
+            anchor_date -= datetime.timedelta(days=1)
     anchor_date_str = anchor_date.strftime("%Y-%m-%d")
 
     equity_base = default_equity_usd * (1 if country == "USA" else usd_krw)
@@ -195,9 +311,10 @@ def has_min_rows(df: pd.DataFrame, min_length: int) -> bool:
     return len(df) >= min_length
 
 
-def calculate_adtv(df: pd.DataFrame) -> Optional[float]:
+def calculate_adtv(df: pd.DataFrame, indicators: Optional[IndicatorBundle] = None) -> Optional[float]:
+    indicators = indicators or IndicatorBundle(df)
     try:
-        rolling_volume = df["volume"].rolling(window=ADTV_ROLLING_WINDOW).mean().iloc[-1]
+        rolling_volume = indicators.rolling("volume", ADTV_ROLLING_WINDOW).iloc[-1]
         if pd.isna(rolling_volume):
             return None
         return float(df.iloc[-1]["close"]) * float(rolling_volume)
@@ -212,11 +329,12 @@ def meets_liquidity_threshold(adtv: Optional[float], country: str, usd_krw: floa
     return adtv >= threshold
 
 
-def calculate_atr(df: pd.DataFrame) -> Optional[float]:
+def calculate_atr(df: pd.DataFrame, indicators: Optional[IndicatorBundle] = None) -> Optional[float]:
+    indicators = indicators or IndicatorBundle(df)
     atr_values: list[float] = []
     try:
         for window in ATR_WINDOWS:
-            atr_series = AverageTrueRange(high=df["high"], low=df["low"], close=df["close"], window=window).average_true_range()
+            atr_series = indicators.atr(window)
             atr_value = float(atr_series.iloc[-1])
             if pd.isna(atr_value) or atr_value <= 0:
                 return None
@@ -226,21 +344,30 @@ def calculate_atr(df: pd.DataFrame) -> Optional[float]:
     return max(atr_values) if atr_values else None
 
 
-def apply_bollinger_bands(df: pd.DataFrame, window: int = BOLLINGER_WINDOW, window_dev: float = BOLLINGER_STD_DEV) -> pd.DataFrame:
+def apply_bollinger_bands(
+        df: pd.DataFrame,
+        window: int = BOLLINGER_WINDOW,
+        window_dev: float = BOLLINGER_STD_DEV,
+        indicators: Optional[IndicatorBundle] = None,
+) -> pd.DataFrame:
     if "close" not in df.columns:
         return df
-    indicator = BollingerBands(close=df["close"], window=window, window_dev=window_dev)
-    df["BB_Mavg"] = indicator.bollinger_mavg()
-    df["BB_Upper"] = indicator.bollinger_hband()
-    df["BB_Lower"] = indicator.bollinger_lband()
+    indicators = indicators or IndicatorBundle(df)
+    df["BB_Mavg"], df["BB_Upper"], df["BB_Lower"] = indicators.bollinger(window, window_dev)
     return df
 
 
-def generate_dca_entry_levels(df: pd.DataFrame, atr: float, max_levels: Optional[int] = None) -> Optional[list[float]]:
+def generate_dca_entry_levels(
+        df: pd.DataFrame,
+        atr: float,
+        max_levels: Optional[int] = None,
+        indicators: Optional[IndicatorBundle] = None,
+) -> Optional[list[float]]:
     """Return descending ladder prices for staged DCA buys using ATR/volatility aware spacing."""
 
     if atr <= 0:
         return None
+    indicators = indicators or IndicatorBundle(df)
 
     try:
         close_price = float(df.iloc[-1]["close"])
@@ -256,19 +383,19 @@ def generate_dca_entry_levels(df: pd.DataFrame, atr: float, max_levels: Optional
 
     if pd.isna(bb_lower_today) or bb_lower_today <= 0:
         try:
-            bb_lower_today = float(df["low"].rolling(window=20, min_periods=5).quantile(0.1).iloc[-2])
+            bb_lower_today = float(indicators.rolling("low", 20, "quantile", min_periods=5, q=0.1).iloc[-2])
         except (KeyError, IndexError, ValueError):
             bb_lower_today = np.nan
 
     swing_floor = np.nan
     try:
-        swing_floor = float(df["low"].rolling(window=30, min_periods=5).min().iloc[-2])
+        swing_floor = float(indicators.rolling("low", 30, "min", min_periods=5).iloc[-2])
     except (KeyError, IndexError, ValueError):
         pass
 
     if pd.isna(swing_floor) or swing_floor <= 0:
         try:
-            swing_floor = float(df["low"].rolling(window=10, min_periods=3).min().iloc[-2])
+            swing_floor = float(indicators.rolling("low", 10, "min", min_periods=3).iloc[-2])
         except (KeyError, IndexError, ValueError):
             swing_floor = np.nan
 
@@ -447,31 +574,28 @@ def calculate_position_volume(
     return max(0, min(base_shares, shares_adtv_cap))
 
 
-def higher_timeframe_ok(df_all: pd.DataFrame) -> bool:
-    df_res = df_all[["date", "open", "high", "low", "close", "volume"]].copy()
-    df_res["date_dt"] = pd.to_datetime(df_res["date"], errors="coerce")
-    df_res = df_res.dropna(subset=["date_dt"]).sort_values("date_dt")
+def higher_timeframe_ok(df_all: pd.DataFrame, indicators: Optional[IndicatorBundle] = None) -> bool:
+    indicators = indicators or IndicatorBundle(df_all)
     weekly_ok = False
     monthly_ok = False
-    if len(df_res) >= 2:
-        weekly = df_res.resample("W-FRI", on="date_dt").agg({"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}).dropna()
-        monthly = df_res.resample("ME", on="date_dt").agg({"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}).dropna()
-        if len(weekly) >= 3:
-            wk_close_prev = float(weekly["close"].iloc[-2])
-            wk_sma20_series = weekly["close"].rolling(20).mean()
-            wk_sma20_prev = wk_sma20_series.iloc[-2] if len(wk_sma20_series) >= 2 else np.nan
-            if not pd.isna(wk_sma20_prev):
-                weekly_ok = bool(wk_close_prev > float(wk_sma20_prev))
-            else:
-                wk_down1 = bool(weekly["close"].iloc[-2] < weekly["close"].iloc[-3])
-                wk_down2 = bool(weekly["close"].iloc[-3] < weekly["close"].iloc[-4]) if len(weekly) >= 4 else False
-                weekly_ok = not (wk_down1 and wk_down2)
-        if len(monthly) >= 2:
-            mo_sma10_series = monthly["close"].rolling(10).mean()
-            mo_sma10_prev = mo_sma10_series.iloc[-2] if len(mo_sma10_series) >= 2 else np.nan
-            if not pd.isna(mo_sma10_prev):
-                mo_close_prev = float(monthly["close"].iloc[-2])
-                monthly_ok = bool(mo_close_prev >= float(mo_sma10_prev))
+    weekly = indicators.resample("W-FRI")
+    monthly = indicators.resample("ME")
+    if len(weekly) >= 3:
+        wk_close_prev = float(weekly["close"].iloc[-2])
+        wk_sma20_series = weekly["close"].rolling(20).mean()
+        wk_sma20_prev = wk_sma20_series.iloc[-2] if len(wk_sma20_series) >= 2 else np.nan
+        if not pd.isna(wk_sma20_prev):
+            weekly_ok = bool(wk_close_prev > float(wk_sma20_prev))
+        else:
+            wk_down1 = bool(weekly["close"].iloc[-2] < weekly["close"].iloc[-3])
+            wk_down2 = bool(weekly["close"].iloc[-3] < weekly["close"].iloc[-4]) if len(weekly) >= 4 else False
+            weekly_ok = not (wk_down1 and wk_down2)
+    if len(monthly) >= 2:
+        mo_sma10_series = monthly["close"].rolling(10).mean()
+        mo_sma10_prev = mo_sma10_series.iloc[-2] if len(mo_sma10_series) >= 2 else np.nan
+        if not pd.isna(mo_sma10_prev):
+            mo_close_prev = float(monthly["close"].iloc[-2])
+            monthly_ok = bool(mo_close_prev >= float(mo_sma10_prev))
     return bool(weekly_ok or monthly_ok)
 
 
@@ -488,9 +612,9 @@ def bb_proximity_ok(df_all: pd.DataFrame, tol: float = 0.05, use_low: bool = Tru
     return bool((pct_b[valid] <= tol).any())
 
 
-def obv_sma_rising(df_all: pd.DataFrame, steps: int = 3) -> bool:
-    obv_series = OnBalanceVolumeIndicator(close=df_all["close"], volume=df_all["volume"]).on_balance_volume()
-    obv_sma = obv_series.rolling(window=10).mean()
+def obv_sma_rising(df_all: pd.DataFrame, steps: int = 3, indicators: Optional[IndicatorBundle] = None) -> bool:
+    indicators = indicators or IndicatorBundle(df_all)
+    obv_sma = indicators.obv_sma(10)
     if len(obv_sma) < steps + 1:
         return False
     if pd.isna(obv_sma.iloc[-1]) or pd.isna(obv_sma.iloc[-steps]):
@@ -498,29 +622,28 @@ def obv_sma_rising(df_all: pd.DataFrame, steps: int = 3) -> bool:
     return bool(obv_sma.iloc[-1] > obv_sma.iloc[-steps])
 
 
-def macd_rebound_ok(df: pd.DataFrame) -> bool:
-    macd_indicator = MACD(close=df['close'], window_fast=12, window_slow=26, window_sign=9)
-    df['MACD'] = macd_indicator.macd()
-    df['MACD_Signal'] = macd_indicator.macd_signal()
-    if pd.isna(df['MACD'].iloc[-1]) or pd.isna(df['MACD_Signal'].iloc[-1]):
+def macd_rebound_ok(df: pd.DataFrame, indicators: Optional[IndicatorBundle] = None) -> bool:
+    indicators = indicators or IndicatorBundle(df)
+    macd, macd_signal = indicators.macd(12, 26, 9)
+    if pd.isna(macd.iloc[-1]) or pd.isna(macd_signal.iloc[-1]):
         return False
-    macd_curr = float(df['MACD'].iloc[-1])
-    macd_prev = float(df['MACD'].iloc[-2])
-    sig_curr = float(df['MACD_Signal'].iloc[-1])
-    sig_prev = float(df['MACD_Signal'].iloc[-2])
-    recent_below_signal = bool((df['MACD'] <= df['MACD_Signal']).tail(6).head(5).any())
+    macd_curr = float(macd.iloc[-1])
+    macd_prev = float(macd.iloc[-2])
+    sig_curr = float(macd_signal.iloc[-1])
+    sig_prev = float(macd_signal.iloc[-2])
+    recent_below_signal = bool((macd <= macd_signal).tail(6).head(5).any())
     return (macd_curr >= sig_curr) and ((macd_curr - sig_curr) > (macd_prev - sig_prev)) and recent_below_signal
 
 
-def rsi_in_range(df: pd.DataFrame, window: int, lower: float, upper: float) -> bool:
-    rsi_series = RSIIndicator(close=df['close'], window=window).rsi()
+def rsi_in_range(df: pd.DataFrame, window: int, lower: float, upper: float, indicators: Optional[IndicatorBundle] = None) -> bool:
+    rsi_series = (indicators or IndicatorBundle(df)).rsi(window)
     if pd.isna(rsi_series.iloc[-1]):
         return False
     return lower <= float(rsi_series.iloc[-1]) <= upper
 
 
-def rsi_rebound_below(df: pd.DataFrame, window: int, upper_bound: float) -> bool:
-    rsi_series = RSIIndicator(close=df['close'], window=window).rsi()
+def rsi_rebound_below(df: pd.DataFrame, window: int, upper_bound: float, indicators: Optional[IndicatorBundle] = None) -> bool:
+    rsi_series = (indicators or IndicatorBundle(df)).rsi(window)
     if len(rsi_series) < 2:
         return False
     curr = rsi_series.iloc[-1]
@@ -1,36 +1,51 @@
 """워크플로우 공통 함수"""
+import asyncio
+import datetime
 import logging
-from typing import List, Union
+from typing import List, Optional, Union
 
 from config import setting_env
 from config.logging_config import get_logger
 from core.decorators import log_execution
-from core.error_handler import handle_error
-from core.exceptions import OrderError
 from data.dto.account_dto import StockResponseDTO
 from data.models import Subscription
 from services.data_handler import get_country_by_symbol
 from services.strategies import DividendStrategy, GrowthStrategy, RangeBoundStrategy
-from services.trading_helpers import fetch_price_dataframe, normalize_dataframe_for_country
+from services.strategies.base import BaseStrategy
+from services.market_snapshot import MarketSnapshot
+from services.price_cache import PriceCache
+from services.trading_calendar import get_trading_calendar
+from services.workflows.holdings import HoldingsSnapshot
+from services.workflows.order_dispatcher import BUY, SELL, OrderDispatcher, OrderReport, OrderRequest
 from utils import discord
 from utils.operations import price_refine
 
 logger = get_logger(__name__)
 
 
-def select_buy_stocks(country: str = "KOR") -> dict[str, dict[float, int]]:
-    """매수 종목 선택"""
-    buy_levels = {}
-
-    strategies = [
+def default_strategies() -> List[BaseStrategy]:
+    """워크플로우가 실행하는 기본 전략 목록"""
+    return [
         DividendStrategy(),
         GrowthStrategy(),
         RangeBoundStrategy(),
     ]
 
-    for strategy in strategies:
+
+def select_buy_stocks(
+        country: str = "KOR",
+        price_cache: Optional[PriceCache] = None,
+        market: Optional[MarketSnapshot] = None,
+        strategies: Optional[List[BaseStrategy]] = None
+) -> dict[str, dict[float, int]]:
+    """매수 종목 선택 (모든 전략이 같은 시장 지표 스냅샷을 읽는다)"""
+    buy_levels = {}
+    price_cache = price_cache or PriceCache()
+    market = market or MarketSnapshot()
+
+    for strategy in strategies or default_strategies():
         try:
-            result = strategy.filter_for_buy(country=country)
+            result = strategy.filter_for_buy(country=country, price_cache=price_cache, market=market)
             for sym, price_dict in result.items():
                 for price, qty in price_dict.items():
                     buy_levels.setdefault(sym, {})
@@ -41,19 +56,22 @@ def select_buy_stocks(country: str = "KOR") -> dict[str, dict[float, int]]:
     return buy_levels
 
 
-def select_sell_stocks(stocks_held: Union[List[StockResponseDTO], StockResponseDTO, None]) -> dict[str, dict[float, int]]:
-    """매도 종목 선택"""
+def select_sell_stocks(
+        stocks_held: Union[HoldingsSnapshot, List[StockResponseDTO], StockResponseDTO, None],
+        price_cache: Optional[PriceCache] = None,
+        market: Optional[MarketSnapshot] = None,
+        strategies: Optional[List[BaseStrategy]] = None
+) -> dict[str, dict[float, int]]:
+    """매도 종목 선택 (보유 수량 제한은 잔고 스냅샷 기준)"""
     sell_levels = {}
+    price_cache = price_cache or PriceCache()
+    market = market or MarketSnapshot()
+    holdings = stocks_held if isinstance(stocks_held, HoldingsSnapshot) else HoldingsSnapshot(stocks_held)
+    stocks_held = holdings.stocks
 
-    strategies = [
-        DividendStrategy(),
-        GrowthStrategy(),
-        RangeBoundStrategy(),
-    ]
-
-    for strategy in strategies:
+    for strategy in strategies or default_strategies():
         try:
-            result = strategy.filter_for_sell(stocks_held)
+            result = strategy.filter_for_sell(stocks_held, price_cache=price_cache, market=market)
             for sym, price_dict in result.items():
                 for price, qty in price_dict.items():
                     sell_levels.setdefault(sym, {})
@@ -62,33 +80,18 @@ def select_sell_stocks(stocks_held: Union[List[StockResponseDTO], StockResponseD
             logger.error(f"select_sell_stocks 전략 실행 오류: {e}")
 
     # 구독하지 않은 종목 처리
-    non_sub_result = filter_non_subscription_for_sell(stocks_held)
+    non_sub_result = filter_non_subscription_for_sell(stocks_held, price_cache=price_cache)
     for sym, price_dict in non_sub_result.items():
         for price, qty in price_dict.items():
             sell_levels.setdefault(sym, {})
             sell_levels[sym][price] = sell_levels[sym].get(price, 0) + qty
 
     # 보유 수량 제한 적용
-    if not stocks_held or not sell_levels:
+    if not holdings or not sell_levels:
         return sell_levels
 
-    holdings = stocks_held if isinstance(stocks_held, list) else [stocks_held]
-    limits: dict[str, int] = {}
-    for stock in holdings:
-        try:
-            symbol = stock.pdno
-        except Exception:
-            continue
-
-        try:
-            hldg_qty = int(float(getattr(stock, "hldg_qty", 0) or 0))
-        except (TypeError, ValueError):
-            hldg_qty = 0
-
-        limits[symbol] = hldg_qty
-
     for symbol in list(sell_levels.keys()):
-        max_qty = limits.get(symbol, 0)
+        max_qty = holdings.quantity(symbol)
         price_qty = sell_levels[symbol]
 
         total_sell = sum(price_qty.values())
@@ -115,7 +118,8 @@ def select_sell_stocks(stocks_held: Union[List[StockResponseDTO], StockResponseD
 
 
 def filter_non_subscription_for_sell(
-        stocks_held: Union[List[StockResponseDTO], StockResponseDTO, None]
+        stocks_held: Union[List[StockResponseDTO], StockResponseDTO, None],
+        price_cache: Optional[PriceCache] = None
 ) -> dict[str, dict[float, int]]:
     """구독하지 않은 보유 종목을 전일 종가로 전량 매도 대상으로 반환"""
     sell_levels: dict[str, dict[float, int]] = {}
@@ -124,6 +128,11 @@ def filter_non_subscription_for_sell(
 
     holdings = stocks_held if isinstance(stocks_held, list) else [stocks_held]
     subscribed_symbols = {sub.symbol for sub in Subscription.select(Subscription.symbol)}
+    price_cache = price_cache or PriceCache()
+    price_cache.prefetch(
+        stock.pdno for stock in holdings
+        if getattr(stock, "pdno", None) and stock.pdno not in subscribed_symbols
+    )
 
     for stock in holdings:
         try:
@@ -147,10 +156,9 @@ def filter_non_subscription_for_sell(
             continue
 
         try:
-            df = fetch_price_dataframe(symbol)
+            df = price_cache.get(symbol)
             if df is None or df.empty or len(df) < 2:
                 continue
-            df = normalize_dataframe_for_country(df, country)
 
             prev_close = float(df.iloc[-2]["close"])
             if prev_close <= 0:
@@ -165,118 +173,121 @@ def filter_non_subscription_for_sell(
     return sell_levels
 
 
+def build_buy_orders(buy_levels, holdings: HoldingsSnapshot, end_date: Optional[str] = None) -> List[OrderRequest]:
+    """
+    매수 대상을 주문 목록으로 변환 (보유 종목은 평균 매입가 대비 2.5% 이상 낮은 가격만)
+
+    :param buy_levels: 매수 대상 {symbol: {price: volume}}
+    :param holdings: 잔고 스냅샷
+    :param end_date: 국내 예약 주문 만료일 (YYYYMMDD)
+    """
+    orders: List[OrderRequest] = []
+    for symbol, levels in (buy_levels or {}).items():
+        country = get_country_by_symbol(symbol)
+        average_price = holdings.average_price(symbol)
+        for price, volume in levels.items():
+            try:
+                if average_price and price > average_price * 0.975:
+                    continue
+                if country == "KOR":
+                    orders.append(OrderRequest(symbol, country, BUY, price_refine(price), volume, end_date))
+                elif country == "USA":
+                    orders.append(OrderRequest(symbol, country, BUY, price, volume))
+            except Exception as e:
+                logger.critical(f"trading_buy 주문 실패: {symbol} -> {e}")
+    return orders
+
+
+def build_sell_orders(sell_levels, holdings: HoldingsSnapshot, end_date: Optional[str] = None) -> List[OrderRequest]:
+    """
+    매도 대상을 주문 목록으로 변환 (보유 수량 한도, 평균 매입가 미만 가격은 매입가 위로 보정)
+
+    :param sell_levels: 매도 대상 {symbol: {price: volume}}
+    :param holdings: 잔고 스냅샷
+    :param end_date: 국내 예약 주문 만료일 (YYYYMMDD)
+    """
+    orders: List[OrderRequest] = []
+    for symbol, levels in (sell_levels or {}).items():
+        if symbol not in holdings:
+            continue
+        country = get_country_by_symbol(symbol)
+        average_price = holdings.average_price(symbol)
+        hldg_qty = holdings.quantity(symbol)
+
+        for price, volume in levels.items():
+            volume = min(volume, hldg_qty)
+            if volume <= 0:
+                continue
+            hldg_qty -= volume
+
+            try:
+                if country == "KOR":
+                    if price < average_price:
+                        price = price_refine(int(average_price * 1.002), 1)
+                    orders.append(OrderRequest(symbol, country, SELL, int(price), volume, end_date))
+                elif country == "USA":
+                    if price < average_price:
+                        price = round(average_price * 1.005, 2)
+                    orders.append(OrderRequest(symbol, country, SELL, round(float(price), 2), volume))
+            except Exception as e:
+                logger.critical(f"trading_sell 주문 실패: {symbol} -> {e}")
+    return orders
+
+
 @log_execution(level=logging.INFO)
-def trading_buy(client, buy_levels):
+async def trading_buy(client, buy_levels, holdings: Optional[HoldingsSnapshot] = None) -> Optional[OrderReport]:
     """
-    매수 주문 실행
+    매수 주문 실행 (가격 수준별 주문을 동시에 전송)
 
-    :param client: KISClient 인스턴스
+    :param client: AsyncKISClient 인스턴스
     :param buy_levels: 매수 대상 {symbol: {price: volume}}
+    :param holdings: 잔고 스냅샷 (없으면 잔고를 한 번 조회)
+    :return: 주문 결과 보고서 (개장일 조회 실패 시 None)
     """
     try:
-        end_date = client.get_nth_open_day(3)
+        # 예약 주문 만료일은 미리 적재한 국내 거래일 달력에서 계산 (API 호출 없음)
+        end_date = get_trading_calendar("KOR").nth_open_day(datetime.date.today(), 3).strftime("%Y%m%d")
+        if holdings is None:
+            holdings = await HoldingsSnapshot.fetch(client)
     except Exception as e:
-        logger.critical(f"trading_buy 오픈일 조회 실패: {e}")
-        return
-
-    money = 0
-
-    for symbol, levels in buy_levels.items():
-        try:
-            country = get_country_by_symbol(symbol)
-            stock = client.get_owned_stock_info(symbol=symbol)
-            for price, volume in levels.items():
-                if stock and price > float(stock.pchs_avg_pric) * 0.975:
-                    continue
+        logger.critical(f"trading_buy 오픈일/잔고 조회 실패: {e}")
+        return None
 
-                try:
-                    if country == "KOR":
-                        price = price_refine(price)
-                        client.buy_reserve(symbol=symbol, price=price, volume=volume, end_date=end_date)
-                        money += price * volume
-                    elif country == "USA":
-                        try:
-                            result = client.buy(symbol, price, volume)
-                            if result:
-                                logger.info(f"매수 성공: {symbol} {volume}주 @{price}")
-                            else:
-                                error = OrderError(f"매수 실패: {symbol}")
-                                handle_error(
-                                    error,
-                                    context="trading_buy",
-                                    metadata={"symbol": symbol, "price": price, "volume": volume},
-                                    should_raise=False
-                                )
-                        except Exception as e:
-                            error = OrderError(f"매수 중 예외 발생: {symbol}", original_error=e)
-                            handle_error(
-                                error,
-                                context="trading_buy",
-                                critical=True,
-                                metadata={"symbol": symbol, "price": price, "volume": volume},
-                                should_raise=False
-                            )
-                        money += price * volume
-                except Exception as e:
-                    logger.critical(f"trading_buy 주문 실패: {symbol} -> {e}")
-        except Exception as e:
-            logger.error(f"trading_buy 처리 중 에러: {symbol} -> {e}")
+    orders = build_buy_orders(buy_levels, holdings, end_date)
+    report = await OrderDispatcher(client).dispatch(orders, label="매수")
+    report.log()
 
+    # 접수에 성공한 주문 금액만 합산
+    money = report.total_amount
     if money:
+        money = int(money) if float(money).is_integer() else round(money, 2)
         try:
-            discord.send_message(f'총 액 : {money}')
+            await asyncio.to_thread(discord.send_message, f'총 액 : {money}')
         except Exception as e:
             logger.error(f"trading_buy 디스코드 전송 실패: {e}")
+    return report
 
 
 @log_execution(level=logging.INFO)
-def trading_sell(client, sell_levels):
+async def trading_sell(client, sell_levels, holdings: Optional[HoldingsSnapshot] = None) -> Optional[OrderReport]:
     """
-    매도 주문 실행
+    매도 주문 실행 (가격 수준별 주문을 동시에 전송)
 
-    :param client: KISClient 인스턴스
+    :param client: AsyncKISClient 인스턴스
     :param sell_levels: 매도 대상 {symbol: {price: volume}}
+    :param holdings: 잔고 스냅샷 (없으면 잔고를 한 번 조회)
+    :return: 주문 결과 보고서 (개장일 조회 실패 시 None)
     """
     try:
-        end_date = client.get_nth_open_day(1)
+        # 예약 주문 만료일은 미리 적재한 국내 거래일 달력에서 계산 (API 호출 없음)
+        end_date = get_trading_calendar("KOR").nth_open_day(datetime.date.today(), 1).strftime("%Y%m%d")
+        if holdings is None:
+            holdings = await HoldingsSnapshot.fetch(client)
     except Exception as e:
-        logger.critical(f"trading_sell 오픈일 조회 실패: {e}")
-        return
+        logger.critical(f"trading_sell 오픈일/잔고 조회 실패: {e}")
+        return None
 
-    for symbol, levels in (sell_levels or {}).items():
-        try:
-            country = get_country_by_symbol(symbol)
-            stock = client.get_owned_stock_info(symbol=symbol)
-            if not stock:
-                continue
-
-            try:
-                hldg_qty = int(float(getattr(stock, "hldg_qty", 0) or 0))
-            except (TypeError, ValueError):
-                hldg_qty = 0
-
-            for price, volume in levels.items():
-                volume = min(volume, hldg_qty)
-                if volume <= 0:
-                    continue
-                hldg_qty -= volume
-
-                try:
-                    if country == "KOR":
-                        if price < float(stock.pchs_avg_pric):
-                            price = price_refine(int(float(stock.pchs_avg_pric) * 1.002), 1)
-                        client.sell_reserve(symbol=symbol, price=int(price), volume=volume, end_date=end_date)
-                    elif country == "USA":
-                        if price < float(stock.pchs_avg_pric):
-                            price = round(float(stock.pchs_avg_pric) * 1.005, 2)
-                        client.submit_overseas_reservation_order(
-                            country=country,
-                            action="sell",
-                            symbol=symbol,
-                            price=str(round(float(price), 2)),
-                            volume=str(volume)
-                        )
-                except Exception as e:
-                    logger.critical(f"trading_sell 주문 실패: {symbol} -> {e}")
-        except Exception as e:
-            logger.error(f"trading_sell 처리 중 에러: {symbol} -> {e}")
+    orders = build_sell_orders(sell_levels, holdings, end_date)
+    report = await OrderDispatcher(client).dispatch(orders, label="매도")
+    report.log()
+    return report
@@ -1,9 +1,11 @@
 """ETF 트레이딩 워크플로우"""
+import asyncio
 import datetime
 
-from clients.kis import KISClient
+from clients.kis import AsyncKISClient
 from config.logging_config import get_logger
 from config import setting_env
+from services.trading_calendar import get_trading_calendar
 from utils import discord
 
 logger = get_logger(__name__)
@@ -13,23 +15,24 @@ class ETFWorkflow:
     """ETF 트레이딩 워크플로우"""
 
     @staticmethod
-    def run():
-        """ETF 관심종목 그룹에 포함된 종목을 1주씩 매수"""
-        ki_api = KISClient(
+    async def run():
+        """ETF 관심종목 그룹에 포함된 종목을 1주씩 매수 (비동기)"""
+        async with AsyncKISClient(
             app_key=setting_env.APP_KEY_ETF,
             app_secret=setting_env.APP_SECRET_ETF,
             account_number=setting_env.ACCOUNT_NUMBER_ETF,
             account_code=setting_env.ACCOUNT_CODE_ETF,
-        )
+        ) as ki_api:
+            await ETFWorkflow._buy_groups(ki_api)
 
-        today = datetime.datetime.now().strftime("%Y%m%d")
-        holidays = ki_api.get_domestic_market_holidays(today)
-        holiday = holidays.get(today)
-        if holiday and holiday.opnd_yn == "N":
+    @staticmethod
+    async def _buy_groups(ki_api: AsyncKISClient):
+        """휴장일/관심종목 그룹 확인 후 매수 및 잔고 알림"""
+        if not get_trading_calendar("KOR").is_open(datetime.date.today()):
             logger.info("ETF 그룹 매수 스킵: 휴장일")
             return
 
-        group_list = ki_api.get_interest_group_list(user_id=setting_env.HTS_ID_ETF)
+        group_list = await ki_api.get_interest_group_list(user_id=setting_env.HTS_ID_ETF)
         if not group_list or not group_list.output2:
             logger.warning("ETF 그룹 매수 스킵: 관심종목 그룹 없음")
             return
@@ -42,12 +45,16 @@ class ETFWorkflow:
             logger.warning("ETF 그룹 매수 스킵: ETF 그룹 미존재")
             return
 
-        symbols = set()
-        for group in etf_groups:
-            detail = ki_api.get_interest_group_stocks(
+        # 그룹별 종목 조회는 서로 독립이므로 동시에 요청
+        details = await asyncio.gather(*(
+            ki_api.get_interest_group_stocks(
                 user_id=setting_env.HTS_ID_ETF,
                 inter_grp_code=group.inter_grp_code,
             )
+            for group in etf_groups
+        ))
+        symbols = set()
+        for detail in details:
             if not detail or not detail.output2:
                 continue
             for item in detail.output2:
@@ -63,24 +70,25 @@ class ETFWorkflow:
 
         for symbol in sorted(symbols):
             try:
-                ki_api.buy(symbol=symbol, price=0, volume=1, order_type="03")
+                await ki_api.buy(symbol=symbol, price=0, volume=1, order_type="03")
                 purchased_symbols.append(symbol)
             except Exception as e:
                 logger.critical(f"ETF 그룹 매수 실패: {symbol} - {e}")
 
         # 구매 금액 계산 및 잔고 확인
         if purchased_symbols:
-            for symbol in purchased_symbols:
-                current_price = ki_api.get_current_price(symbol=symbol)
-                if current_price:
-                    total_purchase_amount += current_price
+            current_prices = await asyncio.gather(
+                *(ki_api.get_current_price(symbol=symbol) for symbol in purchased_symbols)
+            )
+            total_purchase_amount = sum(price for price in current_prices if price)
 
-            account_info = ki_api.get_account_info()
+            account_info = await ki_api.get_account_info()
             if account_info and total_purchase_amount > 0:
                 balance = int(account_info.dnca_tot_amt)
                 threshold = total_purchase_amount * 2
                 if balance <= threshold:
-                    discord.send_message(
+                    await asyncio.to_thread(
+                        discord.send_message,
                         f"[ETF 계좌 잔고 부족 알림]\n"
                         f"금일 구매 금액: {total_purchase_amount:,}원\n"
                         f"현재 잔고: {balance:,}원\n"
@@ -91,4 +99,5 @@ class ETFWorkflow:
 
 # 기존 코드 호환을 위한 함수
 def buy_etf_group_stocks():
-    ETFWorkflow.run()
+    """동기 래퍼 함수 (스케줄러용)"""
+    asyncio.run(ETFWorkflow.run())
@@ -0,0 +1,81 @@
+"""보유 종목 스냅샷"""
+import time
+from typing import Dict, Iterator, List, Optional, Union
+
+from config.logging_config import get_logger
+from data.dto.account_dto import StockResponseDTO
+
+logger = get_logger(__name__)
+
+
+class HoldingsSnapshot:
+    """
+    종목코드로 색인한 보유 종목 스냅샷
+
+    잔고 조회 API는 호출마다 계좌 전체 잔고를 내려받으므로, 단계(매도 선정, 주문 등)를 시작할 때
+    한 번만 조회하고 종목별 보유 수량/매입가는 이 스냅샷에서 읽는다. 해외 보유분은
+    get_owned_stock_info가 국내 DTO 형식(pdno, hldg_qty)으로 변환해 둔 값을 그대로 쓴다.
+    """
+
+    def __init__(self, stocks_held: Union[List[StockResponseDTO], StockResponseDTO, None] = None):
+        if not stocks_held:
+            holdings = []
+        elif isinstance(stocks_held, list):
+            holdings = stocks_held
+        else:
+            holdings = [stocks_held]
+        self._by_symbol: Dict[str, StockResponseDTO] = {
+            stock.pdno: stock for stock in holdings if getattr(stock, "pdno", None)
+        }
+        self.fetched_at = time.monotonic()
+
+    @classmethod
+    async def fetch(cls, client) -> "HoldingsSnapshot":
+        """
+        잔고 조회 1회로 스냅샷 생성
+
+        :param client: AsyncKISClient 인스턴스
+        """
+        snapshot = cls(await client.get_owned_stock_info())
+        logger.info(f"보유 종목 스냅샷 조회: {len(snapshot)}종목")
+        return snapshot
+
+    async def refresh(self, client) -> "HoldingsSnapshot":
+        """새 단계 시작 시 잔고를 다시 조회해 스냅샷 갱신"""
+        fresh = await HoldingsSnapshot.fetch(client)
+        self._by_symbol = fresh._by_symbol
+        self.fetched_at = fresh.fetched_at
+        return self
+
+    @property
+    def stocks(self) -> List[StockResponseDTO]:
+        """보유 종목 목록 (전략의 stocks_held 인자로 그대로 사용)"""
+        return list(self._by_symbol.values())
+
+    def get(self, symbol: str) -> Optional[StockResponseDTO]:
+        return self._by_symbol.get(symbol)
+
+    def quantity(self, symbol: str) -> int:
+        """보유 수량 (미보유/파싱 불가 시 0)"""
+        stock = self._by_symbol.get(symbol)
+        try:
+            return int(float(getattr(stock, "hldg_qty", 0) or 0))
+        except (TypeError, ValueError):
+            return 0
+
+    def average_price(self, symbol: str) -> Optional[float]:
+        """매입 평균가 (미보유/파싱 불가 시 None)"""
+        stock = self._by_symbol.get(symbol)
+        try:
+            return float(stock.pchs_avg_pric) if stock else None
+        except (TypeError, ValueError):
+            return None
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._by_symbol
+
+    def __iter__(self) -> Iterator[StockResponseDTO]:
+        return iter(self._by_symbol.values())
+
+    def __len__(self) -> int:
+        return len(self._by_symbol)
@@ -1,13 +1,16 @@
 """국내주식 트레이딩 워크플로우"""
 import asyncio
 import datetime
-from datetime import timedelta
 
-from clients.kis import KISClient
+from clients.kis import AsyncKISClient
 from config import setting_env
 from config.logging_config import get_logger
 from services.data_handler import add_stock_price
+from services.market_snapshot import MarketSnapshot
+from services.price_cache import PriceCache
+from services.trading_calendar import get_trading_calendar
 from services.workflows.base import select_buy_stocks, select_sell_stocks, trading_buy, trading_sell
+from services.workflows.holdings import HoldingsSnapshot
 
 logger = get_logger(__name__)
 
@@ -18,36 +21,40 @@ class KoreaWorkflow:
     @staticmethod
     async def run():
         """국내주식 일일 트레이딩 실행 (비동기)"""
-        ki_api = KISClient(
+        async with AsyncKISClient(
             app_key=setting_env.APP_KEY_KOR,
             app_secret=setting_env.APP_SECRET_KOR,
             account_number=setting_env.ACCOUNT_NUMBER_KOR,
             account_code=setting_env.ACCOUNT_CODE_KOR
-        )
-
-        if ki_api.check_holiday(datetime.datetime.now().strftime("%Y%m%d")):
-            logger.info("국내 주식 일일 루틴 시작", workflow="korea") 
-            logger.info(f'{datetime.datetime.now()} 휴장일')
-            return
-
-        while datetime.datetime.now().time() < datetime.time(18, 15, 00):
-            await asyncio.sleep(1 * 60)
-
-        add_stock_price(
-            country="KOR",
-            start_date=datetime.datetime.now() - timedelta(days=5),
-            end_date=datetime.datetime.now()
-        )
-
-        stocks_held = ki_api.get_owned_stock_info()
-        sell_queue = select_sell_stocks(stocks_held)
-        buy_stock = select_buy_stocks(country="KOR")
-
-        # 비동기 병렬 실행 (threading 대신 asyncio.gather 사용)
-        await asyncio.gather(
-            asyncio.to_thread(trading_sell, ki_api, sell_queue),
-            asyncio.to_thread(trading_buy, ki_api, buy_stock)
-        )
+        ) as ki_api:
+            if not get_trading_calendar("KOR").is_open(datetime.date.today()):
+                logger.info("국내 주식 일일 루틴 시작", workflow="korea")
+                logger.info(f'{datetime.datetime.now()} 휴장일')
+                return
+
+            while datetime.datetime.now().time() < datetime.time(18, 15, 00):
+                await asyncio.sleep(1 * 60)
+
+            # 종목별 마지막 적재일 이후와 결측 구간만 증분 적재
+            await asyncio.to_thread(add_stock_price, country="KOR")
+
+            # 매도/매수 전략이 같은 가격 히스토리를 공유하도록 실행 단위 캐시 사용
+            # 잔고는 한 번만 조회해 매도 선정/수량 제한/주문이 같은 스냅샷을 읽는다
+            # VIX/지수 추세/환율도 실행 단위로 한 번만 조회해 모든 전략이 공유한다
+            price_cache = PriceCache()
+            market = MarketSnapshot()
+            holdings = await HoldingsSnapshot.fetch(ki_api)
+            sell_queue = select_sell_stocks(holdings, price_cache=price_cache, market=market)
+            buy_stock = select_buy_stocks(country="KOR", price_cache=price_cache, market=market)
+            price_cache.log_stats()
+            market.log_stats()
+
+            # 매도/매수 주문을 한 이벤트 루프에서 동시에 실행 (HTTP/2 연결 하나 공유)
+            await asyncio.gather(
+                trading_sell(ki_api, sell_queue, holdings),
+                trading_buy(ki_api, buy_stock, holdings)
+            )
+            ki_api.rate_limiter.log_stats("korea")
 
 
 # 기존 코드 호환을 위한 함수
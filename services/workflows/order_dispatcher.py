@@ -0,0 +1,142 @@
+"""주문 동시 전송 및 결과 집계"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional
+
+from config import setting_env
+from config.logging_config import get_logger
+from core.error_handler import handle_error
+from core.exceptions import OrderError
+
+logger = get_logger(__name__)
+
+BUY = "buy"
+SELL = "sell"
+
+
+@dataclass(frozen=True)
+class OrderRequest:
+    """주문 한 건 (종목/가격 수준 하나)"""
+    symbol: str
+    country: str
+    side: str
+    price: float
+    volume: int
+    end_date: Optional[str] = None
+
+    @property
+    def amount(self) -> float:
+        return self.price * self.volume
+
+
+@dataclass
+class OrderResult:
+    """주문 한 건의 전송 결과"""
+    request: OrderRequest
+    success: bool
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+
+@dataclass
+class OrderReport:
+    """주문 묶음의 전송 결과 보고서"""
+    label: str
+    results: List[OrderResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def succeeded(self) -> List[OrderResult]:
+        return [result for result in self.results if result.success]
+
+    @property
+    def failed(self) -> List[OrderResult]:
+        return [result for result in self.results if not result.success]
+
+    @property
+    def total_amount(self) -> float:
+        """접수에 성공한 주문의 총 금액"""
+        return sum(result.request.amount for result in self.succeeded)
+
+    def log(self) -> None:
+        """결과 요약 로깅"""
+        if not self.results:
+            return
+        logger.info(
+            f"{self.label} 주문 결과: 성공 {len(self.succeeded)}, 실패 {len(self.failed)}, "
+            f"접수 금액 {self.total_amount:,.2f}, 소요 {self.elapsed:.2f}초"
+        )
+        for result in self.failed:
+            request = result.request
+            logger.warning(
+                f"{self.label} 주문 실패: {request.symbol} {request.volume}주 @{request.price}"
+                f"{f' -> {result.error}' if result.error else ''}"
+            )
+
+
+class OrderDispatcher:
+    """
+    주문 동시 전송기
+
+    주문을 최대 concurrency건까지 동시에 보내고 건별 결과를 OrderReport로 모은다.
+    초당 전송 수는 클라이언트의 앱 키별 호출 제한기가 조절하므로, 동시 전송 수는
+    호출 한도를 채울 만큼만 두면 된다.
+    """
+
+    def __init__(self, client, concurrency: int = None):
+        """
+        :param client: AsyncKISClient 인스턴스
+        :param concurrency: 동시에 진행하는 주문 수 (기본값: ORDER_DISPATCH_CONCURRENCY)
+        """
+        self._client = client
+        self._semaphore = asyncio.Semaphore(max(1, concurrency or setting_env.ORDER_DISPATCH_CONCURRENCY))
+
+    async def dispatch(self, orders: Iterable[OrderRequest], label: str = "") -> OrderReport:
+        """주문 묶음 전송 (결과는 요청 순서대로)"""
+        orders = list(orders)
+        started = time.monotonic()
+        results = await asyncio.gather(*(self._submit(order) for order in orders))
+        return OrderReport(label=label, results=list(results), elapsed=time.monotonic() - started)
+
+    async def _submit(self, order: OrderRequest) -> OrderResult:
+        async with self._semaphore:
+            started = time.monotonic()
+            try:
+                success = bool(await self._send(order))
+                error = None if success else "주문 거부 또는 응답 없음"
+            except Exception as e:
+                success, error = False, f"{type(e).__name__}: {e}"
+            elapsed = time.monotonic() - started
+
+        if not success:
+            handle_error(
+                OrderError(f"{order.side} 주문 실패: {order.symbol}"),
+                context="OrderDispatcher",
+                metadata={"symbol": order.symbol, "price": order.price, "volume": order.volume, "error": error},
+                should_raise=False
+            )
+        return OrderResult(request=order, success=success, error=error, elapsed=elapsed)
+
+    async def _send(self, order: OrderRequest):
+        """국가/매매 구분에 맞는 주문 API 호출"""
+        client = self._client
+        if order.country == "KOR":
+            if order.side == BUY:
+                return await client.buy_reserve(
+                    symbol=order.symbol, price=int(order.price), volume=order.volume, end_date=order.end_date
+                )
+            return await client.sell_reserve(
+                symbol=order.symbol, price=int(order.price), volume=order.volume, end_date=order.end_date
+            )
+        if order.country == "USA":
+            if order.side == BUY:
+                return await client.buy(order.symbol, order.price, order.volume)
+            return await client.submit_overseas_reservation_order(
+                country=order.country,
+                action=SELL,
+                symbol=order.symbol,
+                price=str(round(float(order.price), 2)),
+                volume=str(order.volume)
+            )
+        raise OrderError(f"지원하지 않는 국가: {order.country}")
@@ -7,7 +7,9 @@ from config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
-from clients.kis import KISClient
+from clients.kis import AsyncKISClient
+from services.market_snapshot import MarketSnapshot
+from services.price_cache import PriceCache
 from services.workflows.base import select_buy_stocks, trading_buy
 
 
@@ -18,17 +20,20 @@ class USAWorkflow:
     async def run():
         """미국주식 일일 트레이딩 실행 (비동기)"""
         logger.info("미국 주식 일일 루틴 시작", workflow="usa")
-        ki_api = KISClient(
+        async with AsyncKISClient(
             app_key=setting_env.APP_KEY_USA,
             app_secret=setting_env.APP_SECRET_USA,
             account_number=setting_env.ACCOUNT_NUMBER_USA,
             account_code=setting_env.ACCOUNT_CODE_USA
-        )
-
-        usa_stock = select_buy_stocks(country="USA")
-        
-        # 비동기 실행 (threading 대신 asyncio 사용)
-        await asyncio.to_thread(trading_buy, ki_api, usa_stock)
+        ) as ki_api:
+            price_cache = PriceCache()
+            market = MarketSnapshot()
+            usa_stock = select_buy_stocks(country="USA", price_cache=price_cache, market=market)
+            price_cache.log_stats()
+            market.log_stats()
+
+            await trading_buy(ki_api, usa_stock)
+            ki_api.rate_limiter.log_stats("usa")
 
 
 # 기존 코드 호환을 위한 함수
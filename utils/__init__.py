@@ -1,9 +1,10 @@
 """유틸리티 모듈"""
-from utils.data_util import upsert_many
+from utils.data_util import bulk_upsert, upsert_many
 from utils.operations import price_refine, find_nth_open_day
 
 __all__ = [
     "upsert_many",
+    "bulk_upsert",
     "price_refine",
     "find_nth_open_day",
     "discord",
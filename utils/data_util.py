@@ -1,7 +1,12 @@
+import csv
+import io
+import math
+import uuid
 from typing import Type, Dict, List, Any, Optional
 
-from peewee import Model, Field
+from peewee import Model, Field, PostgresqlDatabase
 
+from config.constants import BULK_COPY_MIN_ROWS, BULK_UPSERT_CHUNK_ROWS
 from config.logging_config import get_logger
 from data import models
 
@@ -29,16 +34,17 @@ def upsert(model: Type[Model], data: Dict[str, Any], conflict_target: List[Field
         logger.error(f"Upsert failed for model {model.__name__}: {e}")
 
 
-def upsert_many(model: Type[Model], data: List[Dict[str, Any]], conflict_target: Optional[List[Field]] = None, preserve_fields: Optional[List[str]] = None) -> None:
+def upsert_many(model: Type[Model], data: List[Dict[str, Any]], conflict_target: Optional[List[Field]] = None, preserve_fields: Optional[List[str]] = None) -> bool:
     """
     Peewee insert_many와 UPSERT를 결합하여 다중 데이터 처리
     :param model: Peewee 모델 클래스
     :param data: 삽입할 데이터의 리스트 (e.g., [{'field1': value1, ...}, ...])
     :param conflict_target: 중복 확인 키 리스트 (e.g., [Model.field1, Model.field2])
     :param preserve_fields: 충돌 시 업데이트할 필드 리스트 (e.g., ['field3', 'field4'])
+    :return: 성공 여부
     """
     if not data:
-        return
+        return True
 
     try:
         with models.db.atomic():
@@ -54,5 +60,86 @@ def upsert_many(model: Type[Model], data: List[Dict[str, Any]], conflict_target:
                     conflict_target=conflict_target,
                     preserve=preserve_fields
                 ).execute()
+        return True
     except Exception as e:
         logger.error(f"Upsert many failed for model {model.__name__}: {e}")
+        return False
+
+
+def bulk_upsert(model: Type[Model], data: List[Dict[str, Any]], conflict_target: List[Field], preserve_fields: Optional[List[str]] = None) -> bool:
+    """
+    대량 UPSERT (여러 종목의 행을 한 번에 적재할 때 사용)
+
+    PostgreSQL이고 행이 BULK_COPY_MIN_ROWS 이상이면 COPY로 임시 테이블에 적재한 뒤
+    INSERT ... ON CONFLICT 한 번으로 병합한다. 그 외에는 BULK_UPSERT_CHUNK_ROWS 단위로 upsert_many를 호출한다.
+    :param model: Peewee 모델 클래스
+    :param data: 삽입할 데이터의 리스트 (모든 행의 키가 같아야 함)
+    :param conflict_target: 중복 확인 키 리스트 (e.g., [Model.field1, Model.field2])
+    :param preserve_fields: 충돌 시 업데이트할 필드 리스트 (없으면 기존 행 유지)
+    :return: 성공 여부
+    """
+    if not data:
+        return True
+
+    if len(data) >= BULK_COPY_MIN_ROWS and isinstance(model._meta.database, PostgresqlDatabase):
+        try:
+            copy_upsert(model, data, conflict_target, preserve_fields)
+            return True
+        except Exception as e:
+            logger.warning(f"COPY upsert failed for model {model.__name__}, falling back to insert_many: {e}")
+
+    for offset in range(0, len(data), BULK_UPSERT_CHUNK_ROWS):
+        if not upsert_many(model, data[offset:offset + BULK_UPSERT_CHUNK_ROWS], conflict_target, preserve_fields):
+            return False
+    return True
+
+
+def copy_upsert(model: Type[Model], data: List[Dict[str, Any]], conflict_target: List[Field], preserve_fields: Optional[List[str]] = None) -> None:
+    """
+    PostgreSQL COPY 기반 UPSERT (실패 시 예외 발생, 트랜잭션 단위로 롤백)
+
+    호출마다 이름이 다른 임시 테이블에 COPY로 적재한 뒤 중복 키를 제거하여 본 테이블에 병합한다.
+    같은 키가 여러 번 오면 upsert_many처럼 마지막 행이 남는다. 호출자 트랜잭션 안(savepoint)에서
+    여러 번 호출해도 충돌하지 않도록 임시 테이블은 병합 직후 바로 삭제한다.
+    """
+    database = model._meta.database
+    if not isinstance(conflict_target, (list, tuple)):
+        conflict_target = [conflict_target]
+
+    fields = [model._meta.fields[name] for name in data[0]]
+    columns = ", ".join(f'"{field.column_name}"' for field in fields)
+    conflict_columns = ", ".join(f'"{field.column_name}"' for field in conflict_target)
+    table = model._meta.table_name
+    staging = f"{table}_bulk_{uuid.uuid4().hex[:12]}"
+
+    if preserve_fields:
+        updates = ", ".join(f'"{name}" = EXCLUDED."{name}"' for name in preserve_fields)
+        conflict_action = f"DO UPDATE SET {updates}"
+    else:
+        conflict_action = "DO NOTHING"
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for seq, row in enumerate(data):
+        writer.writerow([_copy_value(field, row[field.name]) for field in fields] + [seq])
+    buffer.seek(0)
+
+    with database.atomic():
+        cursor = database.cursor()
+        cursor.execute(f'CREATE TEMP TABLE "{staging}" (LIKE "{table}" INCLUDING DEFAULTS) ON COMMIT DROP')
+        cursor.execute(f'ALTER TABLE "{staging}" ADD COLUMN "_bulk_seq" bigint')
+        cursor.copy_expert(f'COPY "{staging}" ({columns}, "_bulk_seq") FROM STDIN WITH (FORMAT csv)', buffer)
+        cursor.execute(
+            f'INSERT INTO "{table}" ({columns}) '
+            f'SELECT DISTINCT ON ({conflict_columns}) {columns} FROM "{staging}" '
+            f'ORDER BY {conflict_columns}, "_bulk_seq" DESC '
+            f'ON CONFLICT ({conflict_columns}) {conflict_action}'
+        )
+        cursor.execute(f'DROP TABLE "{staging}"')
+
+
+def _copy_value(field: Field, value: Any) -> Any:
+    """COPY csv 값 (None/NaN은 빈 칸 = NULL)"""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    return field.db_value(value)